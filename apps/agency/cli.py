@@ -68,6 +68,7 @@ from vibe_core.tools import (  # noqa: E402
     AddTaskTool,
     CompleteTaskTool,
     DelegateTool,
+    GrepContentTool,
     ListTasksTool,
     ReadFileTool,
     ToolRegistry,
@@ -142,6 +143,7 @@ def boot_kernel():
     registry.register(ReadFileTool())
     registry.register(ListDirectoryTool())
     registry.register(SearchFileTool())
+    registry.register(GrepContentTool(invariant_checker=soul))
     # Step 3.5: Register Agenda Tools (ARCH-045)
     registry.register(AddTaskTool())
     registry.register(ListTasksTool())
@@ -450,20 +452,21 @@ async def _run_interactive_repl(kernel: VibeKernel):
 
             # Submit task to kernel
             task = Task(agent_id="vibe-operator", payload={"user_message": cmd})
-            task_id = kernel.submit(task)
-            logger.info(f"📤 Submitted task {task_id}")
+            handle = kernel.submit(task)
+            logger.info(f"📤 Submitted task {handle}")
 
-            # Execute until complete
+            # Execute until the queue drains (delegated tasks included).
+            # tick() blocks on the LLM call - run it in a worker thread;
+            # it returns False once idle, so there is nothing to poll.
             steps = 0
-            while kernel.scheduler.get_queue_status()["pending_tasks"] > 0:
-                kernel.tick()
+            while await asyncio.to_thread(kernel.tick):
                 steps += 1
-                await asyncio.sleep(0.01)  # Prevent CPU spinning
 
             logger.info(f"✅ Task completed in {steps} steps")
 
-            # TODO: Display agent's response (requires ledger query)
-            print(f"   ↳ [Task {task_id} completed]")
+            # The handle carries the agent's response (no ledger query needed)
+            output = getattr(handle.result(), "output", None) if handle.done() else None
+            print(f"   ↳ {output}" if output else f"   ↳ [Task {handle} completed]")
 
         except KeyboardInterrupt:
             print("\n\n👋 Operator interrupted. Goodbye!")
@@ -754,15 +757,13 @@ async def run_mission(kernel: VibeKernel, mission: str):
     task_id = kernel.submit(task)
     logger.info(f"📤 Mission submitted (task_id={task_id})")
 
-    # Execute autonomously
+    # Execute autonomously (tick() returns False once the queue is empty)
     steps = 0
     max_steps = 1000  # Safety limit to prevent infinite loops
 
-    while kernel.scheduler.get_queue_status()["pending_tasks"] > 0 and steps < max_steps:
-        kernel.tick()
+    while steps < max_steps and await asyncio.to_thread(kernel.tick):
         steps += 1
         print(f"   ↳ Step {steps} executed...")
-        await asyncio.sleep(0.01)  # Prevent CPU spinning
 
     # Report outcome
     if steps >= max_steps:
@@ -22,7 +22,6 @@ Version: 1.1 (Phase 3 - GAD-002 + GAD-003)
 import json
 import logging
 import re
-import subprocess
 import time
 import uuid
 import xml.etree.ElementTree as ET
@@ -33,6 +32,7 @@ from typing import Any
 
 import yaml
 
+from vibe_core.runtime.git_state import get_git_state
 from vibe_core.runtime.llm_client import BudgetExceededError, LLMClient
 from vibe_core.store.sqlite_store import SQLiteStore
 
@@ -1134,18 +1134,11 @@ class CoreOrchestrator:
         """
         try:
             # Check if working directory is clean
-            result = subprocess.run(
-                ["git", "status", "--porcelain"],
-                capture_output=True,
-                text=True,
-                cwd=self.repo_root,
-                check=False,
-            )
-            clean = len(result.stdout.strip()) == 0
+            changes = get_git_state(self.repo_root).status()
 
             return {
-                "status": {"clean": clean},
-                "uncommitted_changes": result.stdout.strip().split("\n") if not clean else [],
+                "status": {"clean": not changes},
+                "uncommitted_changes": changes,
             }
         except Exception as e:
             logger.warning(f"Failed to get git status: {e}")
@@ -352,7 +352,7 @@ def compose_steward_prompt_minimal() -> str:
 
 **Your Role:** Execute user requests with precision. Use file tools for simple tasks.
 
-**Available Tools:** read_file, write_file, list_directory, search_file
+**Available Tools:** read_file, write_file, list_directory, search_file, grep_content
 
 Execute the user's request now.
 """
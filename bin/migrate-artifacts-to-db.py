@@ -42,16 +42,18 @@ def migrate_artifacts():
         return 1
 
     # Define artifact patterns by type and location
+    # (keys must match the artifacts.artifact_type CHECK constraint)
     artifact_patterns = {
         "planning": ["artifacts/planning"],
-        "coding": ["artifacts/coding"],
-        "testing": ["artifacts/testing"],
+        "code": ["artifacts/coding"],
+        "test": ["artifacts/testing"],
         "deployment": ["artifacts/deployment"],
     }
 
     imported = 0
     skipped = 0
     errors = 0
+    artifacts = []
 
     # Find all workspaces
     workspaces_dir = root_dir / "workspaces"
@@ -110,21 +112,18 @@ def migrate_artifacts():
                                 except json.JSONDecodeError:
                                     pass
 
-                            # Add to database
-                            artifact_id = db_store.add_artifact(
-                                mission_id=mission_id,
-                                artifact_type=artifact_type,
-                                artifact_name=artifact_name,
-                                created_at=created_at,
-                                path=str(artifact_path),
-                                metadata=metadata,
+                            # Queued for the bulk insert below
+                            artifacts.append(
+                                {
+                                    "mission_id": mission_id,
+                                    "artifact_type": artifact_type,
+                                    "artifact_name": artifact_name,
+                                    "created_at": created_at,
+                                    "path": str(artifact_path),
+                                    "metadata": metadata,
+                                }
                             )
-
-                            print(
-                                f"  ✅ Added: {artifact_type}/{artifact_name} "
-                                f"→ artifact_id={artifact_id}"
-                            )
-                            imported += 1
+                            print(f"  ✅ Found: {artifact_type}/{artifact_name}")
 
                         except Exception as e:
                             print(f"  ❌ ERROR: {artifact_path.name}: {e}")
@@ -137,6 +136,21 @@ def migrate_artifacts():
             print(f"  ❌ ERROR: {workspace.name}: {e}")
             errors += 1
 
+    # One transaction for all workspaces instead of a commit per artifact
+    try:
+        imported = db_store.bulk_add_artifacts(artifacts)
+    except Exception as e:
+        # One bad row aborts the whole batch - fall back to per-artifact
+        # inserts so the good ones still land and only the bad ones count
+        print(f"  ⚠️  Bulk insert failed ({e}), inserting one by one")
+        for artifact in artifacts:
+            try:
+                db_store.add_artifact(**artifact)
+                imported += 1
+            except Exception as e:
+                print(f"  ❌ ERROR: {artifact['path']}: {e}")
+                errors += 1
+
     db_store.close()
 
     # Summary
@@ -51,31 +51,51 @@ def migrate_manifests():
     skipped = 0
     errors = 0
 
-    # Import each manifest
+    # Parse all manifests first, then upsert them in one bulk transaction
+    manifests = []
     for manifest_path in manifest_files:
         try:
             with open(manifest_path) as f:
                 manifest_data = json.load(f)
-
-            project_id = manifest_data.get("metadata", {}).get("projectId", "unknown")
-            project_name = manifest_data.get("metadata", {}).get("name", "Unknown")
-
-            # Import to database
-            mission_id = db_store.import_project_manifest(manifest_data)
-
-            if mission_id:
-                print(f"  ✅ Imported: {project_id} ({project_name}) → mission_id={mission_id}")
-                imported += 1
-            else:
-                print(f"  ⏭️  Skipped: {project_id} (already exists)")
-                skipped += 1
-
         except json.JSONDecodeError:
             print(f"  ❌ ERROR: Invalid JSON in {manifest_path}")
             errors += 1
-        except Exception as e:
-            print(f"  ❌ ERROR: {project_id}: {e}")
+            continue
+        except (OSError, ValueError) as e:  # Unreadable or not UTF-8
+            print(f"  ❌ ERROR: Cannot read {manifest_path}: {e}")
             errors += 1
+            continue
+
+        manifests.append(manifest_data)
+
+    failed: set[str] = set()
+    try:
+        mission_ids = db_store.bulk_import_manifests(manifests)
+    except Exception as e:
+        # One bad manifest aborts the whole batch - fall back to per-manifest
+        # imports so the good ones still land and the bad one is reported
+        print(f"  ⚠️  Bulk import failed ({e}), importing one by one")
+        mission_ids = {}
+        for manifest_data in manifests:
+            project_id = manifest_data.get("metadata", {}).get("projectId", "unknown")
+            try:
+                mission_ids[project_id] = db_store.import_project_manifest(manifest_data)
+            except Exception as e:
+                print(f"  ❌ ERROR: {project_id}: {e}")
+                failed.add(project_id)
+                errors += 1
+
+    for manifest_data in manifests:
+        project_id = manifest_data.get("metadata", {}).get("projectId", "unknown")
+        project_name = manifest_data.get("metadata", {}).get("name", "Unknown")
+        mission_id = mission_ids.get(project_id)
+
+        if mission_id:
+            print(f"  ✅ Imported: {project_id} ({project_name}) → mission_id={mission_id}")
+            imported += 1
+        elif project_id not in failed:
+            print(f"  ⏭️  Skipped: {project_id} (no mission id returned)")
+            skipped += 1
 
     db_store.close()
 
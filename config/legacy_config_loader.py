@@ -286,31 +286,12 @@ class LegacyConfigLoader(ConfigLoaderInterface):
         This is the LEGACY implementation (pre-GAD-100).
         Code extracted from core_orchestrator.py:_get_git_status()
         """
-        try:
-            # Get current branch
-            branch_result = subprocess.run(
-                ["git", "branch", "--show-current"],
-                cwd=self.repo_root,
-                capture_output=True,
-                text=True,
-                timeout=5,
-            )
-            branch = branch_result.stdout.strip() if branch_result.returncode == 0 else "unknown"
+        from vibe_core.runtime.git_state import GitStateError, get_git_state
 
-            # Check if working directory is clean
-            status_result = subprocess.run(
-                ["git", "status", "--porcelain"],
-                cwd=self.repo_root,
-                capture_output=True,
-                text=True,
-                timeout=5,
-            )
-            is_clean = (
-                len(status_result.stdout.strip()) == 0 if status_result.returncode == 0 else False
-            )
-
-            return {"branch": branch, "working_directory_clean": is_clean}
-        except (subprocess.TimeoutExpired, FileNotFoundError):
+        try:
+            git = get_git_state(self.repo_root)
+            return {"branch": git.current_branch(), "working_directory_clean": git.is_clean()}
+        except GitStateError:
             return {"branch": "unknown", "working_directory_clean": False}
 
     def _get_linting_status(self) -> dict[str, Any]:
@@ -21,7 +21,6 @@ Output:
 """
 
 import asyncio
-import json
 import sys
 from pathlib import Path
 
@@ -203,14 +202,12 @@ async def factory_run():
 def query_ledger(kernel: VibeKernel, task_id: str) -> dict:
     """Query ledger for task result."""
     ledger: VibeLedger = kernel.ledger
-    conn = ledger.conn
-    cursor = conn.cursor()
 
     try:
-        cursor.execute("SELECT output_result FROM task_history WHERE task_id = ?", (task_id,))
-        row = cursor.fetchone()
-        if row:
-            return json.loads(row[0])
+        # Large results live compressed in task_blobs, so go through the ledger API
+        output = ledger.get_task_output(task_id)
+        if output is not None:
+            return output
     except Exception as e:
         print(f"   ⚠️  Ledger query failed: {e}")
 
@@ -4,6 +4,7 @@ Tests for SimpleLLMAgent with tool-use capability (ARCH-027)
 Verifies that LLM agents can detect and execute tool calls.
 """
 
+import json
 import tempfile
 from pathlib import Path
 
@@ -231,6 +232,30 @@ def test_llm_agent_detects_tool_call():
         Path(temp_path).unlink()
 
 
+def test_llm_agent_executes_multiple_tool_calls():
+    """SimpleLLMAgent should execute every tool call in a multi-call response, in order"""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        paths = []
+        for name in ("a.txt", "b.txt"):
+            path = Path(tmpdir) / name
+            path.write_text(f"content of {name}")
+            paths.append(str(path))
+
+        provider = MockLLMProviderWithTools(
+            response=json.dumps([{"tool": "read_file", "parameters": {"path": p}} for p in paths])
+        )
+        registry = ToolRegistry()
+        registry.register(ReadFileTool())
+        agent = SimpleLLMAgent(agent_id="test-agent", provider=provider, tool_registry=registry)
+
+        result = agent.process(Task(agent_id="test-agent", payload={"user_message": "Read both"}))
+
+        assert result.success is True
+        outputs = [call["output"] for call in result.output["tool_calls"]]
+        assert outputs == ["content of a.txt", "content of b.txt"]
+        assert result.output["tool_call"] == result.output["tool_calls"][0]
+
+
 def test_llm_agent_no_tool_call_without_registry():
     """SimpleLLMAgent without tool_registry should not execute tools"""
     provider = MockLLMProviderWithTools(
@@ -316,7 +341,7 @@ def test_llm_agent_with_tools_via_kernel():
         assert busy is True
 
         # Query ledger
-        history = kernel.ledger.get_history(limit=1)
+        history = kernel.ledger.get_history(limit=1, include_output=True)
         assert len(history) == 1
         assert history[0]["status"] == "COMPLETED"
         # get_history() already deserializes JSON
@@ -335,7 +335,7 @@ def test_kernel_records_specialist_execution_in_ledger(specialist_agent, valid_t
     kernel.tick()
 
     # Query ledger
-    executions = kernel.ledger.get_history(limit=10)
+    executions = kernel.ledger.get_history(limit=10, include_output=True)
 
     assert len(executions) == 1
     execution = executions[0]
@@ -362,7 +362,7 @@ def test_kernel_records_specialist_failure_in_ledger(specialist_agent, valid_tas
     kernel.tick()
 
     # Query ledger
-    executions = kernel.ledger.get_history(limit=10)
+    executions = kernel.ledger.get_history(limit=10, include_output=True)
 
     assert len(executions) == 1
     execution = executions[0]
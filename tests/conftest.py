@@ -57,6 +57,20 @@ except ImportError:
     pass  # handlers module might not exist in all configs
 
 
+@pytest.fixture(scope="session", autouse=True)
+def isolated_workflow_cache(tmp_path_factory):
+    """Keep WorkflowLoader's compiled-workflow cache out of the real ~/.vibe."""
+    try:
+        from vibe_core.playbook import loader as workflow_loader
+    except ImportError:  # jsonschema/yaml not installed
+        yield
+        return
+
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(workflow_loader, "DEFAULT_CACHE_DIR", tmp_path_factory.mktemp("workflow_cache"))
+        yield
+
+
 @pytest.fixture(scope="function")
 def vibe_root():
     """Provide the vibe-agency root directory for tests."""
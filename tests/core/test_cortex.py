@@ -5,12 +5,22 @@ Tests the LLM integration layer: LLMProvider, SimpleLLMAgent,
 and full stack integration (Kernel → Agent → LLM → Ledger).
 """
 
+import asyncio
+import time
+
 import pytest
 
 from tests.mocks.llm import MockLLMProvider
 from vibe_core.agents import SimpleLLMAgent
 from vibe_core.kernel import VibeKernel
-from vibe_core.llm import LLMProvider
+from vibe_core.llm import (
+    CachingProvider,
+    ChainProvider,
+    LLMError,
+    LLMProvider,
+    ResponseCache,
+)
+from vibe_core.llm.cache import cache_key
 from vibe_core.scheduling import Task
 
 
@@ -394,5 +404,234 @@ class TestKernelLLMIntegration:
         assert "agent-2" in stats["agents"]
 
 
+class SlowAsyncProvider(LLMProvider):
+    """Provider with a native achat() that sleeps on the event loop."""
+
+    def __init__(self, delay: float = 0.1):
+        self.delay = delay
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    def chat(self, messages, model=None, **kwargs) -> str:
+        return asyncio.run(self.achat(messages, model=model, **kwargs))
+
+    async def achat(self, messages, model=None, **kwargs) -> str:
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(self.delay)
+        self.in_flight -= 1
+        return f"async: {messages[-1]['content']}"
+
+    @property
+    def system_prompt(self) -> str:
+        return "You are async."
+
+
+class FailingProvider(MockLLMProvider):
+    """Provider whose every call fails."""
+
+    def chat(self, messages, model=None, **kwargs) -> str:
+        raise RuntimeError("API down")
+
+
+class TestAsyncLLM:
+    """Test achat() on providers, agents and the kernel event loop."""
+
+    def test_default_achat_wraps_sync_chat(self):
+        """Test that sync-only providers can be awaited via the thread shim."""
+        provider = MockLLMProvider(mock_response="shim")
+        assert asyncio.run(provider.achat([{"role": "user", "content": "Hi"}])) == "shim"
+
+    def test_achat_many_runs_concurrently_and_keeps_order(self):
+        """Test that achat_many() overlaps calls and returns results in order."""
+        provider = SlowAsyncProvider(delay=0.1)
+        conversations = [[{"role": "user", "content": f"q{i}"}] for i in range(5)]
+
+        start = time.perf_counter()
+        responses = asyncio.run(provider.achat_many(conversations, max_concurrency=5))
+        elapsed = time.perf_counter() - start
+
+        assert responses == [f"async: q{i}" for i in range(5)]
+        assert provider.max_in_flight == 5
+        assert elapsed < 0.4
+
+    def test_achat_many_respects_max_concurrency(self):
+        """Test that achat_many() never exceeds max_concurrency."""
+        provider = SlowAsyncProvider(delay=0.01)
+        conversations = [[{"role": "user", "content": str(i)}] for i in range(6)]
+        asyncio.run(provider.achat_many(conversations, max_concurrency=2))
+        assert provider.max_in_flight == 2
+
+        with pytest.raises(ValueError):
+            asyncio.run(provider.achat_many(conversations, max_concurrency=0))
+
+    def test_chain_achat_falls_back(self):
+        """Test that ChainProvider.achat() cascades like chat()."""
+        chain = ChainProvider(providers=[FailingProvider(), SlowAsyncProvider(delay=0)])
+        response = asyncio.run(chain.achat([{"role": "user", "content": "Hi"}]))
+        assert response == "async: Hi"
+
+        failing = ChainProvider(providers=[FailingProvider()])
+        with pytest.raises(LLMError):
+            asyncio.run(failing.achat([{"role": "user", "content": "Hi"}]))
+
+    def test_agent_aprocess_matches_process(self):
+        """Test that aprocess() returns the same response shape as process()."""
+        agent = SimpleLLMAgent(agent_id="llm", provider=MockLLMProvider(mock_response="same"))
+        task = Task(agent_id="llm", payload={"user_message": "Hi"})
+
+        sync_result = agent.process(task)
+        async_result = asyncio.run(agent.aprocess(task))
+
+        assert async_result.success
+        assert async_result.output == sync_result.output
+
+    def test_kernel_run_async_overlaps_llm_calls(self):
+        """Test that run_async() awaits several LLM agents concurrently."""
+        kernel = VibeKernel(ledger_path=":memory:")
+        provider = SlowAsyncProvider(delay=0.1)
+        for i in range(4):
+            kernel.register_agent(SimpleLLMAgent(agent_id=f"llm-{i}", provider=provider))
+        kernel.boot()
+        for i in range(4):
+            kernel.submit(Task(agent_id=f"llm-{i}", payload={"user_message": f"m{i}"}))
+
+        start = time.perf_counter()
+        executed = asyncio.run(kernel.run_async())
+        elapsed = time.perf_counter() - start
+
+        assert executed == 4
+        assert provider.max_in_flight == 4
+        assert elapsed < 0.35
+        assert kernel.ledger.get_statistics()["completed"] == 4
+
+
+class TestResponseCache:
+    """Test the LLM response cache and CachingProvider."""
+
+    MESSAGES = [{"role": "user", "content": "Audit this"}]
+
+    def test_cache_key_is_normalized(self):
+        """Test that role case, whitespace and dict order do not change the key."""
+        a = cache_key([{"role": "user", "content": " Hi\n"}], "m", temperature=0.0)
+        b = cache_key([{"content": "Hi", "role": "USER"}], "m", temperature=0.0)
+        c = cache_key([{"role": "user", "content": "Hi"}], "m", temperature=0.5)
+
+        assert a == b
+        assert a != c
+
+    def test_caching_provider_serves_repeats_from_cache(self):
+        """Test that an identical call does not reach the wrapped provider."""
+        mock = MockLLMProvider(mock_response="cached answer", track_calls=True)
+        provider = CachingProvider(mock)
+
+        assert provider.chat(self.MESSAGES) == "cached answer"
+        assert provider.chat(self.MESSAGES) == "cached answer"
+        assert asyncio.run(provider.achat(self.MESSAGES)) == "cached answer"
+
+        assert len(mock.call_history) == 1
+        stats = provider.cache.get_stats()
+        assert stats["hits"] == 2
+        assert stats["misses"] == 1
+
+    def test_lru_eviction_and_ttl(self):
+        """Test that the memory tier evicts LRU entries and expires old ones."""
+        now = [0.0]
+        cache = ResponseCache(max_entries=2, ttl_seconds=10, clock=lambda: now[0])
+        cache.set("a", "1")
+        cache.set("b", "2")
+        cache.get("a")
+        cache.set("c", "3")  # Evicts "b" (least recently used)
+
+        assert cache.get("b") is None
+        assert cache.get("a") == "1"
+
+        now[0] = 11.0
+        assert cache.get("a") is None
+
+    def test_disk_tier_survives_restart_for_replay(self, tmp_path):
+        """Test that a replay-only provider runs entirely from the disk tier."""
+        db_path = str(tmp_path / "llm_cache.db")
+        recording = CachingProvider(
+            MockLLMProvider(mock_response="recorded"), ResponseCache(db_path=db_path)
+        )
+        recording.chat(self.MESSAGES, model="m")
+        recording.cache.close()
+
+        # Same provider type (the key includes it); replay_only never calls it
+        replay = CachingProvider(
+            MockLLMProvider(mock_response="live"), ResponseCache(db_path=db_path), replay_only=True
+        )
+        assert replay.chat(self.MESSAGES, model="m") == "recorded"
+        assert replay.cache.get_stats()["disk_hits"] == 1
+
+        with pytest.raises(LLMError, match="replay-only"):
+            replay.chat([{"role": "user", "content": "New prompt"}], model="m")
+
+    def test_cache_key_includes_provider(self):
+        """Test that the same call through different providers never shares an entry."""
+        assert cache_key(self.MESSAGES, "m", "Google") != cache_key(self.MESSAGES, "m", "Local")
+
+    def test_mock_provider_responses_are_not_cached(self):
+        """Test that responses from a non-cacheable provider never enter the cache."""
+
+        class OfflineProvider(MockLLMProvider):
+            cacheable = False
+
+        cache = ResponseCache()
+        CachingProvider(OfflineProvider(mock_response="simulated"), cache).chat(self.MESSAGES)
+        assert cache.get_stats()["entries"] == 0
+
+        chain = ChainProvider([FailingProvider(), OfflineProvider(mock_response="simulated")])
+        CachingProvider(chain, cache).chat(self.MESSAGES)
+        assert cache.get_stats()["entries"] == 0
+
+        real = MockLLMProvider(mock_response="real", track_calls=True)
+        assert CachingProvider(real, cache).chat(self.MESSAGES) == "real"
+        assert len(real.call_history) == 1
+
+    def test_llm_client_does_not_cache_noop_responses(self):
+        """Test that LLMClient in NoOp (mock) mode bypasses the cache."""
+        from vibe_core.runtime.llm_client import LLMClient
+        from vibe_core.runtime.providers import NoOpProvider
+
+        cache = ResponseCache()
+        client = LLMClient(provider=NoOpProvider(), cache=cache)
+        client.invoke(prompt="What is 2+2?", model="m")
+        client.invoke(prompt="What is 2+2?", model="m")
+
+        assert client.get_cost_summary()["total_invocations"] == 2
+        stats = cache.get_stats()
+        assert (stats["hits"], stats["misses"], stats["entries"]) == (0, 0, 0)
+
+    def test_llm_client_reports_cache_metrics(self):
+        """Test that LLMClient serves repeats from cache and reports hit/miss metrics."""
+        from unittest.mock import MagicMock
+
+        from vibe_core.runtime.llm_client import LLMClient
+        from vibe_core.runtime.providers.base import LLMResponse, LLMUsage
+
+        provider = MagicMock()
+        provider.get_provider_name.return_value = "Stub"
+        provider.invoke.return_value = LLMResponse(
+            content="4",
+            usage=LLMUsage(10, 1, "m", 0.001, "2025-01-01T00:00:00Z"),
+            model="m",
+            finish_reason="end_turn",
+            provider="stub",
+        )
+
+        client = LLMClient(provider=provider, cache=ResponseCache())
+        first = client.invoke(prompt="What is 2+2?", model="m")
+        second = client.invoke(prompt="What is 2+2?", model="m")
+
+        assert second.content == first.content
+        assert second.usage.cost_usd == 0.0
+        summary = client.get_cost_summary()
+        assert summary["total_invocations"] == 1
+        assert summary["cache"]["hits"] == 1
+        assert summary["cache"]["misses"] == 1
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -5,7 +5,10 @@ Tests the Kernel Loop implementation and task execution.
 Updated for ARCH-023 to include agent registration.
 """
 
+import asyncio
 import logging
+import threading
+import time
 from typing import Any
 from unittest.mock import patch
 
@@ -13,7 +16,7 @@ import pytest
 
 from vibe_core.agent_protocol import VibeAgent
 from vibe_core.kernel import KernelStatus, VibeKernel
-from vibe_core.scheduling import Task
+from vibe_core.scheduling import PriorityScheduler, Task
 
 
 class DummyAgent(VibeAgent):
@@ -202,6 +205,22 @@ class TestKernelExecutionCycle:
         assert task_id is not None
         # Task is queued but won't be processed until boot
 
+    def test_tick_respects_priority_scheduler(self):
+        """Test that tick() drains a PriorityScheduler by priority without call-site changes."""
+        kernel = VibeKernel(":memory:", scheduler=PriorityScheduler())
+        agent = DummyAgent("agent-1")
+        kernel.register_agent(agent)
+        kernel.boot()
+
+        kernel.submit(Task(id="low", agent_id="agent-1", payload={}, priority=0))
+        kernel.submit(Task(id="high", agent_id="agent-1", payload={}, priority=9))
+
+        while kernel.tick():
+            pass
+
+        assert [t.id for t in agent.processed_tasks] == ["high", "low"]
+        assert kernel.get_status()["queue_type"] == "PRIORITY"
+
 
 class TestKernelIdleCycle:
     """Test 3: Idle Cycle - Behavior when no tasks are available."""
@@ -406,5 +425,227 @@ class TestKernelIntegration:
         assert status["pending_tasks"] == 0
 
 
+class SlowAgent(DummyAgent):
+    """Agent that sleeps while tracking its peak number of concurrent tasks."""
+
+    def __init__(self, agent_id: str, delay: float = 0.05, max_concurrency: int = 1):
+        super().__init__(agent_id)
+        self.delay = delay
+        self.max_concurrency = max_concurrency
+        self.active = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def process(self, task: Task) -> Any:
+        with self._lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        time.sleep(self.delay)
+        with self._lock:
+            self.active -= 1
+        if task.payload.get("fail"):
+            raise RuntimeError("boom")
+        return super().process(task)
+
+
+class TestKernelWorkerPool:
+    """Tests for concurrent execution via run_workers()."""
+
+    def test_slow_agent_does_not_block_others(self):
+        """Test that tasks for different agents run in parallel."""
+        kernel = VibeKernel(":memory:")
+        agents = [SlowAgent(f"agent-{i}", delay=0.2) for i in range(4)]
+        for agent in agents:
+            kernel.register_agent(agent)
+        kernel.boot()
+
+        for agent in agents:
+            kernel.submit(Task(agent_id=agent.agent_id, payload={}))
+
+        start = time.monotonic()
+        executed = kernel.run_workers(4)
+        elapsed = time.monotonic() - start
+
+        assert executed == 4
+        assert elapsed < 0.6  # Sequential execution would take 0.8s
+        assert all(len(agent.processed_tasks) == 1 for agent in agents)
+        assert kernel.ledger.get_statistics()["completed"] == 4
+
+    def test_per_agent_concurrency_cap_from_manifest(self):
+        """Test that an agent never runs more tasks at once than its manifest allows."""
+        kernel = VibeKernel(":memory:")
+        serial = SlowAgent("serial-agent")
+        parallel = SlowAgent("parallel-agent", max_concurrency=2)
+        kernel.register_agent(serial)
+        kernel.register_agent(parallel)
+        kernel.boot()
+
+        for _ in range(4):
+            kernel.submit(Task(agent_id="serial-agent", payload={}))
+            kernel.submit(Task(agent_id="parallel-agent", payload={}))
+
+        assert kernel.run_workers(8) == 8
+        assert serial.peak == 1
+        assert parallel.peak == 2
+        assert len(serial.processed_tasks) == 4
+        assert len(parallel.processed_tasks) == 4
+
+    def test_saturated_agent_backlog_stays_in_scheduler(self):
+        """Test that tasks waiting on a capped agent are still queued and prioritized."""
+        kernel = VibeKernel(":memory:", scheduler=PriorityScheduler())
+        serial = SlowAgent("serial-agent", delay=0.2)
+        other = SlowAgent("other-agent", delay=0)
+        kernel.register_agent(serial)
+        kernel.register_agent(other)
+        kernel.boot()
+
+        for _ in range(3):
+            kernel.submit(Task(agent_id="serial-agent", payload={}, priority=1))
+        worker = threading.Thread(target=kernel.run_workers, args=(2,))
+        worker.start()
+        time.sleep(0.1)  # First serial task running, two waiting for its slot
+
+        assert kernel.get_status()["pending_tasks"] == 2
+        assert kernel.get_queue_depth("serial-agent") == 3
+        kernel.submit(Task(agent_id="other-agent", payload={}, priority=0))
+        worker.join()
+
+        assert len(other.processed_tasks) == 1
+        assert len(serial.processed_tasks) == 3
+        assert kernel.get_status()["pending_tasks"] == 0
+
+    def test_failures_are_recorded_and_do_not_stop_pool(self):
+        """Test that a failing task is recorded and the pool keeps draining."""
+        kernel = VibeKernel(":memory:")
+        agent = SlowAgent("agent-1", delay=0)
+        kernel.register_agent(agent)
+        kernel.boot()
+
+        failing = Task(agent_id="agent-1", payload={"fail": True})
+        kernel.submit(failing)
+        kernel.submit(Task(agent_id="agent-1", payload={}))
+
+        assert kernel.run_workers(2) == 2
+        assert kernel.ledger.get_task(failing.id)["status"] == "FAILED"
+        assert kernel.ledger.get_statistics()["completed"] == 1
+        assert kernel.get_status()["pending_tasks"] == 0
+
+    def test_run_workers_requires_running_kernel(self):
+        """Test that run_workers() is a no-op when the kernel is stopped."""
+        kernel = VibeKernel(":memory:")
+        kernel.register_agent(DummyAgent("agent-1"))
+        kernel.submit(Task(agent_id="agent-1", payload={}))
+
+        assert kernel.run_workers(2) == 0
+        assert kernel.get_status()["pending_tasks"] == 1
+
+    def test_run_workers_rejects_invalid_count(self):
+        """Test that a worker count below 1 is rejected."""
+        kernel = VibeKernel(":memory:")
+        kernel.boot()
+        with pytest.raises(ValueError):
+            kernel.run_workers(0)
+
+
+class TestKernelTaskHandles:
+    """Test the handles returned by submit() and completion subscriptions."""
+
+    def test_handle_is_task_id_and_resolves_with_result(self):
+        """Test that the handle behaves like the task ID and carries the result."""
+        kernel = VibeKernel(":memory:")
+        kernel.register_agent(DummyAgent("agent-1"))
+        kernel.boot()
+        task = Task(agent_id="agent-1", payload={})
+
+        handle = kernel.submit(task)
+        assert handle == task.id
+        assert not handle.done()
+
+        kernel.tick()
+
+        assert handle.done()
+        assert handle.result() == {"status": "processed", "task_id": task.id}
+        assert handle.event.status == "COMPLETED"
+        assert kernel.get_handle(task.id) is handle
+
+    def test_handle_raises_agent_error(self):
+        """Test that a failed task re-raises the agent's exception from result()."""
+        kernel = VibeKernel(":memory:")
+        kernel.register_agent(SlowAgent("agent-1", delay=0))
+        kernel.boot()
+
+        handle = kernel.submit(Task(agent_id="agent-1", payload={"fail": True}))
+        kernel.run_workers(1)
+
+        with pytest.raises(RuntimeError, match="boom"):
+            handle.result(timeout=1)
+        assert handle.event.status == "FAILED"
+
+    def test_handle_is_awaitable_with_worker_pool(self):
+        """Test that awaiting a handle wakes up when a worker thread finishes the task."""
+        kernel = VibeKernel(":memory:")
+        kernel.register_agent(SlowAgent("agent-1", delay=0.05))
+        kernel.boot()
+        handle = kernel.submit(Task(agent_id="agent-1", payload={}))
+
+        async def wait_for_result():
+            worker = asyncio.create_task(asyncio.to_thread(kernel.run_workers, 1))
+            result = await handle
+            await worker
+            return result
+
+        assert asyncio.run(wait_for_result())["status"] == "processed"
+
+    def test_subscribe_filters_by_agent_and_unsubscribes(self):
+        """Test that subscribers get events for their agent until they unsubscribe."""
+        kernel = VibeKernel(":memory:")
+        kernel.register_agent(DummyAgent("agent-1"))
+        kernel.register_agent(DummyAgent("agent-2"))
+        kernel.boot()
+        events = []
+        unsubscribe = kernel.subscribe(events.append, agent_id="agent-1")
+
+        kernel.submit(Task(agent_id="agent-1", payload={}))
+        kernel.submit(Task(agent_id="agent-2", payload={}))
+        kernel.run_workers(2)
+        unsubscribe()
+        kernel.submit(Task(agent_id="agent-1", payload={}))
+        kernel.tick()
+
+        assert [(e.agent_id, e.status) for e in events] == [("agent-1", "COMPLETED")]
+
+    def test_failing_subscriber_does_not_break_execution(self):
+        """Test that an exception in a subscriber is logged, not propagated."""
+        kernel = VibeKernel(":memory:")
+        kernel.register_agent(DummyAgent("agent-1"))
+        kernel.boot()
+
+        def broken(event):
+            raise RuntimeError("subscriber bug")
+
+        kernel.subscribe(broken)
+        handle = kernel.submit(Task(agent_id="agent-1", payload={}))
+
+        assert kernel.tick() is True
+        assert handle.result()["status"] == "processed"
+
+    def test_queue_depth_tracks_pending_tasks(self):
+        """Test that get_queue_depth() counts submitted tasks until they finish."""
+        kernel = VibeKernel(":memory:")
+        kernel.register_agent(DummyAgent("agent-1"))
+        kernel.register_agent(DummyAgent("agent-2"))
+        kernel.boot()
+
+        kernel.submit(Task(agent_id="agent-1", payload={}))
+        kernel.submit(Task(agent_id="agent-1", payload={}))
+        assert kernel.get_queue_depth("agent-1") == 2
+        assert kernel.get_queue_depth("agent-2") == 0
+
+        kernel.tick()
+        assert kernel.get_queue_depth("agent-1") == 1
+        kernel.tick()
+        assert kernel.get_queue_depth("agent-1") == 0
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
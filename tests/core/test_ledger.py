@@ -5,6 +5,9 @@ Tests the task execution history ledger and SQLite persistence.
 """
 
 import json
+import sqlite3
+import threading
+import time
 from typing import Any
 
 import pytest
@@ -254,7 +257,7 @@ class TestLedgerHistory:
         result = {"complex": [1, 2, 3]}
         ledger.record_completion(task, result)
 
-        history = ledger.get_history()
+        history = ledger.get_history(include_output=True)
         assert len(history) == 1
 
         record = history[0]
@@ -514,5 +517,384 @@ class TestLedgerContextManager:
         # (can't easily test this without accessing private state)
 
 
+class TestLedgerWriteBehind:
+    """Tests for the batched, write-behind ledger mode."""
+
+    @staticmethod
+    def _rows_on_disk(ledger: VibeLedger) -> int:
+        return ledger.conn.execute("SELECT COUNT(*) FROM task_history").fetchone()[0]
+
+    def test_writes_are_deferred_until_flush(self):
+        """Test that events stay pending until flush() writes them in one batch."""
+        ledger = VibeLedger(":memory:", write_behind=True, flush_interval=60)
+        tasks = [Task(agent_id="agent-1", payload={"n": i}) for i in range(3)]
+        for task in tasks:
+            ledger.record_start(task)
+
+        assert self._rows_on_disk(ledger) == 0
+        assert ledger.flush() == 3
+        assert self._rows_on_disk(ledger) == 3
+        assert ledger.flush() == 0
+        ledger.close()
+
+    def test_get_task_sees_pending_writes(self):
+        """Test read-your-writes for get_task() before the batch is flushed."""
+        ledger = VibeLedger(":memory:", write_behind=True, flush_interval=60)
+        task = Task(agent_id="agent-1", payload={"x": 1})
+        ledger.record_start(task)
+        ledger.record_completion(task, {"ok": True})
+
+        record = ledger.get_task(task.id)
+        assert record["status"] == "COMPLETED"
+        assert record["input_payload"] == {"x": 1}
+        assert record["output_result"] == {"ok": True}
+        assert self._rows_on_disk(ledger) == 0
+        ledger.close()
+
+    def test_events_for_same_task_are_coalesced(self):
+        """Test that START followed by COMPLETED costs a single row write."""
+        ledger = VibeLedger(":memory:", write_behind=True, flush_interval=60)
+        task = Task(agent_id="agent-1", payload={})
+        ledger.record_start(task)
+        ledger.record_failure(task, "boom")
+
+        assert ledger.flush() == 1
+        assert ledger.get_task(task.id)["status"] == "FAILED"
+        ledger.close()
+
+    def test_batch_size_triggers_flush(self):
+        """Test that reaching batch_size flushes automatically."""
+        ledger = VibeLedger(":memory:", write_behind=True, batch_size=2, flush_interval=60)
+        ledger.record_start(Task(agent_id="agent-1", payload={}))
+        assert self._rows_on_disk(ledger) == 0
+        ledger.record_start(Task(agent_id="agent-1", payload={}))
+        assert self._rows_on_disk(ledger) == 2
+        ledger.close()
+
+    def test_flush_interval_flushes_in_background(self):
+        """Test that pending rows are flushed after the time window."""
+        ledger = VibeLedger(":memory:", write_behind=True, flush_interval=0.05)
+        ledger.record_start(Task(agent_id="agent-1", payload={}))
+
+        deadline = time.monotonic() + 2
+        while self._rows_on_disk(ledger) == 0 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert self._rows_on_disk(ledger) == 1
+        ledger.close()
+
+    def test_queries_and_close_flush_pending(self, tmp_path):
+        """Test that history/statistics and close() see or persist pending rows."""
+        db_path = str(tmp_path / "ledger.db")
+        ledger = VibeLedger(db_path, write_behind=True, flush_interval=60)
+        assert ledger.conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+
+        task = Task(agent_id="agent-1", payload={})
+        ledger.record_completion(task, "done")
+        assert ledger.get_statistics()["completed"] == 1
+        assert len(ledger.get_history()) == 1
+
+        other = Task(agent_id="agent-2", payload={})
+        ledger.record_start(other)
+        ledger.close()
+
+        with VibeLedger(db_path) as reopened:
+            assert reopened.get_task(other.id)["status"] == "STARTED"
+
+    def test_kernel_shutdown_flushes_ledger(self):
+        """Test that the kernel flushes a write-behind ledger on shutdown."""
+        kernel = VibeKernel(":memory:", ledger_write_behind=True)
+        kernel.register_agent(TestAgent("agent-1"))
+        kernel.boot()
+        kernel.submit(Task(agent_id="agent-1", payload={}))
+        kernel.tick()
+        kernel.shutdown()
+
+        assert self._rows_on_disk(kernel.ledger) == 1
+        kernel.ledger.close()
+
+
+class TestLedgerIndexedQueries:
+    """Tests for keyset pagination, indexes and maintained aggregates."""
+
+    def test_history_page_walks_all_records_without_duplicates(self):
+        """Test that following next_cursor visits every record exactly once, newest first."""
+        ledger = VibeLedger(":memory:")
+        tasks = [Task(id=f"task-{i:02d}", agent_id="agent-1", payload={}) for i in range(7)]
+        for task in tasks:
+            ledger.record_completion(task, "ok")
+
+        seen = []
+        page = ledger.get_history_page(limit=3)
+        seen.extend(r["task_id"] for r in page["records"])
+        while page["next_cursor"]:
+            page = ledger.get_history_page(limit=3, cursor=page["next_cursor"])
+            seen.extend(r["task_id"] for r in page["records"])
+
+        assert sorted(seen) == sorted(t.id for t in tasks)
+        assert len(seen) == len(set(seen))
+        assert seen == [r["task_id"] for r in ledger.get_history(limit=10)]
+
+    def test_history_page_applies_filters(self):
+        """Test that pagination respects status and agent filters."""
+        ledger = VibeLedger(":memory:")
+        for i in range(4):
+            ledger.record_completion(Task(agent_id="agent-A", payload={"i": i}), "ok")
+            ledger.record_failure(Task(agent_id="agent-B", payload={"i": i}), "boom")
+
+        page = ledger.get_history_page(limit=10, status="FAILED")
+        assert len(page["records"]) == 4
+        assert {r["agent_id"] for r in page["records"]} == {"agent-B"}
+        assert page["next_cursor"] is None
+
+        page = ledger.get_history_page(limit=2, agent_id="agent-A")
+        assert len(page["records"]) == 2
+        assert page["next_cursor"] is not None
+
+    def test_history_page_rejects_bad_cursor(self):
+        """Test that a malformed cursor raises ValueError."""
+        ledger = VibeLedger(":memory:")
+        with pytest.raises(ValueError):
+            ledger.get_history_page(cursor="not-a-cursor")
+
+    def test_history_queries_use_indexes(self):
+        """Test that filtered history queries are served by the secondary indexes."""
+        ledger = VibeLedger(":memory:")
+        plan = ledger.conn.execute(
+            "EXPLAIN QUERY PLAN SELECT * FROM task_history WHERE agent_id = ? "
+            "ORDER BY timestamp DESC, task_id DESC LIMIT 10",
+            ("agent-1",),
+        ).fetchall()
+        assert "idx_task_history_agent_timestamp" in plan[0][3]
+
+    def test_statistics_track_status_transitions(self):
+        """Test that aggregates follow START -> COMPLETED/FAILED updates."""
+        ledger = VibeLedger(":memory:")
+        ok = Task(agent_id="agent-1", payload={})
+        bad = Task(agent_id="agent-2", payload={})
+        ledger.record_start(ok)
+        ledger.record_start(bad)
+        assert ledger.get_statistics()["started"] == 2
+
+        ledger.record_completion(ok, "done")
+        ledger.record_failure(bad, "boom")
+        stats = ledger.get_statistics()
+        assert stats["total_tasks"] == 2
+        assert stats["started"] == 0
+        assert stats["completed"] == 1
+        assert stats["failed"] == 1
+        assert sorted(stats["agents"]) == ["agent-1", "agent-2"]
+
+    def test_aggregates_backfilled_for_existing_ledger(self, tmp_path):
+        """Test that a ledger created before the aggregate tables is backfilled once."""
+        db_path = tmp_path / "legacy.db"
+        conn = sqlite3.connect(db_path)
+        conn.execute(
+            """
+            CREATE TABLE task_history (
+                task_id TEXT PRIMARY KEY, agent_id TEXT NOT NULL,
+                input_payload TEXT NOT NULL, output_result TEXT,
+                status TEXT NOT NULL, error_message TEXT, timestamp TEXT NOT NULL
+            )
+            """
+        )
+        conn.execute(
+            "INSERT INTO task_history VALUES ('t1', 'legacy-agent', '{}', NULL, 'COMPLETED', "
+            "NULL, '2025-01-01T00:00:00')"
+        )
+        conn.commit()
+        conn.close()
+
+        with VibeLedger(str(db_path)) as ledger:
+            stats = ledger.get_statistics()
+            assert stats["total_tasks"] == 1
+            assert stats["completed"] == 1
+            assert stats["agents"] == ["legacy-agent"]
+
+        with VibeLedger(str(db_path)) as ledger:
+            assert ledger.get_statistics()["total_tasks"] == 1  # No double backfill
+
+
+class TestLedgerBlobStorage:
+    """Tests for compressed, out-of-line result storage."""
+
+    @staticmethod
+    def _large_result(text: str = "lorem ipsum ") -> dict:
+        return {"success": True, "output": text * 500}
+
+    def test_small_results_stay_inline(self):
+        """Test that results below INLINE_RESULT_LIMIT are stored in task_history."""
+        ledger = VibeLedger(":memory:")
+        task = Task(agent_id="agent-1", payload={})
+        ledger.record_completion(task, {"ok": True})
+
+        row = ledger.conn.execute(
+            "SELECT output_result, output_ref FROM task_history WHERE task_id = ?", (task.id,)
+        ).fetchone()
+        assert row["output_ref"] is None
+        assert json.loads(row["output_result"]) == {"ok": True}
+        assert ledger.conn.execute("SELECT COUNT(*) FROM task_blobs").fetchone()[0] == 0
+
+    def test_large_results_are_compressed_and_deduplicated(self):
+        """Test that identical large results share one compressed blob."""
+        ledger = VibeLedger(":memory:")
+        tasks = [Task(agent_id="agent-1", payload={"i": i}) for i in range(3)]
+        for task in tasks:
+            ledger.record_completion(task, self._large_result())
+
+        blobs = ledger.conn.execute("SELECT size, length(data) FROM task_blobs").fetchall()
+        assert len(blobs) == 1
+        assert blobs[0][1] < blobs[0][0]  # Compressed
+
+        record = ledger.get_task(tasks[1].id)
+        assert record["output_result"] == self._large_result()
+        assert record["output_size"] == len(json.dumps(self._large_result()))
+
+    def test_history_is_metadata_only_by_default(self):
+        """Test that history omits result bodies unless include_output=True."""
+        ledger = VibeLedger(":memory:")
+        task = Task(agent_id="agent-1", payload={})
+        ledger.record_completion(task, self._large_result())
+
+        record = ledger.get_history()[0]
+        assert "output_result" not in record
+        assert record["output_size"] > 0
+
+        full = ledger.get_history(include_output=True)[0]
+        assert full["output_result"] == self._large_result()
+        assert ledger.get_task_output(task.id) == self._large_result()
+        assert ledger.get_task_output("missing") is None
+
+    def test_write_behind_resolves_pending_blobs(self, tmp_path):
+        """Test that unflushed blobs are readable and flushed with their rows."""
+        ledger = VibeLedger(str(tmp_path / "wb.db"), write_behind=True, flush_interval=60)
+        task = Task(agent_id="agent-1", payload={})
+        ledger.record_completion(task, self._large_result("pending "))
+
+        assert ledger.get_task_output(task.id) == self._large_result("pending ")
+        ledger.close()
+
+        with VibeLedger(str(tmp_path / "wb.db")) as reopened:
+            assert reopened.get_task_output(task.id) == self._large_result("pending ")
+
+    def test_kernel_and_inspect_tool_fetch_body_lazily(self):
+        """Test that kernel.get_task_output and InspectResultTool return large bodies."""
+        from vibe_core.tools.inspect_result import InspectResultTool
+
+        class LargeResultAgent(TestAgent):
+            def process(self, task: Task) -> Any:
+                return {"status": "success", "data": "x" * 5000}
+
+        kernel = VibeKernel(ledger_path=":memory:")
+        kernel.register_agent(LargeResultAgent("big-agent"))
+        kernel.boot()
+        task_id = kernel.submit(Task(agent_id="big-agent", payload={}))
+        kernel.tick()
+
+        assert kernel.get_task_output(task_id)["data"] == "x" * 5000
+        result = InspectResultTool(kernel).execute({"task_id": task_id})
+        assert result.output["output"]["data"] == "x" * 5000
+
+
+class TestLedgerRetention:
+    """Tests for retention, archive segments and vacuum."""
+
+    @staticmethod
+    def _record(ledger: VibeLedger, agent_id: str, timestamp: str, result: Any = None) -> Task:
+        task = Task(agent_id=agent_id, payload={"ts": timestamp})
+        ledger.record_completion(task, result if result is not None else {"ok": True})
+        ledger.conn.execute(
+            "UPDATE task_history SET timestamp = ? WHERE task_id = ?", (timestamp, task.id)
+        )
+        ledger.conn.commit()
+        return task
+
+    def test_age_retention_archives_into_daily_segments(self, tmp_path):
+        """Test that old rows move to per-day segments and stay queryable."""
+        ledger = VibeLedger(str(tmp_path / "ledger.db"))
+        old_a = self._record(ledger, "agent-1", "2024-01-01T10:00:00")
+        old_b = self._record(ledger, "agent-2", "2024-01-02T10:00:00")
+        fresh = Task(agent_id="agent-1", payload={})
+        ledger.record_completion(fresh, {"ok": True})
+
+        assert ledger.apply_retention(max_age_days=30) == 2
+
+        segments = sorted(p.name for p in (tmp_path / "ledger_archive").iterdir())
+        assert segments == [
+            "task_history-2024-01-01.jsonl.gz",
+            "task_history-2024-01-02.jsonl.gz",
+        ]
+        assert [r["task_id"] for r in ledger.get_history()] == [fresh.id]
+
+        history = ledger.get_history(include_archived=True)
+        assert [r["task_id"] for r in history] == [fresh.id, old_b.id, old_a.id]
+        assert history[1]["input_payload"] == {"ts": "2024-01-02T10:00:00"}
+        agent_2 = ledger.get_history(agent_id="agent-2", include_archived=True)
+        assert [r["task_id"] for r in agent_2] == [old_b.id]
+
+        stats = ledger.get_statistics()  # Lifetime statistics
+        assert stats["total_tasks"] == 3
+        assert sorted(stats["agents"]) == ["agent-1", "agent-2"]
+        ledger.close()
+
+    def test_row_retention_keeps_started_tasks_and_prunes_blobs(self, tmp_path):
+        """Test that max_rows archives the oldest finished rows and their blobs."""
+        ledger = VibeLedger(":memory:", archive_dir=str(tmp_path / "archive"))
+        big = {"output": "x" * 5000}
+        archived = self._record(ledger, "agent-1", "2024-01-01T00:00:00", big)
+        running = Task(agent_id="agent-1", payload={})
+        ledger.record_start(running)
+        ledger.conn.execute(
+            "UPDATE task_history SET timestamp = '2023-12-31T00:00:00' WHERE task_id = ?",
+            (running.id,),
+        )
+        for day in range(2, 5):
+            self._record(ledger, "agent-1", f"2024-01-0{day}T00:00:00")
+
+        assert ledger.apply_retention(max_rows=3) == 1
+        assert ledger.get_task(running.id)["status"] == "STARTED"
+        assert ledger.conn.execute("SELECT COUNT(*) FROM task_blobs").fetchone()[0] == 0
+
+        history = ledger.get_history(limit=10, include_output=True, include_archived=True)
+        by_id = {r["task_id"]: r for r in history}
+        assert by_id[archived.id]["output_result"] == big
+
+    def test_in_memory_ledger_requires_archive_dir(self):
+        """Test that retention without an archive directory is rejected."""
+        ledger = VibeLedger(":memory:")
+        with pytest.raises(ValueError):
+            ledger.apply_retention(max_rows=0)
+        assert ledger.apply_retention() == 0  # No policy configured
+
+    def test_writes_do_not_run_maintenance_inline(self, tmp_path):
+        """Test that writes never archive inline, not even the first one."""
+        ledger = VibeLedger(str(tmp_path / "ledger.db"), retention_max_rows=2)
+
+        for _ in range(3):
+            ledger.record_completion(Task(agent_id="agent-1", payload={}), {"ok": True})
+
+        assert len(ledger.get_history(limit=10)) == 3
+        ledger.close()
+
+    def test_background_thread_runs_scheduled_maintenance(self, tmp_path):
+        """Test that a configured policy is applied by the maintenance thread."""
+        ledger = VibeLedger(
+            str(tmp_path / "ledger.db"), retention_max_rows=2, maintenance_interval=0.05
+        )
+        assert ledger.conn.execute("PRAGMA auto_vacuum").fetchone()[0] == 2  # INCREMENTAL
+
+        for _ in range(4):
+            ledger.record_completion(Task(agent_id="agent-1", payload={}), {"ok": True})
+
+        deadline = time.monotonic() + 5
+        while len(ledger.get_history(limit=10)) > 2 and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        assert len(ledger.get_history(limit=10)) == 2
+        assert len(ledger.get_history(limit=10, include_archived=True)) == 4
+        assert ledger.vacuum(full=True) >= 0
+        ledger.close()
+        assert not any(t.name == "vibe-ledger-maintenance" for t in threading.enumerate())
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
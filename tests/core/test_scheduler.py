@@ -6,7 +6,7 @@ Tests the minimal FIFO scheduler implementation.
 
 import pytest
 
-from vibe_core.scheduling import Task, VibeScheduler
+from vibe_core.scheduling import PriorityScheduler, Task, VibeScheduler
 
 
 class TestTask:
@@ -152,6 +152,16 @@ class TestVibeScheduler:
         status = scheduler.get_queue_status()
         assert status["pending_tasks"] == 0
 
+    def test_next_task_skips_excluded_agents(self):
+        """Test that excluded agents' tasks are skipped and keep FIFO order."""
+        scheduler = VibeScheduler()
+        for task_id, agent_id in [("a1", "agent-a"), ("a2", "agent-a"), ("b1", "agent-b")]:
+            scheduler.submit_task(Task(id=task_id, agent_id=agent_id, payload={}))
+
+        assert scheduler.next_task(exclude_agents={"agent-a"}).id == "b1"
+        assert scheduler.next_task(exclude_agents={"agent-a"}) is None
+        assert [scheduler.next_task().id for _ in range(2)] == ["a1", "a2"]
+
     def test_multiple_agents_can_submit_tasks(self):
         """Test that multiple agents can submit tasks to the same scheduler."""
         scheduler = VibeScheduler()
@@ -199,5 +209,91 @@ class TestVibeScheduler:
         assert scheduler.next_task().payload == 42
 
 
+class FakeClock:
+    """Manually advanced clock for deterministic aging tests."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestPriorityScheduler:
+    """Tests for the PriorityScheduler (heap + aging + agent fairness)."""
+
+    def test_higher_priority_runs_first(self):
+        """Test that tasks are served by priority, FIFO within a priority."""
+        scheduler = PriorityScheduler(clock=FakeClock())
+        scheduler.submit_task(Task(id="low", agent_id="agent-1", payload={}, priority=0))
+        scheduler.submit_task(Task(id="high", agent_id="agent-1", payload={}, priority=5))
+        scheduler.submit_task(Task(id="high-2", agent_id="agent-1", payload={}, priority=5))
+
+        assert scheduler.next_task().id == "high"
+        assert scheduler.next_task().id == "high-2"
+        assert scheduler.next_task().id == "low"
+        assert scheduler.next_task() is None
+
+    def test_round_robin_between_agents(self):
+        """Test that a chatty agent cannot starve other agents at the same priority."""
+        scheduler = PriorityScheduler(clock=FakeClock())
+        for i in range(3):
+            scheduler.submit_task(Task(id=f"A{i}", agent_id="agent-A", payload={}))
+        scheduler.submit_task(Task(id="B0", agent_id="agent-B", payload={}))
+        scheduler.submit_task(Task(id="C0", agent_id="agent-C", payload={}))
+
+        order = [scheduler.next_task().id for _ in range(5)]
+        assert order == ["A0", "B0", "C0", "A1", "A2"]
+
+    def test_aging_prevents_starvation(self):
+        """Test that a waiting low-priority task eventually beats fresh high-priority work."""
+        clock = FakeClock()
+        scheduler = PriorityScheduler(aging_interval=1.0, clock=clock)
+        scheduler.submit_task(Task(id="old-low", agent_id="agent-1", payload={}, priority=0))
+
+        clock.now = 10.0
+        scheduler.submit_task(Task(id="new-high", agent_id="agent-2", payload={}, priority=5))
+
+        # old-low has waited 10 intervals -> effective priority 10 > 5
+        assert scheduler.next_task().id == "old-low"
+        assert scheduler.next_task().id == "new-high"
+
+    def test_queue_status_reports_depths(self):
+        """Test per-priority and per-agent depth reporting."""
+        scheduler = PriorityScheduler(clock=FakeClock())
+        scheduler.submit_task(Task(agent_id="agent-A", payload={}, priority=1))
+        scheduler.submit_task(Task(agent_id="agent-A", payload={}, priority=3))
+        scheduler.submit_task(Task(agent_id="agent-B", payload={}, priority=3))
+
+        status = scheduler.get_queue_status()
+        assert status["pending_tasks"] == 3
+        assert status["queue_type"] == "PRIORITY"
+        assert status["by_priority"] == {3: 2, 1: 1}
+        assert status["by_agent"] == {"agent-A": 2, "agent-B": 1}
+
+        while scheduler.next_task():
+            pass
+        status = scheduler.get_queue_status()
+        assert status["pending_tasks"] == 0
+        assert status["by_priority"] == {}
+        assert status["by_agent"] == {}
+
+    def test_excluded_agents_stay_queued(self):
+        """Test that excluded agents are skipped without losing their place."""
+        scheduler = PriorityScheduler(clock=FakeClock())
+        scheduler.submit_task(Task(id="busy-high", agent_id="busy", payload={}, priority=5))
+        scheduler.submit_task(Task(id="idle-low", agent_id="idle", payload={}, priority=0))
+
+        assert scheduler.next_task(exclude_agents={"busy"}).id == "idle-low"
+        assert scheduler.next_task(exclude_agents={"busy"}) is None
+        assert scheduler.get_queue_status()["by_agent"] == {"busy": 1}
+        assert scheduler.next_task().id == "busy-high"
+
+    def test_invalid_aging_interval(self):
+        """Test that a non-positive aging interval is rejected."""
+        with pytest.raises(ValueError):
+            PriorityScheduler(aging_interval=0)
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -309,7 +309,7 @@ class TestFullStackObservability:
         kernel.tick()  # Process blocked task
 
         # Get history
-        history = kernel.ledger.get_history(limit=10)
+        history = kernel.ledger.get_history(limit=10, include_output=True)
 
         # Assertions
         assert len(history) >= 2, "Should have at least 2 records"
@@ -383,7 +383,9 @@ class TestFullStackRobustness:
             kernel.tick()
 
         # All tasks should complete (no crashes)
-        history = kernel.ledger.get_history(limit=10, agent_id="resilient-agent")
+        history = kernel.ledger.get_history(
+            limit=10, agent_id="resilient-agent", include_output=True
+        )
         assert len(history) == len(dangerous_paths), "All tasks should be recorded"
 
         # All should be COMPLETED (agent survived)
@@ -233,7 +233,7 @@ def test_hybrid_agent_integration_llm_then_specialist():
         # VERIFICATION: Ledger contains both executions in sequence
         # ====================================================================
 
-        history = kernel.ledger.get_history(limit=10)
+        history = kernel.ledger.get_history(limit=10, include_output=True)
 
         # Should have 2 executions: LLM first, then Specialist
         assert len(history) == 2, "Ledger should contain both agent executions"
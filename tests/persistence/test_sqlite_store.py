@@ -22,11 +22,14 @@ Test Strategy:
 - TODO: Add tests for new tables (session_narrative, artifacts, etc.) in Part 2
 """
 
+import gc
 import os
 import sqlite3
 import tempfile
 import threading
 
+import pytest
+
 from vibe_core.store.sqlite_store import SQLiteStore
 
 
@@ -476,6 +479,285 @@ class TestThreadSafety:
             store.close()
 
 
+class TestConnectionPool:
+    """Test per-thread connections and unit-of-work transactions"""
+
+    def test_file_store_uses_one_connection_per_thread(self):
+        """Test that each thread gets its own connection for file databases"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            store = SQLiteStore(os.path.join(tmpdir, "pool.db"))
+            main_conn = store.conn
+            assert store.conn is main_conn  # Stable within a thread
+
+            other = []
+            thread = threading.Thread(target=lambda: other.append(store.conn))
+            thread.start()
+            thread.join()
+
+            assert other[0] is not main_conn
+            assert store.conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+            store.close()
+            assert store.conn is None
+
+    def test_connections_are_closed_when_threads_exit(self):
+        """Test that thread churn does not accumulate pooled connections"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            store = SQLiteStore(os.path.join(tmpdir, "pool.db"))
+            main_conn = store.conn
+            leaked = []
+
+            for _ in range(20):
+                thread = threading.Thread(target=lambda: leaked.append(store.conn))
+                thread.start()
+                thread.join()
+            gc.collect()
+
+            assert store._connections == [main_conn]
+            with pytest.raises(sqlite3.ProgrammingError):
+                leaked[0].execute("SELECT 1")  # Closed on thread exit
+            store.close()
+
+    def test_memory_store_shares_single_connection(self):
+        """Test that :memory: stores keep one shared connection"""
+        store = SQLiteStore(":memory:")
+        other = []
+        thread = threading.Thread(target=lambda: other.append(store.conn))
+        thread.start()
+        thread.join()
+        assert other[0] is store.conn
+        store.close()
+
+    def test_reader_sees_committed_writes_from_other_thread(self):
+        """Test that a write committed on one connection is visible to another thread"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            store = SQLiteStore(os.path.join(tmpdir, "pool.db"))
+            mission_id = store.create_mission("test-pool-001", "PLANNING", "pending")
+
+            seen = []
+            thread = threading.Thread(target=lambda: seen.append(store.get_mission(mission_id)))
+            thread.start()
+            thread.join()
+            assert seen[0]["mission_uuid"] == "test-pool-001"
+            store.close()
+
+    def test_transaction_commits_once_at_exit(self):
+        """Test that writes inside transaction() are invisible to others until exit"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db_path = os.path.join(tmpdir, "uow.db")
+            store = SQLiteStore(db_path)
+            mission_id = store.create_mission("test-uow-001", "PLANNING", "pending")
+
+            def count_calls():
+                conn = sqlite3.connect(db_path)
+                try:
+                    return conn.execute("SELECT COUNT(*) FROM tool_calls").fetchone()[0]
+                finally:
+                    conn.close()
+
+            with store.transaction():
+                for i in range(5):
+                    store.log_tool_call(
+                        mission_id, "Read", {"i": i}, {}, "2025-01-01T00:00:00Z", 1, True
+                    )
+                assert count_calls() == 0  # Not committed yet
+
+            assert count_calls() == 5
+            store.close()
+
+    def test_transaction_rolls_back_on_error(self):
+        """Test that an exception inside transaction() discards all its writes"""
+        store = SQLiteStore(":memory:")
+        mission_id = store.create_mission("test-uow-002", "PLANNING", "pending")
+
+        try:
+            with store.transaction():
+                store.record_decision(mission_id, "test", "why", "2025-01-01T00:00:00Z", "agent")
+                with store.transaction():  # Nested blocks join the outer one
+                    store.set_memory(mission_id, "key", {"v": 1}, "2025-01-01T00:00:00Z")
+                raise RuntimeError("abort")
+        except RuntimeError:
+            pass
+
+        assert store.get_decisions_for_mission(mission_id) == []
+        assert store.get_memory(mission_id, "key") is None
+        store.close()
+
+    def test_concurrent_writers_do_not_lock_out(self):
+        """Test that pooled writers on many threads all succeed"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            store = SQLiteStore(os.path.join(tmpdir, "writers.db"))
+            mission_id = store.create_mission("test-writers", "PLANNING", "pending")
+            errors = []
+
+            def write_batch(worker):
+                try:
+                    with store.transaction():
+                        for i in range(20):
+                            store.set_memory(
+                                mission_id, f"w{worker}-{i}", {"i": i}, "2025-01-01T00:00:00Z"
+                            )
+                except Exception as e:
+                    errors.append(e)
+
+            threads = [threading.Thread(target=write_batch, args=(w,)) for w in range(8)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+            assert errors == []
+            assert store.get_memory(mission_id, "w7-19")["value"] == {"i": 19}
+            store.close()
+
+
+class TestBulkIngestion:
+    """Test bulk insert APIs used by migrations"""
+
+    @staticmethod
+    def _manifest(project_id, phase="PLANNING", cost=0.0):
+        return {
+            "apiVersion": "agency.os/v1alpha1",
+            "kind": "Project",
+            "metadata": {"projectId": project_id, "name": project_id, "owner": "test@vibe.agency"},
+            "status": {"projectPhase": phase, "lastUpdate": "2025-11-20T00:00:00Z"},
+            "budget": {"max_cost_usd": 100.0, "current_cost_usd": cost},
+        }
+
+    def test_bulk_log_tool_calls_matches_single_insert(self):
+        """Test that bulk-logged tool calls read back like log_tool_call() rows"""
+        store = SQLiteStore(":memory:")
+        mission_id = store.create_mission("test-bulk-001", "CODING", "in_progress")
+        calls = [
+            {
+                "mission_id": mission_id,
+                "tool_name": "Read",
+                "args": {"i": i},
+                "result": {"ok": True} if i % 2 else None,
+                "timestamp": f"2025-01-01T00:00:{i:02d}Z",
+                "duration_ms": i,
+                "success": i != 3,
+                "error_message": "boom" if i == 3 else None,
+            }
+            for i in range(10)
+        ]
+
+        assert store.bulk_log_tool_calls(calls) == 10
+
+        rows = store.get_tool_calls_for_mission(mission_id)
+        assert len(rows) == 10
+        assert rows[3]["success"] == 0
+        assert rows[3]["error_message"] == "boom"
+        assert store.bulk_log_tool_calls([]) == 0
+
+    def test_bulk_add_artifacts_is_atomic(self):
+        """Test that one invalid artifact rolls back the whole batch"""
+        store = SQLiteStore(":memory:")
+        mission_id = store.create_mission("test-bulk-002", "CODING", "in_progress")
+        artifacts = [
+            {
+                "mission_id": mission_id,
+                "artifact_type": "planning",
+                "artifact_name": f"spec-{i}",
+                "created_at": "2025-01-01T00:00:00Z",
+            }
+            for i in range(3)
+        ]
+        artifacts.append({**artifacts[0], "artifact_type": "not-a-type"})
+
+        try:
+            store.bulk_add_artifacts(artifacts)
+            raise AssertionError("CHECK constraint should reject the batch")
+        except sqlite3.IntegrityError:
+            pass
+
+        assert store.get_artifacts(mission_id) == []
+        assert store.bulk_add_artifacts(artifacts[:3]) == 3
+        assert len(store.get_artifacts(mission_id)) == 3
+
+    def test_bulk_import_manifests_upserts(self):
+        """Test that bulk manifest import inserts new and updates existing missions"""
+        store = SQLiteStore(":memory:")
+        existing_id = store.import_project_manifest(self._manifest("proj-a"))
+
+        mission_ids = store.bulk_import_manifests(
+            [self._manifest("proj-a", "CODING", 25.0), self._manifest("proj-b")]
+        )
+
+        assert mission_ids["proj-a"] == existing_id
+        assert len(store.get_mission_history()) == 2
+        updated = store.get_mission(existing_id)
+        assert updated["phase"] == "CODING"
+        assert updated["current_cost_usd"] == 25.0
+        assert store.get_mission(mission_ids["proj-b"])["mission_uuid"] == "proj-b"
+
+    def test_large_batch_rebuilds_deferred_indexes(self, monkeypatch):
+        """Test that indexes dropped for a large batch exist again afterwards"""
+        from vibe_core.store import sqlite_store
+
+        monkeypatch.setattr(sqlite_store, "BULK_INDEX_DEFER_THRESHOLD", 5)
+        store = SQLiteStore(":memory:")
+        mission_id = store.create_mission("test-bulk-003", "CODING", "in_progress")
+
+        def indexes():
+            return {
+                row[0]
+                for row in store.conn.execute(
+                    "SELECT name FROM sqlite_master WHERE type = 'index' AND tbl_name = 'tool_calls'"
+                )
+            }
+
+        before = indexes()
+        calls = [
+            {
+                "mission_id": mission_id,
+                "tool_name": "Grep",
+                "args": {},
+                "result": None,
+                "timestamp": "2025-01-01T00:00:00Z",
+                "duration_ms": 1,
+                "success": True,
+            }
+            for _ in range(20)
+        ]
+        assert store.bulk_log_tool_calls(calls) == 20
+        assert indexes() == before
+        assert len(store.get_tool_calls_for_mission(mission_id)) == 20
+
+    def test_indexes_are_kept_when_table_outgrows_batch(self, monkeypatch):
+        """Test that indexes are only deferred while the table is smaller than the batch"""
+        from vibe_core.store import sqlite_store
+
+        monkeypatch.setattr(sqlite_store, "BULK_INDEX_DEFER_THRESHOLD", 5)
+        store = SQLiteStore(":memory:")
+        mission_id = store.create_mission("test-bulk-004", "CODING", "in_progress")
+        deferred = []
+        original = SQLiteStore._deferred_indexes
+
+        def spy(self, table):
+            deferred.append(table)
+            return original(self, table)
+
+        monkeypatch.setattr(SQLiteStore, "_deferred_indexes", spy)
+        calls = [
+            {
+                "mission_id": mission_id,
+                "tool_name": "Grep",
+                "args": {},
+                "result": None,
+                "timestamp": "2025-01-01T00:00:00Z",
+                "duration_ms": 1,
+                "success": True,
+            }
+            for _ in range(10)
+        ]
+
+        store.bulk_log_tool_calls(calls)  # Empty table: indexes deferred
+        store.bulk_log_tool_calls(calls)  # 10 existing rows: updated incrementally
+
+        assert deferred == ["tool_calls"]
+        assert len(store.get_tool_calls_for_mission(mission_id)) == 20
+
+
 class TestAgentMemory:
     """Test agent memory persistence"""
 
@@ -535,6 +817,24 @@ class TestPlaybookRuns:
         assert run["success"] == 1
         assert run["metrics"]["tool_count"] == 5
 
+    def test_playbook_node_results_are_upserted(self):
+        """Test checkpointing node results (latest result per node wins)"""
+        store = SQLiteStore(":memory:")
+        mission_id = store.create_mission("test-001", "PLANNING", "pending")
+        run_id = store.create_playbook_run(mission_id, "plan", "PLANNING", "2025-11-20T00:00:00Z")
+        store.save_playbook_node_result(run_id, "fetch", "h1", "failed", error_message="boom")
+        store.save_playbook_node_result(run_id, "fetch", "h2", "success", output={"pages": 3})
+        store.save_playbook_node_result(run_id, "analyze", "h3", "skipped")
+
+        results = store.get_playbook_node_results(run_id)
+        assert [(r["node_id"], r["status"]) for r in results] == [
+            ("fetch", "success"),
+            ("analyze", "skipped"),
+        ]
+        assert results[0]["input_hash"] == "h2"
+        assert results[0]["output"] == {"pages": 3}
+        assert results[0]["error_message"] is None
+
 
 # ============================================================================
 # INTEGRATION TEST: Full workflow
@@ -0,0 +1,102 @@
+"""
+Tests for capability-based agent lookup (vibe_core/capability_index.py).
+
+Covers the index itself and its use by AgentRouter and AgentRegistry.
+"""
+
+from vibe_core.capability_index import CapabilityIndex
+from vibe_core.playbook.router import AgentRouter
+
+
+class DummyAgent:
+    def __init__(self, name: str, capabilities: list[str]):
+        self.name = name
+        self.agent_id = name
+        self.capabilities = capabilities
+
+
+class FakeKernel:
+    def __init__(self, depths: dict[str, int]):
+        self.depths = depths
+
+    def get_queue_depth(self, agent_id: str) -> int:
+        return self.depths.get(agent_id, 0)
+
+
+class TestCapabilityIndex:
+    def test_find_returns_items_in_registration_order(self):
+        """Test lookup of every item with a capability."""
+        index = CapabilityIndex()
+        index.add("coder", ["coding", "debugging"])
+        index.add("researcher", ["research"])
+        index.add("reviewer", ["debugging", "review"])
+
+        assert index.find("debugging") == ["coder", "reviewer"]
+        assert index.find("unknown") == []
+        assert len(index) == 3
+
+    def test_best_match_scores_overlap(self):
+        """Test that the item with the most required capabilities wins."""
+        index = CapabilityIndex()
+        index.add("partial", ["coding"])
+        index.add("full", ["coding", "testing"])
+
+        assert index.best_match(("coding", "testing")) == "full"
+        assert index.best_match(("coding", "deploy")) == "partial"  # Ties: first registered
+        assert index.best_match(("deploy",)) is None
+        assert index.best_match(()) is None
+
+    def test_load_breaks_ties(self):
+        """Test that the least loaded of equally capable items is chosen."""
+        index = CapabilityIndex()
+        for name in ("a", "b", "c"):
+            index.add(name, ["coding"])
+        load = {"a": 3, "b": 1, "c": 1}.get
+
+        assert index.best_match(("coding",), load=load) == "b"
+
+    def test_cache_is_invalidated_on_add(self):
+        """Test that a newly added item is considered by cached queries."""
+        index = CapabilityIndex()
+        index.add("partial", ["coding"])
+        assert index.best_match(("coding", "testing")) == "partial"
+
+        index.add("full", ["coding", "testing"])
+        assert index.best_match(("coding", "testing")) == "full"
+
+
+class TestAgentRouterIndex:
+    def test_matches_previous_scoring(self):
+        """Test that indexed matching picks the same agent as a full scan."""
+        agents = [
+            DummyAgent("coder", ["coding", "debugging", "python"]),
+            DummyAgent("researcher", ["research", "search"]),
+            DummyAgent("reviewer", ["review", "python"]),
+        ]
+        router = AgentRouter(agents)
+
+        for skills in (["debugging"], ["python"], ["review", "python"], ["research", "coding"]):
+            expected = max(agents, key=lambda a: (router._score(a, skills), -agents.index(a)))
+            assert router.find_best_agent_for_skills(skills) is expected
+        assert router.find_best_agent_for_skills(["quantum_physics"]) is None
+
+    def test_register_updates_index(self):
+        """Test that agents registered later are found."""
+        router = AgentRouter()
+        assert router.find_best_agent_for_skills(["coding"]) is None
+
+        coder = DummyAgent("coder", ["coding"])
+        router.register(coder)
+        router.register(coder)  # Duplicate registration is ignored
+        assert router.find_best_agent_for_skills(["coding"]) is coder
+        assert router.list_agents() == [coder]
+
+    def test_kernel_queue_depth_breaks_ties(self):
+        """Test load-aware selection between equally capable agents."""
+        busy = DummyAgent("busy", ["coding"])
+        idle = DummyAgent("idle", ["coding"])
+        router = AgentRouter([busy, idle])
+        assert router.find_best_agent_for_skills(["coding"]) is busy
+
+        router.set_kernel(FakeKernel({"busy": 4}))
+        assert router.find_best_agent_for_skills(["coding"]) is idle
@@ -0,0 +1,156 @@
+"""
+Tests for the shared git state reader (vibe_core/runtime/git_state.py).
+
+Every scenario is checked against the real git CLI output.
+"""
+
+import subprocess
+
+import pytest
+
+from vibe_core.runtime.git_state import GitState, GitStateError
+
+
+def git(repo, *args) -> list[str]:
+    result = subprocess.run(["git", *args], cwd=repo, check=True, capture_output=True, text=True)
+    return result.stdout.splitlines()
+
+
+@pytest.fixture
+def repo(tmp_path):
+    git(tmp_path, "init", "-q", "-b", "main")
+    git(tmp_path, "config", "user.email", "test@test.com")
+    git(tmp_path, "config", "user.name", "Test")
+    git(tmp_path, "config", "commit.gpgsign", "false")
+
+    (tmp_path / "src" / "pkg").mkdir(parents=True)
+    (tmp_path / "src" / "app.py").write_text("print('app')\n")
+    (tmp_path / "src" / "pkg" / "core.py").write_text("CORE = 1\n")
+    (tmp_path / "notes.txt").write_text("notes\n")
+    (tmp_path / ".gitignore").write_text("build/\n*.log\n!keep.log\n")
+    git(tmp_path, "add", "-A")
+    git(tmp_path, "commit", "-q", "-m", "Initial commit", "-m", "With a body")
+    (tmp_path / "src" / "extra.py").write_text("EXTRA = 2\n")
+    git(tmp_path, "add", "-A")
+    git(tmp_path, "commit", "-q", "-m", "Add extra")
+    return tmp_path
+
+
+def make_changes(repo):
+    git(repo, "mv", "notes.txt", "moved.txt")
+    (repo / "src" / "app.py").write_text("print('changed')\n")
+    (repo / "src" / "pkg" / "core.py").unlink()
+    (repo / "staged.py").write_text("staged\n")
+    git(repo, "add", "staged.py")
+    (repo / "staged.py").write_text("staged and edited\n")
+    (repo / "build").mkdir()
+    (repo / "build" / "out.bin").write_text("ignored")
+    (repo / "debug.log").write_text("ignored")
+    (repo / "keep.log").write_text("negated")
+    (repo / "docs" / "new").mkdir(parents=True)
+    (repo / "docs" / "new" / "guide.md").write_text("untracked dir")
+    (repo / "with space.txt").write_text("quoted")
+    (repo / "ümlaut.txt").write_text("quoted")
+
+
+class TestGitState:
+    def test_branch_and_log_match_git(self, repo):
+        """Test branch and oneline log against git."""
+        state = GitState(repo)
+        assert state.current_branch() == "main"
+        assert state.recent_commits(3) == git(repo, "log", "--oneline", "-3")
+        assert state.head_commit() == git(repo, "rev-parse", "HEAD")[0]
+
+    def test_status_matches_git_porcelain(self, repo):
+        """Test staged, unstaged, ignored and untracked changes."""
+        make_changes(repo)
+        state = GitState(repo / "src")  # Any directory inside the work tree
+        assert state.status() == git(repo, "status", "--porcelain")
+        assert state.short_status().splitlines() == git(repo, "status", "--short", "--branch")
+        assert not state.is_clean()
+
+    def test_clean_repository(self, repo):
+        """Test that a freshly committed tree is clean."""
+        state = GitState(repo)
+        assert state.status() == []
+        assert state.is_clean()
+
+    def test_packed_objects_and_refs(self, repo):
+        """Test reading after git gc moved everything into packs."""
+        git(repo, "gc", "-q")
+        (repo / "src" / "app.py").write_text("print('changed')\n")
+        state = GitState(repo)
+        assert state.recent_commits(5) == git(repo, "log", "--oneline", "-5")
+        assert state.status() == git(repo, "status", "--porcelain")
+
+    def test_cache_follows_new_commits(self, repo):
+        """Test that cached results are refreshed when refs change."""
+        state = GitState(repo)
+        state.recent_commits(3)
+        (repo / "later.py").write_text("later\n")
+        assert state.status() == ["?? later.py"]
+
+        git(repo, "add", "later.py")
+        git(repo, "commit", "-q", "-m", "Add later")
+        assert state.recent_commits(1) == git(repo, "log", "--oneline", "-1")
+        assert state.status() == []
+
+    def test_upstream_ahead(self, repo, tmp_path_factory):
+        """Test the ahead/behind header against a local upstream."""
+        remote = tmp_path_factory.mktemp("remote")
+        git(remote, "init", "-q", "--bare")
+        git(repo, "remote", "add", "origin", str(remote))
+        git(repo, "push", "-q", "-u", "origin", "main")
+        git(repo, "commit", "-q", "--allow-empty", "-m", "Local only")
+
+        state = GitState(repo)
+        assert state.status_header() == "## main...origin/main [ahead 1]"
+        assert state.status_header() == git(repo, "status", "--short", "--branch")[0]
+
+    def test_detached_head(self, repo):
+        """Test that a detached HEAD reports no branch."""
+        git(repo, "checkout", "-q", "--detach")
+        assert GitState(repo).current_branch() == ""
+
+    def test_inexact_rename(self, repo):
+        """Test that similarity renames are reported like git."""
+        git(repo, "mv", "src/extra.py", "src/renamed.py")
+        (repo / "src" / "renamed.py").write_text("EXTRA = 2\nMORE = 3\n")
+        git(repo, "add", "src/renamed.py")
+        assert GitState(repo).status() == git(repo, "status", "--porcelain")
+
+    def test_shared_clone_with_alternates(self, repo, tmp_path_factory):
+        """Test a clone whose objects live in objects/info/alternates."""
+        clone = tmp_path_factory.mktemp("shared") / "clone"
+        subprocess.run(["git", "clone", "-q", "--shared", str(repo), str(clone)], check=True)
+        (clone / "notes.txt").write_text("edited\n")
+
+        state = GitState(clone)
+        assert state.recent_commits(3) == git(clone, "log", "--oneline", "-3")
+        assert state.status() == [" M notes.txt"]
+        assert state.status_header() == "## main...origin/main"
+        assert not state.is_clean()
+
+    def test_unborn_branch(self, tmp_path):
+        """Test that a repository without commits has no log."""
+        git(tmp_path, "init", "-q", "-b", "main")
+        state = GitState(tmp_path)
+        assert state.recent_commits(3) == []
+        assert state.head_commit() is None
+        assert state.status_header() == "## No commits yet on main"
+
+    def test_validate_git_clean(self, repo, tmp_path_factory):
+        """Test that the clean-gate only passes clean trees or non-repositories."""
+        validator_registry = pytest.importorskip("vibe_core.task_management.validator_registry")
+        validate_git_clean = validator_registry.validate_git_clean
+        assert validate_git_clean(repo) is True
+        (repo / "src" / "app.py").write_text("print('changed')\n")
+        assert validate_git_clean(repo) is False
+        assert validate_git_clean(tmp_path_factory.mktemp("plain")) is True
+
+    def test_not_a_repository(self, tmp_path):
+        """Test that queries outside a repository raise GitStateError."""
+        state = GitState(tmp_path)
+        assert state.is_repository is False
+        with pytest.raises(GitStateError):
+            state.current_branch()
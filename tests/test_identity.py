@@ -134,6 +134,17 @@ class TestAgentManifest:
         assert isinstance(capabilities, list)
         assert "process" in capabilities
 
+    def test_max_concurrency_property(self):
+        """Test max_concurrency defaults to 1 and follows the agent attribute."""
+        provider = MockLLMProvider()
+        agent = SimpleLLMAgent(agent_id="test", provider=provider)
+        assert generate_manifest_for_agent(agent).max_concurrency == 1
+
+        agent.max_concurrency = 3
+        manifest = generate_manifest_for_agent(agent)
+        assert manifest.to_dict()["runtime"]["max_concurrency"] == 3
+        assert manifest.max_concurrency == 3
+
     def test_fingerprint(self):
         """Test fingerprint generation."""
         provider = MockLLMProvider()
@@ -108,6 +108,25 @@ class TestFileTreeGeneration:
         assert "__pycache__" not in tree
         assert "node_modules" not in tree
 
+    def test_file_tree_skips_state_and_caches(self, tmp_path):
+        """Test that the snapshot tree leaves out runtime state, databases and caches."""
+        (tmp_path / ".vibe" / "state").mkdir(parents=True)
+        (tmp_path / ".vibe" / "state" / "vibe_agency.db").write_text("")
+        (tmp_path / "cache").mkdir()
+        (tmp_path / "src" / "pkg" / "deep").mkdir(parents=True)
+        (tmp_path / "src" / "ledger.sqlite").write_text("")
+        (tmp_path / "src" / "main.py").write_text("")
+        kernel = VibeKernel(ledger_path=":memory:")
+        introspector = SystemIntrospector(kernel, repo_root=str(tmp_path))
+
+        tree = introspector.get_file_tree()
+
+        assert "main.py" in tree
+        assert "pkg/" in tree
+        assert "deep/" not in tree  # Snapshot tree is depth-limited
+        for name in (".vibe", "vibe_agency.db", "cache/", "ledger.sqlite"):
+            assert name not in tree
+
 
 class TestAgentStatusAggregation:
     """Test 3: Agent status aggregation."""
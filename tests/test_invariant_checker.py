@@ -13,8 +13,30 @@ Test coverage:
 - Edge cases and error handling
 """
 
+import os
+
 from vibe_core.governance import InvariantChecker, SoulResult
 
+SCOPED_SOUL = """
+safety_rules:
+  - id: "protect_git"
+    condition: "path_contains"
+    pattern: ".git"
+    action: "block"
+    message: "No git."
+  - id: "readonly_deploy"
+    condition: "path_contains"
+    pattern: "deploy/"
+    tools: ["write_file"]
+    action: "block"
+    message: "Deploy is read-only."
+  - id: "warn_only"
+    condition: "path_contains"
+    pattern: "docs"
+    action: "warn"
+    message: "Not enforced."
+"""
+
 
 class TestInvariantCheckerInitialization:
     """Test InvariantChecker initialization and rule loading."""
@@ -350,3 +372,80 @@ class TestIntegrationWithToolExecutor:
         assert hasattr(result, "allowed")
         assert hasattr(result, "reason")
         assert isinstance(result.allowed, bool)
+
+
+class TestCompiledRules:
+    """Test per-tool rule buckets, rule order and hot reload of the compiled rules."""
+
+    def test_tool_scoped_rules_only_apply_to_listed_tools(self, tmp_path):
+        """Test that a rule with "tools" only blocks those tools."""
+        soul = tmp_path / "soul.yaml"
+        soul.write_text(SCOPED_SOUL)
+        checker = InvariantChecker(str(soul), root=str(tmp_path))
+
+        blocked = checker.check_tool_call("write_file", {"path": "deploy/app.yaml"})
+        assert blocked.allowed is False
+        assert "readonly_deploy" in blocked.reason
+        assert checker.check_tool_call("read_file", {"path": "deploy/app.yaml"}).allowed
+        assert checker.check_tool_call("read_file", {"path": "docs/index.md"}).allowed
+
+    def test_first_rule_in_file_order_wins(self, tmp_path):
+        """Test that the earliest matching rule is reported, whatever its condition."""
+        checker = InvariantChecker("tests/fixtures/test_soul.yaml", root=str(tmp_path))
+
+        # Matches test_protect_git (1st), sandbox (3rd) and secret (4th)
+        result = checker.check_tool_call("write_file", {"path": "/elsewhere/.git/secret"})
+        assert "test_protect_git" in result.reason
+
+        # Matches sandbox (3rd) and secret (4th)
+        result = checker.check_tool_call("write_file", {"path": "/elsewhere/secret"})
+        assert "test_sandbox_confinement" in result.reason
+
+    def test_explicit_root_confines_paths(self, tmp_path):
+        """Test that a configured root is used instead of the working directory."""
+        checker = InvariantChecker("tests/fixtures/test_soul.yaml", root=str(tmp_path))
+
+        assert checker.check_tool_call("read_file", {"path": str(tmp_path / "a.txt")}).allowed
+        assert not checker.check_tool_call(
+            "read_file", {"path": os.path.abspath("README.md")}
+        ).allowed
+
+    def test_relative_paths_resolve_against_explicit_root(self, tmp_path):
+        """Test that relative paths are taken relative to the configured root, not the cwd."""
+        checker = InvariantChecker("tests/fixtures/test_soul.yaml", root=str(tmp_path))
+
+        assert checker.check_tool_call("read_file", {"path": "src/a.txt"}).allowed
+        assert not checker.check_tool_call("read_file", {"path": "../a.txt"}).allowed
+
+    def test_hot_reload_on_mtime_change(self, tmp_path):
+        """Test that edits to soul.yaml are picked up without calling reload()."""
+        soul = tmp_path / "soul.yaml"
+        soul.write_text("safety_rules: []\n")
+        checker = InvariantChecker(str(soul), reload_interval=0)
+        assert checker.check_tool_call("read_file", {"path": "deploy/app.yaml"}).allowed
+
+        soul.write_text(SCOPED_SOUL)
+        stat = soul.stat()
+        os.utime(soul, (stat.st_atime, stat.st_mtime + 5))
+
+        assert not checker.check_tool_call("write_file", {"path": "deploy/app.yaml"}).allowed
+        assert checker.rule_count == 3
+
+    def test_broken_reload_keeps_previous_rules(self, tmp_path):
+        """Test that invalid YAML on reload keeps the old rules and is retried later."""
+        soul = tmp_path / "soul.yaml"
+        soul.write_text(SCOPED_SOUL)
+        checker = InvariantChecker(str(soul), reload_interval=0)
+
+        soul.write_text("safety_rules: [unclosed\n")
+        stat = soul.stat()
+        os.utime(soul, (stat.st_atime, stat.st_mtime + 5))
+
+        assert not checker.check_tool_call("write_file", {"path": "deploy/app.yaml"}).allowed
+        assert checker.rule_count == 3
+
+        soul.write_text("safety_rules: []\n")
+        os.utime(soul, (stat.st_atime, stat.st_mtime + 10))
+
+        assert checker.check_tool_call("write_file", {"path": "deploy/app.yaml"}).allowed
+        assert checker.rule_count == 0
@@ -9,7 +9,7 @@ This test suite validates:
 """
 
 import sys
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 import pytest
 
@@ -378,3 +378,20 @@ class TestEndToEndWorkflow:
         kernel_result = kernel.get_task_result(task_id)
         assert result.output["task_id"] == kernel_result["task_id"]
         assert result.output["status"] == kernel_result["status"]
+
+    def test_tool_answers_finished_task_from_handle(self):
+        """Test that a recently finished task is answered without a ledger query."""
+        kernel = VibeKernel(":memory:")
+        provider = MockLLMProvider(mock_response="Result data")
+        kernel.register_agent(SimpleLLMAgent(agent_id="test-agent", provider=provider))
+        kernel.boot()
+
+        task_id = kernel.submit(Task(agent_id="test-agent", payload={"user_message": "Work"}))
+        kernel.tick()
+
+        tool = InspectResultTool(kernel)
+        with patch.object(kernel.ledger, "get_task", side_effect=AssertionError("ledger hit")):
+            result = tool.execute({"task_id": task_id})
+
+        assert result.output["status"] == "COMPLETED"
+        assert result.output["output"] == kernel.get_task_output(task_id)
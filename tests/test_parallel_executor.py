@@ -0,0 +1,312 @@
+"""
+Tests for workflow execution in GraphExecutor (vibe_core/playbook/executor.py).
+
+Covers parallel scheduling and checkpointed (resumable) runs.
+"""
+
+import threading
+import time
+
+import pytest
+
+from vibe_core.playbook.executor import (
+    ExecutionResult,
+    ExecutionStatus,
+    GraphExecutor,
+    WorkflowEdge,
+    WorkflowGraph,
+    WorkflowNode,
+)
+from vibe_core.runtime.quota_manager import OperationalQuota, QuotaLimits
+from vibe_core.store.sqlite_store import SQLiteStore
+
+
+def make_graph(nodes, edges, entry_point, exit_points, **node_kwargs):
+    return WorkflowGraph(
+        id="wf",
+        name="Workflow",
+        intent="Test parallel execution",
+        nodes={n: WorkflowNode(id=n, action=n, **node_kwargs) for n in nodes},
+        edges=[WorkflowEdge(*edge) for edge in edges],
+        entry_point=entry_point,
+        exit_points=exit_points,
+    )
+
+
+class ScriptedExecutor(GraphExecutor):
+    """Executor whose steps sleep and fail according to a script."""
+
+    def __init__(self, delay=0.0, fail=(), fail_times=None, **kwargs):
+        super().__init__(**kwargs)
+        self.delay = delay
+        self.fail = set(fail)
+        self.fail_times = dict(fail_times or {})
+        self.calls = []
+        self._lock = threading.Lock()
+
+    def execute_step(self, graph, node_id, context=None):
+        with self._lock:
+            self.calls.append(node_id)
+            failing = node_id in self.fail or self.fail_times.get(node_id, 0) > 0
+            if self.fail_times.get(node_id, 0) > 0:
+                self.fail_times[node_id] -= 1
+        time.sleep(self.delay.get(node_id, 0.0) if isinstance(self.delay, dict) else self.delay)
+        if failing:
+            raise RuntimeError(f"{node_id} broke")
+        result = ExecutionResult(graph.id, node_id, ExecutionStatus.SUCCESS, output=node_id)
+        self.execution_history.append(result)
+        return result
+
+
+def statuses(result):
+    return {r["node_id"]: r["status"] for r in result["results"]}
+
+
+class TestParallelExecution:
+    def test_independent_nodes_run_concurrently(self):
+        """Test that a wide workflow finishes in critical-path time."""
+        branches = [f"research_{i}" for i in range(6)]
+        graph = make_graph(
+            ["start", *branches, "merge"],
+            [("start", b) for b in branches] + [(b, "merge") for b in branches],
+            "start",
+            ["merge"],
+        )
+        executor = ScriptedExecutor(delay=0.2)
+
+        started = time.monotonic()
+        result = executor.execute(graph)
+        elapsed = time.monotonic() - started
+
+        assert result["status"] == "success"
+        assert elapsed < 1.0  # Sequential would take 8 * 0.2s
+        assert executor.calls[0] == "start"
+        assert executor.calls[-1] == "merge"
+        assert result["execution_order"] == ["start", *branches, "merge"]
+
+    def test_max_workers_bounds_concurrency(self):
+        """Test that max_workers=1 runs nodes one at a time."""
+        graph = make_graph(["a", "b", "c"], [], "a", ["c"])
+        executor = ScriptedExecutor(delay=0.1, max_workers=1)
+
+        started = time.monotonic()
+        executor.execute(graph)
+        assert time.monotonic() - started >= 0.3
+
+    def test_failure_skips_downstream_nodes(self):
+        """Test that dependents of a failed node are skipped, independent ones still run."""
+        graph = make_graph(
+            ["start", "a", "a_next", "b"],
+            [("start", "a"), ("a", "a_next"), ("start", "b")],
+            "start",
+            ["a_next", "b"],
+            retries=0,
+        )
+        executor = ScriptedExecutor(fail={"a"})
+        result = executor.execute(graph)
+
+        assert result["status"] == "failed"
+        assert result["error"] == "Nodes failed: a"
+        assert statuses(result) == {
+            "start": "success",
+            "a": "failed",
+            "a_next": "skipped",
+            "b": "success",
+        }
+        assert "a_next" not in executor.calls
+
+    def test_edge_conditions(self):
+        """Test failure and always edges."""
+        graph = make_graph(
+            ["deploy", "rollback", "announce", "cleanup"],
+            [
+                ("deploy", "rollback", "failure"),
+                ("deploy", "announce", "success"),
+                ("deploy", "cleanup", "always"),
+            ],
+            "deploy",
+            ["cleanup"],
+            retries=0,
+        )
+        result = ScriptedExecutor(fail={"deploy"}).execute(graph)
+
+        assert result["status"] == "success"  # Failure handled by the rollback edge
+        assert statuses(result) == {
+            "deploy": "failed",
+            "rollback": "success",
+            "announce": "skipped",
+            "cleanup": "success",
+        }
+
+    def test_retries(self):
+        """Test that a failing node is retried up to node.retries times."""
+        graph = make_graph(["flaky"], [], "flaky", ["flaky"], retries=2)
+
+        executor = ScriptedExecutor(fail_times={"flaky": 2})
+        assert executor.execute(graph)["status"] == "success"
+        assert executor.calls == ["flaky"] * 3
+
+        executor = ScriptedExecutor(fail_times={"flaky": 3})
+        assert executor.execute(graph)["status"] == "failed"
+        assert executor.calls == ["flaky"] * 3
+
+    def test_timeout(self):
+        """Test that a node exceeding timeout_seconds fails without blocking the run."""
+        graph = make_graph(
+            ["slow", "after"],
+            [("slow", "after")],
+            "slow",
+            ["after"],
+            timeout_seconds=0.1,
+            retries=0,
+        )
+        executor = ScriptedExecutor(delay={"slow": 1.0})
+
+        started = time.monotonic()
+        result = executor.execute(graph)
+
+        assert time.monotonic() - started < 0.8
+        assert statuses(result) == {"slow": "failed", "after": "skipped"}
+        assert result["results"][0]["error"] == "Timed out after 0.1s"
+
+    def test_timeout_counts_from_start_not_submission(self):
+        """Test that nodes queued behind busy workers are not charged for the wait."""
+        graph = make_graph(
+            [f"n{i}" for i in range(6)], [], "n0", ["n5"], timeout_seconds=0.5, retries=0
+        )
+        executor = ScriptedExecutor(delay=0.3, max_workers=2)
+
+        result = executor.execute(graph)
+
+        assert result["status"] == "success"
+        assert sorted(executor.calls) == [f"n{i}" for i in range(6)]
+
+    def test_timed_out_attempt_is_not_overlapped_by_its_retry(self):
+        """Test that a retry only starts once the abandoned attempt has returned."""
+        graph = make_graph(["slow"], [], "slow", ["slow"], timeout_seconds=0.1, retries=1)
+        active = []
+        overlaps = []
+
+        class TrackingExecutor(ScriptedExecutor):
+            def execute_step(self, graph, node_id, context=None):
+                with self._lock:
+                    overlaps.append(len(active))
+                    active.append(node_id)
+                try:
+                    return super().execute_step(graph, node_id, context)
+                finally:
+                    with self._lock:
+                        active.remove(node_id)
+
+        executor = TrackingExecutor(delay=0.3)
+        result = executor.execute(graph)
+
+        assert statuses(result) == {"slow": "failed"}
+        assert executor.calls == ["slow", "slow"]
+        assert overlaps == [0, 0]
+
+    def test_default_steps_run_in_mock_mode(self):
+        """Test that execute() runs nodes through execute_step()."""
+        graph = make_graph(["step1", "step2"], [("step1", "step2")], "step1", ["step2"])
+        executor = GraphExecutor()
+        result = executor.execute(graph, context="shared")
+
+        assert result["status"] == "success"
+        assert result["results"][0]["output"]["context"] == "shared"
+        assert [r.node_id for r in executor.get_execution_history()] == ["step1", "step2"]
+
+    def test_quota_is_charged_by_prompt_size(self):
+        """Test that steps reserve quota for the composed prompt, not a flat amount."""
+        graph = make_graph(["a", "b"], [], "a", ["b"])
+        quota = OperationalQuota(limits=QuotaLimits(tokens_per_minute=1000))
+        executor = GraphExecutor()
+        executor.set_quota_manager(quota)
+
+        result = executor.execute(graph, context="x" * 400)
+
+        assert result["status"] == "success"
+        status = quota.get_status()
+        assert status["totals"]["total_requests"] == 2
+        assert status["tokens"]["this_minute"] == 200
+
+
+class TestCheckpointedRuns:
+    @pytest.fixture
+    def store(self):
+        store = SQLiteStore(":memory:")
+        yield store
+        store.close()
+
+    def pipeline(self, description="Fetch sources"):
+        graph = make_graph(
+            ["fetch", "analyze", "report"],
+            [("fetch", "analyze"), ("analyze", "report")],
+            "fetch",
+            ["report"],
+            retries=0,
+        )
+        graph.nodes["fetch"].description = description
+        return graph
+
+    def test_run_is_checkpointed(self, store):
+        """Test that every node result is stored with the playbook run."""
+        mission_id = store.create_mission("m-1", "CODING", "in_progress")
+        executor = ScriptedExecutor()
+        executor.set_store(store, mission_id)
+
+        result = executor.execute(self.pipeline())
+
+        run = store.get_playbook_run(result["run_id"])
+        assert run["success"] == 1
+        assert run["phase"] == "CODING"
+        assert run["metrics"]["executed"] == 3
+        checkpoints = store.get_playbook_node_results(result["run_id"])
+        assert [(c["node_id"], c["status"], c["output"]) for c in checkpoints] == [
+            ("fetch", "success", "fetch"),
+            ("analyze", "success", "analyze"),
+            ("report", "success", "report"),
+        ]
+
+    def test_resume_skips_finished_nodes(self, store):
+        """Test that resuming re-runs only the nodes that did not succeed."""
+        mission_id = store.create_mission("m-1", "CODING", "in_progress")
+        crashed = ScriptedExecutor(fail={"analyze"})
+        crashed.set_store(store, mission_id)
+        first = crashed.execute(self.pipeline())
+        assert first["status"] == "failed"
+
+        executor = ScriptedExecutor()
+        executor.set_store(store, mission_id)
+        result = executor.execute(self.pipeline(), resume_run_id=first["run_id"])
+
+        assert result["status"] == "success"
+        assert result["run_id"] == first["run_id"]
+        assert result["resumed_nodes"] == ["fetch"]
+        assert executor.calls == ["analyze", "report"]
+        assert store.get_playbook_run(first["run_id"])["success"] == 1
+
+    def test_changed_inputs_are_re_executed(self, store):
+        """Test that a changed node and everything below it runs again."""
+        mission_id = store.create_mission("m-1", "CODING", "in_progress")
+        executor = ScriptedExecutor()
+        executor.set_store(store, mission_id)
+        run_id = executor.execute(self.pipeline())["run_id"]
+
+        executor.calls.clear()
+        executor.execute(self.pipeline(), resume_run_id=run_id)
+        assert executor.calls == []
+
+        executor.execute(self.pipeline("Fetch more sources"), resume_run_id=run_id)
+        assert executor.calls == ["fetch", "analyze", "report"]
+
+    def test_resume_requires_matching_run(self, store):
+        """Test that resume_run_id must name a run of the same workflow."""
+        with pytest.raises(ValueError):
+            GraphExecutor().execute(self.pipeline(), resume_run_id=1)
+
+        mission_id = store.create_mission("m-1", "CODING", "in_progress")
+        run_id = store.create_playbook_run(mission_id, "other", "CODING", "2025-11-20T00:00:00Z")
+        executor = GraphExecutor()
+        executor.set_store(store, mission_id)
+        with pytest.raises(ValueError):
+            executor.execute(self.pipeline(), resume_run_id=run_id)
@@ -0,0 +1,108 @@
+"""
+Tests for prompt composition caching (vibe_core/runtime/prompt_cache.py).
+"""
+
+import os
+
+import pytest
+
+from vibe_core.runtime.prompt_cache import CompositionCache, FileCache
+from vibe_core.runtime.prompt_registry import PromptRegistry
+
+
+def touch(path, content):
+    """Rewrite a file and move its mtime forward (coarse-mtime filesystems)."""
+    path.write_text(content)
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+class TestFileCache:
+    def test_reuses_unchanged_files(self, tmp_path):
+        """Test that a second read is served from cache."""
+        spec = tmp_path / "spec.yaml"
+        spec.write_text("name: auditor\n")
+        files = FileCache()
+
+        assert files.read_yaml(spec) == {"name": "auditor"}
+        assert files.read_yaml(spec) is files.read_yaml(spec)  # Parsed once
+        assert files.get_stats() == {"hits": 2, "misses": 1, "cached": 1}
+
+    def test_rereads_changed_files(self, tmp_path):
+        """Test that a modified file is re-read."""
+        prompt = tmp_path / "prompt.md"
+        prompt.write_text("v1")
+        files = FileCache()
+        assert files.read_text(prompt) == "v1"
+
+        touch(prompt, "v2")
+        assert files.read_text(prompt) == "v2"
+
+    def test_missing_file(self, tmp_path):
+        """Test that missing files raise FileNotFoundError."""
+        with pytest.raises(FileNotFoundError):
+            FileCache().read_text(tmp_path / "missing.md")
+
+
+class TestCompositionCache:
+    def test_hit_until_dependency_changes(self, tmp_path):
+        """Test that a prompt is invalidated when one of its files changes."""
+        fragment = tmp_path / "fragment.md"
+        fragment.write_text("core")
+        files = FileCache()
+        cache = CompositionCache()
+
+        with cache.track() as deps:
+            prompt = files.read_text(fragment) + " prompt"
+        cache.put(("AUDITOR", "task"), prompt, deps, 0.01, {"_resolved": "x"})
+        assert cache.get(("AUDITOR", "task")) == ("core prompt", {"_resolved": "x"})
+
+        touch(fragment, "changed")
+        assert cache.get(("AUDITOR", "task")) is None
+        stats = cache.get_stats()
+        assert (stats["hits"], stats["misses"], stats["stale"]) == (1, 1, 1)
+        assert stats["hit_rate"] == 0.5
+
+    def test_tracks_missing_files(self, tmp_path):
+        """Test that a prompt is invalidated when a checked-for file appears."""
+        files = FileCache()
+        cache = CompositionCache()
+        override = tmp_path / "task_override.md"
+
+        with cache.track() as deps:
+            prompt = "override" if files.exists(override) else "default"
+        cache.put(("key",), prompt, deps, 0.01)
+
+        override.write_text("override")
+        assert cache.get(("key",)) is None
+
+    def test_lru_eviction(self):
+        """Test that the least recently used prompt is evicted."""
+        cache = CompositionCache(max_entries=2)
+        for key in ("a", "b", "c"):
+            cache.put((key,), key, {}, 0.0)
+        assert cache.get(("a",)) is None
+        assert cache.get(("c",)) == ("c", {})
+
+
+class TestPromptRegistryCache:
+    def test_repeated_compose_is_cached(self):
+        """Test that identical compose() calls reuse the composed prompt."""
+        PromptRegistry.clear_cache()
+        kwargs = {"agent": "AUDITOR", "task": None, "workspace": "ROOT"}
+
+        first = PromptRegistry.compose(**kwargs, context={"project_id": "p-1"})
+        context = {"project_id": "p-1"}
+        second = PromptRegistry.compose(**kwargs, context=context)
+
+        assert first == second
+        assert context["_registry_workspace"] == "ROOT"  # Side effects replayed on a hit
+        assert PromptRegistry.get_cache_stats()["hits"] >= 1
+
+    def test_context_is_part_of_the_key(self):
+        """Test that a different context composes a different prompt."""
+        kwargs = {"agent": "AUDITOR", "task": None, "workspace": "ROOT"}
+        first = PromptRegistry.compose(**kwargs, context={"project_id": "p-1"})
+        second = PromptRegistry.compose(**kwargs, context={"project_id": "p-2"})
+        assert "p-1" in first
+        assert "p-2" in second
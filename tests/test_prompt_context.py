@@ -0,0 +1,115 @@
+"""
+Tests for PromptContext resolver caching (GAD-909).
+"""
+
+import threading
+import time
+
+from vibe_core.runtime.prompt_context import PromptContext, ResolverPolicy
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def counting_resolver(value: str = "value"):
+    calls = []
+
+    def resolver() -> str:
+        calls.append(1)
+        return f"{value}-{len(calls)}"
+
+    return resolver, calls
+
+
+class TestResolverCache:
+    def test_uncached_resolver_runs_every_time(self, tmp_path):
+        """Resolvers without a ttl are resolved on every call."""
+        context = PromptContext(vibe_root=tmp_path)
+        resolver, calls = counting_resolver()
+        context.register("live", resolver)
+
+        context.resolve(["live"])
+        context.resolve(["live"])
+
+        assert len(calls) == 2
+
+    def test_ttl_expiry(self, tmp_path):
+        """Cached values are reused until the ttl expires."""
+        clock = FakeClock()
+        context = PromptContext(vibe_root=tmp_path, clock=clock)
+        resolver, calls = counting_resolver()
+        context.register("slow", resolver, ResolverPolicy(ttl=10.0))
+
+        assert context.resolve(["slow"]) == {"slow": "value-1"}
+        clock.now = 9.0
+        assert context.resolve(["slow"]) == {"slow": "value-1"}
+        clock.now = 11.0
+        assert context.resolve(["slow"]) == {"slow": "value-2"}
+        assert context.get_cache_stats()["hits"] == 1
+
+    def test_watched_file_change_invalidates(self, tmp_path):
+        """A change to a watched file invalidates the cached value."""
+        backlog = tmp_path / "BACKLOG.md"
+        backlog.write_text("one")
+        context = PromptContext(vibe_root=tmp_path)
+        resolver, calls = counting_resolver()
+        context.register("agenda", resolver, ResolverPolicy(ttl=3600.0, watch=("BACKLOG.md",)))
+
+        context.resolve(["agenda"])
+        context.resolve(["agenda"])
+        backlog.write_text("one two")
+        context.resolve(["agenda"])
+
+        assert len(calls) == 2
+
+    def test_invalidate(self, tmp_path):
+        """invalidate() forces the next resolve to call the resolver."""
+        context = PromptContext(vibe_root=tmp_path)
+        resolver, calls = counting_resolver()
+        context.register("cached", resolver, ResolverPolicy(ttl=3600.0))
+
+        context.resolve(["cached"])
+        context.invalidate("cached")
+        context.resolve(["cached"])
+
+        assert len(calls) == 2
+
+    def test_misses_resolve_concurrently(self, tmp_path):
+        """Independent keys that miss the cache are resolved in parallel."""
+        context = PromptContext(vibe_root=tmp_path)
+        barrier = threading.Barrier(3, timeout=2)
+
+        def waiting_resolver() -> str:
+            barrier.wait()  # Only passes if all three run at the same time
+            return "ok"
+
+        for key in ("a", "b", "c"):
+            context.register(key, waiting_resolver)
+
+        start = time.perf_counter()
+        result = context.resolve(["c", "a", "b"])
+
+        assert list(result) == ["c", "a", "b"]
+        assert set(result.values()) == {"ok"}
+        assert time.perf_counter() - start < 2
+
+    def test_errors_are_not_cached(self, tmp_path):
+        """A failing resolver is retried on the next call."""
+        context = PromptContext(vibe_root=tmp_path)
+        attempts = []
+
+        def flaky() -> str:
+            attempts.append(1)
+            if len(attempts) == 1:
+                raise RuntimeError("boom")
+            return "recovered"
+
+        context.register("flaky", flaky, ResolverPolicy(ttl=3600.0))
+
+        assert context.resolve(["flaky"])["flaky"].startswith("[Error resolving flaky")
+        assert context.resolve(["flaky"]) == {"flaky": "recovered"}
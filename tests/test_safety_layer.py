@@ -1,14 +1,17 @@
 #!/usr/bin/env python3
 """
-Test suite for GAD-509 (Circuit Breaker) and GAD-510 (Operational Quota Manager)
+Test suite for GAD-509 (Circuit Breaker, Iron Dome) and GAD-510 (Operational Quota Manager)
 
 Tests the safety layer that protects against:
 - Cascading API failures (Circuit Breaker)
 - Unexpected cost spikes (Quota Manager)
 - Rate limit violations (Quota Manager)
 - Token consumption spikes (Quota Manager)
+- Blind edits of unread or since-modified files (Iron Dome read tracking)
 """
 
+import os
+import threading
 import time
 from unittest.mock import MagicMock, Mock
 
@@ -20,11 +23,14 @@ from vibe_core.runtime.circuit_breaker import (
     CircuitBreakerOpenError,
     CircuitBreakerState,
 )
+from vibe_core.runtime.file_access_store import FileAccessStore, ReadState
 from vibe_core.runtime.quota_manager import (
     OperationalQuota,
     QuotaExceededError,
     QuotaLimits,
+    estimate_tokens,
 )
+from vibe_core.runtime.tool_safety_guard import ToolSafetyGuard
 
 # =============================================================================
 # CIRCUIT BREAKER TESTS
@@ -197,6 +203,16 @@ class TestCircuitBreaker:
 # =============================================================================
 
 
+class FakeClock:
+    """Manually advanced time source for OperationalQuota"""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
 class TestQuotaManager:
     """Tests for Operational Quota Manager"""
 
@@ -282,9 +298,10 @@ class TestQuotaManager:
             quota.check_before_request(estimated_tokens=50000, operation="req2")
 
     def test_quota_manager_rolling_window_resets(self):
-        """Rolling windows reset after time period"""
+        """Rolling windows free capacity once requests are older than the window"""
+        clock = FakeClock()
         limits = QuotaLimits(requests_per_minute=2)
-        quota = OperationalQuota(limits=limits)
+        quota = OperationalQuota(limits=limits, clock=clock)
 
         # Record 2 requests
         quota.record_request(tokens_used=100, cost_usd=0.01, operation="req1")
@@ -294,13 +311,129 @@ class TestQuotaManager:
         with pytest.raises(QuotaExceededError):
             quota.check_before_request(estimated_tokens=100, operation="req3")
 
-        # Manually simulate minute window reset
-        quota.metrics.requests_this_minute = 0
-        quota.metrics.minute_start_time = time.time()
+        # A minute later both requests have left the window
+        clock.now += 60
 
         # Now 3rd request should pass
         quota.check_before_request(estimated_tokens=100, operation="req3")
 
+    def test_quota_manager_sliding_window_blocks_boundary_burst(self):
+        """Requests at the end of one minute still count at the start of the next"""
+        clock = FakeClock()
+        quota = OperationalQuota(limits=QuotaLimits(requests_per_minute=2), clock=clock)
+
+        clock.now = 59
+        quota.record_request(tokens_used=100, cost_usd=0.01, operation="req1")
+        quota.record_request(tokens_used=100, cost_usd=0.01, operation="req2")
+
+        clock.now = 61  # A fixed window would have reset at 60
+        with pytest.raises(QuotaExceededError):
+            quota.check_before_request(estimated_tokens=100, operation="req3")
+
+        clock.now = 119
+        quota.check_before_request(estimated_tokens=100, operation="req3")
+        assert quota.get_status()["requests"]["this_minute"] == 0
+
+    def test_quota_manager_cost_windows_slide(self):
+        """Hourly cost only counts the last hour"""
+        clock = FakeClock()
+        quota = OperationalQuota(limits=QuotaLimits(cost_per_hour_usd=1.0), clock=clock)
+
+        quota.record_request(tokens_used=1000, cost_usd=0.60, operation="req1")
+        clock.now = 1800
+        quota.record_request(tokens_used=1000, cost_usd=0.30, operation="req2")
+        clock.now = 3600
+
+        status = quota.get_status()["cost"]
+        assert status["this_hour_usd"] == 0.30
+        assert status["this_day_usd"] == 0.90
+
+    def test_quota_manager_acquire_reserves_capacity(self):
+        """acquire() counts the request right away and record_request() corrects tokens"""
+        quota = OperationalQuota(limits=QuotaLimits(tokens_per_minute=1000))
+
+        reservation = quota.acquire(800, operation="req1")
+        with pytest.raises(QuotaExceededError):
+            quota.check_before_request(estimated_tokens=300, operation="req2")
+
+        quota.record_request(600, 0.01, "req1", reservation=reservation)
+        status = quota.get_status()
+        assert status["requests"]["this_minute"] == 1
+        assert status["tokens"]["this_minute"] == 600
+        assert status["totals"]["total_requests"] == 1
+        quota.check_before_request(estimated_tokens=300, operation="req2")
+
+    def test_quota_manager_acquire_waits_for_capacity(self):
+        """acquire() blocks until capacity frees up instead of raising"""
+        quota = OperationalQuota(limits=QuotaLimits(tokens_per_minute=1000))
+        reservation = quota.acquire(900, operation="req1")
+        acquired = []
+
+        waiter = threading.Thread(
+            target=lambda: acquired.append(quota.acquire(200, timeout=5, operation="req2"))
+        )
+        waiter.start()
+        time.sleep(0.1)
+        assert not acquired  # Still waiting
+
+        quota.record_request(100, 0.01, "req1", reservation=reservation)
+        waiter.join(timeout=5)
+        assert acquired
+        assert quota.get_status()["tokens"]["this_minute"] == 300
+
+    def test_quota_manager_acquire_timeout(self):
+        """acquire() raises once the timeout passes without capacity"""
+        quota = OperationalQuota(limits=QuotaLimits(requests_per_minute=1))
+        quota.acquire(100, operation="req1")
+
+        started = time.monotonic()
+        with pytest.raises(QuotaExceededError, match="no capacity after waiting"):
+            quota.acquire(100, timeout=0.1, operation="req2")
+        assert time.monotonic() - started < 1.0
+
+        # Requests that can never fit fail without waiting
+        with pytest.raises(QuotaExceededError):
+            quota.acquire(20000, operation="huge")
+
+    def test_quota_manager_release_frees_reservation(self):
+        """release() returns a failed request's reservation to the minute window"""
+        quota = OperationalQuota(limits=QuotaLimits(requests_per_minute=1))
+        reservation = quota.acquire(500, operation="req1")
+
+        quota.release(reservation)
+
+        status = quota.get_status()
+        assert status["requests"]["this_minute"] == 0
+        assert status["tokens"]["this_minute"] == 0
+        assert status["totals"]["total_requests"] == 0
+        quota.acquire(100, timeout=0, operation="req2")
+
+    def test_quota_manager_is_thread_safe(self):
+        """Concurrent record_request() calls are all counted"""
+        quota = OperationalQuota(limits=QuotaLimits(requests_per_minute=1000))
+
+        def worker():
+            for _ in range(50):
+                quota.record_request(tokens_used=10, cost_usd=0.001, operation="req")
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        status = quota.get_status()
+        assert status["totals"]["total_requests"] == 400
+        assert status["requests"]["this_minute"] == 400
+        assert status["tokens"]["this_minute"] == 4000
+
+    def test_estimate_tokens(self):
+        """Token estimates scale with prompt length"""
+        assert estimate_tokens("") == 0
+        assert estimate_tokens("abcd") == 1
+        assert estimate_tokens("abcde") == 2
+        assert estimate_tokens("x" * 4000) == 1000
+
     def test_quota_manager_record_request_updates_metrics(self):
         """Recording request updates all relevant metrics"""
         quota = OperationalQuota()
@@ -341,6 +474,119 @@ class TestQuotaManager:
         assert 0.08 < estimated < 0.10
 
 
+# =============================================================================
+# IRON DOME READ TRACKING TESTS
+# =============================================================================
+
+
+def _bump_mtime(path):
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 5_000_000_000))
+
+
+class TestFileAccessStore:
+    """Tests for the bounded, persistent read-tracking store behind ToolSafetyGuard"""
+
+    def test_read_goes_stale_when_file_changes(self, tmp_path):
+        """A read is FRESH until the file changes on disk"""
+        target = tmp_path / "module.py"
+        target.write_text("x = 1\n")
+        store = FileAccessStore()
+
+        assert store.read_state(str(target)) is ReadState.UNREAD
+        store.record_read(str(target))
+        assert store.read_state(str(target)) is ReadState.FRESH
+
+        target.write_text("x = 22\n")
+        assert store.read_state(str(target)) is ReadState.STALE
+
+    def test_touch_without_change_stays_fresh_with_content_hash(self, tmp_path):
+        """A touched but unchanged file stays FRESH when the read content was hashed"""
+        target = tmp_path / "module.py"
+        target.write_text("x = 1\n")
+        store = FileAccessStore()
+        store.record_read(str(target), content="x = 1\n")
+
+        _bump_mtime(target)
+
+        assert store.read_state(str(target)) is ReadState.FRESH
+
+    def test_symlinked_path_shares_record(self, tmp_path):
+        """A read through a symlink counts for the resolved path and vice versa"""
+        real_dir = tmp_path / "real"
+        real_dir.mkdir()
+        (tmp_path / "link").symlink_to(real_dir, target_is_directory=True)
+        (real_dir / "module.py").write_text("x = 1\n")
+        store = FileAccessStore()
+
+        store.record_read(str(tmp_path / "link" / "module.py"))
+
+        assert store.read_state(str(real_dir / "module.py")) is ReadState.FRESH
+        assert store.counts()["tracked"] == 1
+
+    def test_lru_bound_forgets_oldest_paths(self, tmp_path):
+        """Only max_entries paths are tracked; evicted paths count as unread"""
+        store = FileAccessStore(max_entries=2)
+        for name in ("a", "b", "c"):
+            store.record_read(str(tmp_path / name))
+
+        assert store.counts()["tracked"] == 2
+        assert store.read_state(str(tmp_path / "a")) is ReadState.UNREAD
+        assert store.read_state(str(tmp_path / "c")) is ReadState.FRESH
+
+    def test_session_survives_restart(self, tmp_path):
+        """A persistent store restores the session's reads after a restart"""
+        db_path = str(tmp_path / "file_access.db")
+        target = tmp_path / "module.py"
+        target.write_text("x = 1\n")
+
+        first = FileAccessStore(db_path=db_path, session_id="operator")
+        first.record_read(str(target))
+        first.close()
+
+        restored = FileAccessStore(db_path=db_path, session_id="operator")
+        other = FileAccessStore(db_path=db_path, session_id="someone-else")
+        assert restored.read_state(str(target)) is ReadState.FRESH
+        assert other.read_state(str(target)) is ReadState.UNREAD
+
+
+class TestToolSafetyGuardReadTracking:
+    """Tests for ANTI-BLINDNESS enforcement on top of the FileAccessStore"""
+
+    def test_blocks_unread_and_stale_edits(self, tmp_path):
+        """Edits need a read, and the read must still match the file on disk"""
+        target = tmp_path / "module.py"
+        target.write_text("x = 1\n")
+        guard = ToolSafetyGuard()
+
+        allowed, violation = guard.check_action("edit_file", {"path": str(target)})
+        assert not allowed
+        assert "without reading" in violation.message
+
+        guard.record_file_read(str(target))
+        assert guard.check_action("edit_file", {"path": str(target)})[0]
+
+        target.write_text("x = 22\n")
+        allowed, violation = guard.check_action("edit_file", {"path": str(target)})
+        assert not allowed
+        assert "modified on disk" in violation.message
+
+    def test_own_write_keeps_read_fresh(self, tmp_path):
+        """A session's own write does not invalidate its read"""
+        target = tmp_path / "module.py"
+        target.write_text("x = 1\n")
+        guard = ToolSafetyGuard()
+        guard.record_file_read(str(target))
+
+        target.write_text("x = 22\n")
+        guard.record_file_write(str(target))
+
+        assert guard.check_action("edit_file", {"path": str(target)})[0]
+        status = guard.get_status()
+        assert status["files_read"] == 1
+        assert status["files_written"] == 1
+
+
 # =============================================================================
 # INTEGRATION TESTS
 # =============================================================================
@@ -393,6 +639,29 @@ class TestSafetyLayerIntegration:
         with pytest.raises(LLMInvocationError):
             client.invoke(prompt="test")
 
+    def test_llm_client_failures_do_not_consume_quota(self):
+        """Failed invocations (including an open breaker) release their reservation"""
+        import importlib
+
+        llm_module = importlib.import_module("vibe_core.runtime.llm_client")
+        LLMClient = llm_module.LLMClient
+        LLMInvocationError = llm_module.LLMInvocationError
+
+        mock_provider = MagicMock()
+        mock_provider.invoke.side_effect = Exception("Provider Error")
+        mock_provider.get_provider_name.return_value = "MockProvider"
+
+        client = LLMClient(provider=mock_provider)
+        client.circuit_breaker.config.failure_threshold = 2
+
+        for _ in range(5):
+            with pytest.raises(LLMInvocationError):
+                client.invoke(prompt="test")
+
+        status = client.quota_manager.get_status()
+        assert status["requests"]["this_minute"] == 0
+        assert status["tokens"]["this_minute"] == 0
+
     def test_llm_client_records_quota_metrics(self):
         """LLMClient records quota metrics after successful requests"""
         # Import after sys.path is set
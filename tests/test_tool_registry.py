@@ -8,8 +8,12 @@ This module tests the tool registry system including:
 - Error handling
 """
 
+import threading
+import time
 from typing import Any
 
+import pytest
+
 from vibe_core.governance import InvariantChecker
 from vibe_core.tools import ReadFileTool, ToolRegistry, WriteFileTool
 from vibe_core.tools.tool_protocol import Tool, ToolCall, ToolResult
@@ -292,6 +296,92 @@ class TestFileTools:
         assert result.error is not None
 
 
+class TestRangedReads:
+    """Test ReadFileTool paging, summaries and binary detection."""
+
+    @pytest.fixture
+    def big_file(self, tmp_path):
+        path = tmp_path / "big.log"
+        path.write_text("".join(f"line {i:05d}\n" for i in range(1, 1001)))
+        return path
+
+    def test_line_range(self, big_file):
+        """start_line/end_line return exactly those lines plus paging metadata."""
+        result = ReadFileTool().execute({"path": str(big_file), "start_line": 10, "end_line": 12})
+
+        assert result.success is True
+        assert result.output == "line 00010\nline 00011\nline 00012\n"
+        assert result.metadata["total_lines"] == 1000
+        assert result.metadata["next_line"] == 13
+
+    def test_line_longer_than_max_bytes_still_advances(self, tmp_path):
+        """A single oversized line is cut and paging by line moves past it."""
+        path = tmp_path / "minified.js"
+        path.write_text("a\n" + "x" * 50 + "\nb\n")
+        tool = ReadFileTool()
+
+        result = tool.execute({"path": str(path), "start_line": 2, "max_bytes": 10})
+
+        assert result.success is True
+        assert result.output == "x" * 10
+        assert result.metadata["truncated"] is True
+        assert result.metadata["truncated_line"] == 2
+        assert result.metadata["next_line"] == 3
+        assert result.metadata["next_offset"] == 12
+
+        rest = tool.execute({"path": str(path), "offset": result.metadata["next_offset"]})
+        assert rest.output.startswith("x" * 40 + "\n")
+        following = tool.execute({"path": str(path), "start_line": result.metadata["next_line"]})
+        assert following.output == "b\n"
+
+    def test_byte_range(self, big_file):
+        """offset/limit return the byte slice and the next offset."""
+        result = ReadFileTool().execute({"path": str(big_file), "offset": 11, "limit": 11})
+
+        assert result.output == "line 00002\n"
+        assert result.metadata["next_offset"] == 22
+        assert result.metadata["total_bytes"] == 11000
+
+    def test_large_file_is_summarized(self, big_file):
+        """Whole-file reads over max_bytes return head and tail only."""
+        result = ReadFileTool().execute({"path": str(big_file), "max_bytes": 110})
+
+        assert result.success is True
+        assert result.metadata["truncated"] is True
+        assert result.output.startswith("line 00001\n")
+        assert result.output.endswith("line 01000\n")
+        assert "lines omitted" in result.output
+        assert result.metadata["total_lines"] == 1000
+
+    def test_mmap_read_of_file_over_threshold(self, tmp_path, monkeypatch):
+        """Files at the mmap threshold read the same as small files."""
+        from vibe_core.tools import file_tools
+
+        monkeypatch.setattr(file_tools, "MMAP_THRESHOLD", 1)
+        path = tmp_path / "small.txt"
+        path.write_text("a\nb")
+
+        result = ReadFileTool().execute({"path": str(path)})
+
+        assert result.output == "a\nb"
+        assert result.metadata["total_lines"] == 2
+
+    def test_binary_file_rejected(self, tmp_path):
+        """Files with NUL bytes near the start are reported as binary."""
+        path = tmp_path / "image.bin"
+        path.write_bytes(b"\x89PNG\x00\x00" + b"x" * 100)
+
+        result = ReadFileTool().execute({"path": str(path)})
+
+        assert result.success is False
+        assert "binary" in result.error
+
+    def test_mixed_ranges_rejected(self, big_file):
+        """Byte and line ranges cannot be combined."""
+        with pytest.raises(ValueError):
+            ReadFileTool().validate({"path": str(big_file), "offset": 0, "start_line": 1})
+
+
 class TestListAndQuery:
     """Test tool listing and query methods."""
 
@@ -326,3 +416,108 @@ class TestListAndQuery:
 
         registry.register(MockTool("tool2"))
         assert len(registry) == 2
+
+
+class SlowTool(MockTool):
+    """Mock tool that sleeps and records the peak number of concurrent calls per path."""
+
+    def __init__(self, delay: float = 0.05):
+        super().__init__("slow_tool")
+        self.delay = delay
+        self.active: dict[str, int] = {}
+        self.peak_per_path: dict[str, int] = {}
+        self.peak_total = 0
+        self.order: list[str] = []
+        self._lock = threading.Lock()
+
+    def execute(self, parameters: dict[str, Any]) -> ToolResult:
+        path = parameters.get("path", "")
+        with self._lock:
+            self.active[path] = self.active.get(path, 0) + 1
+            self.peak_per_path[path] = max(self.peak_per_path.get(path, 0), self.active[path])
+            self.peak_total = max(self.peak_total, sum(self.active.values()))
+        time.sleep(self.delay)
+        with self._lock:
+            self.active[path] -= 1
+            self.order.append(parameters.get("tag", path))
+        return ToolResult(success=True, output=parameters.get("tag", path))
+
+
+class TestBatchExecution:
+    """Test ToolRegistry.execute_batch()."""
+
+    def test_independent_calls_run_concurrently_in_order(self):
+        """Test that calls on different paths overlap and results keep call order."""
+        registry = ToolRegistry()
+        tool = SlowTool()
+        registry.register(tool)
+        calls = [ToolCall("slow_tool", {"path": f"/tmp/file_{i}.txt"}) for i in range(4)]
+
+        start = time.perf_counter()
+        results = registry.execute_batch(calls)
+        elapsed = time.perf_counter() - start
+
+        assert [r.output for r in results] == [c.parameters["path"] for c in calls]
+        assert tool.peak_total == 4
+        assert elapsed < 0.15
+
+    def test_same_path_calls_are_serialized(self):
+        """Test that calls touching the same path never overlap and run in order."""
+        registry = ToolRegistry()
+        tool = SlowTool(delay=0.02)
+        registry.register(tool)
+        calls = [
+            ToolCall("slow_tool", {"path": "/tmp/shared.txt", "tag": "write"}),
+            ToolCall("slow_tool", {"path": "/tmp/../tmp/shared.txt", "tag": "read"}),
+            ToolCall("slow_tool", {"path": "/tmp/other.txt", "tag": "other"}),
+        ]
+
+        results = registry.execute_batch(calls)
+
+        assert [r.output for r in results] == ["write", "read", "other"]
+        assert max(tool.peak_per_path.values()) == 1
+        assert tool.order.index("write") < tool.order.index("read")
+
+    def test_batch_reports_unknown_tools_per_call(self):
+        """Test that a failing call does not affect the other results."""
+        registry = ToolRegistry()
+        registry.register(MockTool("tool1", return_value="ok"))
+
+        results = registry.execute_batch(
+            [ToolCall("tool1", {}), ToolCall("missing", {}), ToolCall("tool1", {"path": "x"})]
+        )
+
+        assert [r.success for r in results] == [True, False, True]
+        assert "not found" in results[1].error
+
+    def test_batch_contains_governance_errors_per_call(self):
+        """Test that a raising governance check fails only its own call."""
+
+        checker = InvariantChecker("tests/fixtures/test_soul.yaml")
+        check_tool_call = checker.check_tool_call
+
+        def flaky_check(tool_name, parameters):
+            if parameters.get("path") == "boom":
+                raise RuntimeError("checker crashed")
+            return check_tool_call(tool_name, parameters)
+
+        checker.check_tool_call = flaky_check
+        registry = ToolRegistry(invariant_checker=checker)
+        registry.register(MockTool("tool1", return_value="ok"))
+
+        results = registry.execute_batch(
+            [
+                ToolCall("tool1", {"path": "a"}),
+                ToolCall("tool1", {"path": "boom"}),
+                ToolCall("tool1", {"path": "b"}),
+            ]
+        )
+
+        assert [r.success for r in results] == [True, False, True]
+        assert "RuntimeError: checker crashed" in results[1].error
+
+    def test_batch_rejects_invalid_worker_count(self):
+        """Test that max_workers below 1 is rejected."""
+        registry = ToolRegistry()
+        with pytest.raises(ValueError):
+            registry.execute_batch([], max_workers=0)
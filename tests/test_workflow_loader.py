@@ -9,7 +9,11 @@ Tests the data layer → logic layer connection:
 4. Error handling and diagnostics
 """
 
+import json
+import os
+import stat
 import tempfile
+import types
 from pathlib import Path
 
 import pytest
@@ -18,6 +22,7 @@ import yaml
 # Add playbook directory to path
 playbook_dir = Path(__file__).parent.parent / "vibe_core" / "playbook"
 
+from vibe_core.playbook import loader as loader_module
 from vibe_core.playbook.executor import WorkflowEdge, WorkflowGraph, WorkflowNode
 from vibe_core.playbook.loader import WorkflowLoader, WorkflowLoaderError, WorkflowValidationError
 
@@ -410,6 +415,103 @@ class TestWorkflowDirectoryLoading:
             assert len(workflows) == 1
 
 
+@pytest.mark.skipif(
+    not isinstance(loader_module.yaml, types.ModuleType),
+    reason="yaml is replaced by a mock in sys.modules",
+)
+class TestCompiledWorkflowCache:
+    """Tests for the compiled-workflow cache"""
+
+    WORKFLOW = {
+        "workflow": {
+            "id": "cached",
+            "name": "Cached",
+            "intent": "Cached intent",
+            "nodes": [
+                {"id": "start", "action": "analyze"},
+                {"id": "finish", "action": "report"},
+            ],
+            "edges": [{"from": "start", "to": "finish"}],
+            "entry_point": "start",
+            "exit_points": ["finish"],
+        }
+    }
+
+    @pytest.fixture
+    def workflow_file(self, tmp_path):
+        path = tmp_path / "cached.yaml"
+        path.write_text(json.dumps(self.WORKFLOW))  # JSON is valid YAML
+        return path
+
+    def test_warm_load_skips_compilation(self, tmp_path, workflow_file, monkeypatch):
+        """A second loader is served from the cache, including from disk"""
+        cache_dir = tmp_path / "cache"
+        cold = WorkflowLoader(cache_dir=cache_dir)
+        graph = cold.load_workflow(workflow_file)
+        assert cold.cache_stats["misses"] == 1
+        assert graph.plan.execution_order == ["start", "finish"]
+
+        monkeypatch.setattr(loader_module, "_memory_cache", {})  # Simulate a new process
+        warm = WorkflowLoader(cache_dir=cache_dir)
+        monkeypatch.setattr(warm, "_compile_workflow", None)  # Must not be called
+        cached = warm.load_workflow(workflow_file)
+        assert warm.load_workflow(workflow_file) is not cached  # Fresh copy per load
+
+        assert cached == graph
+        assert cached.plan.execution_order == ["start", "finish"]
+        assert warm.cache_stats == {"memory_hits": 1, "disk_hits": 1, "misses": 0}
+
+    def test_edited_workflow_is_recompiled(self, tmp_path, workflow_file):
+        """Changing the YAML file invalidates its cache entry"""
+        loader = WorkflowLoader(cache_dir=tmp_path / "cache")
+        loader.load_workflow(workflow_file)
+
+        edited = json.dumps(self.WORKFLOW).replace("Cached intent", "Edited intent")
+        workflow_file.write_text(edited)
+        assert loader.load_workflow(workflow_file).intent == "Edited intent"
+        assert loader.cache_stats["misses"] == 2
+
+    def test_changed_schema_invalidates_cache(self, tmp_path, workflow_file):
+        """Workflows compiled against another schema are not reused"""
+        cache_dir = tmp_path / "cache"
+        WorkflowLoader(cache_dir=cache_dir).load_workflow(workflow_file)
+
+        schema = WorkflowLoader().schema
+        schema["description"] = "Changed schema"
+        schema_path = tmp_path / "_schema.json"
+        schema_path.write_text(json.dumps(schema))
+
+        loader = WorkflowLoader(schema_path=schema_path, cache_dir=cache_dir)
+        loader.load_workflow(workflow_file)
+        assert loader.cache_stats["misses"] == 1
+
+    def test_corrupt_cache_entry_is_ignored(self, tmp_path, workflow_file, monkeypatch):
+        """An unreadable cache file is replaced by a fresh compile"""
+        cache_dir = tmp_path / "cache"
+        WorkflowLoader(cache_dir=cache_dir).load_workflow(workflow_file)
+        for cache_file in cache_dir.iterdir():
+            cache_file.write_bytes(b"not a pickle")
+
+        monkeypatch.setattr(loader_module, "_memory_cache", {})
+        loader = WorkflowLoader(cache_dir=cache_dir)
+        assert loader.load_workflow(workflow_file).id == "cached"
+        assert loader.cache_stats["misses"] == 1
+
+    @pytest.mark.skipif(not hasattr(os, "getuid"), reason="POSIX permissions only")
+    def test_cache_writable_by_others_is_ignored(self, tmp_path, workflow_file, monkeypatch):
+        """Entries in a cache directory others can write are never unpickled"""
+        cache_dir = tmp_path / "cache"
+        WorkflowLoader(cache_dir=cache_dir).load_workflow(workflow_file)
+        assert stat.S_IMODE(cache_dir.stat().st_mode) == 0o700
+        cache_dir.chmod(0o777)
+
+        monkeypatch.setattr(loader_module, "_memory_cache", {})
+        loader = WorkflowLoader(cache_dir=cache_dir)
+        loader.load_workflow(workflow_file)
+        assert loader.cache_stats["misses"] == 1
+        assert stat.S_IMODE(cache_dir.stat().st_mode) == 0o700  # Tightened on write
+
+
 class TestAutoDebugWorkflow:
     """Specific tests for the auto_debug.yaml workflow"""
 
@@ -0,0 +1,129 @@
+"""
+Tests for the grep_content tool (content search over the workspace).
+"""
+
+import pytest
+
+from vibe_core.governance import InvariantChecker
+from vibe_core.tools import grep_content
+from vibe_core.tools.grep_content import GrepContentTool
+from vibe_core.tools.tool_protocol import ToolCall
+from vibe_core.tools.tool_registry import ToolRegistry
+
+
+@pytest.fixture
+def workspace(tmp_path, monkeypatch):
+    (tmp_path / "src").mkdir()
+    (tmp_path / "src" / "app.py").write_text(
+        "import os\n\n\ndef main():\n    return helper()\n\n\ndef helper():\n    return 1\n"
+    )
+    (tmp_path / "src" / "notes.md").write_text("TODO: call helper\n")
+    (tmp_path / "src" / "blob.bin").write_bytes(b"\x00\x01helper")
+    (tmp_path / "build").mkdir()
+    (tmp_path / "build" / "gen.py").write_text("def helper(): pass\n")
+    (tmp_path / ".gitignore").write_text("build/\n")
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+class TestGrepContentTool:
+    def test_finds_matches_in_path_order(self, workspace):
+        """Matches are reported grep-style; binary and ignored files are skipped."""
+        result = GrepContentTool().execute({"pattern": r"helper"})
+
+        assert result.success is True
+        assert result.output.splitlines() == [
+            "src/app.py:5:     return helper()",
+            "src/app.py:8: def helper():",
+            "src/notes.md:1: TODO: call helper",
+        ]
+        assert result.metadata["files_matched"] == 2
+
+    def test_glob_ignore_case_and_context(self, workspace):
+        """glob narrows the files; context adds surrounding lines."""
+        result = GrepContentTool().execute(
+            {"pattern": "DEF HELPER", "glob": "*.py", "ignore_case": True, "context": 1}
+        )
+
+        assert result.output.splitlines() == [
+            "src/app.py-7- ",
+            "src/app.py:8: def helper():",
+            "src/app.py-9-     return 1",
+        ]
+
+    def test_anchors_match_per_line(self, workspace):
+        """^ and $ anchor at line boundaries, including CRLF files."""
+        (workspace / "src" / "win.py").write_bytes(b"x = 1\r\ndef win():\r\n")
+
+        result = GrepContentTool().execute({"pattern": r"^def "})
+        assert result.metadata["files_matched"] == 2
+
+        result = GrepContentTool().execute({"pattern": r"\(\):$"})
+        assert result.output.splitlines() == [
+            "src/app.py:4: def main():",
+            "src/app.py:8: def helper():",
+            "src/win.py:2: def win():",
+        ]
+
+    def test_max_results_truncates(self, workspace):
+        """The scan stops once max_results matching lines are collected."""
+        result = GrepContentTool().execute({"pattern": "helper", "max_results": 1})
+
+        assert result.metadata["count"] == 1
+        assert result.metadata["truncated"] is True
+
+    def test_worker_processes_give_same_result(self, workspace, monkeypatch):
+        """Scanning in worker processes returns the same matches."""
+        expected = GrepContentTool().execute({"pattern": "helper"}).output
+        monkeypatch.setattr(grep_content, "PROCESS_POOL_MIN_BYTES", 1)
+        monkeypatch.setattr(grep_content, "BATCH_FILES", 1)
+
+        result = GrepContentTool(max_workers=2).execute({"pattern": "helper"})
+
+        assert result.output == expected
+
+    def test_worker_pool_is_shared_and_never_forks(self, workspace, monkeypatch):
+        """Large scans reuse one lazily created pool that does not fork the caller."""
+        monkeypatch.setattr(grep_content, "PROCESS_POOL_MIN_BYTES", 1)
+        monkeypatch.setattr(grep_content, "BATCH_FILES", 1)
+        monkeypatch.setattr(grep_content, "_pools", {})
+        created = []
+        real_pool = grep_content.ProcessPoolExecutor
+
+        def spy(*args, **kwargs):
+            created.append(kwargs["mp_context"].get_start_method())
+            return real_pool(*args, **kwargs)
+
+        monkeypatch.setattr(grep_content, "ProcessPoolExecutor", spy)
+
+        first = GrepContentTool(max_workers=2).execute({"pattern": "helper"})
+        second = GrepContentTool(max_workers=2).execute({"pattern": "helper"})
+
+        assert first.output == second.output
+        assert len(created) == 1
+        assert created[0] in ("forkserver", "spawn")
+        grep_content._pools[2].shutdown()
+
+    def test_soul_rules_apply_per_file(self, workspace):
+        """Files blocked by the InvariantChecker are never searched."""
+        soul = workspace / "soul.yaml"
+        soul.write_text(
+            "safety_rules:\n"
+            "  - id: protect_app\n"
+            "    condition: path_matches\n"
+            "    pattern: src/app.py\n"
+            "    action: block\n"
+        )
+        registry = ToolRegistry(invariant_checker=InvariantChecker(str(soul)))
+        registry.register(GrepContentTool(invariant_checker=InvariantChecker(str(soul))))
+
+        call = ToolCall(tool_name="grep_content", parameters={"pattern": "helper"})
+        result = registry.execute(call)
+
+        assert result.output == "src/notes.md:1: TODO: call helper"
+        assert result.metadata["skipped_blocked"] == 1
+
+    def test_invalid_regex_rejected(self):
+        """An invalid regular expression fails validation."""
+        with pytest.raises(ValueError):
+            GrepContentTool().validate({"pattern": "(unclosed"})
@@ -1,9 +1,10 @@
 """
-Tests for ARCH-042 "Senses" tools (ListDirectoryTool, SearchFileTool).
+Tests for ARCH-042 "Senses" tools (ListDirectoryTool, SearchFileTool, FileIndex).
 """
 
 import pytest
 
+from vibe_core.tools.file_index import FileIndex
 from vibe_core.tools.list_directory import ListDirectoryTool
 from vibe_core.tools.search_file import SearchFileTool
 
@@ -89,3 +90,74 @@ class TestSearchFileTool:
         result = tool.execute({"pattern": "*", "path": "../"})
         assert result.success is False
         assert "Access denied" in result.error
+
+    def test_search_fuzzy(self, tool):
+        """Test fuzzy search ranks the closest file name first."""
+        result = tool.execute({"pattern": "list_directory", "fuzzy": True})
+        assert result.success is True
+        assert result.output.splitlines()[0] == "vibe_core/tools/list_directory.py"
+
+    def test_search_pagination(self, tool):
+        """Test that pages are disjoint and report the next offset."""
+        first = tool.execute({"pattern": "*.py", "path": "vibe_core/tools", "limit": 2})
+        second = tool.execute(
+            {"pattern": "*.py", "path": "vibe_core/tools", "limit": 2, "offset": 2}
+        )
+        assert first.metadata["count"] == 2
+        assert first.metadata["next_offset"] == 2
+        assert first.metadata["total"] == second.metadata["total"]
+        assert set(first.output.splitlines()[:2]).isdisjoint(second.output.splitlines()[:2])
+
+
+class TestFileIndex:
+    @pytest.fixture
+    def workspace(self, tmp_path):
+        (tmp_path / "src" / "pkg").mkdir(parents=True)
+        (tmp_path / "src" / "pkg" / "kernel.py").write_text("")
+        (tmp_path / "src" / "main.py").write_text("")
+        (tmp_path / "README.md").write_text("")
+        (tmp_path / ".git").mkdir()
+        (tmp_path / ".git" / "config").write_text("")
+        (tmp_path / "build").mkdir()
+        (tmp_path / "build" / "out.py").write_text("")
+        (tmp_path / ".gitignore").write_text("build/\n*.log\n")
+        return tmp_path
+
+    def test_glob_skips_hidden_and_gitignored(self, workspace):
+        """Test that glob matches rglob semantics minus ignored entries."""
+        index = FileIndex(workspace)
+        matches, total = index.glob("*.py")
+        assert matches == ["src/main.py", "src/pkg/kernel.py"]
+        assert total == 2
+        assert index.glob("pkg/*.py", under="src")[0] == ["src/pkg/kernel.py"]
+
+    def test_fuzzy_ranking(self, workspace):
+        """Test that fuzzy matches are ranked deterministically."""
+        index = FileIndex(workspace)
+        matches, _ = index.fuzzy("kernl")
+        assert matches == ["src/pkg/kernel.py"]
+        assert index.fuzzy("main")[0][0] == "src/main.py"
+
+    def test_incremental_refresh(self, workspace):
+        """Test that files created after the first scan are picked up."""
+        index = FileIndex(workspace, refresh_interval=0)
+        index.glob("*")
+        (workspace / "src" / "pkg" / "new.py").write_text("")
+        (workspace / "debug.log").write_text("")
+
+        assert "src/pkg/new.py" in index.glob("*.py")[0]
+        assert index.glob("*.log")[1] == 0
+
+    def test_invalidate_bypasses_refresh_interval(self, workspace):
+        """Test that invalidate() makes a new file visible immediately."""
+        index = FileIndex(workspace, refresh_interval=3600)
+        assert index.glob("added.py")[1] == 0
+        (workspace / "src" / "added.py").write_text("")
+        index.invalidate(workspace / "src" / "added.py")
+        assert index.glob("added.py")[0] == ["src/added.py"]
+
+    def test_tree(self, workspace):
+        """Test tree rendering with depth limit."""
+        index = FileIndex(workspace)
+        assert index.tree(max_depth=1) == ["├── src/", "└── README.md"]
+        assert "│   ├── pkg/" in index.tree(max_depth=2)
@@ -7,6 +7,7 @@ via an LLM provider (ARCH-025).
 Updated in ARCH-027 to support tool-use capability.
 """
 
+import asyncio
 import json
 import logging
 from typing import Any, Optional
@@ -163,6 +164,50 @@ class SimpleLLMAgent(VibeAgent):
             >>> result = agent.process(task)
             >>> print(result.output["response"])  # LLM's answer
         """
+        messages, model_to_use = self._prepare_call(task)
+
+        try:
+            # Call LLM provider
+            response = self.provider.chat(messages, model=model_to_use)
+            tool_calls = self._inspect_response(response)
+            tool_results = self._execute_tool_calls(tool_calls)
+            return self._success_response(task, response, model_to_use, tool_results)
+
+        except Exception as e:
+            return self._failure_response(task, e)
+
+    async def aprocess(self, task: Task) -> AgentResponse:
+        """
+        Async counterpart of process(): awaits provider.achat().
+
+        The kernel's run_async() awaits this directly, so many LLM agents can
+        wait on their providers concurrently on one event loop. Tool calls
+        (blocking file/network I/O) run in a worker thread.
+
+        Args:
+            task: The Task to process
+
+        Returns:
+            AgentResponse: Same structure as process()
+
+        Raises:
+            ValueError: If task payload is missing user_message
+        """
+        messages, model_to_use = self._prepare_call(task)
+
+        try:
+            response = await self.provider.achat(messages, model=model_to_use)
+            tool_calls = self._inspect_response(response)
+            tool_results = []
+            if tool_calls:
+                tool_results = await asyncio.to_thread(self._execute_tool_calls, tool_calls)
+            return self._success_response(task, response, model_to_use, tool_results)
+
+        except Exception as e:
+            return self._failure_response(task, e)
+
+    def _prepare_call(self, task: Task) -> tuple[list[dict[str, str]], str | None]:
+        """Validate the task payload and build (messages, model) for the provider."""
         # Extract user message from payload
         payload = task.payload
         if not isinstance(payload, dict):
@@ -187,50 +232,58 @@ class SimpleLLMAgent(VibeAgent):
             f"(user_message length={len(user_message)}, model={model_to_use})"
         )
         logger.debug(f"AGENT: Messages to LLM: {messages}")
+        return messages, model_to_use
 
-        try:
-            # Call LLM provider
-            response = self.provider.chat(messages, model=model_to_use)
+    def _inspect_response(self, response: str) -> list[dict[str, Any]]:
+        """Log the LLM response and return its tool calls, if tools are enabled."""
+        logger.info(f"AGENT: {self.agent_id} received LLM response (length={len(response)})")
+        logger.debug(f"AGENT: LLM response: {response}")
 
-            logger.info(f"AGENT: {self.agent_id} received LLM response (length={len(response)})")
-            logger.debug(f"AGENT: LLM response: {response}")
-
-            # Check if response contains tool call
-            tool_result = None
-            if self.tool_registry:
-                tool_call_data = self._extract_tool_call(response)
-                if tool_call_data:
-                    logger.info(f"AGENT: {self.agent_id} detected tool call in response")
-                    tool_result = self._execute_tool_call(tool_call_data)
-
-            return AgentResponse(
-                agent_id=self.agent_id,
-                task_id=task.id,
-                success=True,
-                output={
-                    "response": response,
-                    "model_used": model_to_use or "default",
-                    "provider": self.provider.__class__.__name__,
-                    "tool_call": tool_result,  # None if no tool call
-                },
-            )
+        # Check if response contains tool calls
+        if not self.tool_registry:
+            return []
+        tool_calls = self._extract_tool_calls(response)
+        if tool_calls:
+            logger.info(f"AGENT: {self.agent_id} detected {len(tool_calls)} tool call(s)")
+        return tool_calls
 
-        except Exception as e:
-            logger.error(f"AGENT: {self.agent_id} LLM call failed for task {task.id}: {e}")
-
-            # Return AgentResponse with failure status instead of raising
-            error_msg = f"LLM call failed: {e!s}"
-            return AgentResponse(
-                agent_id=self.agent_id,
-                task_id=task.id,
-                success=False,
-                output=None,
-                error=error_msg,
-                metadata={
-                    "provider": self.provider.__class__.__name__,
-                    "original_error_type": type(e).__name__,
-                },
-            )
+    def _success_response(
+        self,
+        task: Task,
+        response: str,
+        model_to_use: str | None,
+        tool_results: list[dict[str, Any]],
+    ) -> AgentResponse:
+        """Wrap an LLM response (and its tool results) in an AgentResponse."""
+        return AgentResponse(
+            agent_id=self.agent_id,
+            task_id=task.id,
+            success=True,
+            output={
+                "response": response,
+                "model_used": model_to_use or "default",
+                "provider": self.provider.__class__.__name__,
+                "tool_call": tool_results[0] if tool_results else None,  # First call
+                "tool_calls": tool_results,  # All calls, in response order
+            },
+        )
+
+    def _failure_response(self, task: Task, error: Exception) -> AgentResponse:
+        """Return AgentResponse with failure status instead of raising."""
+        logger.error(f"AGENT: {self.agent_id} LLM call failed for task {task.id}: {error}")
+
+        error_msg = f"LLM call failed: {error!s}"
+        return AgentResponse(
+            agent_id=self.agent_id,
+            task_id=task.id,
+            success=False,
+            output=None,
+            error=error_msg,
+            metadata={
+                "provider": self.provider.__class__.__name__,
+                "original_error_type": type(error).__name__,
+            },
+        )
 
     def _build_messages(
         self, user_message: str, context: dict | None = None
@@ -274,7 +327,7 @@ class SimpleLLMAgent(VibeAgent):
 
     def _extract_tool_call(self, response: str) -> dict[str, Any] | None:
         """
-        Extract tool call from LLM response.
+        Extract the first tool call from LLM response.
 
         Looks for JSON object with format: {"tool": "name", "parameters": {...}}
 
@@ -289,15 +342,40 @@ class SimpleLLMAgent(VibeAgent):
             >>> call = agent._extract_tool_call(response)
             >>> print(call["tool"])  # "read_file"
         """
+        tool_calls = self._extract_tool_calls(response)
+        return tool_calls[0] if tool_calls else None
+
+    def _extract_tool_calls(self, response: str) -> list[dict[str, Any]]:
+        """
+        Extract all tool calls from LLM response.
+
+        Accepts a single call object, a JSON list of call objects, or call
+        objects embedded in surrounding text.
+
+        Args:
+            response: LLM response text
+
+        Returns:
+            list of tool call dicts in response order (empty if none found)
+
+        Example:
+            >>> response = 'Reading both: {"tool": "read_file", "parameters": {"path": "a.py"}} '
+            >>> response += '{"tool": "read_file", "parameters": {"path": "b.py"}}'
+            >>> [c["parameters"]["path"] for c in agent._extract_tool_calls(response)]
+            ['a.py', 'b.py']
+        """
         # Try to parse entire response as JSON first
         try:
             data = json.loads(response.strip())
-            if isinstance(data, dict) and "tool" in data and "parameters" in data:
+            if self._is_tool_call(data):
+                return [data]
+            if isinstance(data, list) and data and all(self._is_tool_call(d) for d in data):
                 return data
         except json.JSONDecodeError:
             pass
 
-        # Fallback: Try to find JSON object with balanced braces
+        # Fallback: Find JSON objects with balanced braces
+        tool_calls = []
         brace_depth = 0
         json_start = -1
 
@@ -313,13 +391,47 @@ class SimpleLLMAgent(VibeAgent):
                     json_str = response[json_start : i + 1]
                     try:
                         data = json.loads(json_str)
-                        if isinstance(data, dict) and "tool" in data and "parameters" in data:
-                            return data
+                        if self._is_tool_call(data):
+                            tool_calls.append(data)
                     except json.JSONDecodeError:
                         pass
                     json_start = -1
 
-        return None
+        return tool_calls
+
+    @staticmethod
+    def _is_tool_call(data: Any) -> bool:
+        """Return True if data has the {"tool": ..., "parameters": ...} shape."""
+        return isinstance(data, dict) and "tool" in data and "parameters" in data
+
+    def _execute_tool_calls(self, tool_calls: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """
+        Execute the tool calls of one response.
+
+        A single call goes through _execute_tool_call(); several calls go
+        through ToolRegistry.execute_batch(), which runs independent calls
+        concurrently and serializes calls on the same path.
+
+        Args:
+            tool_calls: List of {"tool": "name", "parameters": {...}}
+
+        Returns:
+            list of tool execution result dicts, in call order
+        """
+        if len(tool_calls) <= 1:
+            return [self._execute_tool_call(call) for call in tool_calls]
+
+        # Import here to avoid circular dependency
+        from vibe_core.tools.tool_protocol import ToolCall
+
+        logger.info(f"AGENT: {self.agent_id} executing {len(tool_calls)} tool calls as a batch")
+        results = self.tool_registry.execute_batch(
+            [ToolCall(tool_name=call["tool"], parameters=call["parameters"]) for call in tool_calls]
+        )
+        return [
+            self._tool_result_dict(call["tool"], call["parameters"], result)
+            for call, result in zip(tool_calls, results, strict=True)
+        ]
 
     def _execute_tool_call(self, tool_call_data: dict[str, Any]) -> dict[str, Any]:
         """
@@ -355,7 +467,13 @@ class SimpleLLMAgent(VibeAgent):
             f"(tool={tool_name}, success={result.success})"
         )
 
-        # Convert ToolResult to dict
+        return self._tool_result_dict(tool_name, parameters, result)
+
+    @staticmethod
+    def _tool_result_dict(
+        tool_name: str, parameters: dict[str, Any], result: Any
+    ) -> dict[str, Any]:
+        """Convert a ToolResult to the dict stored in the agent's output."""
         return {
             "tool": tool_name,
             "parameters": parameters,
@@ -0,0 +1,144 @@
+"""
+Capability Index for vibe-agency OS.
+
+This module implements the inverted index behind capability-based agent
+lookup. It is shared by AgentRouter (skill matching for workflow nodes)
+and AgentRegistry (STEWARD manifest lookup), which used to scan every
+agent's capability list on every query.
+
+Index layout:
+- Every registered item gets a bit position (its registration order)
+- Each capability maps to a bitset of the items that declare it
+- find() reads one bitset; best_match() scores all agents at once with
+  bitwise AND/OR instead of looping over agents x skills x capabilities
+
+Scoring (best_match):
+- Score = number of required skills an item declares (max overlap)
+- Items with no overlap never match
+- Ties go to the least loaded item if a load function is given, then to
+  the first registered item
+
+Best-match candidates are cached per required-skill tuple and the cache
+is dropped whenever an item is added.
+"""
+
+import threading
+from collections.abc import Callable, Hashable, Iterable, Iterator
+from typing import Generic, TypeVar
+
+T = TypeVar("T")
+
+
+def _positions(bits: int) -> Iterator[int]:
+    """Yield the set bit positions of bits in ascending order."""
+    while bits:
+        low = bits & -bits
+        yield low.bit_length() - 1
+        bits ^= low
+
+
+class CapabilityIndex(Generic[T]):
+    """
+    Inverted index from capability to items, with bitset scoring.
+
+    Thread-safe: writers are serialized by a lock; readers work on
+    immutable ints, so lookups never block on registration.
+
+    Example:
+        >>> index = CapabilityIndex()
+        >>> index.add(coder, ["coding", "debugging"])
+        >>> index.add(researcher, ["research"])
+        >>> index.find("debugging")
+        [coder]
+        >>> index.best_match(("debugging", "python"))
+        coder
+    """
+
+    def __init__(self):
+        """Initialize an empty index."""
+        self._items: list[T] = []
+        self._bits: dict[Hashable, int] = {}
+        self._matches: dict[tuple, list[int]] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def add(self, item: T, capabilities: Iterable[Hashable]) -> None:
+        """
+        Index an item under each of its capabilities.
+
+        Args:
+            item: The item (agent or manifest) to index
+            capabilities: Capabilities the item declares
+        """
+        with self._lock:
+            bit = 1 << len(self._items)
+            self._items.append(item)
+            for capability in capabilities:
+                self._bits[capability] = self._bits.get(capability, 0) | bit
+            self._matches = {}
+
+    def find(self, capability: Hashable) -> list[T]:
+        """
+        Return all items with a capability, in registration order.
+
+        Args:
+            capability: The capability name to search for
+
+        Returns:
+            list: Matching items (empty if none)
+        """
+        items = self._items
+        return [items[pos] for pos in _positions(self._bits.get(capability, 0))]
+
+    def best_match(
+        self,
+        required: Iterable[Hashable],
+        load: Callable[[T], int] | None = None,
+    ) -> T | None:
+        """
+        Return the item declaring the most required capabilities.
+
+        Args:
+            required: Required capabilities (a capability listed twice counts twice)
+            load: Optional function returning an item's current load
+                  (e.g. queue depth); the least loaded tied item wins
+
+        Returns:
+            The best item, or None if no item has any required capability
+        """
+        key = tuple(required)
+        matches = self._matches  # Replaced (not cleared) by add(), so never stale
+        candidates = matches.get(key)
+        if candidates is None:
+            candidates = matches[key] = self._top_scorers(key)
+
+        if not candidates:
+            return None
+        items = self._items
+        if load is None or len(candidates) == 1:
+            return items[candidates[0]]
+        return items[min(candidates, key=lambda pos: (load(items[pos]), pos))]
+
+    def _top_scorers(self, required: tuple) -> list[int]:
+        """Positions of the items with the highest non-zero score."""
+        masks = [self._bits.get(capability, 0) for capability in required]
+        if not masks:
+            return []
+
+        # Fast path: items declaring every required capability share the top score
+        full = masks[0]
+        for mask in masks[1:]:
+            full &= mask
+        if full:
+            return list(_positions(full))
+
+        any_match = 0
+        for mask in masks:
+            any_match |= mask
+        scores = {pos: sum((mask >> pos) & 1 for mask in masks) for pos in _positions(any_match)}
+        if not scores:
+            return []
+        best = max(scores.values())
+        return [pos for pos, score in scores.items() if score == best]
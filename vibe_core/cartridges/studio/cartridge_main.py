@@ -313,27 +313,20 @@ class StudioCartridge(CartridgeBase):
             )
 
             # Submit to kernel
-            task_id = self.kernel.submit(task)
+            handle = self.kernel.submit(task)
 
-            # Wait for completion (simplified - real impl would use async)
+            # Run the kernel until our task finishes (tick() returns False when idle)
             max_ticks = 1000
             ticks = 0
-            while (
-                self.kernel.scheduler.get_queue_status()["pending_tasks"] > 0 and ticks < max_ticks
-            ):
-                self.kernel.tick()
+            while not handle.done() and ticks < max_ticks and self.kernel.tick():
                 ticks += 1
 
-            # Query result from ledger
-            try:
-                result_row = self.kernel.ledger.get_task_result(task_id)
-                if result_row:
-                    return json.loads(result_row)
-                else:
-                    return {"success": False, "error": f"No result for task {task_id}"}
-            except Exception as e:
-                logger.warning(f"Could not retrieve result from ledger: {e}")
-                return {"success": False, "error": str(e)}
+            if not handle.done():
+                return {"success": False, "error": f"No result for task {handle}"}
+
+            # The handle carries the specialist's result (no ledger query needed)
+            result = handle.result()
+            return result.to_dict() if hasattr(result, "to_dict") else result
 
         except Exception as e:
             logger.error(f"Delegation failed: {e}")
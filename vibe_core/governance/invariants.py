@@ -14,12 +14,25 @@ Architecture note:
 This is ARCH-029 from Phase 3 (Governance & Soul).
 """
 
+import logging
+import os
+import re
+import time
+from collections.abc import Callable
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
 import yaml
 
+logger = logging.getLogger(__name__)
+
+# Conditions understood by the checker (all are evaluated against params["path"])
+PATH_CONDITIONS = ("path_contains", "path_matches", "path_outside_root")
+
+# Minimum seconds between soul.yaml modification-time checks (hot reload)
+DEFAULT_RELOAD_INTERVAL = 1.0
+
 
 @dataclass
 class SoulResult:
@@ -35,6 +48,87 @@ class SoulResult:
     reason: str | None = None
 
 
+@dataclass(frozen=True)
+class _RuleSet:
+    """
+    Blocking rules for one tool, compiled for fast matching.
+
+    Rule order is preserved: a call is blocked by the matching rule with the
+    lowest position, exactly as if the rules were checked one by one.
+
+    Attributes:
+        reasons: Block reason per rule position
+        contains: (position, pattern) of path_contains rules, in order
+        contains_regex: Alternation of all path_contains patterns (None if none)
+        exact: path_matches pattern -> lowest position using it
+        outside_root: Position of the first path_outside_root rule (None if none)
+    """
+
+    reasons: tuple[str, ...]
+    contains: tuple[tuple[int, str], ...]
+    contains_regex: re.Pattern | None
+    exact: dict[str, int]
+    outside_root: int | None
+
+    @classmethod
+    def compile(cls, rules: list[dict]) -> "_RuleSet":
+        """Compile blocking rules (in evaluation order) into a rule set."""
+        reasons = []
+        contains = []
+        exact: dict[str, int] = {}
+        outside_root = None
+
+        for position, rule in enumerate(rules):
+            condition = rule.get("condition")
+            pattern = rule.get("pattern", "")
+            default = (
+                "Path outside root blocked"
+                if condition == "path_outside_root"
+                else "Path blocked by soul rule"
+            )
+            reasons.append(f"{rule.get('message', default)} (Rule: {rule.get('id', 'unknown')})")
+
+            if condition == "path_contains" and pattern:
+                contains.append((position, pattern))
+            elif condition == "path_matches" and pattern:
+                exact.setdefault(pattern, position)
+            elif condition == "path_outside_root" and outside_root is None:
+                outside_root = position
+
+        contains_regex = (
+            re.compile("|".join(re.escape(pattern) for _, pattern in contains))
+            if contains
+            else None
+        )
+        return cls(tuple(reasons), tuple(contains), contains_regex, exact, outside_root)
+
+    def first_match(self, path_str: str, is_outside_root: Callable[[str], bool]) -> int | None:
+        """
+        Return the position of the first rule that blocks path_str (None if allowed).
+
+        The substring and exact checks are cheap; the root check (which has
+        to resolve the path on disk) only runs if it could still win.
+        """
+        best = self.exact.get(path_str)
+
+        if self.contains_regex is not None and self.contains_regex.search(path_str):
+            for position, pattern in self.contains:
+                if best is not None and position > best:
+                    break
+                if pattern in path_str:
+                    best = position
+                    break
+
+        if (
+            self.outside_root is not None
+            and (best is None or self.outside_root < best)
+            and is_outside_root(path_str)
+        ):
+            best = self.outside_root
+
+        return best
+
+
 class InvariantChecker:
     """
     Validates tool calls against soul.yaml safety rules.
@@ -48,6 +142,13 @@ class InvariantChecker:
     3. Composable: Rules can be added without code changes
     4. Traceable: Every block includes the reason
 
+    Every tool call goes through this checker, so rules are compiled at load
+    time: blocking rules are bucketed per tool (a rule may list the "tools"
+    it applies to; rules without "tools" apply to every tool), path_contains
+    patterns are merged into one regex and path_matches patterns into a dict.
+    The project root is resolved once. soul.yaml is reloaded automatically
+    when its modification time changes.
+
     Example soul.yaml:
         safety_rules:
           - id: "protect_git"
@@ -55,17 +156,38 @@ class InvariantChecker:
             pattern: ".git"
             action: "block"
             message: "Touching .git is forbidden."
+          - id: "no_deploy_writes"
+            condition: "path_contains"
+            pattern: "deploy/"
+            tools: ["write_file"]
+            action: "block"
+            message: "Deployment files are read-only."
     """
 
-    def __init__(self, soul_path: str = "config/soul.yaml"):
+    def __init__(
+        self,
+        soul_path: str = "config/soul.yaml",
+        root: str | None = None,
+        reload_interval: float | None = DEFAULT_RELOAD_INTERVAL,
+    ):
         """
         Initialize the InvariantChecker.
 
         Args:
             soul_path: Path to the soul.yaml configuration file
+            root: Project root for sandbox confinement (default: the current
+                  working directory at check time)
+            reload_interval: Minimum seconds between soul.yaml modification
+                             checks; None disables hot reload
         """
         self.soul_path = Path(soul_path)
+        self.reload_interval = reload_interval
+        self._fixed_root = os.path.realpath(root) if root is not None else None
+        self._root_cache: tuple[str, str] | None = None  # (cwd, resolved root)
+        self._last_reload_check = time.monotonic()
+        self._mtime = self._soul_mtime()
         self.rules = self._load_rules()
+        self._rule_sets = self._compile(self.rules)
 
     def _load_rules(self) -> list[dict]:
         """
@@ -83,6 +205,45 @@ class InvariantChecker:
             data = yaml.safe_load(f)
             return data.get("safety_rules", [])
 
+    @staticmethod
+    def _compile(rules: list[dict]) -> tuple[dict[str, _RuleSet], _RuleSet]:
+        """Compile rules into (per-tool rule sets, default rule set)."""
+        blocking = [
+            rule
+            for rule in rules
+            if rule.get("action") == "block" and rule.get("condition") in PATH_CONDITIONS
+        ]
+        tool_names = {tool for rule in blocking for tool in rule.get("tools") or ()}
+
+        def applies(rule: dict, tool_name: str | None) -> bool:
+            tools = rule.get("tools")
+            return not tools or tool_name in tools
+
+        default = _RuleSet.compile([rule for rule in blocking if applies(rule, None)])
+        buckets = {
+            tool: _RuleSet.compile([rule for rule in blocking if applies(rule, tool)])
+            for tool in tool_names
+        }
+        return buckets, default
+
+    def _soul_mtime(self) -> float | None:
+        """Return soul.yaml's modification time (None if it does not exist)."""
+        try:
+            return os.stat(self.soul_path).st_mtime
+        except OSError:
+            return None
+
+    def _maybe_reload(self) -> None:
+        """Reload the rules if soul.yaml changed (checked at most every reload_interval)."""
+        if self.reload_interval is None:
+            return
+        now = time.monotonic()
+        if now - self._last_reload_check < self.reload_interval:
+            return
+        self._last_reload_check = now
+        if self._soul_mtime() != self._mtime:
+            self.reload()
+
     def check_tool_call(self, tool_name: str, params: dict[str, Any]) -> SoulResult:
         """
         Validate a tool call against all safety rules.
@@ -103,65 +264,21 @@ class InvariantChecker:
             >>> print(result.allowed)  # False
             >>> print(result.reason)   # "Touching .git is forbidden..."
         """
-        # Check each rule in order
-        for rule in self.rules:
-            # Only apply rules that have "block" action
-            if rule.get("action") != "block":
-                continue
+        self._maybe_reload()
 
-            # Check if this rule applies to this tool call
-            result = self._check_rule(rule, tool_name, params)
-            if not result.allowed:
-                return result
+        # All supported conditions are file path based
+        if "path" not in params:
+            return SoulResult(allowed=True)
 
-        # All rules passed
-        return SoulResult(allowed=True)
-
-    def _check_rule(self, rule: dict, tool_name: str, params: dict[str, Any]) -> SoulResult:
-        """
-        Check a single rule against a tool call.
+        buckets, default = self._rule_sets
+        rule_set = buckets.get(tool_name, default)
 
-        Args:
-            rule: The rule dictionary from soul.yaml
-            tool_name: Name of the tool
-            params: Tool parameters
+        # The first matching rule (in soul.yaml order) blocks the call
+        position = rule_set.first_match(str(params["path"]), self._is_path_outside_root)
+        if position is not None:
+            return SoulResult(allowed=False, reason=rule_set.reasons[position])
 
-        Returns:
-            SoulResult indicating whether this rule blocks the call
-        """
-        condition = rule.get("condition")
-
-        # File path based rules (most common)
-        if "path" in params:
-            path_str = str(params["path"])
-
-            # Rule: path_contains
-            if condition == "path_contains":
-                pattern = rule.get("pattern", "")
-                if pattern and pattern in path_str:
-                    return SoulResult(
-                        allowed=False,
-                        reason=f"{rule.get('message', 'Path blocked by soul rule')} (Rule: {rule.get('id', 'unknown')})",
-                    )
-
-            # Rule: path_matches (exact match)
-            elif condition == "path_matches":
-                pattern = rule.get("pattern", "")
-                if pattern and pattern == path_str:
-                    return SoulResult(
-                        allowed=False,
-                        reason=f"{rule.get('message', 'Path blocked by soul rule')} (Rule: {rule.get('id', 'unknown')})",
-                    )
-
-            # Rule: path_outside_root (sandbox confinement)
-            elif condition == "path_outside_root":
-                if self._is_path_outside_root(path_str):
-                    return SoulResult(
-                        allowed=False,
-                        reason=f"{rule.get('message', 'Path outside root blocked')} (Rule: {rule.get('id', 'unknown')})",
-                    )
-
-        # Rule passed (or didn't apply)
+        # All rules passed
         return SoulResult(allowed=True)
 
     def _is_path_outside_root(self, path_str: str) -> bool:
@@ -177,34 +294,50 @@ class InvariantChecker:
         Returns:
             True if path is outside project root
         """
+        root = self._root_path()
         try:
-            # Get absolute path of the target
-            target_path = Path(path_str).resolve()
-
-            # Get project root (assuming we're running from project root)
-            # In production, this should be configurable
-            root_path = Path.cwd().resolve()
-
-            # Check if target is under root
-            # This handles .. and symlinks correctly
-            try:
-                target_path.relative_to(root_path)
-                return False  # Inside root
-            except ValueError:
-                return True  # Outside root
-
-        except (OSError, RuntimeError):
+            # Get absolute path of the target (handles .. and symlinks);
+            # relative paths are taken relative to a configured root
+            if self._fixed_root is not None:
+                path_str = os.path.join(root, path_str)
+            target = os.path.realpath(path_str)
+        except (OSError, RuntimeError, ValueError):
             # If we can't resolve the path, block it (fail-safe)
             return True
 
+        # Check if target is under root
+        return not (target == root or target.startswith(root.rstrip(os.sep) + os.sep))
+
+    def _root_path(self) -> str:
+        """Return the resolved project root (cached; re-resolved only if the cwd changes)."""
+        if self._fixed_root is not None:
+            return self._fixed_root
+
+        cwd = os.getcwd()
+        if self._root_cache is None or self._root_cache[0] != cwd:
+            self._root_cache = (cwd, os.path.realpath(cwd))
+        return self._root_cache[1]
+
     def reload(self) -> None:
         """
         Reload rules from soul.yaml.
 
-        Useful for development/testing when you want to update rules without
-        restarting the system.
+        Called automatically when the file's modification time changes;
+        call it directly to force a reload. If soul.yaml cannot be read or
+        parsed, the previous rules stay in force and the reload is retried
+        on the next modification-time check.
         """
-        self.rules = self._load_rules()
+        mtime = self._soul_mtime()
+        try:
+            rules = self._load_rules()
+            rule_sets = self._compile(rules)
+        except (OSError, yaml.YAMLError, AttributeError, TypeError) as e:
+            logger.warning(f"InvariantChecker: keeping previous rules, reload failed: {e}")
+            return
+
+        self.rules = rules
+        self._rule_sets = rule_sets
+        self._mtime = mtime
 
     @property
     def rule_count(self) -> int:
@@ -29,14 +29,21 @@ Example Usage:
 
 import json
 import logging
+import threading
 from datetime import datetime, timezone
 from hashlib import sha256
 from typing import Any
 
 from vibe_core.agent_protocol import VibeAgent
+from vibe_core.capability_index import CapabilityIndex
 
 logger = logging.getLogger(__name__)
 
+# Concurrent tasks an agent accepts when it does not declare max_concurrency.
+# Agents keep per-instance state (e.g. LLM conversation history), so the
+# safe default is one task at a time per agent.
+DEFAULT_MAX_CONCURRENCY = 1
+
 
 class ManifestGenerator:
     """
@@ -293,8 +300,10 @@ class ManifestGenerator:
         """
         Build the 'runtime' section (introspection endpoints).
 
-        This describes how to query the agent's runtime state. For Level 1,
-        we provide minimal info. Level 2+ can add:
+        This describes how to query the agent's runtime state and how many
+        tasks the kernel may run on the agent at once (max_concurrency, taken
+        from an optional `max_concurrency` attribute on the agent).
+        For Level 1, we provide minimal info. Level 2+ can add:
         - Live health checks
         - State query endpoints
         - Log access
@@ -309,6 +318,9 @@ class ManifestGenerator:
             "introspection_endpoint": f"kernel.get_agent_manifest('{agent.agent_id}')",
             "state_query": f"kernel.get_agent_status('{agent.agent_id}')",
             "logs": "kernel.ledger.query(agent_id='{agent.agent_id}')",
+            "max_concurrency": max(
+                1, int(getattr(agent, "max_concurrency", DEFAULT_MAX_CONCURRENCY))
+            ),
         }
 
     def _build_governance_section(self) -> dict[str, Any]:
@@ -407,6 +419,12 @@ class AgentManifest:
         """Return the agent's specialization domain."""
         return self.manifest["agent"]["specialization"]
 
+    @property
+    def max_concurrency(self) -> int:
+        """Return how many tasks the kernel may run on this agent at once."""
+        runtime = self.manifest.get("runtime") or {}
+        return max(1, int(runtime.get("max_concurrency", DEFAULT_MAX_CONCURRENCY)))
+
     def fingerprint(self) -> str:
         """
         Generate a SHA256 fingerprint of the manifest.
@@ -497,8 +515,9 @@ class AgentRegistry:
     Design:
     - Simple dict-based storage (Level 1)
     - Can be persisted to disk (data/registry/)
-    - Can be queried by agent_id or capability
-    - Thread-safe for reads (single-threaded kernel OK for now)
+    - Can be queried by agent_id or capability (CapabilityIndex, no scan)
+    - Thread-safe: registration is serialized by a lock so the concurrent
+      kernel (run_workers) can read while agents are being registered
 
     Example:
         >>> registry = AgentRegistry()
@@ -516,6 +535,8 @@ class AgentRegistry:
             >>> registry = AgentRegistry()
         """
         self.manifests: dict[str, AgentManifest] = {}
+        self._capability_index: CapabilityIndex[AgentManifest] = CapabilityIndex()
+        self._lock = threading.Lock()
         logger.debug("Initialized AgentRegistry")
 
     def register(self, manifest: AgentManifest) -> None:
@@ -535,10 +556,12 @@ class AgentRegistry:
         """
         agent_id = manifest.agent_id
 
-        if agent_id in self.manifests:
-            raise ValueError(f"Agent '{agent_id}' is already registered")
+        with self._lock:
+            if agent_id in self.manifests:
+                raise ValueError(f"Agent '{agent_id}' is already registered")
 
-        self.manifests[agent_id] = manifest
+            self.manifests[agent_id] = manifest
+            self._capability_index.add(manifest, manifest.capabilities)
         logger.info(f"Registered manifest for {agent_id}")
 
     def lookup(self, agent_id: str) -> AgentManifest | None:
@@ -572,9 +595,7 @@ class AgentRegistry:
             >>> agents = registry.find_by_capability("read_file")
             >>> print(f"Found {len(agents)} agents with read_file capability")
         """
-        return [
-            manifest for manifest in self.manifests.values() if capability in manifest.capabilities
-        ]
+        return self._capability_index.find(capability)
 
     def list_all(self) -> list[AgentManifest]:
         """
@@ -21,9 +21,35 @@ from pathlib import Path
 from typing import Any
 
 from vibe_core.kernel import VibeKernel
+from vibe_core.tools.file_index import get_file_index
 
 logger = logging.getLogger(__name__)
 
+# The file tree is embedded in every snapshot, so it stays shallow
+SNAPSHOT_TREE_DEPTH = 2
+SNAPSHOT_TREE_FILES_PER_DIR = 5
+
+# Runtime state, databases and caches are not system structure
+SNAPSHOT_SKIPPED_DIRS = frozenset({".vibe", "state", "cache", ".cache"})
+SNAPSHOT_SKIPPED_SUFFIXES = (
+    ".db",
+    ".db-journal",
+    ".db-shm",
+    ".db-wal",
+    ".sqlite",
+    ".sqlite3",
+    ".pkl",
+    ".pickle",
+    ".log",
+)
+
+
+def _skip_in_snapshot(name: str, is_dir: bool) -> bool:
+    """Return True for state, database and cache entries."""
+    if is_dir:
+        return name in SNAPSHOT_SKIPPED_DIRS
+    return name.endswith(SNAPSHOT_SKIPPED_SUFFIXES)
+
 
 @dataclass
 class FileNode:
@@ -103,55 +129,29 @@ class SystemIntrospector:
             current = current.parent
         return str(cwd)
 
-    def get_file_tree(self, max_depth: int = 3) -> str:
+    def get_file_tree(self, max_depth: int = SNAPSHOT_TREE_DEPTH) -> str:
         """
         Generate clean file tree showing only relevant system structure.
 
-        This is a **semantic** tree, not exhaustive - focuses on code and
-        architecture, not documentation or artifacts.
+        Built from the shared workspace FileIndex (hidden, __pycache__ and
+        .gitignore'd entries are skipped, as are state, database and cache
+        files); long file lists are collapsed to a count per directory to
+        keep the snapshot dense.
+
+        Args:
+            max_depth: Directory levels to expand
 
         Returns:
             Compact tree-formatted string suitable for agent context
         """
-        tree_lines = ["vibe-agency/"]
-        tree_lines.append("├── vibe_core/                    [Core OS Kernel]")
-        tree_lines.append("│   ├── kernel.py                (Task orchestrator)")
-        tree_lines.append("│   ├── ledger.py                (SQLite persistence)")
-        tree_lines.append("│   ├── identity.py              (STEWARD manifests)")
-        tree_lines.append("│   ├── agent_protocol.py        (VibeAgent interface)")
-        tree_lines.append("│   ├── introspection.py         (System snapshots)")
-        tree_lines.append("│   ├── agents/                  (Agent implementations)")
-        tree_lines.append("│   ├── scheduling/              (Task scheduler)")
-        tree_lines.append("│   ├── tools/                   (ReadFile, WriteFile, Delegate)")
-        tree_lines.append("│   ├── governance/              (Soul Governance)")
-        tree_lines.append("│   ├── llm/                     (Provider chain)")
-        tree_lines.append("│   └── playbook/                (Playbook execution)")
-        tree_lines.append("│")
-        tree_lines.append("├── apps/agency/")
-        tree_lines.append("│   ├── cli.py                   (Main CLI entry point)")
-        tree_lines.append("│   ├── orchestrator/            (Legacy orchestrator)")
-        tree_lines.append("│   └── specialists/             (Coding, Planning, Testing)")
-        tree_lines.append("│")
-        tree_lines.append("├── tests/                       [Test Suite - 631+ tests]")
-        tree_lines.append("│   ├── core/                    (Kernel, ledger, scheduler)")
-        tree_lines.append("│   ├── test_introspection.py    (ARCH-038 tests)")
-        tree_lines.append("│   ├── test_arch_*.py           (Architecture tests)")
-        tree_lines.append("│   └── mocks/                   (Mock providers)")
-        tree_lines.append("│")
-        tree_lines.append("├── docs/")
-        tree_lines.append("│   ├── architecture/            [System design docs]")
-        tree_lines.append("│   ├── policies/                (Agent decisions)")
-        tree_lines.append("│   └── roadmap/                 (Phase planning)")
-        tree_lines.append("│")
-        tree_lines.append("├── config/")
-        tree_lines.append("│   ├── soul.yaml                (Governance rules)")
-        tree_lines.append("│   └── vibe_config.yaml         (System config)")
-        tree_lines.append("│")
-        tree_lines.append("├── CLAUDE.md                    [Operational snapshot]")
-        tree_lines.append("├── INDEX.md                     [Documentation hub]")
-        tree_lines.append("├── steward.json                 [Master STEWARD manifest]")
-        tree_lines.append("└── pyproject.toml               [Package metadata]")
-
+        tree_lines = [f"{Path(self.repo_root).name}/"]
+        tree_lines.extend(
+            get_file_index(self.repo_root).tree(
+                max_depth=max_depth,
+                files_per_dir=SNAPSHOT_TREE_FILES_PER_DIR,
+                skip=_skip_in_snapshot,
+            )
+        )
         return "\n".join(tree_lines)
 
     def get_agent_status(self) -> list[AgentStatus]:
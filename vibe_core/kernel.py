@@ -8,8 +8,14 @@ The Kernel is the central "System Object" - before this, vibe was
 just a collection of scripts. Now, VibeKernel IS the application.
 """
 
+import asyncio
+import inspect
 import logging
 import os
+import threading
+from collections import Counter, OrderedDict
+from collections.abc import Callable
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from enum import Enum
 from pathlib import Path
 from typing import Any
@@ -17,10 +23,13 @@ from typing import Any
 from vibe_core.agent_protocol import AgentNotFoundError, VibeAgent
 from vibe_core.identity import AgentRegistry, generate_manifest_for_agent
 from vibe_core.ledger import VibeLedger
-from vibe_core.scheduling import Task, VibeScheduler
+from vibe_core.scheduling import Task, TaskEvent, TaskHandle, VibeScheduler
 
 logger = logging.getLogger(__name__)
 
+# Finished task handles kept for get_handle() lookups (oldest dropped first)
+DEFAULT_HANDLE_HISTORY = 1024
+
 
 class KernelStatus(str, Enum):
     """Kernel operational states."""
@@ -45,10 +54,12 @@ class VibeKernel:
     - Records all executions to ledger (ARCH-024)
     - Manages kernel lifecycle (boot/shutdown)
     - Provides tick() for incremental task processing
+    - Resolves the TaskHandle returned by submit() and notifies subscribers
+      when a task completes or fails (no ledger polling needed)
     - Serves as the single point of coordination
 
     Design Principles:
-    - Single-threaded execution (for now)
+    - Single-threaded execution via tick(); opt-in worker pool via run_workers()
     - Explicit tick() calls (no hidden threads)
     - Clear state machine (STOPPED -> RUNNING -> STOPPED)
     - Defensive programming (graceful idle handling)
@@ -56,26 +67,51 @@ class VibeKernel:
     - Persistent observability via ledger
     """
 
-    def __init__(self, ledger_path: str = "vibe_ledger.db"):
+    def __init__(
+        self,
+        ledger_path: str = "vibe_ledger.db",
+        scheduler: VibeScheduler | None = None,
+        ledger_write_behind: bool = False,
+        ledger_retention_days: float | None = None,
+    ):
         """
         Initialize the kernel with scheduler, agent registry, and ledger.
 
         Args:
             ledger_path: Path to SQLite ledger database. Use ":memory:"
                          for in-memory database (useful for testing).
+            scheduler: Scheduler instance to use. Defaults to the FIFO
+                       VibeScheduler; pass a PriorityScheduler for
+                       priority scheduling with aging and agent fairness.
+            ledger_write_behind: If True, the ledger batches its writes
+                                 (flushed on shutdown()); see VibeLedger.
+            ledger_retention_days: If set, finished tasks older than this are
+                                   rolled into the ledger's archive segments.
 
         Example:
             >>> kernel = VibeKernel()  # Uses "vibe_ledger.db"
             >>> test_kernel = VibeKernel(":memory:")  # In-memory for tests
+            >>> fair_kernel = VibeKernel(":memory:", scheduler=PriorityScheduler())
         """
-        self.scheduler = VibeScheduler()
+        self.scheduler = scheduler if scheduler is not None else VibeScheduler()
         self.agent_registry: dict[str, VibeAgent] = {}
+        self._registry_lock = threading.Lock()  # Guards agent_registry (run_workers)
         self.manifest_registry = AgentRegistry()  # STEWARD manifest registry (ARCH-026)
-        self.ledger = VibeLedger(ledger_path)
+        self.ledger = VibeLedger(
+            ledger_path,
+            write_behind=ledger_write_behind,
+            retention_days=ledger_retention_days,
+        )
         self.status = KernelStatus.STOPPED
         self.inbox_messages: list[dict[str, str]] = []  # GAD-006: Asynchronous Intent
         self.agenda_tasks: list[str] = []  # ARCH-045: Agenda system (pending tasks)
         self.git_status: str | None = None  # ARCH-044: Git-Ops sync status
+        # Task completion notifications (submit() handles + subscribe() callbacks)
+        self._events_lock = threading.Lock()
+        self._pending_handles: dict[str, TaskHandle] = {}
+        self._queue_depth: Counter[str] = Counter()  # Pending handles per agent
+        self._finished_handles: OrderedDict[str, TaskHandle] = OrderedDict()
+        self._subscribers: list[tuple[Callable[[TaskEvent], None], str | None]] = []
         logger.debug("KERNEL: Initialized (status=STOPPED)")
 
     def _scan_inbox(self) -> None:
@@ -271,7 +307,7 @@ class VibeKernel:
 
         This gracefully stops the kernel. Any pending tasks in the
         scheduler remain queued but will not be processed until
-        the kernel is booted again.
+        the kernel is booted again. Batched ledger writes are flushed.
 
         Example:
             >>> kernel = VibeKernel()
@@ -280,6 +316,7 @@ class VibeKernel:
             >>> print(kernel.status)  # KernelStatus.STOPPED
         """
         self.status = KernelStatus.STOPPED
+        self.ledger.flush()
         logger.info("KERNEL: SHUTDOWN")
 
     def register_agent(self, agent: VibeAgent) -> None:
@@ -308,12 +345,14 @@ class VibeKernel:
         """
         agent_id = agent.agent_id
 
-        if agent_id in self.agent_registry:
-            raise ValueError(
-                f"Agent '{agent_id}' is already registered. Cannot register duplicate agent IDs."
-            )
+        with self._registry_lock:
+            if agent_id in self.agent_registry:
+                raise ValueError(
+                    f"Agent '{agent_id}' is already registered. "
+                    f"Cannot register duplicate agent IDs."
+                )
 
-        self.agent_registry[agent_id] = agent
+            self.agent_registry[agent_id] = agent
         logger.info(f"KERNEL: Registered agent '{agent_id}'")
 
     def _validate_delegation(self, agent_id: str) -> None:
@@ -364,13 +403,17 @@ class VibeKernel:
 
         logger.debug(f"KERNEL: Delegation validation passed for {agent_id}")
 
-    def submit(self, task: Task) -> str:
+    def submit(self, task: Task) -> TaskHandle:
         """
         Submit a task to the kernel's scheduler (ARCH-026 Phase 4).
 
         This is a convenience proxy to scheduler.submit_task().
         Before queueing, it validates the agent using STEWARD manifest.
 
+        The returned TaskHandle is the task ID string and also a future:
+        it resolves when the kernel records the task's completion or failure,
+        so callers can wait on it instead of polling the ledger.
+
         Validation checks (Phase 4):
         1. Agent is registered
         2. Agent has an active manifest
@@ -380,7 +423,7 @@ class VibeKernel:
             task: The Task to be queued
 
         Returns:
-            str: The task ID for tracking
+            TaskHandle: The task ID (a str) with a future for its result
 
         Raises:
             ValueError: If agent is not registered or manifest invalid
@@ -388,21 +431,95 @@ class VibeKernel:
         Example:
             >>> kernel = VibeKernel()
             >>> task = Task(agent_id="agent-1", payload={"action": "compile"})
-            >>> task_id = kernel.submit(task)
+            >>> handle = kernel.submit(task)
+            >>> kernel.run_workers()
+            >>> handle.result()  # Agent's return value (or raises its error)
         """
         # ARCH-026 Phase 4: Validate delegation using manifest
         self._validate_delegation(task.agent_id)
 
-        task_id = self.scheduler.submit_task(task)
-        logger.debug(f"KERNEL: Task {task_id} submitted to {task.agent_id}")
-        return task_id
+        # Track the handle before queueing so a worker cannot finish the task first
+        handle = TaskHandle(task)
+        with self._events_lock:
+            self._pending_handles[task.id] = handle
+            self._queue_depth[task.agent_id] += 1
+
+        self.scheduler.submit_task(task)
+        logger.debug(f"KERNEL: Task {task.id} submitted to {task.agent_id}")
+        return handle
+
+    def subscribe(
+        self, callback: Callable[[TaskEvent], None], agent_id: str | None = None
+    ) -> Callable[[], None]:
+        """
+        Register a callback for task completion events.
+
+        The callback receives a TaskEvent for every task that completes or
+        fails (optionally only for one agent). It runs on the thread that
+        executed the task; exceptions it raises are logged and ignored.
+
+        Args:
+            callback: Function called with each TaskEvent
+            agent_id: If set, only events for this agent are delivered
+
+        Returns:
+            Callable[[], None]: Call it to unsubscribe
+
+        Example:
+            >>> unsubscribe = kernel.subscribe(lambda e: print(e.task_id, e.status))
+            >>> kernel.tick()  # Prints "<task-id> COMPLETED"
+            >>> unsubscribe()
+        """
+        subscription = (callback, agent_id)
+        with self._events_lock:
+            self._subscribers.append(subscription)
+
+        def unsubscribe() -> None:
+            with self._events_lock:
+                if subscription in self._subscribers:
+                    self._subscribers.remove(subscription)
+
+        return unsubscribe
+
+    def get_handle(self, task_id: str) -> TaskHandle | None:
+        """
+        Look up the handle of a submitted task.
+
+        Pending tasks are always found; finished ones only while they are
+        among the last DEFAULT_HANDLE_HISTORY completions. Fall back to the
+        ledger for anything older.
+
+        Args:
+            task_id: The task ID returned by submit()
+
+        Returns:
+            TaskHandle | None: The handle, or None if not tracked
+        """
+        with self._events_lock:
+            return self._pending_handles.get(task_id) or self._finished_handles.get(task_id)
+
+    def get_queue_depth(self, agent_id: str) -> int:
+        """
+        Return the number of submitted tasks for an agent that have not finished.
+
+        Counts queued and running tasks submitted through submit(); used by
+        AgentRouter to prefer the least loaded of equally capable agents.
+
+        Args:
+            agent_id: The agent to check
+
+        Returns:
+            int: Pending task count (0 if none)
+        """
+        with self._events_lock:
+            return self._queue_depth.get(agent_id, 0)
 
     def tick(self) -> bool:
         """
         Execute one iteration of the kernel loop.
 
         This is the heartbeat of the system. On each tick:
-        1. Retrieve the next task from the scheduler (FIFO)
+        1. Retrieve the next task from the scheduler (FIFO or priority)
         2. If a task exists, execute it
         3. If no task exists, return idle status
 
@@ -436,6 +553,167 @@ class VibeKernel:
         self._execute_task(task)
         return True
 
+    def run_workers(self, n: int = 4) -> int:
+        """
+        Drain the scheduler with a bounded pool of worker threads.
+
+        This is the concurrent counterpart of tick(): instead of running one
+        task per call on the caller's thread, up to `n` tasks run at once so a
+        slow agent (e.g. a long LLM call) no longer blocks every other agent.
+        tick() remains the single-threaded path and is unaffected.
+
+        Per-agent concurrency is capped by the agent's STEWARD manifest
+        (runtime.max_concurrency, default 1). Tasks for an agent that is at
+        its cap stay queued in the scheduler (still aging and competing by
+        priority) until one of its running tasks ends.
+
+        Tasks submitted while the pool runs (e.g. by delegating agents) are
+        picked up as well. Returns once the queue is empty and all workers
+        are idle.
+
+        Args:
+            n: Maximum number of tasks executing at the same time
+
+        Returns:
+            int: Number of tasks executed (successful or failed)
+
+        Raises:
+            ValueError: If n is less than 1
+
+        Example:
+            >>> kernel = VibeKernel()
+            >>> kernel.boot()
+            >>> kernel.submit(Task(agent_id="agent-1", payload={}))
+            >>> kernel.submit(Task(agent_id="agent-2", payload={}))
+            >>> kernel.run_workers(4)  # Both agents run in parallel
+            2
+
+        Notes:
+            - Task failures are recorded to the ledger and logged; they do
+              not stop the pool (unlike tick(), which re-raises)
+            - Agents without a manifest (kernel not booted) are capped at 1
+        """
+        if n < 1:
+            raise ValueError(f"Worker count must be at least 1, got {n}")
+
+        if self.status != KernelStatus.RUNNING:
+            logger.warning(f"KERNEL: run_workers() called but status is {self.status}")
+            return 0
+
+        in_flight: dict[Future, Task] = {}
+        running: Counter[str] = Counter()
+        executed = 0
+
+        logger.info(f"KERNEL: Worker pool started (workers={n})")
+        with ThreadPoolExecutor(max_workers=n, thread_name_prefix="vibe-worker") as pool:
+            while True:
+                while len(in_flight) < n:
+                    task = self._next_dispatchable(running)
+                    if task is None:
+                        break
+                    running[task.agent_id] += 1
+                    in_flight[pool.submit(self._execute_task, task)] = task
+
+                if not in_flight:
+                    break
+
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    task = in_flight.pop(future)
+                    running[task.agent_id] -= 1
+                    executed += 1
+                    error = future.exception()
+                    if error is not None:
+                        logger.error(f"KERNEL: Worker task {task.id} failed: {error}")
+
+        logger.info(f"KERNEL: Worker pool drained ({executed} task(s) executed)")
+        return executed
+
+    async def run_async(self, max_concurrency: int = 16) -> int:
+        """
+        Drain the scheduler on the running event loop.
+
+        The asyncio counterpart of run_workers(): agents that implement an
+        aprocess() coroutine (e.g. SimpleLLMAgent) are awaited directly, so
+        many LLM calls can be in flight without a thread each; other agents
+        run in worker threads. Per-agent concurrency caps apply exactly as
+        in run_workers().
+
+        Args:
+            max_concurrency: Maximum number of tasks in flight at once
+
+        Returns:
+            int: Number of tasks executed (successful or failed)
+
+        Raises:
+            ValueError: If max_concurrency is less than 1
+
+        Example:
+            >>> kernel.submit(Task(agent_id="llm-a", payload={"user_message": "..."}))
+            >>> kernel.submit(Task(agent_id="llm-b", payload={"user_message": "..."}))
+            >>> await kernel.run_async()  # Both LLM calls overlap
+            2
+        """
+        if max_concurrency < 1:
+            raise ValueError(f"max_concurrency must be at least 1, got {max_concurrency}")
+
+        if self.status != KernelStatus.RUNNING:
+            logger.warning(f"KERNEL: run_async() called but status is {self.status}")
+            return 0
+
+        in_flight: dict[asyncio.Task, Task] = {}
+        running: Counter[str] = Counter()
+        executed = 0
+
+        while True:
+            while len(in_flight) < max_concurrency:
+                task = self._next_dispatchable(running)
+                if task is None:
+                    break
+                running[task.agent_id] += 1
+                in_flight[asyncio.ensure_future(self._aexecute_task(task))] = task
+
+            if not in_flight:
+                break
+
+            done, _ = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+            for future in done:
+                task = in_flight.pop(future)
+                running[task.agent_id] -= 1
+                executed += 1
+                error = future.exception()
+                if error is not None:
+                    logger.error(f"KERNEL: Async task {task.id} failed: {error}")
+
+        logger.info(f"KERNEL: Event loop drained ({executed} task(s) executed)")
+        return executed
+
+    def _next_dispatchable(self, running: Counter[str]) -> Task | None:
+        """
+        Pick the next task whose agent is below its concurrency cap.
+
+        Saturated agents are excluded from the scheduler lookup rather than
+        dequeued, so their tasks keep their place, age, and still show up in
+        get_queue_status() and get_queue_depth().
+
+        Args:
+            running: Number of in-flight tasks per agent
+
+        Returns:
+            Task | None: A task that may start now, or None if none can
+        """
+        saturated = {
+            agent_id
+            for agent_id, count in running.items()
+            if count >= self._agent_concurrency_limit(agent_id)
+        }
+        return self.scheduler.next_task(exclude_agents=saturated)
+
+    def _agent_concurrency_limit(self, agent_id: str) -> int:
+        """Return the agent's max concurrent tasks from its STEWARD manifest (default 1)."""
+        manifest = self.manifest_registry.lookup(agent_id)
+        return manifest.max_concurrency if manifest else 1
+
     def _execute_task(self, task: Task) -> Any:
         """
         Execute a single task by dispatching to the registered agent.
@@ -459,19 +737,55 @@ class VibeKernel:
             - All executions (success/failure) are recorded to the ledger
             - Ledger recording failures are logged but don't stop execution
         """
+        agent = self._begin_task(task)
+
+        try:
+            # Execute the task
+            result = agent.process(task)
+        except Exception as e:
+            self._fail_task(task, e)
+            # Re-raise the exception so caller can handle it
+            raise
+
+        return self._complete_task(task, result)
+
+    async def _aexecute_task(self, task: Task) -> Any:
+        """
+        Async counterpart of _execute_task() used by run_async().
+
+        Agents with an aprocess() coroutine are awaited on the event loop;
+        plain agents run process() in a worker thread.
+        """
+        agent = self._begin_task(task)
+
+        try:
+            if inspect.iscoroutinefunction(getattr(agent, "aprocess", None)):
+                result = await agent.aprocess(task)
+            else:
+                result = await asyncio.to_thread(agent.process, task)
+        except Exception as e:
+            self._fail_task(task, e)
+            raise
+
+        return self._complete_task(task, result)
+
+    def _begin_task(self, task: Task) -> VibeAgent:
+        """Look up the task's agent and record the start (raises if unknown)."""
         agent_id = task.agent_id
 
         # Look up the agent in the registry
-        if agent_id not in self.agent_registry:
-            error_msg = (
-                f"Agent '{agent_id}' not found. Available: {list(self.agent_registry.keys())}"
-            )
+        with self._registry_lock:
+            agent = self.agent_registry.get(agent_id)
+            available = list(self.agent_registry.keys())
+
+        if agent is None:
+            error_msg = f"Agent '{agent_id}' not found. Available: {available}"
             logger.error(f"KERNEL: {error_msg} (task={task.id})")
             # Record the failure before raising
             self.ledger.record_failure(task, error_msg)
-            raise AgentNotFoundError(agent_id=agent_id, task_id=task.id)
-
-        agent = self.agent_registry[agent_id]
+            error = AgentNotFoundError(agent_id=agent_id, task_id=task.id)
+            self._publish(TaskEvent(task.id, agent_id, "FAILED", error=error))
+            raise error
 
         # Record task start
         self.ledger.record_start(task)
@@ -481,32 +795,56 @@ class VibeKernel:
             f">> KERNEL EXEC: Dispatching Task {task.id} to Agent '{agent_id}' "
             f"(payload={task.payload})"
         )
-
-        try:
-            # Execute the task
-            result = agent.process(task)
-
-            # Convert AgentResponse to dict for ledger storage if needed
-            from vibe_core.agent_protocol import AgentResponse
-
-            result_for_ledger = result.to_dict() if isinstance(result, AgentResponse) else result
-
-            # Record successful completion
-            self.ledger.record_completion(task, result_for_ledger)
-
-            logger.debug(f"KERNEL: Task {task.id} completed (result={result})")
-
-            return result
-
-        except Exception as e:
-            # Record failure before re-raising
-            error_msg = f"{type(e).__name__}: {e!s}"
-            self.ledger.record_failure(task, error_msg)
-
-            logger.error(f"KERNEL: Task {task.id} failed: {error_msg}")
-
-            # Re-raise the exception so caller can handle it
-            raise
+        return agent
+
+    def _complete_task(self, task: Task, result: Any) -> Any:
+        """Record a successful result in the ledger and return it."""
+        # Convert AgentResponse to dict for ledger storage if needed
+        from vibe_core.agent_protocol import AgentResponse
+
+        result_for_ledger = result.to_dict() if isinstance(result, AgentResponse) else result
+
+        # Record successful completion
+        self.ledger.record_completion(task, result_for_ledger)
+
+        logger.debug(f"KERNEL: Task {task.id} completed (result={result})")
+        self._publish(TaskEvent(task.id, task.agent_id, "COMPLETED", result=result))
+
+        return result
+
+    def _fail_task(self, task: Task, error: Exception) -> None:
+        """Record an agent failure in the ledger."""
+        error_msg = f"{type(error).__name__}: {error!s}"
+        self.ledger.record_failure(task, error_msg)
+
+        logger.error(f"KERNEL: Task {task.id} failed: {error_msg}")
+        self._publish(TaskEvent(task.id, task.agent_id, "FAILED", error=error))
+
+    def _publish(self, event: TaskEvent) -> None:
+        """Resolve the task's handle and deliver the event to subscribers."""
+        with self._events_lock:
+            handle = self._pending_handles.pop(event.task_id, None)
+            if handle is not None:
+                self._queue_depth[handle.task.agent_id] -= 1
+                if not self._queue_depth[handle.task.agent_id]:
+                    del self._queue_depth[handle.task.agent_id]
+                self._finished_handles[event.task_id] = handle
+                while len(self._finished_handles) > DEFAULT_HANDLE_HISTORY:
+                    self._finished_handles.popitem(last=False)
+            subscribers = [
+                callback
+                for callback, agent_id in self._subscribers
+                if agent_id is None or agent_id == event.agent_id
+            ]
+
+        if handle is not None:
+            handle._resolve(event)
+
+        for callback in subscribers:
+            try:
+                callback(event)
+            except Exception as e:
+                logger.error(f"KERNEL: Task event subscriber failed for {event.task_id}: {e}")
 
     def get_status(self) -> dict:
         """
@@ -580,7 +918,7 @@ class VibeKernel:
             >>> print(f"Found {len(planning_agents)} planning agents")
 
         Notes:
-            - Searches manifest capabilities
+            - Served by the manifest registry's capability index (no scan)
             - Returns empty list if no matches found
             - Useful for intelligent task routing
         """
@@ -653,11 +991,10 @@ class VibeKernel:
             - Equivalent to: kernel.get_task_result(task_id)["output_result"]
             - Returns None if task not found OR if no output_result
             - Always safe to use (no KeyError)
+            - Reads only the result columns (large results are decompressed
+              from the ledger's blob table on demand)
         """
-        record = self.get_task_result(task_id)
-        if record is None:
-            return None
-        return record.get("output_result")
+        return self.ledger.get_task_output(task_id)
 
     def get_inbox_messages(self) -> list[dict[str, str]]:
         """
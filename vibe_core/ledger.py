@@ -8,16 +8,138 @@ The Ledger is the "Black Box" - it records every task execution
 for observability, debugging, and crash recovery.
 """
 
+import gzip
+import hashlib
 import json
 import logging
+import os
 import sqlite3
-from datetime import datetime
+import threading
+import time
+import zlib
+from collections import Counter, defaultdict
+from collections.abc import Iterator
+from datetime import datetime, timedelta
+from pathlib import Path
 from typing import Any
 
 from vibe_core.scheduling import Task
 
 logger = logging.getLogger(__name__)
 
+_COLUMNS = (
+    "task_id",
+    "agent_id",
+    "input_payload",
+    "output_result",
+    "status",
+    "error_message",
+    "timestamp",
+    "output_ref",
+    "output_size",
+)
+
+# Columns returned by metadata-only history queries (no result body)
+_METADATA_COLUMNS = tuple(col for col in _COLUMNS if col != "output_result")
+
+# Upsert (not INSERT OR REPLACE): REPLACE deletes the old row without firing
+# DELETE triggers, which would corrupt the aggregate tables maintained below.
+# Only the module-level column names are interpolated; values are bound as ? parameters.
+_UPSERT_SQL = f"""
+    INSERT INTO task_history ({", ".join(_COLUMNS)})
+    VALUES ({", ".join("?" for _ in _COLUMNS)})
+    ON CONFLICT(task_id) DO UPDATE SET
+    {", ".join(f"{col} = excluded.{col}" for col in _COLUMNS[1:])}
+"""  # noqa: S608
+
+# Secondary indexes: filtered history queries and keyset pagination walk these
+# in (timestamp, task_id) order instead of scanning and sorting the table.
+_INDEX_SQL = (
+    "CREATE INDEX IF NOT EXISTS idx_task_history_timestamp ON task_history (timestamp, task_id)",
+    "CREATE INDEX IF NOT EXISTS idx_task_history_agent_timestamp "
+    "ON task_history (agent_id, timestamp, task_id)",
+    "CREATE INDEX IF NOT EXISTS idx_task_history_status_timestamp "
+    "ON task_history (status, timestamp, task_id)",
+)
+
+# Aggregate tables kept in sync by triggers, so get_statistics() reads a
+# handful of counter rows instead of scanning task_history.
+_AGGREGATE_SQL = (
+    """
+    CREATE TABLE IF NOT EXISTS task_status_counts (
+        status TEXT PRIMARY KEY,
+        count INTEGER NOT NULL
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS task_agent_counts (
+        agent_id TEXT PRIMARY KEY,
+        count INTEGER NOT NULL
+    )
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS trg_task_history_insert
+    AFTER INSERT ON task_history
+    BEGIN
+        INSERT INTO task_status_counts (status, count) VALUES (NEW.status, 1)
+            ON CONFLICT(status) DO UPDATE SET count = count + 1;
+        INSERT INTO task_agent_counts (agent_id, count) VALUES (NEW.agent_id, 1)
+            ON CONFLICT(agent_id) DO UPDATE SET count = count + 1;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS trg_task_history_update
+    AFTER UPDATE OF status, agent_id ON task_history
+    WHEN OLD.status IS NOT NEW.status OR OLD.agent_id IS NOT NEW.agent_id
+    BEGIN
+        UPDATE task_status_counts SET count = count - 1 WHERE status = OLD.status;
+        INSERT INTO task_status_counts (status, count) VALUES (NEW.status, 1)
+            ON CONFLICT(status) DO UPDATE SET count = count + 1;
+        UPDATE task_agent_counts SET count = count - 1 WHERE agent_id = OLD.agent_id;
+        INSERT INTO task_agent_counts (agent_id, count) VALUES (NEW.agent_id, 1)
+            ON CONFLICT(agent_id) DO UPDATE SET count = count + 1;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS trg_task_history_delete
+    AFTER DELETE ON task_history
+    BEGIN
+        UPDATE task_status_counts SET count = count - 1 WHERE status = OLD.status;
+        UPDATE task_agent_counts SET count = count - 1 WHERE agent_id = OLD.agent_id;
+    END
+    """,
+)
+
+# Write-behind defaults: flush after this many pending rows or this many seconds
+DEFAULT_BATCH_SIZE = 200
+DEFAULT_FLUSH_INTERVAL = 0.5
+
+# Serialized results at least this many bytes are compressed and moved out of
+# task_history into the content-addressed task_blobs table
+INLINE_RESULT_LIMIT = 1024
+
+# Content-addressed result bodies: key is the SHA-256 of the uncompressed JSON,
+# so identical results (retries, repeated LLM answers) are stored once
+_BLOB_SQL = """
+    CREATE TABLE IF NOT EXISTS task_blobs (
+        hash TEXT PRIMARY KEY,
+        codec TEXT NOT NULL,
+        size INTEGER NOT NULL,
+        data BLOB NOT NULL
+    )
+"""
+_BLOB_INSERT_SQL = (
+    "INSERT INTO task_blobs (hash, codec, size, data) VALUES (?, ?, ?, ?) "
+    "ON CONFLICT(hash) DO NOTHING"
+)
+
+# Retention: seconds between automatic maintenance runs (archive + vacuum)
+DEFAULT_MAINTENANCE_INTERVAL = 3600.0
+
+# Archive segments: one gzip'd JSON-lines file per UTC day, append-only
+_SEGMENT_PREFIX = "task_history-"
+_SEGMENT_SUFFIX = ".jsonl.gz"
+
 
 class VibeLedger:
     """
@@ -35,32 +157,105 @@ class VibeLedger:
     - Structured data (JSON serialization for complex payloads)
     - Failure-safe (recording errors never crashes kernel)
     - Queryable (SQL interface for analysis)
+    - Thread-safe (one lock serializes access to the shared connection,
+      so concurrent kernel workers can record safely)
+    - Optional write-behind mode: events are staged in memory and flushed
+      in batches inside one transaction (by count or time window), so a
+      task costs a fraction of a commit instead of two fsyncs. get_task()
+      still sees pending writes; flush() is the barrier for tests/shutdown.
+    - Compact history: results of INLINE_RESULT_LIMIT bytes or more are
+      zlib-compressed into a deduplicated blob table; history queries return
+      metadata only unless include_output=True, and get_task_output()
+      fetches a single body on demand.
+    - Optional retention: rows beyond an age / row-count policy are rolled
+      into compressed per-day segment files (see apply_retention()) that
+      get_history(include_archived=True) still reads, and freed pages are
+      returned to the filesystem by incremental vacuum. A background thread
+      applies the policy, so writers never pay for archiving inline.
 
     Schema:
         task_history table:
         - task_id: Unique task identifier (TEXT PRIMARY KEY)
         - agent_id: Agent that processed the task (TEXT)
         - input_payload: Task payload as JSON (TEXT)
-        - output_result: Agent result as JSON (TEXT, nullable)
+        - output_result: Agent result as JSON if small (TEXT, nullable)
         - status: COMPLETED, FAILED, or STARTED (TEXT)
         - error_message: Error details if FAILED (TEXT, nullable)
         - timestamp: Execution timestamp (TEXT, ISO format)
+        - output_ref: task_blobs hash if the result is stored out of line (TEXT, nullable)
+        - output_size: Size of the serialized result in bytes (INTEGER, nullable)
+        Indexed on (timestamp), (agent_id, timestamp) and (status, timestamp).
+
+        task_blobs table:
+        - hash: SHA-256 of the serialized result (TEXT PRIMARY KEY)
+        - codec: Compression codec, currently "zlib" (TEXT)
+        - size: Uncompressed size in bytes (INTEGER)
+        - data: Compressed result (BLOB)
+
+        task_status_counts / task_agent_counts tables:
+        - Row counts per status / agent, maintained by triggers
     """
 
-    def __init__(self, db_path: str = "vibe_ledger.db"):
+    def __init__(
+        self,
+        db_path: str = "vibe_ledger.db",
+        write_behind: bool = False,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+        retention_days: float | None = None,
+        retention_max_rows: int | None = None,
+        archive_dir: str | None = None,
+        maintenance_interval: float = DEFAULT_MAINTENANCE_INTERVAL,
+    ):
         """
         Initialize the ledger with SQLite database.
 
         Args:
             db_path: Path to SQLite database file. Use ":memory:"
                      for in-memory database (testing).
+            write_behind: If True, queue events and flush them in batches
+                          instead of committing every event.
+            batch_size: Write-behind only - flush once this many rows are pending
+            flush_interval: Write-behind only - flush pending rows at least
+                            every this many seconds (background thread)
+            retention_days: Archive finished tasks older than this many days
+            retention_max_rows: Archive finished tasks beyond the newest N rows
+            archive_dir: Directory for archive segments. Defaults to
+                         "<db name>_archive" next to the database file.
+            maintenance_interval: Seconds between automatic maintenance runs
+                                  (background thread, only when a retention
+                                  policy is set)
 
         Example:
             >>> ledger = VibeLedger("vibe_ledger.db")
             >>> # For testing:
             >>> test_ledger = VibeLedger(":memory:")
+            >>> # High-throughput kernels:
+            >>> fast_ledger = VibeLedger("vibe_ledger.db", write_behind=True)
+            >>> # Keep one week hot, archive the rest:
+            >>> lean_ledger = VibeLedger("vibe_ledger.db", retention_days=7)
         """
+        if batch_size < 1:
+            raise ValueError(f"batch_size must be at least 1, got {batch_size}")
+        if retention_max_rows is not None and retention_max_rows < 0:
+            raise ValueError(f"retention_max_rows must be >= 0, got {retention_max_rows}")
+
         self.db_path = db_path
+        self.write_behind = write_behind
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._lock = threading.RLock()
+        self._pending: dict[str, tuple] = {}  # task_id -> latest unflushed row
+        self._pending_blobs: dict[str, tuple] = {}  # hash -> unflushed task_blobs row
+        self._last_flush = time.monotonic()
+        self._stop_flusher = threading.Event()
+        self._flusher: threading.Thread | None = None
+        self.retention_days = retention_days
+        self.retention_max_rows = retention_max_rows
+        self.maintenance_interval = maintenance_interval
+        self._last_maintenance = time.monotonic()  # First run one interval from now
+        self._stop_maintenance = threading.Event()
+        self._maintainer: threading.Thread | None = None
         try:
             self.conn = sqlite3.connect(db_path, check_same_thread=False)
             # Test connection integrity
@@ -76,10 +271,50 @@ class VibeLedger:
             logger.info("LEDGER: Initialized (db_path=:memory: [FALLBACK])")
 
         self.conn.row_factory = sqlite3.Row  # Enable dict-like access
+        if archive_dir is None and self.db_path != ":memory:":
+            db_file = Path(self.db_path)
+            archive_dir = str(db_file.parent / f"{db_file.stem}_archive")
+        self.archive_dir = Path(archive_dir) if archive_dir else None
+        self._configure_journal()
         self._initialize_schema()
 
+        if self.write_behind:
+            self._flusher = threading.Thread(
+                target=self._flush_loop, name="vibe-ledger-flusher", daemon=True
+            )
+            self._flusher.start()
+
+        if self.retention_days is not None or self.retention_max_rows is not None:
+            self._maintainer = threading.Thread(
+                target=self._maintenance_loop, name="vibe-ledger-maintenance", daemon=True
+            )
+            self._maintainer.start()
+
+    def _configure_journal(self) -> None:
+        """
+        Enable WAL journaling for on-disk ledgers.
+
+        WAL turns each commit into a sequential append (one fsync at
+        checkpoint time instead of per commit with synchronous=NORMAL), and
+        lets readers proceed while a batch is being written.
+        """
+        if self.db_path == ":memory:":
+            return
+        try:
+            # Only takes effect on a new database (existing ones: vacuum(full=True))
+            self.conn.execute("PRAGMA auto_vacuum=INCREMENTAL")
+            self.conn.execute("PRAGMA journal_mode=WAL")
+            self.conn.execute("PRAGMA synchronous=NORMAL")
+        except sqlite3.Error as e:
+            logger.warning(f"LEDGER: Could not enable WAL journal: {e}")
+
     def _initialize_schema(self) -> None:
-        """Create task_history table if it doesn't exist."""
+        """
+        Create task_history, its indexes and aggregate tables if missing.
+
+        Ledgers created before the aggregate tables existed are backfilled
+        once with a full scan; afterwards the triggers keep them current.
+        """
         cursor = self.conn.cursor()
         cursor.execute(
             """
@@ -90,10 +325,39 @@ class VibeLedger:
                 output_result TEXT,
                 status TEXT NOT NULL,
                 error_message TEXT,
-                timestamp TEXT NOT NULL
+                timestamp TEXT NOT NULL,
+                output_ref TEXT,
+                output_size INTEGER
             )
         """
         )
+        # Ledgers created before out-of-line results existed
+        existing = {row["name"] for row in cursor.execute("PRAGMA table_info(task_history)")}
+        for column, column_type in (("output_ref", "TEXT"), ("output_size", "INTEGER")):
+            if column not in existing:
+                cursor.execute(f"ALTER TABLE task_history ADD COLUMN {column} {column_type}")
+        cursor.execute(_BLOB_SQL)
+        for statement in _INDEX_SQL:
+            cursor.execute(statement)
+
+        cursor.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'task_status_counts'"
+        )
+        needs_backfill = cursor.fetchone() is None
+        for statement in _AGGREGATE_SQL:
+            cursor.execute(statement)
+
+        if needs_backfill:
+            cursor.execute(
+                "INSERT INTO task_status_counts (status, count) "
+                "SELECT status, COUNT(*) FROM task_history GROUP BY status"
+            )
+            cursor.execute(
+                "INSERT INTO task_agent_counts (agent_id, count) "
+                "SELECT agent_id, COUNT(*) FROM task_history GROUP BY agent_id"
+            )
+            logger.debug("LEDGER: Aggregate tables backfilled")
+
         self.conn.commit()
         logger.debug("LEDGER: Schema initialized")
 
@@ -111,22 +375,7 @@ class VibeLedger:
             >>> ledger.record_start(task)
         """
         try:
-            cursor = self.conn.cursor()
-            cursor.execute(
-                """
-                INSERT OR REPLACE INTO task_history
-                (task_id, agent_id, input_payload, status, timestamp)
-                VALUES (?, ?, ?, ?, ?)
-            """,
-                (
-                    task.id,
-                    task.agent_id,
-                    json.dumps(task.payload),
-                    "STARTED",
-                    datetime.utcnow().isoformat(),
-                ),
-            )
-            self.conn.commit()
+            self._write_row(self._build_row(task, "STARTED"))
             logger.debug(f"LEDGER: Recorded START for task {task.id}")
         except Exception as e:
             logger.error(f"LEDGER: Failed to record start for task {task.id}: {e}")
@@ -145,6 +394,8 @@ class VibeLedger:
 
         Notes:
             - Result is JSON-serialized; non-serializable results are converted to str
+            - Results of INLINE_RESULT_LIMIT bytes or more are stored compressed
+              in task_blobs (deduplicated by content hash)
             - Recording failures are logged but don't raise exceptions
         """
         try:
@@ -154,23 +405,23 @@ class VibeLedger:
             except (TypeError, ValueError):
                 result_json = json.dumps(str(result))
 
-            cursor = self.conn.cursor()
-            cursor.execute(
-                """
-                INSERT OR REPLACE INTO task_history
-                (task_id, agent_id, input_payload, output_result, status, timestamp)
-                VALUES (?, ?, ?, ?, ?, ?)
-            """,
-                (
-                    task.id,
-                    task.agent_id,
-                    json.dumps(task.payload),
-                    result_json,
-                    "COMPLETED",
-                    datetime.utcnow().isoformat(),
-                ),
-            )
-            self.conn.commit()
+            encoded = result_json.encode("utf-8")
+            if len(encoded) < INLINE_RESULT_LIMIT:
+                row = self._build_row(
+                    task, "COMPLETED", output_result=result_json, output_size=len(encoded)
+                )
+                self._write_row(row)
+            else:
+                blob = (
+                    hashlib.sha256(encoded).hexdigest(),
+                    "zlib",
+                    len(encoded),
+                    zlib.compress(encoded),
+                )
+                row = self._build_row(
+                    task, "COMPLETED", output_ref=blob[0], output_size=len(encoded)
+                )
+                self._write_row(row, blob)
             logger.debug(f"LEDGER: Recorded COMPLETED for task {task.id}")
         except Exception as e:
             logger.error(f"LEDGER: Failed to record completion for task {task.id}: {e}")
@@ -195,29 +446,161 @@ class VibeLedger:
             - This ensures the ledger never causes a double-fault
         """
         try:
-            cursor = self.conn.cursor()
-            cursor.execute(
-                """
-                INSERT OR REPLACE INTO task_history
-                (task_id, agent_id, input_payload, status, error_message, timestamp)
-                VALUES (?, ?, ?, ?, ?, ?)
-            """,
-                (
-                    task.id,
-                    task.agent_id,
-                    json.dumps(task.payload),
-                    "FAILED",
-                    error,
-                    datetime.utcnow().isoformat(),
-                ),
-            )
-            self.conn.commit()
+            self._write_row(self._build_row(task, "FAILED", error_message=error))
             logger.debug(f"LEDGER: Recorded FAILED for task {task.id}")
         except Exception as e:
             logger.error(f"LEDGER: Failed to record failure for task {task.id}: {e}")
 
+    @staticmethod
+    def _build_row(
+        task: Task,
+        status: str,
+        output_result: str | None = None,
+        error_message: str | None = None,
+        output_ref: str | None = None,
+        output_size: int | None = None,
+    ) -> tuple:
+        """Build a full task_history row (column order of _UPSERT_SQL)."""
+        return (
+            task.id,
+            task.agent_id,
+            json.dumps(task.payload),
+            output_result,
+            status,
+            error_message,
+            datetime.utcnow().isoformat(),
+            output_ref,
+            output_size,
+        )
+
+    def _write_row(self, row: tuple, blob: tuple | None = None) -> None:
+        """
+        Persist one task_history row (and the result blob it references).
+
+        Direct mode: upsert and commit immediately.
+        Write-behind mode: stage the row in memory (a later event for the same
+        task replaces the earlier one) and flush once batch_size rows are pending.
+        """
+        with self._lock:
+            if self.write_behind:
+                if blob is not None:
+                    self._pending_blobs[blob[0]] = blob
+                self._pending[row[0]] = row
+                if len(self._pending) >= self.batch_size:
+                    self._flush_pending()
+                return
+
+            with self.conn:  # Blob and row commit together
+                if blob is not None:
+                    self.conn.execute(_BLOB_INSERT_SQL, blob)
+                self.conn.execute(_UPSERT_SQL, row)
+
+    def flush(self) -> int:
+        """
+        Write all pending events to the database (write-behind barrier).
+
+        In direct mode this is a no-op. Call it before reading the database
+        from another connection, in tests, and on shutdown.
+
+        Returns:
+            int: Number of rows written
+
+        Example:
+            >>> ledger = VibeLedger("vibe_ledger.db", write_behind=True)
+            >>> ledger.record_start(task)
+            >>> ledger.flush()  # Row is now on disk
+            1
+        """
+        with self._lock:
+            return self._flush_pending()
+
+    def _flush_pending(self) -> int:
+        """Write the pending rows in one transaction (caller holds the lock)."""
+        if not self._pending:
+            return 0
+
+        rows = list(self._pending.values())
+        try:
+            with self.conn:  # Single transaction: commit on success, rollback on error
+                self.conn.executemany(_BLOB_INSERT_SQL, self._pending_blobs.values())
+                self.conn.executemany(_UPSERT_SQL, rows)
+        except sqlite3.Error as e:
+            # Keep rows pending so the next flush retries them
+            logger.error(f"LEDGER: Failed to flush {len(rows)} pending row(s): {e}")
+            return 0
+
+        self._pending.clear()
+        self._pending_blobs.clear()
+        self._last_flush = time.monotonic()
+        logger.debug(f"LEDGER: Flushed {len(rows)} row(s)")
+        return len(rows)
+
+    def _flush_loop(self) -> None:
+        """Background flusher: flush pending rows every flush_interval seconds."""
+        while not self._stop_flusher.wait(self.flush_interval):
+            with self._lock:
+                if self._pending and time.monotonic() - self._last_flush >= self.flush_interval:
+                    self._flush_pending()
+
+    def _pending_record(self, task_id: str) -> dict[str, Any] | None:
+        """Return a not-yet-flushed row as a record dict (caller holds the lock)."""
+        row = self._pending.get(task_id)
+        if row is None:
+            return None
+        return dict(zip(_COLUMNS, row, strict=True))
+
+    def _load_outputs(self, records: list[dict[str, Any]]) -> None:
+        """
+        Fill output_result of records whose result lives in task_blobs.
+
+        Fetches all referenced blobs in one query (pending blobs first).
+        Caller holds the lock.
+        """
+        refs = {r["output_ref"] for r in records if r.get("output_ref")}
+        if not refs:
+            return
+
+        blobs = {ref: self._pending_blobs[ref] for ref in refs if ref in self._pending_blobs}
+        missing = [ref for ref in refs if ref not in blobs]
+        if missing:
+            placeholders = ", ".join("?" for _ in missing)
+            cursor = self.conn.execute(
+                f"SELECT hash, codec, size, data FROM task_blobs WHERE hash IN ({placeholders})",  # noqa: S608
+                missing,
+            )
+            blobs.update({row["hash"]: tuple(row) for row in cursor})
+
+        for record in records:
+            blob = blobs.get(record.get("output_ref"))
+            if blob is not None:
+                record["output_result"] = self._decode_blob(blob)
+
+    @staticmethod
+    def _decode_blob(blob: tuple) -> str:
+        """Decompress a task_blobs row back into the serialized result."""
+        _, codec, _, data = blob
+        if codec != "zlib":
+            raise ValueError(f"Unknown result codec: {codec!r}")
+        return zlib.decompress(data).decode("utf-8")
+
+    @staticmethod
+    def _deserialize(record: dict[str, Any]) -> dict[str, Any]:
+        """Decode the JSON payload/result columns of a record in place."""
+        for key in ("input_payload", "output_result"):
+            if record.get(key):
+                try:
+                    record[key] = json.loads(record[key])
+                except json.JSONDecodeError:
+                    pass  # Keep as string if invalid JSON
+        return record
+
     def get_history(
-        self, limit: int = 10, status: str | None = None, agent_id: str | None = None
+        self,
+        limit: int = 10,
+        status: str | None = None,
+        agent_id: str | None = None,
+        include_output: bool = False,
+        include_archived: bool = False,
     ) -> list[dict[str, Any]]:
         """
         Retrieve recent task execution history.
@@ -226,6 +609,13 @@ class VibeLedger:
             limit: Maximum number of records to return (default: 10)
             status: Filter by status (COMPLETED, FAILED, STARTED), or None for all
             agent_id: Filter by agent_id, or None for all agents
+            include_output: If True, include each record's output_result body.
+                            By default only metadata is returned (output_size
+                            tells how large the result is); use
+                            get_task_output() to fetch single bodies lazily.
+            include_archived: If True, also search archive segments written by
+                              apply_retention() (reads only as many daily
+                              segments as needed to fill the limit)
 
         Returns:
             List of task history records as dictionaries
@@ -239,59 +629,116 @@ class VibeLedger:
             >>>
             >>> # Get tasks for specific agent
             >>> agent_history = ledger.get_history(agent_id="echo-agent")
+            >>>
+            >>> # Include result bodies
+            >>> full = ledger.get_history(limit=5, include_output=True)
         """
         try:
-            cursor = self.conn.cursor()
+            records = self._query_history(limit, status, agent_id, include_output=include_output)
+            if include_archived:
+                records = self._merge_archived(records, limit, status, agent_id, include_output)
+            return records
+        except Exception as e:
+            logger.error(f"LEDGER: Failed to retrieve history: {e}")
+            return []
 
-            # Build query with optional filters
-            query = "SELECT * FROM task_history WHERE 1=1"
-            params = []
+    def get_history_page(
+        self,
+        limit: int = 50,
+        status: str | None = None,
+        agent_id: str | None = None,
+        cursor: str | None = None,
+        include_output: bool = False,
+    ) -> dict[str, Any]:
+        """
+        Retrieve one page of history, newest first, using keyset pagination.
 
-            if status:
-                query += " AND status = ?"
-                params.append(status)
+        Unlike OFFSET paging, each page is an index range scan that starts
+        right after the previous page, so page N costs the same as page 1
+        and rows inserted meanwhile never shift or duplicate results.
 
-            if agent_id:
-                query += " AND agent_id = ?"
-                params.append(agent_id)
+        Args:
+            limit: Maximum number of records in the page (default: 50)
+            status: Filter by status, or None for all
+            agent_id: Filter by agent_id, or None for all agents
+            cursor: Opaque cursor from the previous page's "next_cursor",
+                    or None for the first page
+            include_output: If True, include each record's output_result body
 
-            query += " ORDER BY timestamp DESC LIMIT ?"
-            params.append(limit)
+        Returns:
+            dict: {"records": [...], "next_cursor": str | None}
+                  next_cursor is None when there are no more records
 
-            cursor.execute(query, params)
-            rows = cursor.fetchall()
+        Raises:
+            ValueError: If the cursor is malformed
 
-            # Convert to list of dicts
-            history = []
-            for row in rows:
-                record = dict(row)
-                # Deserialize JSON fields
-                if record["input_payload"]:
-                    try:
-                        record["input_payload"] = json.loads(record["input_payload"])
-                    except json.JSONDecodeError:
-                        pass  # Keep as string if invalid JSON
+        Example:
+            >>> page = ledger.get_history_page(limit=100, agent_id="echo-agent")
+            >>> while page["next_cursor"]:
+            ...     page = ledger.get_history_page(limit=100, cursor=page["next_cursor"])
+        """
+        after = None
+        if cursor is not None:
+            timestamp, sep, task_id = cursor.partition("|")
+            if not sep:
+                raise ValueError(f"Invalid history cursor: {cursor!r}")
+            after = (timestamp, task_id)
+
+        records = self._query_history(
+            limit, status, agent_id, after=after, include_output=include_output
+        )
+        next_cursor = None
+        if len(records) == limit and records:
+            last = records[-1]
+            next_cursor = f"{last['timestamp']}|{last['task_id']}"
+        return {"records": records, "next_cursor": next_cursor}
+
+    def _query_history(
+        self,
+        limit: int,
+        status: str | None,
+        agent_id: str | None,
+        after: tuple[str, str] | None = None,
+        include_output: bool = False,
+    ) -> list[dict[str, Any]]:
+        """Run an indexed history query ordered by (timestamp, task_id) DESC."""
+        self.flush()  # Read-your-writes in write-behind mode
 
-                if record["output_result"]:
-                    try:
-                        record["output_result"] = json.loads(record["output_result"])
-                    except json.JSONDecodeError:
-                        pass  # Keep as string if invalid JSON
+        # Build query with optional filters
+        columns = _COLUMNS if include_output else _METADATA_COLUMNS
+        query = f"SELECT {', '.join(columns)} FROM task_history WHERE 1=1"  # noqa: S608
+        params: list[Any] = []
 
-                history.append(record)
+        if status:
+            query += " AND status = ?"
+            params.append(status)
 
-            return history
+        if agent_id:
+            query += " AND agent_id = ?"
+            params.append(agent_id)
 
-        except Exception as e:
-            logger.error(f"LEDGER: Failed to retrieve history: {e}")
-            return []
+        if after is not None:
+            query += " AND (timestamp, task_id) < (?, ?)"
+            params.extend(after)
+
+        query += " ORDER BY timestamp DESC, task_id DESC LIMIT ?"
+        params.append(limit)
 
-    def get_task(self, task_id: str) -> dict[str, Any] | None:
+        with self._lock:
+            records = [dict(row) for row in self.conn.execute(query, params).fetchall()]
+            if include_output:
+                self._load_outputs(records)
+
+        # Deserialize JSON fields
+        return [self._deserialize(record) for record in records]
+
+    def get_task(self, task_id: str, include_output: bool = True) -> dict[str, Any] | None:
         """
         Retrieve a specific task record by ID.
 
         Args:
             task_id: The task ID to look up
+            include_output: If False, skip the output_result body (metadata only)
 
         Returns:
             Task record as dictionary, or None if not found
@@ -302,37 +749,72 @@ class VibeLedger:
             ...     print(record["status"])  # "COMPLETED"
         """
         try:
-            cursor = self.conn.cursor()
-            cursor.execute("SELECT * FROM task_history WHERE task_id = ?", (task_id,))
-            row = cursor.fetchone()
-
-            if row:
-                record = dict(row)
-                # Deserialize JSON fields
-                if record["input_payload"]:
-                    try:
-                        record["input_payload"] = json.loads(record["input_payload"])
-                    except json.JSONDecodeError:
-                        pass
-
-                if record["output_result"]:
-                    try:
-                        record["output_result"] = json.loads(record["output_result"])
-                    except json.JSONDecodeError:
-                        pass
-
-                return record
+            with self._lock:
+                # Pending (write-behind) rows are newer than anything on disk
+                record = self._pending_record(task_id)
+                if record is None:
+                    columns = _COLUMNS if include_output else _METADATA_COLUMNS
+                    cursor = self.conn.cursor()
+                    cursor.execute(
+                        f"SELECT {', '.join(columns)} FROM task_history WHERE task_id = ?",  # noqa: S608
+                        (task_id,),
+                    )
+                    row = cursor.fetchone()
+                    record = dict(row) if row else None
+                elif not include_output:
+                    del record["output_result"]
+
+                if record and include_output:
+                    self._load_outputs([record])
+
+            return self._deserialize(record) if record else None
 
+        except Exception as e:
+            logger.error(f"LEDGER: Failed to retrieve task {task_id}: {e}")
             return None
 
+    def get_task_output(self, task_id: str) -> Any:
+        """
+        Fetch only the result body of a task (lazy counterpart of get_history).
+
+        Args:
+            task_id: The task ID to look up
+
+        Returns:
+            The deserialized output_result, or None if the task is unknown
+            or has no result
+
+        Example:
+            >>> for record in ledger.get_history(limit=50):
+            ...     if record["output_size"] and record["status"] == "COMPLETED":
+            ...         body = ledger.get_task_output(record["task_id"])
+        """
+        try:
+            with self._lock:
+                record = self._pending_record(task_id)
+                if record is None:
+                    row = self.conn.execute(
+                        "SELECT output_result, output_ref FROM task_history WHERE task_id = ?",
+                        (task_id,),
+                    ).fetchone()
+                    record = dict(row) if row else None
+                if record is None:
+                    return None
+                self._load_outputs([record])
+
+            return self._deserialize(record).get("output_result")
+
         except Exception as e:
-            logger.error(f"LEDGER: Failed to retrieve task {task_id}: {e}")
+            logger.error(f"LEDGER: Failed to retrieve output for task {task_id}: {e}")
             return None
 
     def get_statistics(self) -> dict[str, Any]:
         """
         Get aggregate statistics about task execution.
 
+        Reads the trigger-maintained counter tables, so the cost does not
+        grow with the number of recorded tasks.
+
         Returns:
             Dictionary with statistics:
             - total_tasks: Total number of tasks recorded
@@ -346,22 +828,20 @@ class VibeLedger:
             >>> print(f"Success rate: {stats['completed'] / stats['total_tasks']:.2%}")
         """
         try:
+            self.flush()  # Read-your-writes in write-behind mode
             cursor = self.conn.cursor()
 
-            # Total tasks
-            cursor.execute("SELECT COUNT(*) as count FROM task_history")
-            total_tasks = cursor.fetchone()["count"]
+            with self._lock:
+                # By status
+                cursor.execute("SELECT status, count FROM task_status_counts WHERE count > 0")
+                status_counts = {row["status"]: row["count"] for row in cursor.fetchall()}
 
-            # By status
-            cursor.execute("SELECT status, COUNT(*) as count FROM task_history GROUP BY status")
-            status_counts = {row["status"]: row["count"] for row in cursor.fetchall()}
-
-            # Unique agents
-            cursor.execute("SELECT DISTINCT agent_id FROM task_history")
-            agents = [row["agent_id"] for row in cursor.fetchall()]
+                # Unique agents
+                cursor.execute("SELECT agent_id FROM task_agent_counts WHERE count > 0")
+                agents = [row["agent_id"] for row in cursor.fetchall()]
 
             return {
-                "total_tasks": total_tasks,
+                "total_tasks": sum(status_counts.values()),
                 "completed": status_counts.get("COMPLETED", 0),
                 "failed": status_counts.get("FAILED", 0),
                 "started": status_counts.get("STARTED", 0),
@@ -378,6 +858,210 @@ class VibeLedger:
                 "agents": [],
             }
 
+    # ------------------------------------------------------------------
+    # Retention & archival
+    # ------------------------------------------------------------------
+
+    def apply_retention(
+        self, max_age_days: float | None = None, max_rows: int | None = None
+    ) -> int:
+        """
+        Roll old task_history rows into compressed archive segments.
+
+        A row is archived if it is older than max_age_days OR not among the
+        newest max_rows rows. Tasks still in STARTED state are never archived.
+        Archived rows are appended to one gzip'd JSON-lines segment per day
+        (result bodies inlined, so segments are self-contained), then deleted
+        from the database together with blobs no longer referenced.
+        get_statistics() keeps counting archived tasks.
+
+        Args:
+            max_age_days: Age limit, defaults to the ledger's retention_days
+            max_rows: Row limit, defaults to the ledger's retention_max_rows
+
+        Returns:
+            int: Number of rows archived
+
+        Raises:
+            ValueError: If the ledger has no archive directory (in-memory
+                        ledgers need an explicit archive_dir)
+
+        Example:
+            >>> archived = ledger.apply_retention(max_age_days=30)
+            >>> ledger.get_history(limit=100, include_archived=True)
+        """
+        max_age_days = self.retention_days if max_age_days is None else max_age_days
+        max_rows = self.retention_max_rows if max_rows is None else max_rows
+        if max_age_days is None and max_rows is None:
+            return 0
+        if self.archive_dir is None:
+            raise ValueError("archive_dir is required to archive an in-memory ledger")
+
+        conditions = []
+        params: list[Any] = []
+        if max_age_days is not None:
+            conditions.append("timestamp < ?")
+            params.append((datetime.utcnow() - timedelta(days=max_age_days)).isoformat())
+        if max_rows is not None:
+            conditions.append(
+                "task_id NOT IN (SELECT task_id FROM task_history "
+                "ORDER BY timestamp DESC, task_id DESC LIMIT ?)"
+            )
+            params.append(max_rows)
+        query = (
+            f"SELECT {', '.join(_COLUMNS)} FROM task_history "  # noqa: S608
+            f"WHERE status != 'STARTED' AND ({' OR '.join(conditions)}) "
+            "ORDER BY timestamp, task_id"
+        )
+
+        with self._lock:
+            self._flush_pending()
+            records = [dict(row) for row in self.conn.execute(query, params).fetchall()]
+            if not records:
+                return 0
+            self._load_outputs(records)
+
+            segments: dict[str, list[dict[str, Any]]] = defaultdict(list)
+            for record in records:
+                record["output_ref"] = None  # Body is inlined in the segment
+                segments[record["timestamp"][:10]].append(record)
+            for day, day_records in segments.items():
+                self._append_segment(day, day_records)
+
+            with self.conn:
+                self.conn.executemany(
+                    "DELETE FROM task_history WHERE task_id = ?",
+                    [(record["task_id"],) for record in records],
+                )
+                # Statistics cover the ledger's lifetime: undo the delete trigger
+                for status, count in Counter(r["status"] for r in records).items():
+                    self.conn.execute(
+                        "UPDATE task_status_counts SET count = count + ? WHERE status = ?",
+                        (count, status),
+                    )
+                for agent_id, count in Counter(r["agent_id"] for r in records).items():
+                    self.conn.execute(
+                        "UPDATE task_agent_counts SET count = count + ? WHERE agent_id = ?",
+                        (count, agent_id),
+                    )
+                self.conn.execute(
+                    "DELETE FROM task_blobs WHERE hash NOT IN "
+                    "(SELECT output_ref FROM task_history WHERE output_ref IS NOT NULL)"
+                )
+
+        logger.info(f"LEDGER: Archived {len(records)} row(s) into {len(segments)} segment(s)")
+        return len(records)
+
+    def vacuum(self, full: bool = False) -> int:
+        """
+        Return free database pages to the filesystem.
+
+        Incremental vacuum is cheap and runs online. A full VACUUM rewrites
+        the whole file; it is needed once to switch a ledger created before
+        auto_vacuum=INCREMENTAL was enabled.
+
+        Args:
+            full: Run a full VACUUM (enables incremental mode if needed)
+
+        Returns:
+            int: Number of free pages released
+        """
+        if self.db_path == ":memory:":
+            return 0
+        with self._lock:
+            self._flush_pending()
+            before = self.conn.execute("PRAGMA freelist_count").fetchone()[0]
+            if full:
+                self.conn.execute("PRAGMA auto_vacuum=INCREMENTAL")
+                self.conn.execute("VACUUM")
+            elif self.conn.execute("PRAGMA auto_vacuum").fetchone()[0] == 2:
+                self.conn.execute("PRAGMA incremental_vacuum").fetchall()
+                self.conn.commit()
+            after = self.conn.execute("PRAGMA freelist_count").fetchone()[0]
+        return before - after
+
+    def maintenance(self) -> dict[str, int]:
+        """
+        Apply the retention policy, then vacuum freed pages.
+
+        Runs automatically on a background thread every maintenance_interval
+        seconds when a retention policy is configured; can also be called
+        directly (e.g. from a cron job or at shutdown), which restarts the
+        interval.
+
+        Returns:
+            dict: {"archived": rows archived, "freed_pages": pages released}
+        """
+        with self._lock:
+            self._last_maintenance = time.monotonic()
+            archived = self.apply_retention()
+            freed = self.vacuum() if archived else 0
+        return {"archived": archived, "freed_pages": freed}
+
+    def _maintenance_loop(self) -> None:
+        """Background maintainer: run maintenance once maintenance_interval has elapsed."""
+        while True:
+            due = self._last_maintenance + self.maintenance_interval
+            if self._stop_maintenance.wait(max(0.0, due - time.monotonic())):
+                return
+            if time.monotonic() - self._last_maintenance < self.maintenance_interval:
+                continue  # maintenance() was called directly in the meantime
+            try:
+                self.maintenance()
+            except Exception as e:
+                logger.error(f"LEDGER: Maintenance failed: {e}")
+                self._last_maintenance = time.monotonic()  # Retry next interval
+
+    def _append_segment(self, day: str, records: list[dict[str, Any]]) -> None:
+        """Append records to the day's segment as one gzip member, then fsync."""
+        self.archive_dir.mkdir(parents=True, exist_ok=True)
+        lines = "".join(json.dumps(record) + "\n" for record in records)
+        path = self.archive_dir / f"{_SEGMENT_PREFIX}{day}{_SEGMENT_SUFFIX}"
+        with open(path, "ab") as f:
+            f.write(gzip.compress(lines.encode("utf-8")))
+            f.flush()
+            os.fsync(f.fileno())
+
+    def _iter_archived(self) -> Iterator[list[dict[str, Any]]]:
+        """Yield each archive segment's records, newest day first."""
+        if self.archive_dir is None or not self.archive_dir.is_dir():
+            return
+        segments = sorted(self.archive_dir.glob(f"{_SEGMENT_PREFIX}*{_SEGMENT_SUFFIX}"))
+        for path in reversed(segments):
+            with gzip.open(path, "rt", encoding="utf-8") as f:
+                yield [json.loads(line) for line in f if line.strip()]
+
+    def _merge_archived(
+        self,
+        records: list[dict[str, Any]],
+        limit: int,
+        status: str | None,
+        agent_id: str | None,
+        include_output: bool,
+    ) -> list[dict[str, Any]]:
+        """Merge archived records into a history result, newest first."""
+        seen = {record["task_id"] for record in records}
+        archived: list[dict[str, Any]] = []
+        for segment in self._iter_archived():
+            for record in segment:
+                if record["task_id"] in seen:
+                    continue  # Hot row wins (segment written, delete not committed)
+                if status and record["status"] != status:
+                    continue
+                if agent_id and record["agent_id"] != agent_id:
+                    continue
+                seen.add(record["task_id"])
+                if not include_output:
+                    record.pop("output_result", None)
+                archived.append(self._deserialize(record))
+            # Segments are per day: older segments cannot beat what we have
+            if len(archived) >= limit:
+                break
+
+        merged = records + archived
+        merged.sort(key=lambda r: (r["timestamp"], r["task_id"]), reverse=True)
+        return merged[:limit]
+
     def record_decision(self, **kwargs) -> None:
         """
         Record a specialist decision (COMPATIBILITY STUB for legacy Specialists).
@@ -434,9 +1118,19 @@ class VibeLedger:
         }
 
     def close(self) -> None:
-        """Close the database connection."""
+        """Flush pending writes and close the database connection."""
+        if self._maintainer is not None:
+            self._stop_maintenance.set()
+            self._maintainer.join()
+            self._maintainer = None
+        if self._flusher is not None:
+            self._stop_flusher.set()
+            self._flusher.join()
+            self._flusher = None
         if self.conn:
-            self.conn.close()
+            with self._lock:
+                self._flush_pending()
+                self.conn.close()
             logger.info("LEDGER: Database connection closed")
 
     def __enter__(self):
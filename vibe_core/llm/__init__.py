@@ -5,6 +5,7 @@ This module provides the LLM abstraction layer that enables agents
 to perform cognitive work via language models.
 """
 
+from vibe_core.llm.cache import CachingProvider, ResponseCache
 from vibe_core.llm.chain import ChainProvider
 from vibe_core.llm.human_provider import HumanProvider
 from vibe_core.llm.provider import LLMError, LLMProvider
@@ -12,10 +13,12 @@ from vibe_core.llm.smart_local_provider import SmartLocalProvider
 from vibe_core.llm.steward_provider import StewardProvider
 
 __all__ = [
+    "CachingProvider",
     "ChainProvider",
     "HumanProvider",
     "LLMError",
     "LLMProvider",
+    "ResponseCache",
     "SmartLocalProvider",
     "StewardProvider",
 ]
@@ -0,0 +1,345 @@
+"""
+LLM response cache for vibe-agency OS.
+
+Identical prompts (repeated quality-gate audits, re-run playbooks) used to
+pay full latency and cost on every call. This module adds a two-tier
+response cache keyed by a canonical hash of (provider, messages, model, kwargs):
+
+- Memory tier: LRU with TTL (fast, per process)
+- Disk tier: optional SQLite table (survives restarts, shared by runs)
+
+CachingProvider wraps any LLMProvider with the cache; LLMClient accepts a
+ResponseCache directly and reports its metrics in get_cost_summary().
+With replay_only=True a CachingProvider never calls the wrapped provider,
+so a recorded playbook run can be replayed deterministically from cache.
+Responses from offline/mock providers (LLMProvider.cacheable = False) are
+never stored, so they cannot be served to a real provider later.
+
+Example:
+    >>> cache = ResponseCache(db_path=".vibe/state/llm_cache.db", ttl_seconds=86400)
+    >>> provider = CachingProvider(GoogleProvider(), cache)
+    >>> agent = SimpleLLMAgent(agent_id="auditor", provider=provider)
+"""
+
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from typing import Any
+
+from vibe_core.llm.provider import LLMError, LLMProvider
+
+logger = logging.getLogger(__name__)
+
+# Memory tier defaults
+DEFAULT_MAX_ENTRIES = 1024
+DEFAULT_TTL_SECONDS = 3600.0
+
+
+def cache_key(
+    messages: list[dict[str, str]],
+    model: str | None = None,
+    provider: str | None = None,
+    **kwargs: Any,
+) -> str:
+    """
+    Compute the canonical cache key for an LLM call.
+
+    Messages are normalized (role lower-cased, content stripped of leading and
+    trailing whitespace, extra keys kept) and serialized with sorted keys, so
+    semantically identical calls hash the same regardless of dict ordering.
+
+    Args:
+        messages: Chat messages ({"role", "content"} dicts)
+        model: Model identifier (part of the key)
+        provider: Provider name (part of the key, so providers never share entries)
+        **kwargs: Generation parameters (temperature, max_tokens, ...)
+
+    Returns:
+        str: SHA-256 hex digest
+
+    Example:
+        >>> cache_key([{"role": "user", "content": "Hi "}], model="m") == \\
+        ...     cache_key([{"content": "Hi", "role": "USER"}], model="m")
+        True
+    """
+    normalized = [
+        {
+            **message,
+            "role": str(message.get("role", "")).lower(),
+            "content": str(message.get("content", "")).strip(),
+        }
+        for message in messages
+    ]
+    canonical = json.dumps(
+        {"messages": normalized, "model": model, "provider": provider, "kwargs": kwargs},
+        sort_keys=True,
+        separators=(",", ":"),
+        default=str,
+    )
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+class ResponseCache:
+    """
+    Two-tier (memory LRU + optional SQLite) cache for LLM responses.
+
+    Values are strings (response text, or JSON for richer responses).
+    Disk hits are promoted into the memory tier. Expired entries are
+    dropped lazily on lookup. Thread-safe.
+
+    Metrics (get_stats()):
+    - hits / misses / hit_rate
+    - memory_hits / disk_hits
+    - saved_cost_usd: cost of the original calls served from cache
+    """
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        ttl_seconds: float | None = DEFAULT_TTL_SECONDS,
+        db_path: str | None = None,
+        clock: Callable[[], float] = time.time,
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries: Memory tier capacity (least recently used evicted first)
+            ttl_seconds: Entry lifetime in seconds, or None for no expiry
+            db_path: SQLite file for the disk tier, or None for memory only
+            clock: Wall-clock time source (injectable for tests)
+
+        Raises:
+            ValueError: If max_entries is less than 1
+        """
+        if max_entries < 1:
+            raise ValueError(f"max_entries must be at least 1, got {max_entries}")
+
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._lock = threading.Lock()
+        # key -> (value, created_at, cost_usd)
+        self._memory: OrderedDict[str, tuple[str, float, float]] = OrderedDict()
+        self._stats = {"hits": 0, "misses": 0, "memory_hits": 0, "disk_hits": 0}
+        self._saved_cost = 0.0
+
+        self._conn: sqlite3.Connection | None = None
+        if db_path is not None:
+            self._conn = sqlite3.connect(db_path, check_same_thread=False)
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS llm_cache (
+                    key TEXT PRIMARY KEY,
+                    value TEXT NOT NULL,
+                    created_at REAL NOT NULL,
+                    cost_usd REAL NOT NULL DEFAULT 0
+                )
+                """
+            )
+            self._conn.commit()
+
+    def get(self, key: str) -> str | None:
+        """
+        Look up a cached value (memory tier first, then disk).
+
+        Args:
+            key: Cache key from cache_key()
+
+        Returns:
+            str | None: Cached value, or None on miss/expiry
+        """
+        now = self._clock()
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None and self._expired(entry[1], now):
+                del self._memory[key]
+                entry = None
+
+            if entry is not None:
+                self._memory.move_to_end(key)
+                self._record_hit("memory_hits", entry[2])
+                return entry[0]
+
+            if self._conn is not None:
+                row = self._conn.execute(
+                    "SELECT value, created_at, cost_usd FROM llm_cache WHERE key = ?", (key,)
+                ).fetchone()
+                if row is not None and not self._expired(row[1], now):
+                    self._remember(key, tuple(row))
+                    self._record_hit("disk_hits", row[2])
+                    return row[0]
+                if row is not None:
+                    self._conn.execute("DELETE FROM llm_cache WHERE key = ?", (key,))
+                    self._conn.commit()
+
+            self._stats["misses"] += 1
+            return None
+
+    def set(self, key: str, value: str, cost_usd: float = 0.0) -> None:
+        """
+        Store a value in both tiers.
+
+        Args:
+            key: Cache key from cache_key()
+            value: Response to cache
+            cost_usd: What the original call cost (reported as savings on hits)
+        """
+        entry = (value, self._clock(), cost_usd)
+        with self._lock:
+            self._remember(key, entry)
+            if self._conn is not None:
+                self._conn.execute(
+                    "INSERT INTO llm_cache (key, value, created_at, cost_usd) VALUES (?, ?, ?, ?) "
+                    "ON CONFLICT(key) DO UPDATE SET value = excluded.value, "
+                    "created_at = excluded.created_at, cost_usd = excluded.cost_usd",
+                    (key, *entry),
+                )
+                self._conn.commit()
+
+    def clear(self) -> None:
+        """Drop all entries from both tiers (metrics are kept)."""
+        with self._lock:
+            self._memory.clear()
+            if self._conn is not None:
+                self._conn.execute("DELETE FROM llm_cache")
+                self._conn.commit()
+
+    def get_stats(self) -> dict[str, Any]:
+        """
+        Get cache metrics.
+
+        Returns:
+            dict: hits, misses, hit_rate, memory_hits, disk_hits,
+                  entries (memory tier size) and saved_cost_usd
+        """
+        with self._lock:
+            lookups = self._stats["hits"] + self._stats["misses"]
+            return {
+                **self._stats,
+                "hit_rate": round(self._stats["hits"] / lookups, 4) if lookups else 0.0,
+                "entries": len(self._memory),
+                "saved_cost_usd": round(self._saved_cost, 4),
+            }
+
+    def close(self) -> None:
+        """Close the disk tier."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def _expired(self, created_at: float, now: float) -> bool:
+        return self.ttl_seconds is not None and now - created_at > self.ttl_seconds
+
+    def _remember(self, key: str, entry: tuple[str, float, float]) -> None:
+        """Insert into the memory tier, evicting the LRU entry (caller holds lock)."""
+        self._memory[key] = entry
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+    def _record_hit(self, tier: str, cost_usd: float) -> None:
+        self._stats["hits"] += 1
+        self._stats[tier] += 1
+        self._saved_cost += cost_usd
+
+
+class CachingProvider(LLMProvider):
+    """
+    LLMProvider decorator that serves repeated calls from a ResponseCache.
+
+    Transparent to agents: wrap the provider and pass the wrapper wherever
+    an LLMProvider is expected (SimpleLLMAgent, ChainProvider, ...).
+
+    Example:
+        >>> provider = CachingProvider(ChainProvider([google, local]), ResponseCache())
+        >>> provider.chat(messages)  # Calls the chain
+        >>> provider.chat(messages)  # Served from cache
+    """
+
+    def __init__(
+        self,
+        provider: LLMProvider,
+        cache: ResponseCache | None = None,
+        replay_only: bool = False,
+    ):
+        """
+        Initialize the caching wrapper.
+
+        Args:
+            provider: The provider to call on cache misses
+            cache: Cache to use (default: a new in-memory ResponseCache)
+            replay_only: If True, a cache miss raises LLMError instead of
+                         calling the provider (deterministic replays)
+        """
+        self.provider = provider
+        self.cache = cache if cache is not None else ResponseCache()
+        self.replay_only = replay_only
+        self._provider_name = provider.get_metadata().get("provider_name", type(provider).__name__)
+
+    def chat(self, messages: list[dict[str, str]], model: str | None = None, **kwargs) -> str:
+        """
+        Return the cached response, or call the wrapped provider and cache it.
+
+        Raises:
+            LLMError: On a cache miss in replay_only mode
+        """
+        key = cache_key(messages, model, self._provider_name, **kwargs)
+        cached = self.cache.get(key)
+        if cached is not None:
+            return cached
+
+        self._check_replay(key)
+        response = self.provider.chat(messages, model=model, **kwargs)
+        self._store(key, response)
+        return response
+
+    async def achat(
+        self, messages: list[dict[str, str]], model: str | None = None, **kwargs
+    ) -> str:
+        """Async counterpart of chat() (awaits the wrapped provider's achat())."""
+        key = cache_key(messages, model, self._provider_name, **kwargs)
+        cached = self.cache.get(key)
+        if cached is not None:
+            return cached
+
+        self._check_replay(key)
+        response = await self.provider.achat(messages, model=model, **kwargs)
+        self._store(key, response)
+        return response
+
+    def _store(self, key: str, response: str) -> None:
+        if self.provider.cacheable:
+            self.cache.set(key, response)
+
+    def _check_replay(self, key: str) -> None:
+        if self.replay_only:
+            raise LLMError(
+                f"Cache miss in replay-only mode (key={key[:12]})",
+                provider="CachingProvider",
+            )
+
+    @property
+    def system_prompt(self) -> str:
+        """Return the wrapped provider's system prompt."""
+        return self.provider.system_prompt
+
+    def get_metadata(self) -> dict[str, str]:
+        """Get metadata of the wrapped provider plus cache metrics."""
+        stats = self.cache.get_stats()
+        return {
+            **self.provider.get_metadata(),
+            "cache_hits": str(stats["hits"]),
+            "cache_misses": str(stats["misses"]),
+            "cache_hit_rate": str(stats["hit_rate"]),
+        }
+
+    def __repr__(self) -> str:
+        """String representation for debugging."""
+        return f"CachingProvider(provider={self.provider!r}, replay_only={self.replay_only})"
@@ -146,17 +146,62 @@ class ChainProvider(LLMProvider):
                 continue
 
         # If we get here, ALL providers failed
+        raise self._chain_failure(errors)
+
+    async def achat(
+        self, messages: list[dict[str, str]], model: str | None = None, **kwargs
+    ) -> str:
+        """
+        Async counterpart of chat(): awaits each provider's achat() in order.
+
+        Same fallback semantics as chat(); native async providers in the
+        chain run on the event loop, the rest in worker threads.
+
+        Raises:
+            LLMError: If ALL providers in the chain fail
+        """
+        errors = []
+
+        for i, provider in enumerate(self.providers):
+            try:
+                logger.debug(f"ChainProvider: Trying provider {i} ({provider.__class__.__name__})")
+
+                response = await provider.achat(messages, model=model, **kwargs)
+
+                if i > 0:
+                    logger.warning(
+                        f"ChainProvider: Recovered from provider failure. "
+                        f"Now using {provider.__class__.__name__} (index {i})"
+                    )
+
+                self._current_provider_index = i
+                return response
+
+            except Exception as e:
+                error_msg = f"{provider.__class__.__name__} (index {i}): {e}"
+                errors.append(error_msg)
+                logger.warning(f"ChainProvider: Provider failed, trying next: {error_msg}")
+
+        raise self._chain_failure(errors)
+
+    def _chain_failure(self, errors: list[str]) -> LLMError:
+        """Build (and log) the error raised when every provider failed."""
         all_errors = "\n".join(f"  - {err}" for err in errors)
         error_summary = f"All {len(self.providers)} provider(s) failed:\n{all_errors}"
 
         logger.error(f"ChainProvider: CRITICAL - {error_summary}")
 
-        raise LLMError(
+        return LLMError(
             message=error_summary,
             provider="ChainProvider",
             original_error=Exception(error_summary),
         )
 
+    @property
+    def cacheable(self) -> bool:
+        """Whether the provider that answered last produces cacheable responses."""
+        return self.providers[self._current_provider_index].cacheable
+
     @property
     def system_prompt(self) -> str:
         """
@@ -130,6 +130,40 @@ class GoogleProvider(LLMProvider):
             logger.error(error_msg)
             raise RuntimeError(error_msg) from e
 
+    async def achat(
+        self,
+        messages: list[dict[str, str]],
+        model: str | None = None,
+        **kwargs: Any,
+    ) -> str:
+        """
+        Async counterpart of chat() using the SDK's native async client.
+
+        Many calls can be in flight on one event loop (no thread per call).
+
+        Args:
+            messages: List of message dicts with 'role' and 'content' keys
+            model: Model identifier (uses default if None)
+            **kwargs: Additional parameters (temperature, max_tokens, etc.)
+
+        Returns:
+            str: The LLM's response text
+        """
+        prompt = self._messages_to_prompt(messages)
+
+        try:
+            llm_response = await self._provider.ainvoke(
+                prompt=prompt,
+                model=model or self._default_model,
+                **kwargs,
+            )
+            return llm_response.content
+
+        except Exception as e:
+            error_msg = f"Google Gemini invocation failed: {e}"
+            logger.error(error_msg)
+            raise RuntimeError(error_msg) from e
+
     @property
     def system_prompt(self) -> str:
         """
@@ -5,8 +5,12 @@ This module defines the standard interface for LLM providers (ARCH-025),
 enabling the kernel to orchestrate cognitive work via language models.
 """
 
+import asyncio
 from abc import ABC, abstractmethod
 
+# Default cap on concurrent calls issued by achat_many()
+DEFAULT_MAX_CONCURRENCY = 8
+
 
 class LLMProvider(ABC):
     """
@@ -22,6 +26,8 @@ class LLMProvider(ABC):
     - Simple return type (string response)
     - Configurable system prompts
     - Testable (MockProvider for unit tests)
+    - Async-capable: achat() never blocks the event loop. Providers with a
+      native async client override it; all others get a thread-backed shim.
 
     Example:
         >>> class MyProvider(LLMProvider):
@@ -34,6 +40,10 @@ class LLMProvider(ABC):
         ...         return "You are a helpful assistant."
     """
 
+    # Whether responses may be stored in a shared ResponseCache. Offline and
+    # mock providers set this to False so their output never reaches real ones.
+    cacheable: bool = True
+
     @abstractmethod
     def chat(self, messages: list[dict[str, str]], model: str | None = None, **kwargs) -> str:
         """
@@ -66,6 +76,67 @@ class LLMProvider(ABC):
         """
         pass
 
+    async def achat(
+        self, messages: list[dict[str, str]], model: str | None = None, **kwargs
+    ) -> str:
+        """
+        Async counterpart of chat().
+
+        The default implementation runs chat() in a worker thread, so every
+        existing provider can be awaited without blocking the event loop.
+        Providers backed by an async SDK override this with a native
+        coroutine.
+
+        Args:
+            messages: List of message dicts with 'role' and 'content' keys
+            model: Optional model identifier
+            **kwargs: Additional provider-specific parameters
+
+        Returns:
+            str: The LLM's response text
+
+        Example:
+            >>> response = await provider.achat([{"role": "user", "content": "Hi"}])
+        """
+        return await asyncio.to_thread(self.chat, messages, model=model, **kwargs)
+
+    async def achat_many(
+        self,
+        conversations: list[list[dict[str, str]]],
+        model: str | None = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        **kwargs,
+    ) -> list[str]:
+        """
+        Fan out several independent chats concurrently.
+
+        Args:
+            conversations: One message list per call
+            model: Optional model identifier (shared by all calls)
+            max_concurrency: Maximum calls in flight at once
+            **kwargs: Additional provider-specific parameters
+
+        Returns:
+            list[str]: Responses in the order of `conversations`
+
+        Raises:
+            ValueError: If max_concurrency is less than 1
+            Exception: The first failure of any call (others still complete)
+
+        Example:
+            >>> audits = await provider.achat_many([msgs_a, msgs_b, msgs_c])
+        """
+        if max_concurrency < 1:
+            raise ValueError(f"max_concurrency must be at least 1, got {max_concurrency}")
+
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def bounded(messages: list[dict[str, str]]) -> str:
+            async with semaphore:
+                return await self.achat(messages, model=model, **kwargs)
+
+        return list(await asyncio.gather(*(bounded(m) for m in conversations)))
+
     @property
     @abstractmethod
     def system_prompt(self) -> str:
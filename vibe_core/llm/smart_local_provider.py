@@ -34,6 +34,9 @@ class SmartLocalProvider(LLMProvider):
     structured task assignments to the specialist crew.
     """
 
+    # Simulated responses must not be cached for real providers
+    cacheable = False
+
     def __init__(self):
         """Initialize Smart Local Provider."""
         logger.info("SmartLocalProvider initialized (offline orchestrator mode)")
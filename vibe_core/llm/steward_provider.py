@@ -29,6 +29,7 @@ Version: 1.0 (ARCH-033C)
 
 import logging
 import sys
+import threading
 from typing import Any
 
 from vibe_core.llm.provider import LLMProvider
@@ -74,6 +75,10 @@ class StewardProvider(LLMProvider):
         - Transparent, no hidden magic
     """
 
+    # One terminal, one operator: concurrent calls (e.g. achat() fan-out from
+    # worker threads) queue up instead of interleaving prompts on stdout/stdin
+    _intervention_lock = threading.Lock()
+
     def __init__(self):
         """
         Initialize Steward Provider.
@@ -121,6 +126,11 @@ class StewardProvider(LLMProvider):
         # Convert messages to a single prompt
         prompt_text = self._messages_to_prompt(messages)
 
+        with self._intervention_lock:
+            return self._request_completion(prompt_text)
+
+    def _request_completion(self, prompt_text: str) -> str:
+        """Print the structured prompt and read the STEWARD's completion from stdin."""
         # Output structured prompt for Claude Code to parse
         print("\n" + "=" * 70)
         print("[🤖 STEWARD_INTERVENTION_REQUIRED]")
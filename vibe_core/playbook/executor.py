@@ -21,18 +21,32 @@ Architecture:
 Version: 0.1 (Logic Foundation)
 """
 
+import hashlib
+import json
 import logging
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from dataclasses import dataclass, field
+from datetime import datetime
 from enum import Enum
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
+from vibe_core.runtime.quota_manager import estimate_tokens
+
 # Import runtime modules with proper package paths
 if TYPE_CHECKING:
     pass
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of workflow nodes executed concurrently
+DEFAULT_MAX_WORKERS = 8
+
+# How often execute() re-checks an attempt that a worker has not started yet
+ATTEMPT_START_POLL_SECONDS = 0.05
+
 
 class ExecutionStatus(Enum):
     """Status of workflow execution"""
@@ -64,7 +78,19 @@ class WorkflowEdge:
 
     from_node: str
     to_node: str
-    condition: str = "success"  # "success" or "always"
+    condition: str = "success"  # "success", "failure" or "always"
+
+
+@dataclass
+class ExecutionPlan:
+    """Execution plan (output of topological sort)"""
+
+    workflow_id: str
+    execution_order: list[str]  # Node IDs in execution order
+    dependencies: dict[str, list[str]]  # node_id → list of dependencies
+    is_valid: bool
+    errors: list[str] = field(default_factory=list)
+    graph_signature: tuple = field(default=(), repr=False)  # Structure the plan was built from
 
 
 @dataclass
@@ -79,17 +105,89 @@ class WorkflowGraph:
     entry_point: str
     exit_points: list[str]
     estimated_cost_usd: float = 0.0
+    # Precomputed plan (see build_execution_plan), reused while the structure is unchanged
+    plan: ExecutionPlan | None = field(default=None, repr=False, compare=False)
 
 
-@dataclass
-class ExecutionPlan:
-    """Execution plan (output of topological sort)"""
+def _graph_signature(graph: WorkflowGraph) -> tuple:
+    """Everything the execution plan depends on (nodes, edges, entry and exit points)."""
+    return (
+        tuple(graph.nodes),
+        tuple((edge.from_node, edge.to_node) for edge in graph.edges),
+        graph.entry_point,
+        tuple(graph.exit_points),
+    )
 
-    workflow_id: str
-    execution_order: list[str]  # Node IDs in execution order
-    dependencies: dict[str, list[str]]  # node_id → list of dependencies
-    is_valid: bool
-    errors: list[str] = field(default_factory=list)
+
+def build_execution_plan(graph: WorkflowGraph) -> ExecutionPlan:
+    """
+    Perform topological sort to determine execution order.
+
+    Returns ExecutionPlan with nodes in execution order, or with
+    errors if graph is invalid.
+    """
+    signature = _graph_signature(graph)
+
+    def invalid(error: str) -> ExecutionPlan:
+        return ExecutionPlan(
+            workflow_id=graph.id,
+            execution_order=[],
+            dependencies={},
+            is_valid=False,
+            errors=[error],
+            graph_signature=signature,
+        )
+
+    # Build adjacency list and in-degree counts (dict keys keep the order stable)
+    adjacency: dict[str, dict[str, None]] = {node_id: {} for node_id in graph.nodes}
+    in_degree: dict[str, int] = {node_id: 0 for node_id in graph.nodes}
+
+    for edge in graph.edges:
+        if edge.from_node not in adjacency or edge.to_node not in adjacency:
+            return invalid(f"Edge references non-existent node: {edge.from_node} → {edge.to_node}")
+
+        if edge.to_node not in adjacency[edge.from_node]:
+            adjacency[edge.from_node][edge.to_node] = None
+            in_degree[edge.to_node] += 1
+
+    # Kahn's algorithm for topological sort
+    queue = deque(node_id for node_id, degree in in_degree.items() if degree == 0)
+    execution_order = []
+
+    while queue:
+        node = queue.popleft()
+        execution_order.append(node)
+
+        for neighbor in adjacency[node]:
+            in_degree[neighbor] -= 1
+            if in_degree[neighbor] == 0:
+                queue.append(neighbor)
+
+    # Check for cycles
+    if len(execution_order) != len(graph.nodes):
+        return invalid("Workflow contains circular dependencies")
+
+    # Verify entry and exit points exist
+    if graph.entry_point not in graph.nodes:
+        return invalid(f"Entry point {graph.entry_point} not found")
+
+    for exit_point in graph.exit_points:
+        if exit_point not in graph.nodes:
+            return invalid(f"Exit point {exit_point} not found")
+
+    # Build dependency map (reverse of adjacency)
+    dependencies = {node_id: [] for node_id in graph.nodes}
+    for edge in graph.edges:
+        if edge.from_node not in dependencies[edge.to_node]:
+            dependencies[edge.to_node].append(edge.from_node)
+
+    return ExecutionPlan(
+        workflow_id=graph.id,
+        execution_order=execution_order,
+        dependencies=dependencies,
+        is_valid=True,
+        graph_signature=signature,
+    )
 
 
 @dataclass
@@ -105,6 +203,16 @@ class ExecutionResult:
     duration_seconds: float = 0.0
 
 
+@dataclass
+class _NodeAttempt:
+    """One attempt at running a node (started is set by the worker)"""
+
+    node_id: str
+    number: int
+    started: float | None = None
+    retry: bool = False
+
+
 class AgentInterface:
     """
     Abstract interface for agents (mock for testing).
@@ -155,12 +263,20 @@ class GraphExecutor:
     connecting to real agent implementations.
     """
 
-    def __init__(self):
-        """Initialize executor"""
+    def __init__(self, max_workers: int = DEFAULT_MAX_WORKERS):
+        """
+        Initialize executor.
+
+        Args:
+            max_workers: Maximum number of nodes executed concurrently by execute()
+        """
+        self.max_workers = max_workers
         self.agent: AgentInterface = MockAgent()  # Default to mock (backward compatible)
         self.router = None  # AgentRouter (GAD-904) when connected
         self.quota = None  # OperationalQuota instance when safety layer active
         self.lens_prompt = None  # GAD-906/907: Semantic lens injection
+        self.store = None  # SQLiteStore for checkpointed (resumable) runs
+        self.mission_id: int | None = None
         self.execution_history: list[ExecutionResult] = []
 
     def set_agent(self, agent: AgentInterface) -> None:
@@ -176,6 +292,21 @@ class GraphExecutor:
         """Attach OperationalQuota for pre-flight cost checks"""
         self.quota = quota_manager
 
+    def set_store(self, store, mission_id: int) -> None:  # type: ignore
+        """
+        Attach SQLiteStore to checkpoint execute() runs.
+
+        Each run is recorded as a playbook run of the mission and every node
+        result is checkpointed, so an interrupted run can be resumed with
+        execute(graph, resume_run_id=...).
+
+        Args:
+            store: SQLiteStore instance
+            mission_id: Mission the playbook runs belong to
+        """
+        self.store = store
+        self.mission_id = mission_id
+
     def set_lens(self, lens_prompt: str) -> None:
         """
         Set semantic lens for mindset injection (GAD-906/907).
@@ -191,84 +322,15 @@ class GraphExecutor:
 
     def _topological_sort(self, graph: WorkflowGraph) -> ExecutionPlan:
         """
-        Perform topological sort to determine execution order.
+        Determine execution order (see build_execution_plan).
 
-        Returns ExecutionPlan with nodes in execution order, or with
-        errors if graph is invalid.
+        Reuses the plan attached to the graph while the graph's structure is
+        unchanged (e.g. precomputed by WorkflowLoader).
         """
-        # Build adjacency list and in-degree counts
-        adjacency: dict[str, set[str]] = {node_id: set() for node_id in graph.nodes}
-        in_degree: dict[str, int] = {node_id: 0 for node_id in graph.nodes}
-
-        for edge in graph.edges:
-            if edge.from_node not in adjacency or edge.to_node not in adjacency:
-                return ExecutionPlan(
-                    workflow_id=graph.id,
-                    execution_order=[],
-                    dependencies={},
-                    is_valid=False,
-                    errors=[
-                        f"Edge references non-existent node: {edge.from_node} → {edge.to_node}"
-                    ],
-                )
-
-            adjacency[edge.from_node].add(edge.to_node)
-            in_degree[edge.to_node] += 1
-
-        # Kahn's algorithm for topological sort
-        queue = [node_id for node_id, degree in in_degree.items() if degree == 0]
-        execution_order = []
-
-        while queue:
-            node = queue.pop(0)
-            execution_order.append(node)
-
-            for neighbor in adjacency[node]:
-                in_degree[neighbor] -= 1
-                if in_degree[neighbor] == 0:
-                    queue.append(neighbor)
-
-        # Check for cycles
-        if len(execution_order) != len(graph.nodes):
-            return ExecutionPlan(
-                workflow_id=graph.id,
-                execution_order=[],
-                dependencies={},
-                is_valid=False,
-                errors=["Workflow contains circular dependencies"],
-            )
-
-        # Verify entry and exit points exist
-        if graph.entry_point not in graph.nodes:
-            return ExecutionPlan(
-                workflow_id=graph.id,
-                execution_order=[],
-                dependencies={},
-                is_valid=False,
-                errors=[f"Entry point {graph.entry_point} not found"],
-            )
-
-        for exit_point in graph.exit_points:
-            if exit_point not in graph.nodes:
-                return ExecutionPlan(
-                    workflow_id=graph.id,
-                    execution_order=[],
-                    dependencies={},
-                    is_valid=False,
-                    errors=[f"Exit point {exit_point} not found"],
-                )
-
-        # Build dependency map (reverse of adjacency)
-        dependencies = {node_id: [] for node_id in graph.nodes}
-        for edge in graph.edges:
-            dependencies[edge.to_node].append(edge.from_node)
-
-        return ExecutionPlan(
-            workflow_id=graph.id,
-            execution_order=execution_order,
-            dependencies=dependencies,
-            is_valid=True,
-        )
+        plan = graph.plan
+        if plan is None or plan.graph_signature != _graph_signature(graph):
+            plan = graph.plan = build_execution_plan(graph)
+        return plan
 
     def validate_workflow(self, graph: WorkflowGraph) -> tuple[bool, str]:
         """
@@ -494,10 +556,21 @@ class GraphExecutor:
         else:
             prompt = base_prompt
 
-        # Quota pre-flight check
+        # Quota pre-flight: wait for rate capacity sized to the composed prompt
+        estimated_tokens = estimate_tokens(prompt)
+        reservation = None
         if self.quota:
             try:
-                self.quota.check_before_request(estimated_tokens=50, operation=node.action)
+                if hasattr(self.quota, "acquire"):
+                    reservation = self.quota.acquire(
+                        estimated_tokens,
+                        timeout=node.timeout_seconds,
+                        operation=node.action,
+                    )
+                else:
+                    self.quota.check_before_request(
+                        estimated_tokens=estimated_tokens, operation=node.action
+                    )
             except Exception as e:  # QuotaExceededError
                 return ExecutionResult(
                     workflow_id=graph.id,
@@ -576,17 +649,63 @@ class GraphExecutor:
 
         # Record quota usage
         if self.quota:
-            self.quota.record_request(tokens_used=50, cost_usd=cost_usd, operation=node.action)
+            kwargs = {"reservation": reservation} if reservation is not None else {}
+            self.quota.record_request(
+                tokens_used=estimated_tokens, cost_usd=cost_usd, operation=node.action, **kwargs
+            )
 
         return result
 
-    def execute(self, graph: WorkflowGraph) -> dict[str, Any]:
+    def execute(
+        self,
+        graph: WorkflowGraph,
+        context: str | None = None,
+        resume_run_id: int | None = None,
+    ) -> dict[str, Any]:
         """
-        Execute the workflow (uses agent interface).
+        Execute the workflow, running independent nodes concurrently.
+
+        Every node whose dependencies have resolved is dispatched to a worker
+        pool (up to max_workers at once), so a wide workflow takes roughly as
+        long as its critical path. Each node runs through execute_step().
+
+        Edge conditions decide whether a node runs once its dependencies resolve:
+        - "success": the upstream node must have succeeded (default)
+        - "failure": the upstream node must have failed
+        - "always": the upstream node only has to finish
+
+        A node whose conditions are not met is SKIPPED, which in turn skips its
+        "success" dependents, so a failure cancels everything downstream of it.
+        Each attempt is limited to the node's timeout_seconds, counted from
+        when a worker starts it, and a failed node is retried up to
+        node.retries times. Threads cannot be interrupted, so a timed-out
+        attempt is abandoned: it keeps its worker slot until it returns, and
+        the node's retry is only started after that.
+
+        With a store attached (set_store), the run is recorded as a playbook
+        run and every node result is checkpointed as soon as it is known.
+        Resuming a run re-uses each successful node whose inputs (node
+        definition, context, lens and upstream results) are unchanged, and
+        executes everything else.
 
-        For now, this is a stub that returns the execution plan.
-        Phase 2 will implement actual agent invocation.
+        Args:
+            graph: The workflow graph
+            context: Optional context/prompt passed to every node
+            resume_run_id: Playbook run to resume (requires set_store)
+
+        Returns:
+            Dictionary with status ("success" unless a node failed without a
+            "failure" edge to handle it), execution_order and per-node results
+            in execution order. Checkpointed runs also report run_id and
+            resumed_nodes.
+
+        Raises:
+            ValueError: If resume_run_id is given without a store, or does not
+                name a run of this workflow
         """
+        if resume_run_id is not None and self.store is None:
+            raise ValueError("resume_run_id requires a store (call set_store first)")
+
         # Validate first
         is_valid, validation_msg = self.validate_workflow(graph)
         if not is_valid:
@@ -599,33 +718,307 @@ class GraphExecutor:
         # Generate plan
         plan = self._topological_sort(graph)
 
-        # Execute (Phase 2: will actually call agents)
-        results = []
-        for node_id in plan.execution_order:
-            node = graph.nodes[node_id]
-            result = ExecutionResult(
-                workflow_id=graph.id,
-                node_id=node_id,
-                status=ExecutionStatus.SUCCESS,
-                output={"message": f"[PHASE 2] Would execute {node.action}"},
-                cost_usd=0.0,
-            )
-            results.append(result)
-            self.execution_history.append(result)
+        run_id = None
+        checkpoints: dict[str, dict[str, Any]] = {}
+        if self.store is not None:
+            run_id, checkpoints = self._start_run(graph, resume_run_id)
+
+        incoming: dict[str, list[WorkflowEdge]] = {node_id: [] for node_id in graph.nodes}
+        outgoing: dict[str, list[WorkflowEdge]] = {node_id: [] for node_id in graph.nodes}
+        for edge in graph.edges:
+            incoming[edge.to_node].append(edge)
+            outgoing[edge.from_node].append(edge)
+
+        pending = {node_id: len(edges) for node_id, edges in incoming.items()}
+        ready = deque(node_id for node_id in plan.execution_order if pending[node_id] == 0)
+        results: dict[str, ExecutionResult] = {}
+        input_hashes: dict[str, str] = {}
+        resumed: list[str] = []
+        runnable: deque[tuple[str, int]] = deque()
+        running: dict[Future, _NodeAttempt] = {}
+        # Timed-out attempts whose threads have not returned yet
+        abandoned: dict[Future, _NodeAttempt] = {}
+        max_workers = max(1, self.max_workers)
+        started = time.monotonic()
+
+        def resolve(node_id: str, result: ExecutionResult) -> None:
+            results[node_id] = result
+            if run_id is not None and node_id not in resumed:
+                self.store.save_playbook_node_result(
+                    run_id,
+                    node_id,
+                    input_hashes[node_id],
+                    result.status.value,
+                    output=result.output,
+                    error_message=result.error,
+                    cost_usd=result.cost_usd,
+                    duration_seconds=result.duration_seconds,
+                )
+            for edge in outgoing[node_id]:
+                pending[edge.to_node] -= 1
+                if pending[edge.to_node] == 0:
+                    ready.append(edge.to_node)
+
+        def retry_or_fail(attempt: _NodeAttempt, result: ExecutionResult) -> bool:
+            """Decide whether a failed attempt is retried (True) or the node fails."""
+            if attempt.number <= graph.nodes[attempt.node_id].retries:
+                logger.warning(
+                    f"Node {attempt.node_id} failed (attempt {attempt.number}): "
+                    f"{result.error}. Retrying."
+                )
+                return True
+            logger.error(f"Node {attempt.node_id} failed: {result.error}")
+            return False
 
-        return {
+        pool = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix=f"workflow-{graph.id}"
+        )
+        try:
+            while ready or runnable or running or any(a.retry for a in abandoned.values()):
+                while ready:
+                    node_id = ready.popleft()
+                    input_hashes[node_id] = self._input_hash(
+                        graph.nodes[node_id], incoming[node_id], results, input_hashes, context
+                    )
+                    blocked = [
+                        edge.from_node
+                        for edge in incoming[node_id]
+                        if not self._edge_satisfied(edge, results[edge.from_node])
+                    ]
+                    if blocked:
+                        result = ExecutionResult(
+                            workflow_id=graph.id,
+                            node_id=node_id,
+                            status=ExecutionStatus.SKIPPED,
+                            error=f"Edge condition not met for: {', '.join(blocked)}",
+                        )
+                        logger.info(f"⏭️  Skipping {node_id}: {result.error}")
+                        self.execution_history.append(result)
+                        resolve(node_id, result)
+                        continue
+
+                    checkpoint = checkpoints.get(node_id)
+                    if (
+                        checkpoint is not None
+                        and checkpoint["status"] == ExecutionStatus.SUCCESS.value
+                        and checkpoint["input_hash"] == input_hashes[node_id]
+                    ):
+                        logger.info(f"♻️  Resuming {node_id} from run {run_id} checkpoint")
+                        resumed.append(node_id)
+                        resolve(
+                            node_id,
+                            ExecutionResult(
+                                workflow_id=graph.id,
+                                node_id=node_id,
+                                status=ExecutionStatus.SUCCESS,
+                                output=checkpoint["output"],
+                                cost_usd=checkpoint["cost_usd"],
+                                duration_seconds=checkpoint["duration_seconds"],
+                            ),
+                        )
+                    else:
+                        runnable.append((node_id, 1))
+
+                # Only hand out free workers, so a submitted attempt starts right away
+                while runnable and len(running) + len(abandoned) < max_workers:
+                    node_id, number = runnable.popleft()
+                    attempt = _NodeAttempt(node_id, number)
+                    running[pool.submit(self._run_node, graph, node_id, context, attempt)] = attempt
+
+                # Abandoned attempts matter only for a pending retry or a free worker
+                waiting = [
+                    *running,
+                    *(f for f, a in abandoned.items() if a.retry or runnable),
+                ]
+                if not waiting:
+                    continue
+
+                now = time.monotonic()
+                deadlines = [
+                    a.started + graph.nodes[a.node_id].timeout_seconds
+                    for a in running.values()
+                    if a.started is not None
+                ]
+                if len(deadlines) < len(running):
+                    deadlines.append(now + ATTEMPT_START_POLL_SECONDS)
+                done, _ = wait(
+                    waiting,
+                    timeout=max(0.0, min(deadlines) - now) if deadlines else None,
+                    return_when=FIRST_COMPLETED,
+                )
+                now = time.monotonic()
+
+                for future in abandoned.keys() & done:
+                    attempt = abandoned.pop(future)
+                    if attempt.retry:
+                        runnable.append((attempt.node_id, attempt.number + 1))
+
+                for future, attempt in list(running.items()):
+                    timeout = graph.nodes[attempt.node_id].timeout_seconds
+                    if future in done:
+                        del running[future]
+                        result = future.result()
+                        if result.status == ExecutionStatus.FAILED and retry_or_fail(
+                            attempt, result
+                        ):
+                            runnable.append((attempt.node_id, attempt.number + 1))
+                            continue
+                    elif attempt.started is not None and attempt.started + timeout <= now:
+                        del running[future]
+                        abandoned[future] = attempt
+                        result = ExecutionResult(
+                            workflow_id=graph.id,
+                            node_id=attempt.node_id,
+                            status=ExecutionStatus.FAILED,
+                            error=f"Timed out after {timeout}s",
+                            duration_seconds=timeout,
+                        )
+                        self.execution_history.append(result)
+                        # Retry once the abandoned attempt has returned
+                        attempt.retry = retry_or_fail(attempt, result)
+                        if attempt.retry:
+                            continue
+                    else:
+                        continue
+                    resolve(attempt.node_id, result)
+        finally:
+            # Don't block on abandoned (timed-out) attempts
+            pool.shutdown(wait=False, cancel_futures=True)
+
+        ordered = [results[node_id] for node_id in plan.execution_order]
+        unhandled = [
+            r.node_id
+            for r in ordered
+            if r.status == ExecutionStatus.FAILED
+            and not any(edge.condition == "failure" for edge in outgoing[r.node_id])
+        ]
+
+        summary = {
             "workflow_id": graph.id,
-            "status": "success",
+            "status": "failed" if unhandled else "success",
             "execution_order": plan.execution_order,
+            "duration_seconds": time.monotonic() - started,
             "results": [
                 {
                     "node_id": r.node_id,
                     "status": r.status.value,
                     "output": r.output,
+                    "error": r.error,
                 }
-                for r in results
+                for r in ordered
             ],
         }
+        if unhandled:
+            summary["error"] = f"Nodes failed: {', '.join(unhandled)}"
+
+        if run_id is not None:
+            executed = [r for r in ordered if r.node_id not in resumed]
+            self.store.complete_playbook_run(
+                run_id,
+                completed_at=datetime.utcnow().isoformat() + "Z",
+                success=not unhandled,
+                metrics={
+                    "nodes": len(ordered),
+                    "executed": len(executed),
+                    "resumed": len(resumed),
+                    "failed": len(unhandled),
+                    "cost_usd": sum(r.cost_usd for r in executed),
+                    "duration_seconds": summary["duration_seconds"],
+                },
+            )
+            summary["run_id"] = run_id
+            summary["resumed_nodes"] = resumed
+        return summary
+
+    def _start_run(
+        self, graph: WorkflowGraph, resume_run_id: int | None
+    ) -> tuple[int, dict[str, dict[str, Any]]]:
+        """Create (or look up) the playbook run and load its node checkpoints."""
+        if resume_run_id is None:
+            mission = self.store.get_mission(self.mission_id)
+            run_id = self.store.create_playbook_run(
+                self.mission_id,
+                playbook_name=graph.id,
+                phase=mission["phase"] if mission else None,
+                started_at=datetime.utcnow().isoformat() + "Z",
+            )
+            return run_id, {}
+
+        run = self.store.get_playbook_run(resume_run_id)
+        if run is None or run["playbook_name"] != graph.id:
+            raise ValueError(f"Playbook run {resume_run_id} is not a run of workflow {graph.id}")
+        checkpoints = {r["node_id"]: r for r in self.store.get_playbook_node_results(resume_run_id)}
+        logger.info(f"Resuming run {resume_run_id} ({len(checkpoints)} checkpointed nodes)")
+        return resume_run_id, checkpoints
+
+    def _input_hash(
+        self,
+        node: WorkflowNode,
+        incoming: list[WorkflowEdge],
+        results: dict[str, ExecutionResult],
+        input_hashes: dict[str, str],
+        context: str | None,
+    ) -> str:
+        """
+        Fingerprint everything a node's result depends on.
+
+        Upstream hashes are included, so a change anywhere upstream changes
+        the fingerprint of every node below it.
+        """
+        payload = {
+            "action": node.action,
+            "description": node.description,
+            "required_skills": node.required_skills,
+            "prompt_key": node.prompt_key,
+            "knowledge_context": node.knowledge_context,
+            "context": context,
+            "lens": self.lens_prompt,
+            "upstream": sorted(
+                [
+                    edge.from_node,
+                    edge.condition,
+                    input_hashes[edge.from_node],
+                    results[edge.from_node].status.value,
+                    json.dumps(results[edge.from_node].output, sort_keys=True, default=str),
+                ]
+                for edge in incoming
+            ),
+        }
+        encoded = json.dumps(payload, sort_keys=True, default=str)
+        return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+    def _run_node(
+        self,
+        graph: WorkflowGraph,
+        node_id: str,
+        context: str | None,
+        attempt: _NodeAttempt | None = None,
+    ) -> ExecutionResult:
+        """Run one attempt of a node in a worker thread (exceptions become FAILED)."""
+        started = time.monotonic()
+        if attempt is not None:
+            attempt.started = started
+        try:
+            return self.execute_step(graph, node_id, context)
+        except Exception as e:
+            result = ExecutionResult(
+                workflow_id=graph.id,
+                node_id=node_id,
+                status=ExecutionStatus.FAILED,
+                error=str(e),
+                duration_seconds=time.monotonic() - started,
+            )
+            self.execution_history.append(result)
+            return result
+
+    @staticmethod
+    def _edge_satisfied(edge: WorkflowEdge, upstream: ExecutionResult) -> bool:
+        """Check whether an edge lets its target run given the upstream result."""
+        if edge.condition == "always":
+            return True
+        if edge.condition == "failure":
+            return upstream.status == ExecutionStatus.FAILED
+        return upstream.status == ExecutionStatus.SUCCESS
 
     def get_execution_history(self) -> list[ExecutionResult]:
         """Get execution history"""
@@ -10,24 +10,49 @@ Responsibilities:
 2. Validate against _schema.json
 3. Convert YAML → Python objects (WorkflowNode, WorkflowEdge, WorkflowGraph)
 4. Provide error handling with clear diagnostics
+5. Cache compiled workflows (graph + execution plan) on disk, so warm
+   starts skip YAML parsing and schema validation
 
 This is the bridge between semantic definitions and executable workflows.
 
-Version: 0.1 (Foundation)
+Version: 0.2 (Compiled workflow cache)
 """
 
+import hashlib
 import json
 import logging
+import os
+import pickle
+import threading
 from pathlib import Path
 from typing import Any
 
 import jsonschema
 import yaml
 
-from vibe_core.playbook.executor import WorkflowEdge, WorkflowGraph, WorkflowNode
+from vibe_core.playbook.executor import (
+    WorkflowEdge,
+    WorkflowGraph,
+    WorkflowNode,
+    build_execution_plan,
+)
 
 logger = logging.getLogger(__name__)
 
+# Default directory for compiled workflows (matches PathsConfig.cache_dir).
+# Read when a loader is created, so tests can redirect it.
+DEFAULT_CACHE_DIR = Path.home() / ".vibe" / "cache" / "workflows"
+
+# Marks "cache_dir not given" (None means: no disk cache)
+_DEFAULT = object()
+
+# Bump when WorkflowGraph or the compiled format changes (old entries are ignored)
+CACHE_FORMAT_VERSION = 1
+
+# Compiled workflows shared by all loaders in this process: cache file → (key, pickled graph)
+_memory_cache: dict[str, tuple[tuple, bytes]] = {}
+_memory_cache_lock = threading.Lock()
+
 
 class WorkflowValidationError(Exception):
     """Raised when workflow validation fails"""
@@ -41,6 +66,22 @@ class WorkflowLoaderError(Exception):
     pass
 
 
+def _is_private(path: Path, forbidden_mode: int) -> bool:
+    """
+    Return True if path is owned by this user and has none of forbidden_mode's bits.
+
+    Cache entries are pickles, so they are only trusted when nobody else
+    could have written them. Always True where files have no POSIX owner.
+
+    Raises:
+        FileNotFoundError: If path does not exist
+    """
+    if not hasattr(os, "getuid"):
+        return True
+    st = path.stat()
+    return st.st_uid == os.getuid() and not st.st_mode & forbidden_mode
+
+
 class WorkflowLoader:
     """
     Loads and validates YAML workflow definitions.
@@ -49,15 +90,26 @@ class WorkflowLoader:
     1. Load YAML file
     2. Parse YAML → Python dict
     3. Validate against JSON Schema
-    4. Convert to WorkflowGraph object
+    4. Convert to WorkflowGraph object (with a precomputed execution plan)
+
+    Compiled workflows are cached in memory and in cache_dir, keyed by file
+    path, mtime, size and schema hash. A cache hit skips steps 1-4; editing
+    the workflow or the schema invalidates the entry.
     """
 
-    def __init__(self, schema_path: str | Path | None = None):
+    def __init__(
+        self,
+        schema_path: str | Path | None = None,
+        cache_dir: str | Path | None = _DEFAULT,  # type: ignore[assignment]
+    ):
         """
         Initialize loader with optional custom schema path.
 
         Args:
             schema_path: Path to _schema.json (defaults to same directory as this file)
+            cache_dir: Directory for compiled workflows (default: DEFAULT_CACHE_DIR;
+                None disables the cache). Entries are pickles, so it must only be
+                writable by the user.
         """
         if schema_path is None:
             # Default: look for schema in workflows/ subdirectory
@@ -75,10 +127,21 @@ class WorkflowLoader:
         except json.JSONDecodeError as e:
             raise WorkflowLoaderError(f"Invalid JSON in schema file: {e}")
 
+        if cache_dir is _DEFAULT:
+            cache_dir = DEFAULT_CACHE_DIR
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else None
+        self.schema_hash = hashlib.sha256(
+            json.dumps(self.schema, sort_keys=True).encode("utf-8")
+        ).hexdigest()
+        self.cache_stats = {"memory_hits": 0, "disk_hits": 0, "misses": 0}
+
     def load_workflow(self, yaml_path: str | Path) -> WorkflowGraph:
         """
         Load and validate a YAML workflow file.
 
+        Served from the compiled-workflow cache while the file and the schema
+        are unchanged.
+
         Args:
             yaml_path: Path to YAML workflow file
 
@@ -91,9 +154,30 @@ class WorkflowLoader:
         """
         yaml_path = Path(yaml_path)
 
-        if not yaml_path.exists():
+        try:
+            st = yaml_path.stat()
+        except OSError:
             raise WorkflowLoaderError(f"Workflow file not found: {yaml_path}")
 
+        if self.cache_dir is None:
+            return self._compile_workflow(yaml_path)
+
+        resolved = str(yaml_path.resolve())
+        key = (CACHE_FORMAT_VERSION, resolved, st.st_mtime_ns, st.st_size, self.schema_hash)
+        digest = hashlib.sha256(resolved.encode("utf-8")).hexdigest()
+        cache_file = self.cache_dir / f"{digest}.pickle"
+
+        graph = self._load_compiled(cache_file, key)
+        if graph is not None:
+            return graph
+
+        graph = self._compile_workflow(yaml_path)
+        self.cache_stats["misses"] += 1
+        self._store_compiled(cache_file, key, graph)
+        return graph
+
+    def _compile_workflow(self, yaml_path: Path) -> WorkflowGraph:
+        """Parse, validate and build a workflow (the uncached path of load_workflow)."""
         # Load YAML
         try:
             with open(yaml_path) as f:
@@ -116,7 +200,63 @@ class WorkflowLoader:
 
         # Convert to WorkflowGraph
         workflow_def = data["workflow"]
-        return self._build_workflow_graph(workflow_def, yaml_path)
+        graph = self._build_workflow_graph(workflow_def, yaml_path)
+        graph.plan = build_execution_plan(graph)
+        return graph
+
+    def _load_compiled(self, cache_file: Path, key: tuple) -> WorkflowGraph | None:
+        """
+        Return a cached compiled workflow for key, or None.
+
+        Every hit is unpickled into a fresh WorkflowGraph, so callers may
+        modify the graph they get.
+        """
+        with _memory_cache_lock:
+            entry = _memory_cache.get(str(cache_file))
+        if entry is not None and entry[0] == key:
+            self.cache_stats["memory_hits"] += 1
+            # Bytes produced by pickle.dumps in this process, never read from disk
+            return pickle.loads(entry[1])  # noqa: S301
+
+        try:
+            if not _is_private(cache_file.parent, 0o077) or not _is_private(cache_file, 0o022):
+                logger.warning(f"Ignoring workflow cache not private to this user: {cache_file}")
+                return None
+            # Only unpickled from a 0700 directory owned by this user (checked above),
+            # so nobody else can plant an entry
+            with open(cache_file, "rb") as f:
+                cached_key, payload = pickle.load(f)  # noqa: S301
+            if cached_key != key:
+                return None
+            graph = pickle.loads(payload)  # noqa: S301
+        except FileNotFoundError:
+            return None
+        except Exception as e:  # Corrupt or incompatible entry: recompile
+            logger.debug(f"Ignoring unreadable workflow cache {cache_file}: {e}")
+            return None
+
+        with _memory_cache_lock:
+            _memory_cache[str(cache_file)] = (key, payload)
+        self.cache_stats["disk_hits"] += 1
+        return graph
+
+    def _store_compiled(self, cache_file: Path, key: tuple, graph: WorkflowGraph) -> None:
+        """Cache a compiled workflow in memory and on disk (failures are only logged)."""
+        payload = pickle.dumps(graph, protocol=pickle.HIGHEST_PROTOCOL)
+        with _memory_cache_lock:
+            _memory_cache[str(cache_file)] = (key, payload)
+
+        tmp_file = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+        try:
+            cache_file.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+            if not _is_private(cache_file.parent, 0o077):
+                os.chmod(cache_file.parent, 0o700)  # Loads skip directories others can write
+            with open(tmp_file, "wb") as f:
+                pickle.dump((key, payload), f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_file, cache_file)  # Atomic: readers never see partial files
+        except OSError as e:
+            logger.warning(f"Could not write workflow cache {cache_file}: {e}")
+            tmp_file.unlink(missing_ok=True)
 
     def _build_workflow_graph(
         self, workflow_def: dict[str, Any], source_path: Path
@@ -11,19 +11,26 @@ Status: INITIAL IMPLEMENTATION (mocked dispatch, $0 cost)
 
 Responsibilities:
 1. Maintain registry of active agent instances
-2. Match required skills -> best agent (max overlap, ties resolved by first registered)
+2. Match required skills -> best agent (max overlap, ties resolved by the
+   least loaded agent when a kernel is attached, then by first registered)
 3. Provide simple APIs:
    - register(agent)
    - find_best_agent(action: SemanticAction)
    - find_best_agent_for_skills(skills: list[str])
 4. Safe fallback: return None if no agent can fully satisfy required skills
 
+Matching uses a CapabilityIndex (skill -> agents bitsets), cached per
+required-skill tuple and rebuilt on register(), so per-node lookups in
+validate_workflow() and execute_step() do not rescan every agent.
+
 NOTE: No real LLM calls yet. Execution is mocked per instructions.
 """
 
 from __future__ import annotations
 
-from typing import Protocol
+from typing import Any, Protocol
+
+from vibe_core.capability_index import CapabilityIndex
 
 
 class HasRequiredSkills(Protocol):
@@ -34,35 +41,43 @@ class HasRequiredSkills(Protocol):
 class AgentRouter:
     """Agent capability matching and selection."""
 
-    def __init__(self, agents: list[object] | None = None):
+    def __init__(self, agents: list[object] | None = None, kernel: Any = None):
         self._agents: list[object] = agents or []
+        self._kernel = kernel  # VibeKernel for load-aware tie-breaking (optional)
+        self._index: CapabilityIndex[object] = CapabilityIndex()
+        for agent in self._agents:
+            self._index.add(agent, self._capabilities(agent))
 
     # Registry operations -------------------------------------------------
     def register(self, agent: object) -> None:
         if agent not in self._agents:
             self._agents.append(agent)
+            self._index.add(agent, self._capabilities(agent))
+
+    def set_kernel(self, kernel: Any) -> None:
+        """Break ties between equally capable agents by the kernel's queue depth."""
+        self._kernel = kernel
 
     def list_agents(self) -> list[object]:
         return list(self._agents)
 
     # Matching logic ------------------------------------------------------
+    @staticmethod
+    def _capabilities(agent: object) -> list[str]:
+        return getattr(agent, "capabilities", []) or []
+
     def _score(self, agent: object, required: list[str]) -> int:
-        capabilities = getattr(agent, "capabilities", []) or []
+        capabilities = self._capabilities(agent)
         return sum(1 for skill in required if skill in capabilities)
 
+    def _queue_depth(self, agent: object) -> int:
+        agent_id = getattr(agent, "agent_id", None)
+        return self._kernel.get_queue_depth(agent_id) if agent_id is not None else 0
+
     def find_best_agent_for_skills(self, required_skills: list[str]) -> object | None:
-        if not self._agents:
-            return None
-        best = None
-        best_score = -1
-        for agent in self._agents:
-            score = self._score(agent, required_skills)
-            if score > best_score:
-                best = agent
-                best_score = score
-        if best_score <= 0:  # No overlap at all
-            return None
-        return best
+        # Max overlap; no overlap at all -> None
+        load = self._queue_depth if self._kernel is not None else None
+        return self._index.best_match(required_skills, load=load)
 
     def find_best_agent(self, action: HasRequiredSkills) -> object | None:
         return self.find_best_agent_for_skills(action.required_skills)
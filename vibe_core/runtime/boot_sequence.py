@@ -13,6 +13,7 @@ from datetime import datetime
 from pathlib import Path
 
 from vibe_core.runtime.context_loader import ContextLoader
+from vibe_core.runtime.git_state import get_git_state
 from vibe_core.runtime.playbook_engine import PlaybookEngine
 from vibe_core.runtime.project_memory import ProjectMemoryManager
 from vibe_core.runtime.prompt_composer import PromptComposer
@@ -79,20 +80,7 @@ class BootSequence:
     def _check_uncommitted_changes(self) -> dict:
         """Check for uncommitted changes - graceful detection"""
         try:
-            import subprocess
-
-            result = subprocess.run(
-                ["git", "status", "--porcelain"],
-                cwd=self.project_root,
-                capture_output=True,
-                text=True,
-                timeout=5,
-                check=True,
-            )
-
-            uncommitted = [
-                line.strip() for line in result.stdout.strip().split("\n") if line.strip()
-            ]
+            uncommitted = [line.strip() for line in get_git_state(self.project_root).status()]
 
             return {
                 "has_uncommitted": len(uncommitted) > 0,
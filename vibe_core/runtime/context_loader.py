@@ -13,6 +13,8 @@ import subprocess
 from pathlib import Path
 from typing import Any
 
+from vibe_core.runtime.git_state import get_git_state
+
 
 class ContextLoader:
     """Loads project context from multiple sources"""
@@ -64,41 +66,16 @@ class ContextLoader:
     def _load_git_status(self) -> dict[str, Any]:
         """Get git status - safe defaults if git unavailable"""
         try:
-            # Get current branch
-            branch = subprocess.run(
-                ["git", "branch", "--show-current"],
-                cwd=self.project_root,
-                capture_output=True,
-                text=True,
-                timeout=5,
-            )
-
-            # Get uncommitted changes count
-            status = subprocess.run(
-                ["git", "status", "--porcelain"],
-                cwd=self.project_root,
-                capture_output=True,
-                text=True,
-                timeout=5,
-            )
-
-            # Get recent commits
-            log = subprocess.run(
-                ["git", "log", "-3", "--oneline"],
-                cwd=self.project_root,
-                capture_output=True,
-                text=True,
-                timeout=5,
-            )
-
-            uncommitted_files = [line for line in status.stdout.strip().split("\n") if line]
+            git = get_git_state(self.project_root)
+            uncommitted_files = git.status()
+            recent_commits = git.recent_commits(3)
 
             return {
-                "branch": branch.stdout.strip() or "unknown",
+                "branch": git.current_branch() or "unknown",
                 "uncommitted": len(uncommitted_files),
                 "uncommitted_files": uncommitted_files[:5],  # First 5
-                "recent_commits": log.stdout.strip().split("\n"),
-                "last_commit": log.stdout.strip().split("\n")[0] if log.stdout.strip() else "none",
+                "recent_commits": recent_commits,
+                "last_commit": recent_commits[0] if recent_commits else "none",
                 "status": "available",
             }
         except Exception as e:
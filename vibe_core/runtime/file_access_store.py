@@ -0,0 +1,333 @@
+#!/usr/bin/env python3
+"""
+File Access Store for the Tool Safety Guard (GAD-509 Extension)
+================================================================
+
+Remembers which files an agent session has read and written, so the
+ANTI-BLINDNESS rule ("no edit without a prior read") can be enforced
+without unbounded in-process sets.
+
+Features:
+- Bounded: least recently used paths are forgotten first (forgotten = unread)
+- Cheap: each path is resolved (symlinks included) once, then cached and interned
+- Change detection: each read stores the file's mtime, size and (optionally)
+  content hash, so "read, but modified on disk since" is detected with a
+  stat() instead of forcing the agent to re-read the file
+- Persistent: with a db_path, sessions survive restarts (SQLite)
+
+Version: 1.0
+"""
+
+import hashlib
+import logging
+import os
+import sqlite3
+import sys
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from enum import Enum
+from functools import lru_cache
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# Maximum number of paths tracked per session before LRU eviction
+DEFAULT_MAX_TRACKED_FILES = 10_000
+
+
+@lru_cache(maxsize=DEFAULT_MAX_TRACKED_FILES)
+def _canonical_path(absolute: str) -> str:
+    """Resolve symlinks in an absolute path once; later lookups hit the cache"""
+    return sys.intern(os.path.normcase(os.path.realpath(absolute)))
+
+
+class ReadState(Enum):
+    """Whether the session's view of a file is current"""
+
+    UNREAD = "unread"  # Never read (or forgotten)
+    FRESH = "fresh"  # Read, unchanged on disk since
+    STALE = "stale"  # Read, but modified on disk since
+
+
+@dataclass
+class FileRecord:
+    """What the session knows about one file"""
+
+    path: str
+    read: bool = False
+    written: bool = False
+    mtime_ns: int | None = None
+    size: int | None = None
+    content_hash: str | None = None
+
+
+def content_digest(content: str | bytes) -> str:
+    """Return the SHA-256 hex digest used to fingerprint file content"""
+    if isinstance(content, str):
+        content = content.encode("utf-8")
+    return hashlib.sha256(content).hexdigest()
+
+
+class FileAccessStore:
+    """
+    LRU-bounded, optionally persistent record of file reads/writes per session.
+
+    Usage:
+        store = FileAccessStore(db_path=".vibe/state/file_access.db", session_id="operator")
+        store.record_read("foo.py", content=text)
+        store.read_state("foo.py")  # ReadState.FRESH
+        # ... someone edits foo.py on disk ...
+        store.read_state("foo.py")  # ReadState.STALE
+    """
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_MAX_TRACKED_FILES,
+        db_path: str | None = None,
+        session_id: str = "default",
+    ):
+        """
+        Initialize the store.
+
+        Args:
+            max_entries: Maximum number of tracked paths (LRU eviction)
+            db_path: SQLite file to persist the session to (None = memory only)
+            session_id: Session key in the database (one store per session)
+        """
+        if max_entries < 1:
+            raise ValueError(f"max_entries must be at least 1, got {max_entries}")
+
+        self.max_entries = max_entries
+        self.session_id = session_id
+        self._records: OrderedDict[str, FileRecord] = OrderedDict()
+        self._lock = threading.Lock()
+
+        self._conn: sqlite3.Connection | None = None
+        if db_path is not None:
+            self._conn = sqlite3.connect(db_path, check_same_thread=False)
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS file_access (
+                    session_id TEXT NOT NULL,
+                    path TEXT NOT NULL,
+                    read INTEGER NOT NULL,
+                    written INTEGER NOT NULL,
+                    mtime_ns INTEGER,
+                    size INTEGER,
+                    content_hash TEXT,
+                    last_access INTEGER NOT NULL,
+                    PRIMARY KEY (session_id, path)
+                )
+                """
+            )
+            self._conn.commit()
+            self._load()
+
+    # ------------------------------------------------------------------
+    # Recording
+    # ------------------------------------------------------------------
+
+    def record_read(self, path: str, content: str | bytes | None = None) -> FileRecord:
+        """
+        Record that the session read a file (fingerprints its current state).
+
+        Args:
+            path: Path of the file that was read
+            content: Content that was read (stored as a hash; optional)
+
+        Returns:
+            FileRecord: The updated record
+        """
+        with self._lock:
+            record = self._touch(path)
+            record.read = True
+            self._fingerprint(record, content)
+            self._persist(record)
+            return record
+
+    def record_write(self, path: str, content: str | bytes | None = None) -> FileRecord:
+        """
+        Record that the session wrote a file.
+
+        A file the session read stays FRESH after its own write: the session
+        knows what it wrote, so the fingerprint is refreshed.
+
+        Args:
+            path: Path of the file that was written
+            content: Content that was written (stored as a hash; optional)
+
+        Returns:
+            FileRecord: The updated record
+        """
+        with self._lock:
+            record = self._touch(path)
+            record.written = True
+            self._fingerprint(record, content)
+            self._persist(record)
+            return record
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def read_state(self, path: str) -> ReadState:
+        """
+        Return whether the session's last read of a file is still current.
+
+        Costs one stat() call. Only if the stat changed while the size did
+        not, and a content hash is known, is the file hashed to tell a
+        touch from a real edit.
+
+        Args:
+            path: Path of the file to check
+
+        Returns:
+            ReadState: UNREAD, FRESH or STALE
+        """
+        with self._lock:
+            record = self._records.get(self.normalize(path))
+            if record is None or not record.read:
+                return ReadState.UNREAD
+            self._records.move_to_end(record.path)
+
+            mtime_ns, size = self._stat(record.path)
+            if (mtime_ns, size) == (record.mtime_ns, record.size):
+                return ReadState.FRESH
+
+            if record.content_hash is not None and size is not None and size == record.size:
+                try:
+                    with open(record.path, "rb") as f:
+                        unchanged = content_digest(f.read()) == record.content_hash
+                except OSError:
+                    unchanged = False
+                if unchanged:
+                    record.mtime_ns = mtime_ns
+                    self._persist(record)
+                    return ReadState.FRESH
+
+            return ReadState.STALE
+
+    def get(self, path: str) -> FileRecord | None:
+        """Return the record for a path (None if not tracked)"""
+        with self._lock:
+            return self._records.get(self.normalize(path))
+
+    def counts(self) -> dict[str, int]:
+        """Return the number of tracked, read and written paths"""
+        with self._lock:
+            records = self._records.values()
+            return {
+                "tracked": len(self._records),
+                "read": sum(1 for r in records if r.read),
+                "written": sum(1 for r in records if r.written),
+            }
+
+    def clear(self) -> None:
+        """Forget everything recorded for this session (memory and disk)"""
+        with self._lock:
+            self._records.clear()
+            if self._conn is not None:
+                self._conn.execute(
+                    "DELETE FROM file_access WHERE session_id = ?", (self.session_id,)
+                )
+                self._conn.commit()
+
+    def close(self) -> None:
+        """Close the database connection (if persistent)"""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    @staticmethod
+    def normalize(path: str) -> str:
+        """
+        Normalize a path for comparison.
+
+        Symlinks are resolved so the same file reached through different
+        paths (e.g. /tmp vs /private/tmp) maps to one record. The resolve
+        runs once per absolute path; repeated lookups are served from cache.
+
+        Args:
+            path: File path to normalize
+
+        Returns:
+            Interned canonical, normalized path
+        """
+        return _canonical_path(os.path.abspath(path))
+
+    # ------------------------------------------------------------------
+    # Internals (caller holds the lock)
+    # ------------------------------------------------------------------
+
+    def _touch(self, path: str) -> FileRecord:
+        """Get or create the record for path as most recently used, evicting LRU"""
+        normalized = self.normalize(path)
+        record = self._records.get(normalized)
+        if record is None:
+            record = self._records[normalized] = FileRecord(path=normalized)
+        self._records.move_to_end(normalized)
+
+        while len(self._records) > self.max_entries:
+            evicted, _ = self._records.popitem(last=False)
+            if self._conn is not None:
+                self._conn.execute(
+                    "DELETE FROM file_access WHERE session_id = ? AND path = ?",
+                    (self.session_id, evicted),
+                )
+            logger.debug(f"📤 Evicted file record: {evicted}")
+        return record
+
+    def _fingerprint(self, record: FileRecord, content: str | bytes | None) -> None:
+        record.mtime_ns, record.size = self._stat(record.path)
+        record.content_hash = content_digest(content) if content is not None else None
+
+    @staticmethod
+    def _stat(path: str) -> tuple[int | None, int | None]:
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None, None
+        return stat.st_mtime_ns, stat.st_size
+
+    def _persist(self, record: FileRecord) -> None:
+        if self._conn is None:
+            return
+        self._conn.execute(
+            "INSERT INTO file_access "
+            "(session_id, path, read, written, mtime_ns, size, content_hash, last_access) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, "
+            "(SELECT COALESCE(MAX(last_access), 0) + 1 FROM file_access WHERE session_id = ?)) "
+            "ON CONFLICT(session_id, path) DO UPDATE SET read = excluded.read, "
+            "written = excluded.written, mtime_ns = excluded.mtime_ns, size = excluded.size, "
+            "content_hash = excluded.content_hash, last_access = excluded.last_access",
+            self._row(record) + (self.session_id,),
+        )
+        self._conn.commit()
+
+    def _row(self, record: FileRecord) -> tuple[Any, ...]:
+        return (
+            self.session_id,
+            record.path,
+            int(record.read),
+            int(record.written),
+            record.mtime_ns,
+            record.size,
+            record.content_hash,
+        )
+
+    def _load(self) -> None:
+        """Load the most recently used records of this session from disk"""
+        rows = self._conn.execute(
+            "SELECT path, read, written, mtime_ns, size, content_hash FROM file_access "
+            "WHERE session_id = ? ORDER BY last_access DESC LIMIT ?",
+            (self.session_id, self.max_entries),
+        ).fetchall()
+        for path, read, written, mtime_ns, size, content_hash in reversed(rows):
+            path = sys.intern(path)
+            self._records[path] = FileRecord(
+                path, bool(read), bool(written), mtime_ns, size, content_hash
+            )
+        if rows:
+            logger.info(f"📂 Restored {len(rows)} file record(s) for session '{self.session_id}'")
@@ -0,0 +1,382 @@
+#!/usr/bin/env python3
+"""
+Git State Reader - Shared, Cached Git Queries
+=============================================
+
+Prompt context, the context loader, the boot sequence and the orchestrator
+all need the same few facts about the repository (branch, recent commits,
+uncommitted changes), and every one of them used to fork `git` to get
+them. Process spawn overhead dominated boot time and per-turn context
+building, so this module answers them from one shared, cached reader:
+
+- Branch and HEAD: read natively from .git/HEAD, loose refs and packed-refs
+- Config: read natively from .git/config (upstream lookup)
+- Log and status header: `git log` / `git status`, cached on the mtimes of
+  HEAD, the current branch ref, packed-refs, the reflog, config and the
+  upstream ref, so they only re-run after a commit, checkout or fetch
+- Porcelain status: `git status --porcelain` on every call (work tree edits
+  change no git metadata, so there is nothing to key a cache on)
+
+Objects, packs and the index are never parsed here; git stays the source of
+truth for anything that needs them (alternates, partial clones, filters).
+
+Usage:
+    from vibe_core.runtime.git_state import get_git_state
+
+    git = get_git_state(project_root)
+    git.current_branch()      # "main"
+    git.recent_commits(3)     # ["abc1234 Fix parser", ...]
+    git.status()              # [" M vibe_core/kernel.py", "?? notes.md"]
+
+Version: 1.1
+"""
+
+import logging
+import os
+import re
+import subprocess
+import threading
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+# Timeout for git subprocess calls (seconds)
+GIT_TIMEOUT = 5
+
+
+class GitStateError(Exception):
+    """The repository could not be read (not a repository, or git failed)."""
+
+
+class GitState:
+    """
+    Read-only view of a git repository's state (thread-safe, cached).
+
+    Raises GitStateError from every query if root is not inside a git
+    work tree.
+    """
+
+    def __init__(self, root: str | Path):
+        """
+        Initialize the reader.
+
+        Args:
+            root: Any directory inside the work tree
+        """
+        self.root = os.path.realpath(root)
+        self._lock = threading.RLock()
+        self._cache: dict[str, tuple[tuple, object]] = {}
+        self.work_tree: str | None = None
+        self.git_dir: str | None = None
+        self.common_dir: str | None = None
+        self._discover()
+
+    # ------------------------------------------------------------------
+    # Public queries
+    # ------------------------------------------------------------------
+
+    @property
+    def is_repository(self) -> bool:
+        """Return True if root is inside a git work tree."""
+        return self.git_dir is not None
+
+    def current_branch(self) -> str:
+        """
+        Return the checked-out branch name ("" when HEAD is detached).
+
+        Same as `git branch --show-current`.
+        """
+        return self._cached("branch", self._head_signature, self._read_branch)
+
+    def head_commit(self) -> str | None:
+        """Return the full hash HEAD points to (None before the first commit)."""
+        return self._cached("head", self._refs_signature, lambda: self._resolve_ref("HEAD"))
+
+    def recent_commits(self, limit: int = 3) -> list[str]:
+        """
+        Return the last commits as "abbrev subject" lines.
+
+        Same as `git log --oneline -<limit>`: reachable commits, newest
+        committer date first.
+
+        Args:
+            limit: Maximum number of commits
+
+        Returns:
+            list[str]: One line per commit (empty before the first commit)
+        """
+        return self._cached(f"log:{limit}", self._refs_signature, lambda: self._read_log(limit))
+
+    def status(self) -> list[str]:
+        """
+        Return uncommitted changes as `git status --porcelain` lines.
+
+        Not cached: work tree edits change no git metadata, so git is asked
+        on every call.
+
+        Returns:
+            list[str]: Lines like "M  staged.py", " M edited.py", "?? new.md"
+        """
+        self._require_repo()
+        return [line for line in self._run_git(["status", "--porcelain"]).splitlines() if line]
+
+    def status_header(self) -> str:
+        """Return the branch line of `git status --short --branch` ("## main...origin/main")."""
+        return self._cached("header", self._header_signature, self._read_header)
+
+    def short_status(self) -> str:
+        """Return the output of `git status --short --branch`."""
+        return "\n".join([self.status_header(), *self.status()])
+
+    def is_clean(self) -> bool:
+        """Return True if there are no uncommitted or untracked changes."""
+        return not self.status()
+
+    def config_value(self, section: str, key: str, subsection: str | None = None) -> str | None:
+        """
+        Return a value from the repository's .git/config (None if unset).
+
+        Args:
+            section: Section name (e.g. "branch")
+            key: Key name (e.g. "remote")
+            subsection: Subsection (e.g. "main" for [branch "main"])
+        """
+        config = self._cached("config", self._config_signature, self._read_config)
+        name = f"{section.lower()}.{subsection}" if subsection is not None else section.lower()
+        return config.get(name, {}).get(key.lower())
+
+    def invalidate(self) -> None:
+        """Drop all cached results (they are also invalidated by mtime changes)."""
+        with self._lock:
+            self._cache.clear()
+
+    # ------------------------------------------------------------------
+    # Discovery and caching
+    # ------------------------------------------------------------------
+
+    def _discover(self) -> None:
+        current = self.root
+        while True:
+            dot_git = os.path.join(current, ".git")
+            if os.path.isdir(dot_git):
+                git_dir = dot_git
+                break
+            if os.path.isfile(dot_git):  # Worktree or submodule: "gitdir: <path>"
+                with open(dot_git, encoding="utf-8") as f:
+                    line = f.read().strip()
+                if not line.startswith("gitdir:"):
+                    return
+                git_dir = os.path.normpath(os.path.join(current, line[7:].strip()))
+                break
+            parent = os.path.dirname(current)
+            if parent == current:
+                return
+            current = parent
+
+        common_dir = git_dir
+        try:
+            with open(os.path.join(git_dir, "commondir"), encoding="utf-8") as f:
+                common_dir = os.path.normpath(os.path.join(git_dir, f.read().strip()))
+        except OSError:
+            pass
+
+        self.work_tree = current
+        self.git_dir = git_dir
+        self.common_dir = common_dir
+
+    def _require_repo(self) -> None:
+        if self.git_dir is None:
+            raise GitStateError(f"Not a git repository: {self.root}")
+
+    def _cached(self, key: str, signature, compute):
+        self._require_repo()
+        with self._lock:
+            current = signature()
+            entry = self._cache.get(key)
+            if entry is not None and entry[0] == current:
+                return entry[1]
+            value = compute()
+            self._cache[key] = (current, value)
+            return value
+
+    @staticmethod
+    def _stat_key(path: str) -> tuple[int, int] | None:
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        return st.st_mtime_ns, st.st_size
+
+    def _head_signature(self) -> tuple:
+        return (self._stat_key(os.path.join(self.git_dir, "HEAD")),)
+
+    def _refs_signature(self) -> tuple:
+        branch = self._read_branch()
+        return (
+            self._stat_key(os.path.join(self.git_dir, "HEAD")),
+            self._stat_key(os.path.join(self.common_dir, "packed-refs")),
+            self._stat_key(os.path.join(self.common_dir, "refs", "heads", *branch.split("/")))
+            if branch
+            else None,
+            self._stat_key(os.path.join(self.git_dir, "logs", "HEAD")),
+            self._config_signature(),
+        )
+
+    def _header_signature(self) -> tuple:
+        upstream_ref = self._upstream()[1]
+        if upstream_ref is None:
+            return self._refs_signature()
+        path = os.path.join(self.common_dir, *upstream_ref.split("/"))
+        return (*self._refs_signature(), self._stat_key(path))
+
+    def _upstream(self) -> tuple[str | None, str | None]:
+        """Return (display name, full ref) of the current branch's upstream."""
+        branch = self._read_branch()
+        remote = self.config_value("branch", "remote", branch) if branch else None
+        merge = self.config_value("branch", "merge", branch) if branch else None
+        if not remote or not merge:
+            return None, None
+        merge_branch = merge.removeprefix("refs/heads/")
+        if remote == ".":
+            return merge_branch, f"refs/heads/{merge_branch}"
+        return f"{remote}/{merge_branch}", f"refs/remotes/{remote}/{merge_branch}"
+
+    def _config_signature(self) -> tuple:
+        return (self._stat_key(os.path.join(self.common_dir, "config")),)
+
+    def _run_git(self, args: list[str]) -> str:
+        try:
+            # Fixed "git" executable; args are built by this module, never from user input
+            result = subprocess.run(  # noqa: S603
+                ["git", *args],
+                cwd=self.work_tree,
+                capture_output=True,
+                text=True,
+                timeout=GIT_TIMEOUT,
+            )
+        except (OSError, subprocess.TimeoutExpired) as e:
+            raise GitStateError(f"git {args[0]} failed: {e}") from e
+        if result.returncode != 0:
+            raise GitStateError(f"git {args[0]} failed: {result.stderr.strip()}")
+        return result.stdout.rstrip("\n")
+
+    # ------------------------------------------------------------------
+    # Refs and config
+    # ------------------------------------------------------------------
+
+    def _read_head(self) -> str:
+        with open(os.path.join(self.git_dir, "HEAD"), encoding="utf-8") as f:
+            return f.read().strip()
+
+    def _read_branch(self) -> str:
+        head = self._read_head()
+        if head.startswith("ref: refs/heads/"):
+            return head[len("ref: refs/heads/") :]
+        return ""
+
+    def _resolve_ref(self, name: str, depth: int = 0) -> str | None:
+        """Resolve HEAD or a full ref name to a commit hash (None if unborn)."""
+        if depth > 5:
+            raise GitStateError(f"Symbolic ref loop at {name}")
+        if name == "HEAD":
+            value = self._read_head()
+        else:
+            base = self.common_dir if name.startswith("refs/") else self.git_dir
+            try:
+                with open(os.path.join(base, *name.split("/")), encoding="utf-8") as f:
+                    value = f.read().strip()
+            except OSError:
+                return self._packed_refs().get(name)
+        if value.startswith("ref: "):
+            return self._resolve_ref(value[5:], depth + 1)
+        return value or None
+
+    def _packed_refs(self) -> dict[str, str]:
+        return self._cached(
+            "packed-refs",
+            lambda: (self._stat_key(os.path.join(self.common_dir, "packed-refs")),),
+            self._read_packed_refs,
+        )
+
+    def _read_packed_refs(self) -> dict[str, str]:
+        refs = {}
+        try:
+            with open(os.path.join(self.common_dir, "packed-refs"), encoding="utf-8") as f:
+                for line in f:
+                    if line.startswith(("#", "^")):
+                        continue
+                    sha, _, name = line.strip().partition(" ")
+                    if name:
+                        refs[name] = sha
+        except OSError:
+            pass
+        return refs
+
+    def _read_config(self) -> dict[str, dict[str, str]]:
+        """Parse .git/config ([section "sub"] key = value; includes not followed)."""
+        config: dict[str, dict[str, str]] = {}
+        section = None
+        try:
+            with open(os.path.join(self.common_dir, "config"), encoding="utf-8") as f:
+                lines = f.read().splitlines()
+        except OSError:
+            return config
+        for line in lines:
+            line = line.strip()
+            if not line or line.startswith(("#", ";")):
+                continue
+            header = re.match(r'^\[\s*([^\s\]"]+)(?:\s+"(.*)")?\s*\]$', line)
+            if header:
+                name, sub = header.groups()
+                section = f"{name.lower()}.{sub}" if sub is not None else name.lower()
+                config.setdefault(section, {})
+            elif section is not None:
+                key, _, value = line.partition("=")
+                config[section][key.strip().lower()] = value.strip().strip('"')
+        return config
+
+    # ------------------------------------------------------------------
+    # Git subprocess queries
+    # ------------------------------------------------------------------
+
+    def _read_log(self, limit: int) -> list[str]:
+        if self._resolve_ref("HEAD") is None:
+            return []  # git log fails on an unborn branch
+        return self._run_git(["log", "--oneline", f"-{limit}"]).splitlines()
+
+    def _read_header(self) -> str:
+        out = self._run_git(["status", "--short", "--branch", "--untracked-files=no"])
+        return out.splitlines()[0] if out else ""
+
+
+# ========================================================================
+# Shared Instances (one reader per repository root)
+# ========================================================================
+
+_states: dict[str, GitState] = {}
+_states_lock = threading.Lock()
+
+
+def get_git_state(root: str | Path | None = None) -> GitState:
+    """
+    Get the shared GitState for a directory (created on first use).
+
+    Args:
+        root: Directory inside the work tree (default: current working directory)
+
+    Returns:
+        GitState shared by every caller using the same root
+    """
+    key = os.path.realpath(root if root is not None else os.getcwd())
+    with _states_lock:
+        state = _states.get(key)
+        if state is None:
+            state = _states[key] = GitState(key)
+        return state
+
+
+__all__ = [
+    "GitState",
+    "GitStateError",
+    "get_git_state",
+]
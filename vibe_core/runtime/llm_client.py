@@ -12,23 +12,30 @@ Features:
 - Cost tracking (input/output tokens)
 - Circuit breaker (GAD-509)
 - Operational quotas (GAD-510)
+- Optional response cache (identical calls served without provider round-trip)
 
 **BACKWARD COMPATIBLE**: Maintains same API as previous version
 
 Version: 2.0 (GAD-511)
 """
 
+import json
 import logging
 from dataclasses import dataclass
 from datetime import datetime
 from typing import Any
 
+from vibe_core.llm.cache import ResponseCache, cache_key
+
 from .circuit_breaker import CircuitBreaker, CircuitBreakerConfig, CircuitBreakerOpenError
 from .providers import LLMProvider, LLMProviderError, NoOpProvider, get_default_provider
-from .quota_manager import OperationalQuota, QuotaExceededError, QuotaLimits
+from .quota_manager import OperationalQuota, QuotaExceededError, QuotaLimits, estimate_tokens
 
 logger = logging.getLogger(__name__)
 
+# Seconds invoke() waits for RPM/TPM capacity before raising QuotaExceededError
+DEFAULT_QUOTA_WAIT_SECONDS = 60.0
+
 
 # =============================================================================
 # DATA STRUCTURES (Kept for backward compatibility)
@@ -202,16 +209,26 @@ class LLMClient:
         print(f"Cost: ${response.usage.cost_usd:.4f}")
     """
 
-    def __init__(self, budget_limit: float | None = None, provider: LLMProvider | None = None):
+    def __init__(
+        self,
+        budget_limit: float | None = None,
+        provider: LLMProvider | None = None,
+        cache: ResponseCache | None = None,
+        quota_wait_seconds: float = DEFAULT_QUOTA_WAIT_SECONDS,
+    ):
         """
         Initialize LLM client.
 
         Args:
             budget_limit: Optional budget limit in USD (default: None = no limit)
             provider: Optional explicit provider (default: auto-detect via factory)
+            cache: Optional response cache (default: None = every call hits the provider)
+            quota_wait_seconds: Max seconds to wait for rate quota capacity per call
         """
         self.cost_tracker = CostTracker()
         self.budget_limit = budget_limit
+        self.cache = cache
+        self.quota_wait_seconds = quota_wait_seconds
 
         # Initialize safety layer (GAD-509 & GAD-510)
         self.circuit_breaker = CircuitBreaker(
@@ -276,6 +293,22 @@ class LLMClient:
             CircuitBreakerOpenError: If circuit breaker is OPEN
             LLMInvocationError: If all retries fail
         """
+        # Cache hits cost nothing, so they bypass budget and quota checks.
+        # NoOp (mock) responses are never cached or served from cache.
+        key = None
+        if self.cache is not None and not isinstance(self.provider, NoOpProvider):
+            key = cache_key(
+                [{"role": "user", "content": prompt}],
+                model,
+                self.provider.get_provider_name(),
+                max_tokens=max_tokens,
+                temperature=temperature,
+            )
+            cached = self.cache.get(key)
+            if cached is not None:
+                logger.info(f"LLM invocation served from cache: {model}")
+                return self._cached_response(cached)
+
         # Check budget before invocation
         if self.budget_limit and self.cost_tracker.total_cost >= self.budget_limit:
             raise BudgetExceededError(
@@ -283,17 +316,20 @@ class LLMClient:
                 f"(current: ${self.cost_tracker.total_cost:.4f})"
             )
 
-        # Check operational quotas (GAD-510 pre-flight check)
-        estimated_tokens = max_tokens
+        # Wait for operational quota capacity (GAD-510 pre-flight check)
+        estimated_tokens = estimate_tokens(prompt) + max_tokens
         try:
-            self.quota_manager.check_before_request(
-                estimated_tokens=estimated_tokens, operation=f"invoke({model})"
+            reservation = self.quota_manager.acquire(
+                estimated_tokens,
+                timeout=self.quota_wait_seconds,
+                operation=f"invoke({model})",
             )
         except QuotaExceededError as e:
             logger.error(f"Quota check failed: {e}")
             raise
 
         # Delegate to provider through circuit breaker
+        recorded = False
         try:
 
             def provider_invoke():
@@ -321,8 +357,12 @@ class LLMClient:
                 provider_response.usage.input_tokens + provider_response.usage.output_tokens
             )
             self.quota_manager.record_request(
-                tokens_used=total_tokens, cost_usd=usage.cost_usd, operation=f"invoke({model})"
+                tokens_used=total_tokens,
+                cost_usd=usage.cost_usd,
+                operation=f"invoke({model})",
+                reservation=reservation,
             )
+            recorded = True
 
             # Log success
             provider_name = getattr(provider_response, "provider", "unknown")
@@ -331,6 +371,19 @@ class LLMClient:
                 f"(in: {usage.input_tokens}, out: {usage.output_tokens}, cost: ${usage.cost_usd:.4f})"
             )
 
+            if key is not None:
+                self.cache.set(
+                    key,
+                    json.dumps(
+                        {
+                            "content": provider_response.content,
+                            "model": provider_response.model,
+                            "finish_reason": provider_response.finish_reason,
+                        }
+                    ),
+                    cost_usd=usage.cost_usd,
+                )
+
             # Return standardized response (convert provider response to legacy format)
             return LLMResponse(
                 content=provider_response.content,
@@ -354,9 +407,33 @@ class LLMClient:
             logger.error(f"Unexpected error during invocation: {e}")
             raise LLMInvocationError(f"LLM invocation failed: {type(e).__name__} - {e!s}")
 
+        finally:
+            # Failed calls (e.g. an open breaker) must not hold rate capacity
+            if not recorded:
+                self.quota_manager.release(reservation)
+
+    def _cached_response(self, cached: str) -> LLMResponse:
+        """Rebuild a legacy LLMResponse from a cache entry (zero usage, zero cost)"""
+        data = json.loads(cached)
+        usage = LLMUsage(
+            input_tokens=0,
+            output_tokens=0,
+            model=data["model"],
+            cost_usd=0.0,
+            timestamp=datetime.now().isoformat(),
+        )
+        return LLMResponse(
+            content=data["content"],
+            usage=usage,
+            model=data["model"],
+            finish_reason=data["finish_reason"],
+        )
+
     def get_cost_summary(self) -> dict[str, Any]:
-        """Get cost tracking summary"""
+        """Get cost tracking summary (plus cache hit/miss metrics if a cache is set)"""
         summary = self.cost_tracker.get_summary()
+        if self.cache is not None:
+            summary["cache"] = self.cache.get_stats()
         if self.budget_limit:
             summary["budget_limit_usd"] = self.budget_limit
             summary["budget_remaining_usd"] = round(
@@ -0,0 +1,340 @@
+#!/usr/bin/env python3
+"""
+Prompt Cache - Fragment and composition caching for prompt building
+
+PromptRuntime and PromptRegistry assemble every prompt from the same files
+(composition specs, task metadata, knowledge files, tool definitions, SOPs,
+workspace manifests). This module keeps two layers of cache so an agent call
+does not re-read and re-parse them each time:
+
+- FileCache: file contents and parsed YAML/JSON, validated by (mtime, size).
+  A changed file is re-read on next access; unchanged fragments are reused.
+- CompositionCache: fully composed prompts keyed by the composition inputs.
+  Each entry records the files (and missing files) it was built from, and is
+  served only while all of them are unchanged.
+
+Dependency tracking:
+    Every FileCache access inside a `CompositionCache.track()` block is
+    recorded, including existence checks and globs, so a prompt is
+    invalidated when a fragment changes, appears or disappears.
+
+Usage:
+    files = get_file_cache()
+    spec = files.read_yaml(agent_path / "_composition.yaml")
+
+    cache = CompositionCache()
+    cached = cache.get(key)
+    if cached is None:
+        with cache.track() as deps:
+            prompt = build()
+        cache.put(key, prompt, deps, compose_seconds)
+
+Created: 2026-10-17
+Version: 1.0
+"""
+
+import json
+import logging
+import os
+import threading
+from collections import OrderedDict
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import yaml
+
+logger = logging.getLogger(__name__)
+
+# Maximum number of files kept by FileCache
+DEFAULT_MAX_FILES = 512
+
+# Maximum number of composed prompts kept by CompositionCache
+DEFAULT_MAX_PROMPTS = 128
+
+# (mtime_ns, size) of a file, or None if it does not exist
+Stamp = tuple[int, int] | None
+
+_MISSING = object()
+
+
+def _stamp(path: str) -> Stamp:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+@dataclass
+class _FileEntry:
+    stamp: Stamp
+    text: str
+    parsed: Any = _MISSING
+
+
+_recorders = threading.local()
+
+
+def _record(path: str, stamp: Stamp) -> None:
+    """Record a file dependency in every active track() block of this thread."""
+    for deps in getattr(_recorders, "stack", ()):
+        deps.setdefault(path, stamp)
+
+
+class FileCache:
+    """
+    Thread-safe cache of file contents and parsed YAML/JSON.
+
+    Parsed values are shared between callers and must be treated as read-only.
+    """
+
+    def __init__(self, max_files: int = DEFAULT_MAX_FILES):
+        """
+        Initialize the cache.
+
+        Args:
+            max_files: Maximum number of cached files (least recently used evicted)
+        """
+        self.max_files = max_files
+        self._entries: OrderedDict[str, _FileEntry] = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0}
+
+    def read_text(self, path: str | Path) -> str:
+        """
+        Return the contents of a text file.
+
+        Raises:
+            FileNotFoundError: If the file does not exist
+        """
+        return self._entry(path).text
+
+    def read_yaml(self, path: str | Path) -> Any:
+        """
+        Return a parsed YAML file (parsed once per file version).
+
+        Raises:
+            FileNotFoundError: If the file does not exist
+            yaml.YAMLError: If the file is not valid YAML
+        """
+        return self._parsed(path, yaml.safe_load)
+
+    def read_json(self, path: str | Path) -> Any:
+        """
+        Return a parsed JSON file (parsed once per file version).
+
+        Raises:
+            FileNotFoundError: If the file does not exist
+            json.JSONDecodeError: If the file is not valid JSON
+        """
+        return self._parsed(path, json.loads)
+
+    def exists(self, path: str | Path) -> bool:
+        """Return True if path exists (recorded as a dependency either way)."""
+        full_path = os.path.abspath(path)
+        stamp = _stamp(full_path)
+        _record(full_path, stamp)
+        return stamp is not None
+
+    def glob(self, directory: str | Path, pattern: str) -> list[Path]:
+        """Return sorted glob matches (the directory is recorded as a dependency)."""
+        directory = Path(directory)
+        full_path = os.path.abspath(directory)
+        _record(full_path, _stamp(full_path))
+        return sorted(directory.glob(pattern))
+
+    def invalidate(self, path: str | Path | None = None) -> None:
+        """
+        Drop cached files.
+
+        Args:
+            path: File to drop (default: all files)
+        """
+        with self._lock:
+            if path is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(os.path.abspath(path), None)
+
+    def get_stats(self) -> dict[str, int]:
+        """Return cache hits, misses and the number of cached files."""
+        with self._lock:
+            return {**self._stats, "cached": len(self._entries)}
+
+    def _entry(self, path: str | Path) -> _FileEntry:
+        full_path = os.path.abspath(path)
+        stamp = _stamp(full_path)
+        _record(full_path, stamp)
+        if stamp is None:
+            raise FileNotFoundError(f"No such file: {path}")
+
+        with self._lock:
+            entry = self._entries.get(full_path)
+            if entry is not None and entry.stamp == stamp:
+                self._entries.move_to_end(full_path)
+                self._stats["hits"] += 1
+                return entry
+            self._stats["misses"] += 1
+
+        with open(full_path, encoding="utf-8") as f:
+            entry = _FileEntry(stamp, f.read())
+
+        with self._lock:
+            self._entries[full_path] = entry
+            self._entries.move_to_end(full_path)
+            while len(self._entries) > self.max_files:
+                self._entries.popitem(last=False)
+        return entry
+
+    def _parsed(self, path: str | Path, parse) -> Any:
+        entry = self._entry(path)
+        if entry.parsed is _MISSING:
+            entry.parsed = parse(entry.text)
+        return entry.parsed
+
+
+@dataclass
+class _Composition:
+    value: str
+    deps: dict[str, Stamp]
+    extras: dict[str, Any]
+
+
+class CompositionCache:
+    """
+    LRU cache of composed prompts, invalidated by their file dependencies.
+
+    Example:
+        >>> cache = CompositionCache()
+        >>> with cache.track() as deps:
+        ...     prompt = get_file_cache().read_text("prompt.md")
+        >>> cache.put(("AUDITOR", "semantic_audit"), prompt, deps, 0.05)
+        >>> cache.get(("AUDITOR", "semantic_audit"))[0] == prompt
+        True
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_PROMPTS):
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of cached prompts (least recently used evicted)
+        """
+        self.max_entries = max_entries
+        self._entries: OrderedDict[tuple, _Composition] = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0, "stale": 0}
+        self._compose_seconds = 0.0
+        self._composed = 0
+
+    @contextmanager
+    def track(self) -> Iterator[dict[str, Stamp]]:
+        """Record every FileCache access in this thread into the yielded dict."""
+        deps: dict[str, Stamp] = {}
+        stack = getattr(_recorders, "stack", None)
+        if stack is None:
+            stack = _recorders.stack = []
+        stack.append(deps)
+        try:
+            yield deps
+        finally:
+            stack.remove(deps)
+
+    def get(self, key: tuple) -> tuple[str, dict[str, Any]] | None:
+        """
+        Return (prompt, extras) for key if all its dependencies are unchanged.
+
+        Args:
+            key: Hashable composition key
+
+        Returns:
+            Cached prompt and the extras stored with it, or None on a miss
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is not None and all(_stamp(p) == s for p, s in entry.deps.items()):
+            with self._lock:
+                self._entries.move_to_end(key)
+                self._stats["hits"] += 1
+            return entry.value, entry.extras
+
+        with self._lock:
+            self._stats["misses"] += 1
+            if entry is not None:
+                self._stats["stale"] += 1
+                self._entries.pop(key, None)
+        return None
+
+    def put(
+        self,
+        key: tuple,
+        value: str,
+        deps: dict[str, Stamp],
+        compose_seconds: float,
+        extras: dict[str, Any] | None = None,
+    ) -> None:
+        """
+        Store a composed prompt.
+
+        Args:
+            key: Hashable composition key
+            value: Composed prompt
+            deps: File dependencies recorded with track()
+            compose_seconds: Time spent composing (for stats)
+            extras: Additional data to return with the prompt on a hit
+        """
+        with self._lock:
+            self._compose_seconds += compose_seconds
+            self._composed += 1
+            self._entries[key] = _Composition(value, dict(deps), extras or {})
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all cached prompts (stats are kept)."""
+        with self._lock:
+            self._entries.clear()
+
+    def get_stats(self) -> dict[str, Any]:
+        """
+        Return cache statistics.
+
+        Returns:
+            Dict with hits, misses, stale (misses caused by changed files),
+            hit_rate, cached (entries) and avg_compose_ms (per stored prompt)
+        """
+        with self._lock:
+            lookups = self._stats["hits"] + self._stats["misses"]
+            composed = self._composed
+            return {
+                **self._stats,
+                "hit_rate": self._stats["hits"] / lookups if lookups else 0.0,
+                "cached": len(self._entries),
+                "avg_compose_ms": 1000 * self._compose_seconds / composed if composed else 0.0,
+            }
+
+
+# ========================================================================
+# Global Instance (Singleton Pattern)
+# ========================================================================
+
+_default_file_cache: FileCache | None = None
+_default_file_cache_lock = threading.Lock()
+
+
+def get_file_cache() -> FileCache:
+    """
+    Get the global file cache shared by prompt composition (singleton).
+
+    Returns:
+        FileCache instance
+    """
+    global _default_file_cache
+    with _default_file_cache_lock:
+        if _default_file_cache is None:
+            _default_file_cache = FileCache()
+        return _default_file_cache
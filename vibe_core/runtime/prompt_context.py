@@ -23,18 +23,67 @@ Usage:
     # Pass to prompt registry
     prompt = PromptRegistry.get("research.analyze_topic", context)
 
+Caching:
+    Resolvers registered with a ttl are cached. A cached value is reused until
+    its ttl expires or one of its watched files changes (mtime/size), e.g.
+    git resolvers watch .git/HEAD and .git/index, agenda resolvers watch
+    workspace/BACKLOG.md. Keys that miss the cache are resolved concurrently.
+
 Created: 2025-11-19
-Version: 1.0 (MVP - Core Resolvers)
+Version: 1.1 (Cached resolvers)
 """
 
 import logging
-import subprocess
+import os
+import threading
+import time
 from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
 
+from vibe_core.runtime.git_state import GitStateError, get_git_state
+
 logger = logging.getLogger(__name__)
 
+# Maximum number of resolvers running at the same time in one resolve() call
+DEFAULT_RESOLVE_WORKERS = 8
+
+# Files that change whenever git state changes (relative to vibe_root).
+# refs/heads is a directory: ref updates rename a lock file into it.
+GIT_WATCH_PATHS = (
+    ".git/HEAD",
+    ".git/index",
+    ".git/logs/HEAD",
+    ".git/packed-refs",
+    ".git/refs/heads",
+)
+
+# Signature of watched files: (mtime_ns, size) per file, None if missing
+Signature = tuple[tuple[int, int] | None, ...]
+
+
+@dataclass(frozen=True)
+class ResolverPolicy:
+    """
+    Caching policy of one resolver.
+
+    Attributes:
+        ttl: Seconds a value stays valid (None = never cached)
+        watch: Paths (relative to vibe_root) whose change invalidates the value
+    """
+
+    ttl: float | None = None
+    watch: tuple[str, ...] = ()
+
+
+@dataclass(frozen=True)
+class _CachedValue:
+    value: str
+    resolved_at: float
+    signature: Signature
+
 
 class PromptContext:
     """
@@ -42,14 +91,22 @@ class PromptContext:
 
     Manages a registry of "resolvers" - functions that return live system data.
     Resolvers are called on-demand and their results injected into prompt templates.
+    Values of resolvers with a ResolverPolicy ttl are cached (see module docstring).
     """
 
-    def __init__(self, vibe_root: Path | None = None):
+    def __init__(
+        self,
+        vibe_root: Path | None = None,
+        max_workers: int = DEFAULT_RESOLVE_WORKERS,
+        clock: Callable[[], float] = time.monotonic,
+    ):
         """
         Initialize the prompt context engine.
 
         Args:
             vibe_root: Root directory of vibe-agency. If None, auto-detected.
+            max_workers: Maximum resolvers run concurrently per resolve() call
+            clock: Monotonic time source for ttls (injectable for tests)
         """
         if vibe_root is None:
             # Auto-detect: We're in vibe_core/runtime/prompt_context.py
@@ -57,7 +114,13 @@ class PromptContext:
             vibe_root = Path(__file__).parent.parent.parent
 
         self.vibe_root = Path(vibe_root)
+        self.max_workers = max_workers
+        self._clock = clock
         self._resolvers: dict[str, Callable[[], str]] = {}
+        self._policies: dict[str, ResolverPolicy] = {}
+        self._cache: dict[str, _CachedValue] = {}
+        self._cache_lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0}
         self._kernel = None  # ARCH-064: Kernel reference for oracle resolver
 
         # Register core resolvers
@@ -71,52 +134,80 @@ class PromptContext:
             kernel: VibeKernel instance (late binding)
         """
         self._kernel = kernel
+        self.invalidate("kernel_capabilities")
         logger.debug("✅ Kernel reference set for oracle resolver (ARCH-064)")
 
     def _register_core_resolvers(self) -> None:
-        """Register the built-in core resolvers."""
-        self.register("git_status", self._resolve_git_status)
-        self.register("project_structure", self._resolve_project_structure)
+        """Register the built-in core resolvers (with their caching policies)."""
+        # git status also reflects unstaged edits, which touch no git file: short ttl
+        git_status = ResolverPolicy(ttl=5.0, watch=GIT_WATCH_PATHS)
+        git_refs = ResolverPolicy(ttl=300.0, watch=GIT_WATCH_PATHS)
+        backlog = ResolverPolicy(ttl=60.0, watch=("workspace/BACKLOG.md",))
+
+        self.register("git_status", self._resolve_git_status, git_status)
+        self.register(
+            "project_structure",
+            self._resolve_project_structure,
+            ResolverPolicy(ttl=300.0, watch=(".",)),
+        )
         self.register("system_time", self._resolve_system_time)
-        self.register("current_branch", self._resolve_current_branch)
-        self.register("recent_commits", self._resolve_recent_commits)
+        self.register("current_branch", self._resolve_current_branch, git_refs)
+        self.register("recent_commits", self._resolve_recent_commits, git_refs)
 
         # ARCH-060: Kernel state resolvers (data only, no interpretation)
-        self.register("inbox_count", self._resolve_inbox_count)
-        self.register("agenda_summary", self._resolve_agenda_summary)
-        self.register("agenda_tasks", self._resolve_agenda_tasks)
+        self.register(
+            "inbox_count",
+            self._resolve_inbox_count,
+            ResolverPolicy(ttl=60.0, watch=("workspace/inbox",)),
+        )
+        self.register("agenda_summary", self._resolve_agenda_summary, backlog)
+        self.register("agenda_tasks", self._resolve_agenda_tasks, backlog)
         self.register("git_sync_status", self._resolve_git_sync_status)
 
         # ARCH-064: Oracle resolver (system capabilities for Steward)
-        self.register("kernel_capabilities", self._resolve_kernel_capabilities)
+        self.register(
+            "kernel_capabilities", self._resolve_kernel_capabilities, ResolverPolicy(ttl=5.0)
+        )
 
         logger.debug("✅ Registered 10 core context resolvers (5 legacy + 4 kernel state + 1 oracle)")
 
-    def register(self, key: str, resolver: Callable[[], str]) -> None:
+    def register(
+        self,
+        key: str,
+        resolver: Callable[[], str],
+        policy: ResolverPolicy | None = None,
+    ) -> None:
         """
         Register a new context resolver.
 
         Args:
             key: Context key (e.g., "git_status")
             resolver: Function that returns a string value
+            policy: Caching policy (None = resolved on every call)
         """
         self._resolvers[key] = resolver
+        self._policies[key] = policy or ResolverPolicy()
+        self.invalidate(key)
         logger.debug(f"Registered context resolver: {key}")
 
     def resolve(self, keys: list[str] | None = None) -> dict[str, str]:
         """
         Resolve context values for specified keys.
 
+        Cached values that are still valid are returned without calling their
+        resolver; the remaining resolvers run concurrently.
+
         Args:
             keys: List of context keys to resolve. If None, resolves all registered keys.
 
         Returns:
-            Dictionary mapping keys to resolved values
+            Dictionary mapping keys to resolved values (in the order of keys)
         """
         if keys is None:
             keys = list(self._resolvers.keys())
 
-        context = {}
+        context: dict[str, str] = {}
+        pending: list[str] = []
 
         for key in keys:
             if key not in self._resolvers:
@@ -124,15 +215,90 @@ class PromptContext:
                 context[key] = f"[Unknown context key: {key}]"
                 continue
 
-            try:
-                value = self._resolvers[key]()
-                context[key] = value
-                logger.debug(f"✅ Resolved context: {key} ({len(value)} chars)")
-            except Exception as e:
-                logger.warning(f"⚠️  Failed to resolve context '{key}': {e}")
-                context[key] = f"[Error resolving {key}: {e}]"
+            cached = self._cached(key)
+            if cached is not None:
+                context[key] = cached
+            elif key not in pending:
+                pending.append(key)
+
+        if len(pending) > 1 and self.max_workers > 1:
+            with ThreadPoolExecutor(
+                max_workers=min(self.max_workers, len(pending)),
+                thread_name_prefix="prompt-context",
+            ) as pool:
+                values = dict(zip(pending, pool.map(self._resolve_key, pending), strict=True))
+        else:
+            values = {key: self._resolve_key(key) for key in pending}
+        context.update(values)
+
+        return {key: context[key] for key in keys}
+
+    def invalidate(self, key: str | None = None) -> None:
+        """
+        Drop cached values so they are resolved again on next use.
 
-        return context
+        Args:
+            key: Context key to drop (None = all keys)
+        """
+        with self._cache_lock:
+            if key is None:
+                self._cache.clear()
+            else:
+                self._cache.pop(key, None)
+
+    def get_cache_stats(self) -> dict[str, int]:
+        """Return cache hits, misses and the number of cached keys."""
+        with self._cache_lock:
+            return {**self._stats, "cached": len(self._cache)}
+
+    def _cached(self, key: str) -> str | None:
+        """Return the cached value of key if its ttl and watched files still hold."""
+        policy = self._policies[key]
+        if policy.ttl is None:
+            return None
+
+        with self._cache_lock:
+            entry = self._cache.get(key)
+        if (
+            entry is not None
+            and self._clock() - entry.resolved_at < policy.ttl
+            and self._signature(policy.watch) == entry.signature
+        ):
+            with self._cache_lock:
+                self._stats["hits"] += 1
+            return entry.value
+        return None
+
+    def _resolve_key(self, key: str) -> str:
+        """Call the resolver of key and cache the value (per its policy)."""
+        policy = self._policies[key]
+        # Signature first: a change during resolution must invalidate the value
+        signature = self._signature(policy.watch)
+        resolved_at = self._clock()
+
+        try:
+            value = self._resolvers[key]()
+            logger.debug(f"✅ Resolved context: {key} ({len(value)} chars)")
+        except Exception as e:
+            logger.warning(f"⚠️  Failed to resolve context '{key}': {e}")
+            return f"[Error resolving {key}: {e}]"
+
+        with self._cache_lock:
+            self._stats["misses"] += 1
+            if policy.ttl is not None:
+                self._cache[key] = _CachedValue(value, resolved_at, signature)
+        return value
+
+    def _signature(self, watch: tuple[str, ...]) -> Signature:
+        """Return (mtime_ns, size) of each watched path (None if missing)."""
+        signature = []
+        for rel_path in watch:
+            try:
+                stat = os.stat(self.vibe_root / rel_path)
+                signature.append((stat.st_mtime_ns, stat.st_size))
+            except OSError:
+                signature.append(None)
+        return tuple(signature)
 
     # ========================================================================
     # Core Resolvers
@@ -146,22 +312,7 @@ class PromptContext:
             Git status output (branch, changes, etc.)
         """
         try:
-            result = subprocess.run(
-                ["git", "status", "--short", "--branch"],
-                cwd=self.vibe_root,
-                capture_output=True,
-                text=True,
-                timeout=5,
-            )
-
-            if result.returncode == 0:
-                return result.stdout.strip()
-            else:
-                return f"[Git error: {result.stderr.strip()}]"
-        except subprocess.TimeoutExpired:
-            return "[Git timeout]"
-        except FileNotFoundError:
-            return "[Git not installed]"
+            return get_git_state(self.vibe_root).short_status()
         except Exception as e:
             return f"[Git error: {e}]"
 
@@ -264,18 +415,9 @@ class PromptContext:
             Current branch name
         """
         try:
-            result = subprocess.run(
-                ["git", "branch", "--show-current"],
-                cwd=self.vibe_root,
-                capture_output=True,
-                text=True,
-                timeout=5,
-            )
-
-            if result.returncode == 0:
-                return result.stdout.strip()
-            else:
-                return "[Not a git repository]"
+            return get_git_state(self.vibe_root).current_branch()
+        except GitStateError:
+            return "[Not a git repository]"
         except Exception as e:
             return f"[Error: {e}]"
 
@@ -287,18 +429,9 @@ class PromptContext:
             Last 3 commits (oneline format)
         """
         try:
-            result = subprocess.run(
-                ["git", "log", "--oneline", "-3"],
-                cwd=self.vibe_root,
-                capture_output=True,
-                text=True,
-                timeout=5,
-            )
-
-            if result.returncode == 0:
-                return result.stdout.strip()
-            else:
-                return "[No commits]"
+            return "\n".join(get_git_state(self.vibe_root).recent_commits(3)) or "[No commits]"
+        except GitStateError:
+            return "[No commits]"
         except Exception as e:
             return f"[Error: {e}]"
 
@@ -484,8 +617,6 @@ class PromptContext:
             Possible values: "SYNCED", "BEHIND_BY_N", "DIVERGED", "FETCH_FAILED", "NO_REPO"
         """
         try:
-            import os
-
             status = os.getenv("VIBE_GIT_STATUS", "UNKNOWN")
             return status
 
@@ -26,17 +26,29 @@ Architecture:
     - SOP injection
     - Composition order: Governance → Context → Tools → SOPs → Agent
 
+Caching:
+    Composed prompts are cached by (agent, task, workspace, tools, SOPs,
+    context hash). A cached prompt is reused while every file it was built
+    from is unchanged; fragment files are shared through the prompt file
+    cache, so a change only re-reads the files that changed.
+
 Created: 2025-11-15
-Version: 1.0 (MVP)
+Version: 1.1 (Composition cache)
 """
 
+import hashlib
+import json
 import logging
+import os
+import time
 from importlib.util import module_from_spec, spec_from_file_location
 from pathlib import Path
 from typing import Any
 
 import yaml
 
+from vibe_core.runtime.prompt_cache import CompositionCache, get_file_cache
+
 # Import PromptRuntime using proper package path
 from vibe_core.runtime.prompt_runtime import PromptRuntime
 
@@ -53,7 +65,6 @@ try:
             workspace_utils = module_from_spec(spec)
             spec.loader.exec_module(workspace_utils)
             get_active_workspace = workspace_utils.get_active_workspace
-            load_workspace_manifest = workspace_utils.load_workspace_manifest
             resolve_manifest_path = workspace_utils.resolve_manifest_path
             WORKSPACE_UTILS_AVAILABLE = True
         else:
@@ -64,7 +75,6 @@ except ImportError as e:
     logging.warning(f"workspace_utils not available: {e}")
     WORKSPACE_UTILS_AVAILABLE = False
     get_active_workspace = None  # type: ignore
-    load_workspace_manifest = None  # type: ignore
     resolve_manifest_path = None  # type: ignore
 
 
@@ -97,8 +107,8 @@ class PromptRegistry:
     context enrichment capabilities.
     """
 
-    # Class-level cache for Guardian Directives (loaded once)
-    _guardian_directives_cache: str | None = None
+    # Class-level cache of composed prompts (invalidated by file changes)
+    _composition_cache = CompositionCache()
 
     # Class-level prompt storage (key-based lookup)
     _prompts: dict[str, str] = {}
@@ -146,6 +156,47 @@ class PromptRegistry:
         elif workspace is None:
             workspace = "ROOT"  # Fallback
 
+        key = cls._composition_key(
+            agent, task, workspace, inject_governance, inject_tools, inject_sops, context
+        )
+        cached = cls._composition_cache.get(key) if key is not None else None
+        if cached is not None:
+            final_prompt, context_updates = cached
+            context.update(context_updates)  # Same side effects as a fresh composition
+            logger.info(f"Prompt served from cache: {len(final_prompt):,} chars")
+            return final_prompt
+
+        started = time.perf_counter()
+        caller_context = dict(context)
+        with cls._composition_cache.track() as deps:
+            final_prompt = cls._compose_layers(
+                agent, task, workspace, inject_governance, inject_tools, inject_sops, context
+            )
+
+        if key is not None:
+            context_updates = {
+                k: v
+                for k, v in context.items()
+                if k not in caller_context or caller_context[k] is not v
+            }
+            cls._composition_cache.put(
+                key, final_prompt, deps, time.perf_counter() - started, context_updates
+            )
+
+        return final_prompt
+
+    @classmethod
+    def _compose_layers(
+        cls,
+        agent: str,
+        task: str | None,
+        workspace: str,
+        inject_governance: bool,
+        inject_tools: list[str] | None,
+        inject_sops: list[str] | None,
+        context: dict[str, Any],
+    ) -> str:
+        """Build the prompt layers (uncached). See compose() for arguments."""
         context["_registry_workspace"] = workspace
 
         # 1. Get base prompt from PromptRuntime
@@ -201,6 +252,58 @@ class PromptRegistry:
 
         return final_prompt
 
+    @classmethod
+    def _composition_key(
+        cls,
+        agent: str,
+        task: str | None,
+        workspace: str,
+        inject_governance: bool,
+        inject_tools: list[str] | None,
+        inject_sops: list[str] | None,
+        context: dict[str, Any],
+    ) -> tuple | None:
+        """
+        Build the composition cache key (None if the context can't be hashed).
+
+        The active workspace and working directory are part of the key because
+        PromptRuntime resolves workspace paths from them.
+        """
+        try:
+            encoded = json.dumps(context, sort_keys=True, default=str)
+        except (TypeError, ValueError):
+            return None
+        context_hash = hashlib.sha256(encoded.encode()).hexdigest()
+        active_workspace = get_active_workspace() if WORKSPACE_UTILS_AVAILABLE else None
+        return (
+            agent,
+            task,
+            workspace,
+            active_workspace,
+            inject_governance,
+            tuple(inject_tools or ()),
+            tuple(inject_sops or ()),
+            context_hash,
+            os.getcwd(),
+        )
+
+    @classmethod
+    def get_cache_stats(cls) -> dict[str, Any]:
+        """
+        Return composition cache statistics.
+
+        Returns:
+            Dict with hits, misses, stale, hit_rate, cached, avg_compose_ms and
+            "files" (hits/misses/cached of the shared prompt file cache)
+        """
+        return {**cls._composition_cache.get_stats(), "files": get_file_cache().get_stats()}
+
+    @classmethod
+    def clear_cache(cls) -> None:
+        """Drop all cached prompts and prompt files."""
+        cls._composition_cache.clear()
+        get_file_cache().invalidate()
+
     @classmethod
     def register(cls, key: str, prompt: str) -> None:
         """
@@ -258,16 +361,12 @@ class PromptRegistry:
         Returns:
             Formatted markdown section with Guardian Directives
         """
-        # Return cached version if available
-        if cls._guardian_directives_cache is not None:
-            return cls._guardian_directives_cache
-
-        # Load from file
+        files = get_file_cache()
         directives_path = (
             _REPO_ROOT / "system_steward_framework" / "knowledge" / "guardian_directives.yaml"
         )
 
-        if not directives_path.exists():
+        if not files.exists(directives_path):
             raise GovernanceLoadError(
                 f"Guardian Directives not found: {directives_path}\n"
                 f"Expected location: system_steward_framework/knowledge/guardian_directives.yaml\n"
@@ -275,8 +374,7 @@ class PromptRegistry:
             )
 
         try:
-            with open(directives_path) as f:
-                data = yaml.safe_load(f)
+            data = files.read_yaml(directives_path)
         except yaml.YAMLError as e:
             raise GovernanceLoadError(f"Invalid YAML in Guardian Directives: {e}") from e
 
@@ -285,10 +383,7 @@ class PromptRegistry:
         if not template:
             raise GovernanceLoadError("Guardian Directives YAML missing 'injection_template' field")
 
-        # Cache for future calls
-        cls._guardian_directives_cache = template.strip()
-
-        return cls._guardian_directives_cache
+        return template.strip()
 
     @classmethod
     def _enrich_context(cls, workspace: str, context: dict[str, Any]) -> str:
@@ -312,8 +407,8 @@ class PromptRegistry:
         if WORKSPACE_UTILS_AVAILABLE:
             try:
                 manifest_path = resolve_manifest_path(workspace)
-                if manifest_path.exists():
-                    manifest_data = load_workspace_manifest(workspace)
+                if get_file_cache().exists(manifest_path):
+                    manifest_data = get_file_cache().read_json(manifest_path)
                     lines.append(f"**Manifest Path:** `{manifest_path}`\n")
             except Exception as e:
                 logger.warning(f"Could not load manifest for workspace {workspace}: {e}")
@@ -379,22 +474,22 @@ class PromptRegistry:
             / "tools"
             / "tool_definitions.yaml",  # Legacy
         ]
+        files = get_file_cache()
         tool_defs_path = None
         for candidate in tool_defs_candidates:
-            if candidate.exists():
+            if files.exists(candidate):
                 tool_defs_path = candidate
                 break
 
         if tool_defs_path is None:
             tool_defs_path = tool_defs_candidates[0]  # Use first as default for error message
 
-        if not tool_defs_path.exists():
+        if not files.exists(tool_defs_path):
             logger.warning(f"Tool definitions not found: {tool_defs_path}")
             return "# === TOOLS ===\n\n*(Tool definitions file not found)*"
 
         try:
-            with open(tool_defs_path) as f:
-                all_tools = yaml.safe_load(f)
+            all_tools = files.read_yaml(tool_defs_path)
         except yaml.YAMLError as e:
             logger.error(f"Invalid YAML in tool definitions: {e}")
             return "# === TOOLS ===\n\n*(Invalid tool definitions YAML)*"
@@ -444,9 +539,10 @@ class PromptRegistry:
         Returns:
             Formatted markdown section with SOP content
         """
+        files = get_file_cache()
         sops_dir = _REPO_ROOT / "system_steward_framework" / "knowledge" / "sops"
 
-        if not sops_dir.exists():
+        if not files.exists(sops_dir):
             logger.warning(f"SOPs directory not found: {sops_dir}")
             return "# === STANDARD OPERATING PROCEDURES ===\n\n*(SOPs directory not found)*"
 
@@ -454,19 +550,18 @@ class PromptRegistry:
 
         for sop_id in sop_ids:
             # Try to find SOP file with pattern SOP_XXX_*.md
-            sop_files = list(sops_dir.glob(f"{sop_id}_*.md"))
+            sop_files = files.glob(sops_dir, f"{sop_id}_*.md")
 
             if not sop_files:
                 # Fall back to exact match
                 sop_file = sops_dir / f"{sop_id}.md"
-                if sop_file.exists():
+                if files.exists(sop_file):
                     sop_files = [sop_file]
 
             if sop_files:
                 sop_file = sop_files[0]  # Use first match
                 try:
-                    with open(sop_file) as f:
-                        sop_content = f.read()
+                    sop_content = files.read_text(sop_file)
                     lines.append(f"\n## {sop_id}\n")
                     lines.append(sop_content)
                     lines.append("\n---\n")
@@ -28,6 +28,8 @@ from typing import Any
 
 import yaml
 
+from vibe_core.runtime.prompt_cache import get_file_cache
+
 # Configure logging early (before any logger usage)
 logging.basicConfig(
     level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
@@ -135,7 +137,7 @@ class PromptRuntime:
             self.base_path = Path(__file__).resolve().parent.parent.parent
         else:
             self.base_path = Path(base_path)
-        self.knowledge_cache = {}  # Cache loaded YAML files
+        self.files = get_file_cache()  # Shared, mtime-validated file/YAML cache
 
     def execute_task(self, agent_id: str, task_id: str, context: dict[str, Any]) -> str:
         """
@@ -252,7 +254,7 @@ class PromptRuntime:
         agent_path = self._get_agent_path(agent_id)
         comp_file = agent_path / "_composition.yaml"
 
-        if not comp_file.exists():
+        if not self.files.exists(comp_file):
             raise FileNotFoundError(
                 f"Composition file not found: {comp_file}\n"
                 f"Expected location: {agent_path}/_composition.yaml\n"
@@ -260,8 +262,7 @@ class PromptRuntime:
             )
 
         try:
-            with open(comp_file) as f:
-                data = yaml.safe_load(f)
+            data = self.files.read_yaml(comp_file)
         except yaml.YAMLError as e:
             raise MalformedYAMLError(
                 f"Invalid YAML syntax in {comp_file}\n"
@@ -311,10 +312,10 @@ class PromptRuntime:
 
         # Try with task_ prefix first, fall back to bare task_id
         meta_file = agent_path / "tasks" / f"task_{task_id}.meta.yaml"
-        if not meta_file.exists():
+        if not self.files.exists(meta_file):
             meta_file = agent_path / "tasks" / f"{task_id}.meta.yaml"
 
-        if not meta_file.exists():
+        if not self.files.exists(meta_file):
             # Provide helpful error with available tasks
             tasks_dir = agent_path / "tasks"
             available_tasks = []
@@ -335,8 +336,7 @@ class PromptRuntime:
             )
 
         try:
-            with open(meta_file) as f:
-                data = yaml.safe_load(f)
+            data = self.files.read_yaml(meta_file)
         except yaml.YAMLError as e:
             raise MalformedYAMLError(
                 f"Invalid YAML syntax in {meta_file}\nError: {e}\nFix: Check YAML syntax"
@@ -371,8 +371,7 @@ class PromptRuntime:
         agent_path = self._get_agent_path(agent_id)
         deps_file = agent_path / "_knowledge_deps.yaml"
 
-        with open(deps_file) as f:
-            deps = yaml.safe_load(f)
+        deps = self.files.read_yaml(deps_file)
 
         knowledge_files = []
 
@@ -396,16 +395,7 @@ class PromptRuntime:
 
     def _load_knowledge_file(self, relative_path: str) -> str:
         """Load a knowledge YAML file (with caching)"""
-        if relative_path in self.knowledge_cache:
-            return self.knowledge_cache[relative_path]
-
-        full_path = self.base_path / relative_path
-
-        with open(full_path) as f:
-            content = f.read()
-
-        self.knowledge_cache[relative_path] = content
-        return content
+        return self.files.read_text(self.base_path / relative_path)
 
     def _compose_prompt(
         self,
@@ -449,7 +439,7 @@ class PromptRuntime:
             elif source == "${task_prompt}" and step_type == "task":
                 # Try with task_ prefix first, fall back to bare task_id
                 task_file = agent_path / "tasks" / f"task_{task_id}.md"
-                if not task_file.exists():
+                if not self.files.exists(task_file):
                     task_file = agent_path / "tasks" / f"{task_id}.md"
                 task_prompt = self._load_file(task_file)
                 composed_parts.append(f"# === TASK INSTRUCTIONS ===\n\n{task_prompt}")
@@ -535,7 +525,7 @@ class PromptRuntime:
         agent_path = self.base_path / AGENT_REGISTRY[agent_id]
 
         # Verify agent directory exists
-        if not agent_path.exists():
+        if not self.files.exists(agent_path):
             raise AgentNotFoundError(
                 f"Agent directory not found: {agent_path}\n"
                 f"Agent ID: {agent_id}\n"
@@ -546,9 +536,8 @@ class PromptRuntime:
         return agent_path
 
     def _load_file(self, path: Path) -> str:
-        """Load a file's contents"""
-        with open(path) as f:
-            return f.read()
+        """Load a file's contents (with caching)"""
+        return self.files.read_text(path)
 
     def _compose_tools_section(
         self, source: str, available_tools: list[str], agent_path: Path
@@ -574,8 +563,7 @@ class PromptRuntime:
 
         # Load tool definitions
         try:
-            with open(tool_defs_path) as f:
-                all_tools = yaml.safe_load(f)
+            all_tools = self.files.read_yaml(tool_defs_path)
         except FileNotFoundError:
             logger.warning(f"Tool definitions file not found: {tool_defs_path}")
             return "*(No tools available - tool_definitions.yaml not found)*"
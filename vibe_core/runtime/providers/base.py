@@ -20,6 +20,7 @@ Design Principles:
 Version: 1.0 (GAD-511)
 """
 
+import asyncio
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from datetime import datetime
@@ -94,6 +95,30 @@ class LLMProvider(ABC):
         """
         pass
 
+    async def ainvoke(
+        self,
+        prompt: str,
+        model: str,
+        max_tokens: int = 4096,
+        temperature: float = 1.0,
+        **kwargs: Any,
+    ) -> LLMResponse:
+        """
+        Invoke the LLM without blocking the event loop.
+
+        Default implementation runs invoke() in a worker thread; providers
+        with a native async SDK override this.
+
+        Returns:
+            LLMResponse with content, usage, and metadata
+
+        Raises:
+            LLMProviderError: If invocation fails
+        """
+        return await asyncio.to_thread(
+            self.invoke, prompt, model, max_tokens=max_tokens, temperature=temperature, **kwargs
+        )
+
     @abstractmethod
     def calculate_cost(self, input_tokens: int, output_tokens: int, model: str) -> float:
         """
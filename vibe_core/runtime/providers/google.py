@@ -22,6 +22,7 @@ Pricing (as of 2025-11-19):
 Version: 1.2 (Updated for Gemini 2.5)
 """
 
+import asyncio
 import logging
 import time
 from datetime import datetime
@@ -124,100 +125,155 @@ class GoogleProvider(LLMProvider):
 
         for attempt in range(max_retries):
             try:
-                # Create model instance
                 gemini_model = self.genai.GenerativeModel(model)
-
-                # Configure generation settings
-                generation_config = {
-                    "max_output_tokens": max_tokens,
-                    "temperature": temperature,
-                }
-
-                # Generate response
                 response = gemini_model.generate_content(
                     prompt,
-                    generation_config=generation_config,
+                    generation_config=self._generation_config(max_tokens, temperature),
                 )
+                return self._to_llm_response(response, model)
 
-                # Extract token usage (Google provides this in metadata)
-                # Note: Google's API may not always provide exact token counts
-                # We'll use best-effort estimation
-                input_tokens = 0
-                output_tokens = 0
-
-                if hasattr(response, "usage_metadata") and response.usage_metadata:
-                    input_tokens = getattr(response.usage_metadata, "prompt_token_count", 0)
-                    output_tokens = getattr(response.usage_metadata, "candidates_token_count", 0)
-
-                # Calculate cost
-                cost = self.calculate_cost(
-                    input_tokens=input_tokens,
-                    output_tokens=output_tokens,
-                    model=model,
-                )
+            except Exception as e:
+                last_error = e
+                wait_time = self._retry_delay(e, attempt, max_retries)
+                if wait_time is None:
+                    break
+                time.sleep(wait_time)
 
-                # Create usage record
-                usage = LLMUsage(
-                    input_tokens=input_tokens,
-                    output_tokens=output_tokens,
-                    model=model,
-                    cost_usd=cost,
-                    timestamp=datetime.utcnow().isoformat() + "Z",
-                )
+        # All retries failed
+        raise ProviderInvocationError(
+            f"Google Gemini invocation failed after {max_retries} attempts. "
+            f"Last error: {type(last_error).__name__} - {last_error!s}"
+        )
 
-                # Extract text from response
-                content = response.text if hasattr(response, "text") else str(response)
-
-                # Determine finish reason
-                finish_reason = "stop"
-                if hasattr(response, "candidates") and response.candidates:
-                    candidate = response.candidates[0]
-                    if hasattr(candidate, "finish_reason"):
-                        finish_reason = str(candidate.finish_reason)
-
-                # Log success
-                logger.info(
-                    f"Google Gemini invocation successful: {model} "
-                    f"(in: {usage.input_tokens}, out: {usage.output_tokens}, "
-                    f"cost: ${usage.cost_usd:.4f})"
-                )
+    async def ainvoke(
+        self,
+        prompt: str,
+        model: str = "gemini-2.5-flash",
+        max_tokens: int = 4096,
+        temperature: float = 1.0,
+        max_retries: int = 3,
+        **kwargs: Any,
+    ) -> LLMResponse:
+        """
+        Invoke Gemini without blocking the event loop.
+
+        Same contract as invoke(), but uses the SDK's generate_content_async
+        and asyncio.sleep() for backoff, so many calls can be in flight on
+        one event loop.
+
+        Raises:
+            ProviderInvocationError: If all retries fail
+        """
+        last_error = None
 
-                # Return standardized response
-                return LLMResponse(
-                    content=content,
-                    usage=usage,
-                    model=model,
-                    finish_reason=finish_reason,
-                    provider="google",
+        for attempt in range(max_retries):
+            try:
+                gemini_model = self.genai.GenerativeModel(model)
+                response = await gemini_model.generate_content_async(
+                    prompt,
+                    generation_config=self._generation_config(max_tokens, temperature),
                 )
+                return self._to_llm_response(response, model)
 
             except Exception as e:
                 last_error = e
-                error_name = type(e).__name__
-
-                # Check if retryable error
-                retryable_errors = ["ResourceExhausted", "ServiceUnavailable", "DeadlineExceeded"]
-                is_retryable = any(err in error_name for err in retryable_errors)
-
-                if is_retryable and attempt < max_retries - 1:
-                    # Exponential backoff: 2s, 4s, 8s
-                    wait_time = 2**attempt
-                    logger.warning(
-                        f"Google Gemini invocation failed ({error_name}), "
-                        f"retrying in {wait_time}s (attempt {attempt + 1}/{max_retries})"
-                    )
-                    time.sleep(wait_time)
-                else:
-                    # Non-retryable error or max retries reached
-                    logger.error(f"Google Gemini invocation failed: {error_name} - {e!s}")
+                wait_time = self._retry_delay(e, attempt, max_retries)
+                if wait_time is None:
                     break
+                await asyncio.sleep(wait_time)
 
-        # All retries failed
         raise ProviderInvocationError(
             f"Google Gemini invocation failed after {max_retries} attempts. "
             f"Last error: {type(last_error).__name__} - {last_error!s}"
         )
 
+    @staticmethod
+    def _generation_config(max_tokens: int, temperature: float) -> dict[str, Any]:
+        """Build the generation settings for a Gemini call."""
+        return {
+            "max_output_tokens": max_tokens,
+            "temperature": temperature,
+        }
+
+    def _to_llm_response(self, response: Any, model: str) -> LLMResponse:
+        """Convert a Gemini SDK response into a standardized LLMResponse."""
+        # Extract token usage (Google provides this in metadata)
+        # Note: Google's API may not always provide exact token counts
+        # We'll use best-effort estimation
+        input_tokens = 0
+        output_tokens = 0
+
+        if hasattr(response, "usage_metadata") and response.usage_metadata:
+            input_tokens = getattr(response.usage_metadata, "prompt_token_count", 0)
+            output_tokens = getattr(response.usage_metadata, "candidates_token_count", 0)
+
+        # Calculate cost
+        cost = self.calculate_cost(
+            input_tokens=input_tokens,
+            output_tokens=output_tokens,
+            model=model,
+        )
+
+        # Create usage record
+        usage = LLMUsage(
+            input_tokens=input_tokens,
+            output_tokens=output_tokens,
+            model=model,
+            cost_usd=cost,
+            timestamp=datetime.utcnow().isoformat() + "Z",
+        )
+
+        # Extract text from response
+        content = response.text if hasattr(response, "text") else str(response)
+
+        # Determine finish reason
+        finish_reason = "stop"
+        if hasattr(response, "candidates") and response.candidates:
+            candidate = response.candidates[0]
+            if hasattr(candidate, "finish_reason"):
+                finish_reason = str(candidate.finish_reason)
+
+        # Log success
+        logger.info(
+            f"Google Gemini invocation successful: {model} "
+            f"(in: {usage.input_tokens}, out: {usage.output_tokens}, "
+            f"cost: ${usage.cost_usd:.4f})"
+        )
+
+        # Return standardized response
+        return LLMResponse(
+            content=content,
+            usage=usage,
+            model=model,
+            finish_reason=finish_reason,
+            provider="google",
+        )
+
+    @staticmethod
+    def _retry_delay(error: Exception, attempt: int, max_retries: int) -> int | None:
+        """
+        Return the backoff before the next attempt, or None to stop retrying.
+
+        Only transient errors are retried, with exponential backoff: 1s, 2s, 4s...
+        """
+        error_name = type(error).__name__
+
+        # Check if retryable error
+        retryable_errors = ["ResourceExhausted", "ServiceUnavailable", "DeadlineExceeded"]
+        is_retryable = any(err in error_name for err in retryable_errors)
+
+        if is_retryable and attempt < max_retries - 1:
+            wait_time = 2**attempt
+            logger.warning(
+                f"Google Gemini invocation failed ({error_name}), "
+                f"retrying in {wait_time}s (attempt {attempt + 1}/{max_retries})"
+            )
+            return wait_time
+
+        # Non-retryable error or max retries reached
+        logger.error(f"Google Gemini invocation failed: {error_name} - {error!s}")
+        return None
+
     def calculate_cost(self, input_tokens: int, output_tokens: int, model: str) -> float:
         """
         Calculate cost based on Google Gemini pricing.
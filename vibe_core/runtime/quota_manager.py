@@ -14,16 +14,28 @@ Quotas tracked:
 
 Implementation of operational safeguards - prevents runaway API costs.
 
+Sliding windows:
+- Every request is logged with its timestamp; a window only counts the
+  requests of the last 60s / 3600s / 86400s, so there is no boundary at
+  which the counters reset and a 2x burst slips through
+- All counters are guarded by one lock, so a single OperationalQuota can be
+  shared by the kernel, the parallel GraphExecutor and LLMClient threads
+- acquire() waits for RPM/TPM capacity instead of raising, and reserves it
+  so concurrent callers cannot claim the same capacity twice
+
 GAD-510.1: Dynamic Quota Configuration
 - Loads quota limits from environment variables
 - Falls back to safe defaults if undefined
 - Configurable limits prevent surprises and enable custom budgets
 
-Version: 1.1 (GAD-510 + GAD-510.1)
+Version: 1.2 (GAD-510 + GAD-510.1, sliding windows)
 """
 
 import logging
+import threading
 import time
+from collections import deque
+from collections.abc import Callable
 from dataclasses import dataclass, field
 from typing import Any
 
@@ -39,6 +51,15 @@ except ImportError:
     get_config = None
 
 
+# Sliding window lengths in seconds
+MINUTE_SECONDS = 60.0
+HOUR_SECONDS = 3600.0
+DAY_SECONDS = 86400.0
+
+# Rough characters-per-token ratio used to estimate prompt size
+CHARS_PER_TOKEN = 4
+
+
 class QuotaExceededError(Exception):
     """Raised when an operational quota would be exceeded"""
 
@@ -116,9 +137,32 @@ class QuotaLimits:
         return cls(**limits_dict)
 
 
+def estimate_tokens(text: str) -> int:
+    """
+    Estimate the number of tokens in a prompt.
+
+    Uses the common ~4 characters per token heuristic, rounded up.
+
+    Args:
+        text: Prompt text
+
+    Returns:
+        Estimated token count
+    """
+    return -(-len(text) // CHARS_PER_TOKEN)
+
+
+@dataclass
+class QuotaReservation:
+    """A request counted in the minute window (returned by acquire())"""
+
+    timestamp: float
+    tokens: int
+
+
 @dataclass
 class QuotaMetrics:
-    """Metrics about quota usage"""
+    """Metrics about quota usage (window counters cover the last minute/hour/day)"""
 
     total_requests: int = 0
     total_tokens: int = 0
@@ -128,9 +172,9 @@ class QuotaMetrics:
     cost_this_hour_usd: float = 0.0
     cost_this_day_usd: float = 0.0
     quota_violations: list[dict[str, Any]] = field(default_factory=list)
-    minute_start_time: float = field(default_factory=time.time)
-    hour_start_time: float = field(default_factory=time.time)
-    day_start_time: float = field(default_factory=time.time)
+    minute_log: deque[QuotaReservation] = field(default_factory=deque)
+    hour_log: deque[tuple[float, float]] = field(default_factory=deque)  # (timestamp, cost)
+    day_log: deque[tuple[float, float]] = field(default_factory=deque)  # (timestamp, cost)
 
 
 class OperationalQuota:
@@ -142,10 +186,12 @@ class OperationalQuota:
     - Runaway cost spikes
     - Resource exhaustion
 
+    Thread-safe: one instance can be shared by concurrent callers.
+
     Usage:
         quota = OperationalQuota()
 
-        # Pre-flight check
+        # Pre-flight check (raises immediately if over quota)
         try:
             quota.check_before_request(estimated_tokens=5000, operation="feature_implementation")
         except QuotaExceededError as e:
@@ -154,17 +200,29 @@ class OperationalQuota:
 
         # Record actual usage
         quota.record_request(tokens_used=4800, cost_usd=0.24, operation="feature_implementation")
+
+        # Or wait for rate capacity and reserve it (release() it if the request fails)
+        reservation = quota.acquire(5000, timeout=30, operation="feature_implementation")
+        quota.record_request(4800, 0.24, "feature_implementation", reservation=reservation)
     """
 
-    def __init__(self, limits: QuotaLimits | None = None):
+    def __init__(
+        self,
+        limits: QuotaLimits | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
         """
         Initialize quota manager.
 
         Args:
             limits: QuotaLimits configuration (loads from env vars if None)
+            clock: Time source in seconds (injectable for tests)
         """
         self.limits = limits or QuotaLimits.from_environment()
         self.metrics = QuotaMetrics()
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._capacity = threading.Condition(self._lock)
 
         logger.info(
             f"Quota Manager initialized: "
@@ -192,32 +250,234 @@ class OperationalQuota:
         Raises:
             QuotaExceededError: If quota would be exceeded
         """
-        # Update rolling windows
-        self._update_rolling_windows()
+        with self._lock:
+            self._expire(self._clock())
 
-        # Check 1: Request rate limit
-        if self.metrics.requests_this_minute >= self.limits.requests_per_minute:
+            violation = self._rate_violation(estimated_tokens)
+            if violation:
+                raise QuotaExceededError(violation)
+
+            self._check_cost(estimated_tokens, operation)
+
+        return True, "OK"
+
+    def acquire(
+        self,
+        tokens: int,
+        timeout: float | None = None,
+        operation: str = "unknown",
+    ) -> QuotaReservation:
+        """
+        Wait until the request fits the RPM/TPM windows, then reserve it.
+
+        The reservation counts as a request of `tokens` tokens in the minute
+        window right away; pass it to record_request() to replace the estimate
+        with the actual usage.
+
+        Cost limits are budgets rather than rates, so they are not waited on.
+
+        Args:
+            tokens: Estimated tokens this request will use
+            timeout: Maximum seconds to wait (None waits indefinitely)
+            operation: Human-readable description of the operation
+
+        Returns:
+            QuotaReservation for record_request()
+
+        Raises:
+            QuotaExceededError: If tokens exceed the TPM limit, a cost limit
+                would be exceeded, or no capacity frees up within timeout
+        """
+        if tokens > self.limits.tokens_per_minute:
             raise QuotaExceededError(
+                f"Request can never fit the token rate limit: "
+                f"{tokens}/{self.limits.tokens_per_minute} TPM. "
+                f"Operation: '{operation}'"
+            )
+
+        deadline = None if timeout is None else self._clock() + timeout
+        with self._capacity:
+            while True:
+                now = self._clock()
+                self._expire(now)
+                self._check_cost(tokens, operation)
+
+                wait = self._rate_wait(tokens, now)
+                if wait <= 0:
+                    reservation = QuotaReservation(now, tokens)
+                    self._log_request(reservation)
+                    return reservation
+
+                if deadline is not None:
+                    if now >= deadline:
+                        raise QuotaExceededError(
+                            f"{self._rate_violation(tokens)} (no capacity after waiting {timeout}s)"
+                        )
+                    wait = min(wait, deadline - now)
+
+                logger.debug(f"Quota wait: {operation} needs {tokens} tokens, waiting {wait:.2f}s")
+                self._capacity.wait(wait)
+
+    def record_request(
+        self,
+        tokens_used: int,
+        cost_usd: float,
+        operation: str = "unknown",
+        reservation: QuotaReservation | None = None,
+    ):
+        """
+        Record a completed request.
+
+        Args:
+            tokens_used: Actual tokens used
+            cost_usd: Actual cost in USD
+            operation: Human-readable description of the operation
+            reservation: Reservation from acquire() (the request is then
+                already counted; only its token count is corrected)
+        """
+        with self._capacity:
+            now = self._clock()
+            self._expire(now)
+
+            if reservation is None:
+                self._log_request(QuotaReservation(now, tokens_used))
+            elif reservation.timestamp > now - MINUTE_SECONDS:
+                # Still in the minute window: swap the estimate for actual usage
+                freed = reservation.tokens - tokens_used
+                self.metrics.tokens_this_minute -= freed
+                reservation.tokens = tokens_used
+                if freed > 0:
+                    self._capacity.notify_all()
+
+            # Record metrics
+            self.metrics.total_requests += 1
+            self.metrics.total_tokens += tokens_used
+            self.metrics.total_cost_usd += cost_usd
+            self.metrics.hour_log.append((now, cost_usd))
+            self.metrics.day_log.append((now, cost_usd))
+            self.metrics.cost_this_hour_usd += cost_usd
+            self.metrics.cost_this_day_usd += cost_usd
+
+            requests_this_minute = self.metrics.requests_this_minute
+            tokens_this_minute = self.metrics.tokens_this_minute
+            cost_this_hour = self.metrics.cost_this_hour_usd
+            cost_this_day = self.metrics.cost_this_day_usd
+
+        logger.info(
+            f"Request recorded: {operation} "
+            f"({tokens_used} tokens, ${cost_usd:.4f}). "
+            f"Running totals - RPM: {requests_this_minute}, "
+            f"TPM: {tokens_this_minute}, "
+            f"Hour: ${cost_this_hour:.2f}, "
+            f"Day: ${cost_this_day:.2f}"
+        )
+
+        # Check if approaching limits (for warning)
+        if cost_this_hour > self.limits.cost_per_hour_usd * 0.8:
+            logger.warning(
+                f"Hourly cost at 80% of limit: "
+                f"${cost_this_hour:.2f}/"
+                f"${self.limits.cost_per_hour_usd:.2f}"
+            )
+
+        if cost_this_day > self.limits.cost_per_day_usd * 0.8:
+            logger.warning(
+                f"Daily cost at 80% of limit: "
+                f"${cost_this_day:.2f}/"
+                f"${self.limits.cost_per_day_usd:.2f}"
+            )
+
+    def release(self, reservation: QuotaReservation) -> None:
+        """
+        Return an unused reservation (the request failed before using quota).
+
+        Args:
+            reservation: Reservation from acquire() that will not be recorded
+        """
+        with self._capacity:
+            self._expire(self._clock())
+            try:
+                self.metrics.minute_log.remove(reservation)
+            except ValueError:
+                return  # Already slid out of the minute window
+            self.metrics.requests_this_minute -= 1
+            self.metrics.tokens_this_minute -= reservation.tokens
+            self._capacity.notify_all()
+
+    def _log_request(self, entry: QuotaReservation) -> None:
+        """Count a request in the minute window (caller holds the lock)"""
+        self.metrics.minute_log.append(entry)
+        self.metrics.requests_this_minute += 1
+        self.metrics.tokens_this_minute += entry.tokens
+
+    def _expire(self, now: float) -> None:
+        """Drop requests that slid out of their window (caller holds the lock)"""
+        metrics = self.metrics
+
+        minute_log = metrics.minute_log
+        while minute_log and minute_log[0].timestamp <= now - MINUTE_SECONDS:
+            entry = minute_log.popleft()
+            metrics.requests_this_minute -= 1
+            metrics.tokens_this_minute -= entry.tokens
+
+        hour_log = metrics.hour_log
+        while hour_log and hour_log[0][0] <= now - HOUR_SECONDS:
+            metrics.cost_this_hour_usd -= hour_log.popleft()[1]
+        if not hour_log:
+            metrics.cost_this_hour_usd = 0.0  # Drop float drift
+
+        day_log = metrics.day_log
+        while day_log and day_log[0][0] <= now - DAY_SECONDS:
+            metrics.cost_this_day_usd -= day_log.popleft()[1]
+        if not day_log:
+            metrics.cost_this_day_usd = 0.0
+
+    def _rate_violation(self, tokens: int) -> str | None:
+        """Describe the RPM/TPM limit a request would exceed, if any"""
+        if self.metrics.requests_this_minute >= self.limits.requests_per_minute:
+            return (
                 f"Request rate limit exceeded: {self.metrics.requests_this_minute}/"
                 f"{self.limits.requests_per_minute} RPM"
             )
 
-        # Check 2: Token rate limit
-        if self.metrics.tokens_this_minute + estimated_tokens > self.limits.tokens_per_minute:
-            raise QuotaExceededError(
+        if self.metrics.tokens_this_minute + tokens > self.limits.tokens_per_minute:
+            return (
                 f"Token rate limit would be exceeded: "
-                f"{self.metrics.tokens_this_minute + estimated_tokens}/"
+                f"{self.metrics.tokens_this_minute + tokens}/"
                 f"{self.limits.tokens_per_minute} TPM. "
-                f"Estimated tokens: {estimated_tokens}"
+                f"Estimated tokens: {tokens}"
             )
 
-        # Check 3: Estimate cost and check against limits
-        estimated_cost = self._estimate_cost(estimated_tokens)
+        return None
+
+    def _rate_wait(self, tokens: int, now: float) -> float:
+        """Seconds until a request fits the RPM/TPM windows (0 if it fits now)"""
+        metrics = self.metrics
+        wait = 0.0
+
+        # Requests: wait for enough of the oldest entries to slide out
+        excess = metrics.requests_this_minute - self.limits.requests_per_minute + 1
+        if excess > 0:
+            wait = metrics.minute_log[excess - 1].timestamp + MINUTE_SECONDS - now
+
+        excess_tokens = metrics.tokens_this_minute + tokens - self.limits.tokens_per_minute
+        if excess_tokens > 0:
+            for entry in metrics.minute_log:
+                excess_tokens -= entry.tokens
+                if excess_tokens <= 0:
+                    wait = max(wait, entry.timestamp + MINUTE_SECONDS - now)
+                    break
+
+        return wait
+
+    def _check_cost(self, tokens: int, operation: str) -> None:
+        """Raise if a request would exceed a cost limit (caller holds the lock)"""
+        estimated_cost = self._estimate_cost(tokens)
 
         if estimated_cost > self.limits.cost_per_request_usd:
             logger.warning(
                 f"High-cost request detected: ${estimated_cost:.2f} "
-                f"for operation '{operation}' ({estimated_tokens} tokens)"
+                f"for operation '{operation}' ({tokens} tokens)"
             )
             # Raise error - require explicit approval for high-cost requests
             raise QuotaExceededError(
@@ -226,7 +486,7 @@ class OperationalQuota:
                 f"Operation: '{operation}'"
             )
 
-        # Check 4: Hourly cost limit
+        # Hourly cost limit
         if self.metrics.cost_this_hour_usd + estimated_cost > self.limits.cost_per_hour_usd:
             remaining = self.limits.cost_per_hour_usd - self.metrics.cost_this_hour_usd
             logger.warning(
@@ -242,7 +502,7 @@ class OperationalQuota:
                 f"Request cost: ${estimated_cost:.2f}"
             )
 
-        # Check 5: Daily cost limit
+        # Daily cost limit
         if self.metrics.cost_this_day_usd + estimated_cost > self.limits.cost_per_day_usd:
             remaining = self.limits.cost_per_day_usd - self.metrics.cost_this_day_usd
             logger.warning(
@@ -258,78 +518,6 @@ class OperationalQuota:
                 f"Request cost: ${estimated_cost:.2f}"
             )
 
-        return True, "OK"
-
-    def record_request(
-        self,
-        tokens_used: int,
-        cost_usd: float,
-        operation: str = "unknown",
-    ):
-        """
-        Record a completed request.
-
-        Args:
-            tokens_used: Actual tokens used
-            cost_usd: Actual cost in USD
-            operation: Human-readable description of the operation
-        """
-        # Update rolling windows
-        self._update_rolling_windows()
-
-        # Record metrics
-        self.metrics.total_requests += 1
-        self.metrics.total_tokens += tokens_used
-        self.metrics.total_cost_usd += cost_usd
-        self.metrics.requests_this_minute += 1
-        self.metrics.tokens_this_minute += tokens_used
-        self.metrics.cost_this_hour_usd += cost_usd
-        self.metrics.cost_this_day_usd += cost_usd
-
-        logger.info(
-            f"Request recorded: {operation} "
-            f"({tokens_used} tokens, ${cost_usd:.4f}). "
-            f"Running totals - RPM: {self.metrics.requests_this_minute}, "
-            f"TPM: {self.metrics.tokens_this_minute}, "
-            f"Hour: ${self.metrics.cost_this_hour_usd:.2f}, "
-            f"Day: ${self.metrics.cost_this_day_usd:.2f}"
-        )
-
-        # Check if approaching limits (for warning)
-        if self.metrics.cost_this_hour_usd > self.limits.cost_per_hour_usd * 0.8:
-            logger.warning(
-                f"Hourly cost at 80% of limit: "
-                f"${self.metrics.cost_this_hour_usd:.2f}/"
-                f"${self.limits.cost_per_hour_usd:.2f}"
-            )
-
-        if self.metrics.cost_this_day_usd > self.limits.cost_per_day_usd * 0.8:
-            logger.warning(
-                f"Daily cost at 80% of limit: "
-                f"${self.metrics.cost_this_day_usd:.2f}/"
-                f"${self.limits.cost_per_day_usd:.2f}"
-            )
-
-    def _update_rolling_windows(self):
-        """Update rolling time windows"""
-        now = time.time()
-
-        # Reset minute window if 60s passed
-        if now - self.metrics.minute_start_time >= 60:
-            self.metrics.requests_this_minute = 0
-            self.metrics.tokens_this_minute = 0
-            self.metrics.minute_start_time = now
-
-        # Reset hour window if 3600s passed
-        if now - self.metrics.hour_start_time >= 3600:
-            self.metrics.cost_this_hour_usd = 0.0
-            self.metrics.hour_start_time = now
-
-        # Reset day window if 86400s passed
-        if now - self.metrics.day_start_time >= 86400:
-            self.metrics.cost_this_day_usd = 0.0
-            self.metrics.day_start_time = now
-
     def _estimate_cost(self, tokens: int) -> float:
         """
         Estimate cost for a given number of tokens.
@@ -362,8 +550,12 @@ class OperationalQuota:
         Returns:
             Dictionary with current metrics and limits
         """
-        self._update_rolling_windows()
+        with self._lock:
+            self._expire(self._clock())
+            return self._status()
 
+    def _status(self) -> dict[str, Any]:
+        """Build the get_status() dict (caller holds the lock)"""
         return {
             "requests": {
                 "this_minute": self.metrics.requests_this_minute,
@@ -400,4 +592,6 @@ class OperationalQuota:
         Useful for testing or explicit user intervention.
         """
         logger.info("Quota Manager manually reset")
-        self.metrics = QuotaMetrics()
+        with self._capacity:
+            self.metrics = QuotaMetrics()
+            self._capacity.notify_all()
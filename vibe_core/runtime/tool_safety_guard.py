@@ -10,19 +10,21 @@ It physically prevents operations that are known to cause "AI Slop" and regressi
 
 Rules (Non-negotiable):
   1. ANTI-BLINDNESS: No file edits without prior read in session
+     (a read goes stale if the file changed on disk since)
   2. BLAST RADIUS: No directory deletions without explicit override
   3. TEST DISCIPLINE: No commits when tests are failing
 
-Version: 1.0 (GAD-509 Extension - Operation Iron Dome)
+Version: 1.1 (GAD-509 Extension - Operation Iron Dome)
 """
 
 import logging
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-from pathlib import Path
 from typing import Any
 
+from .file_access_store import FileAccessStore, ReadState
+
 logger = logging.getLogger(__name__)
 
 
@@ -48,10 +50,8 @@ class SafetyViolation:
 
 @dataclass
 class SessionContext:
-    """Tracks session state for safety checks"""
+    """Tracks session state for safety checks (file reads/writes live in the FileAccessStore)"""
 
-    files_read: set[str] = field(default_factory=set)
-    files_written: set[str] = field(default_factory=set)
     violations: list[SafetyViolation] = field(default_factory=list)
     session_start: str = field(default_factory=lambda: datetime.utcnow().isoformat() + "Z")
 
@@ -84,18 +84,25 @@ class ToolSafetyGuard:
 
         # After successful read
         guard.record_file_read("foo.py")
+
+        # Persistent, bounded read tracking across restarts
+        store = FileAccessStore(db_path=".vibe/state/file_access.db", session_id="operator")
+        guard = ToolSafetyGuard(file_store=store)
     """
 
-    def __init__(self, enable_strict_mode: bool = True):
+    def __init__(self, enable_strict_mode: bool = True, file_store: FileAccessStore | None = None):
         """
         Initialize the safety guard.
 
         Args:
             enable_strict_mode: If True, enforce all blocking rules.
                                If False, log warnings but allow operations.
+            file_store: Where file reads/writes are tracked (default: a new
+                        in-memory FileAccessStore)
         """
         self.strict_mode = enable_strict_mode
         self.context = SessionContext()
+        self.file_store = file_store if file_store is not None else FileAccessStore()
 
         logger.info(
             f"Tool Safety Guard initialized (strict_mode={enable_strict_mode}). "
@@ -120,14 +127,22 @@ class ToolSafetyGuard:
         # Rule 1: Anti-Blindness
         if tool_name in ["edit_file", "write_file", "modify_file"]:
             file_path = self._extract_file_path(args)
-            if file_path and not self._was_file_read(file_path):
+            state = self._read_state(file_path) if file_path else ReadState.FRESH
+            if state is not ReadState.FRESH:
+                if state is ReadState.STALE:
+                    message = (
+                        f"BLOCKED: '{file_path}' was modified on disk after it was read. "
+                        f"Read the file again before editing."
+                    )
+                else:
+                    message = (
+                        f"BLOCKED: Cannot edit '{file_path}' without reading it first. "
+                        f"This prevents hallucinated edits. Read the file before editing."
+                    )
                 violation = SafetyViolation(
                     rule="ANTI_BLINDNESS",
                     severity=ViolationSeverity.BLOCKING,
-                    message=(
-                        f"BLOCKED: Cannot edit '{file_path}' without reading it first. "
-                        f"This prevents hallucinated edits. Read the file before editing."
-                    ),
+                    message=message,
                     tool_name=tool_name,
                     args=args,
                 )
@@ -166,31 +181,32 @@ class ToolSafetyGuard:
 
         return True, None
 
-    def record_file_read(self, file_path: str):
+    def record_file_read(self, file_path: str, content: str | bytes | None = None):
         """
         Record that a file has been read in this session.
 
         Args:
             file_path: Path to the file that was read
+            content: Content that was read (optional; lets a touched but
+                     unchanged file stay fresh)
         """
-        normalized = self._normalize_path(file_path)
-        self.context.files_read.add(normalized)
-        logger.debug(f"📖 Recorded file read: {normalized}")
+        record = self.file_store.record_read(file_path, content)
+        logger.debug(f"📖 Recorded file read: {record.path}")
 
-    def record_file_write(self, file_path: str):
+    def record_file_write(self, file_path: str, content: str | bytes | None = None):
         """
         Record that a file has been written in this session.
 
         Args:
             file_path: Path to the file that was written
+            content: Content that was written (optional)
         """
-        normalized = self._normalize_path(file_path)
-        self.context.files_written.add(normalized)
-        logger.debug(f"✍️ Recorded file write: {normalized}")
+        record = self.file_store.record_write(file_path, content)
+        logger.debug(f"✍️ Recorded file write: {record.path}")
 
     def _was_file_read(self, file_path: str) -> bool:
         """
-        Check if a file was read in the current session.
+        Check if a file was read in the current session (and is unchanged since).
 
         Args:
             file_path: Path to check
@@ -198,27 +214,13 @@ class ToolSafetyGuard:
         Returns:
             True if file was read, False otherwise
         """
-        normalized = self._normalize_path(file_path)
-        was_read = normalized in self.context.files_read
+        return self._read_state(file_path) is ReadState.FRESH
 
-        logger.debug(f"🔍 Check file read: {normalized} → {was_read}")
-        return was_read
-
-    def _normalize_path(self, path: str) -> str:
-        """
-        Normalize a file path for comparison.
-
-        Args:
-            path: File path to normalize
-
-        Returns:
-            Normalized absolute path
-        """
-        try:
-            return str(Path(path).resolve())
-        except Exception:
-            # If path resolution fails, return as-is
-            return path
+    def _read_state(self, file_path: str) -> ReadState:
+        """Look up whether the session's read of a file is current."""
+        state = self.file_store.read_state(file_path)
+        logger.debug(f"🔍 Check file read: {file_path} → {state.value}")
+        return state
 
     def _extract_file_path(self, args: dict[str, Any]) -> str | None:
         """
@@ -243,11 +245,13 @@ class ToolSafetyGuard:
         Returns:
             Dictionary with session context and violation stats
         """
+        counts = self.file_store.counts()
         return {
             "strict_mode": self.strict_mode,
             "session_start": self.context.session_start,
-            "files_read": len(self.context.files_read),
-            "files_written": len(self.context.files_written),
+            "files_read": counts["read"],
+            "files_written": counts["written"],
+            "files_tracked": counts["tracked"],
             "violations": {
                 "total": len(self.context.violations),
                 "blocking": sum(
@@ -274,3 +278,4 @@ class ToolSafetyGuard:
         """
         logger.info("🔄 Resetting Tool Safety Guard session context")
         self.context = SessionContext()
+        self.file_store.clear()
@@ -2,9 +2,13 @@
 Scheduling module for vibe-agency.
 
 This module provides the core scheduling primitives for the vibe OS,
-including the FIFO task queue and scheduler.
+including the FIFO task queue and scheduler, the priority
+scheduler with aging and per-agent fairness, and the task handles
+returned by VibeKernel.submit().
 """
 
+from vibe_core.scheduling.priority_scheduler import PriorityScheduler
 from vibe_core.scheduling.scheduler import Task, VibeScheduler
+from vibe_core.scheduling.task_handle import TaskEvent, TaskHandle
 
-__all__ = ["Task", "VibeScheduler"]
+__all__ = ["PriorityScheduler", "Task", "TaskEvent", "TaskHandle", "VibeScheduler"]
@@ -0,0 +1,171 @@
+"""
+Priority Scheduler for vibe-agency OS.
+
+This module implements the priority scheduling mode for the kernel.
+It is a drop-in replacement for the FIFO VibeScheduler: the kernel only
+ever calls submit_task(), next_task() and get_queue_status(), so
+VibeKernel.tick() works unchanged on top of it.
+
+Scheduling policy:
+- Higher Task.priority runs first (same convention as the task manager)
+- Waiting tasks age: every `aging_interval` seconds in the queue adds
+  one priority level, so low-priority work is never starved forever
+- Agents with the same effective priority are served round-robin, so
+  one chatty agent cannot monopolize the queue
+"""
+
+import heapq
+import itertools
+import threading
+import time
+from collections import Counter, deque
+from collections.abc import Callable, Container
+
+from vibe_core.scheduling.scheduler import Task, VibeScheduler
+
+# Seconds a task must wait before it gains one priority level
+DEFAULT_AGING_INTERVAL = 5.0
+
+
+class PriorityScheduler(VibeScheduler):
+    """
+    Heap-based priority scheduler with aging and per-agent fairness.
+
+    Each agent owns a min-heap of its pending tasks. The heap key is
+    `enqueued_at / aging_interval - priority`: since every waiting task
+    ages at the same rate, this static key orders tasks exactly like
+    their (growing) effective priority, so aging costs nothing at pop time.
+
+    next_task() compares the head task of every agent by effective priority
+    (priority + whole aging intervals waited) and serves the best one.
+    Ties are broken by agent rotation order (least recently served first),
+    which gives round-robin between agents at the same priority band.
+
+    Thread-safe: all queue operations are guarded by a lock.
+    """
+
+    def __init__(
+        self,
+        aging_interval: float = DEFAULT_AGING_INTERVAL,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Initialize an empty priority scheduler.
+
+        Args:
+            aging_interval: Seconds of waiting that add one priority level.
+                            Must be positive.
+            clock: Monotonic time source (injectable for tests)
+
+        Raises:
+            ValueError: If aging_interval is not positive
+        """
+        if aging_interval <= 0:
+            raise ValueError(f"aging_interval must be positive, got {aging_interval}")
+
+        self.aging_interval = aging_interval
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._counter = itertools.count()  # FIFO tie-breaker within a heap
+
+        # agent_id -> heap of (key, seq, enqueued_at, task)
+        self._heaps: dict[str, list[tuple[float, int, float, Task]]] = {}
+        # Agents with pending tasks, in round-robin order (front = served longest ago)
+        self._rotation: deque[str] = deque()
+        self._by_priority: Counter[int] = Counter()
+        self._size = 0
+
+    def submit_task(self, task: Task) -> str:
+        """
+        Submit a task to the priority queue.
+
+        Args:
+            task: The Task object to be queued
+
+        Returns:
+            str: The task ID (task.id) for tracking
+        """
+        now = self._clock()
+        key = now / self.aging_interval - task.priority
+
+        with self._lock:
+            heap = self._heaps.get(task.agent_id)
+            if heap is None:
+                heap = self._heaps[task.agent_id] = []
+                self._rotation.append(task.agent_id)
+            heapq.heappush(heap, (key, next(self._counter), now, task))
+            self._by_priority[task.priority] += 1
+            self._size += 1
+
+        return task.id
+
+    def next_task(self, exclude_agents: Container[str] = ()) -> Task | None:
+        """
+        Retrieve and remove the next task to run.
+
+        Args:
+            exclude_agents: Agents whose tasks are skipped (they stay queued
+                            and keep aging, e.g. agents at their concurrency cap)
+
+        Returns:
+            Task | None: The highest effective priority task (round-robin
+                         between agents on ties), or None if none is eligible
+        """
+        with self._lock:
+            if not self._size:
+                return None
+
+            now = self._clock()
+            best_agent = None
+            best_band = None
+            for agent_id in self._rotation:
+                if agent_id in exclude_agents:
+                    continue
+                _, _, enqueued_at, head = self._heaps[agent_id][0]
+                band = self._effective_priority(head, enqueued_at, now)
+                if best_band is None or band > best_band:
+                    best_agent, best_band = agent_id, band
+            if best_agent is None:
+                return None
+
+            heap = self._heaps[best_agent]
+            _, _, _, task = heapq.heappop(heap)
+
+            # Served agent goes to the back of the rotation
+            self._rotation.remove(best_agent)
+            if heap:
+                self._rotation.append(best_agent)
+            else:
+                del self._heaps[best_agent]
+
+            self._by_priority[task.priority] -= 1
+            if not self._by_priority[task.priority]:
+                del self._by_priority[task.priority]
+            self._size -= 1
+
+            return task
+
+    def _effective_priority(self, task: Task, enqueued_at: float, now: float) -> int:
+        """Base priority plus one level per full aging interval waited."""
+        return task.priority + int((now - enqueued_at) / self.aging_interval)
+
+    def get_queue_status(self) -> dict:
+        """
+        Get the current status of the priority queue.
+
+        Returns:
+            dict: Status information including pending task count,
+                  depth per base priority and depth per agent
+
+        Example:
+            >>> scheduler = PriorityScheduler()
+            >>> scheduler.submit_task(Task(agent_id="agent-1", payload={}, priority=3))
+            >>> scheduler.get_queue_status()["by_agent"]  # {"agent-1": 1}
+        """
+        with self._lock:
+            return {
+                "pending_tasks": self._size,
+                "queue_type": "PRIORITY",
+                "by_priority": dict(sorted(self._by_priority.items(), reverse=True)),
+                "by_agent": {agent_id: len(self._heaps[agent_id]) for agent_id in self._rotation},
+            }
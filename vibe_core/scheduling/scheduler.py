@@ -5,8 +5,10 @@ This module implements the minimal FIFO scheduler (ARCH-021),
 which serves as the heartbeat for task distribution across agents.
 """
 
+import threading
 import uuid
 from collections import deque
+from collections.abc import Container
 from dataclasses import dataclass, field
 from typing import Any
 
@@ -39,7 +41,7 @@ class VibeScheduler:
 
     Design Principles:
     - Simple FIFO queue (no priority yet, but Task has priority field for future)
-    - Thread-safe operations (using deque)
+    - Thread-safe operations (deque guarded by a lock)
     - Minimal dependencies (pure Python)
     - Clear task lifecycle tracking
     """
@@ -47,6 +49,7 @@ class VibeScheduler:
     def __init__(self):
         """Initialize an empty task queue."""
         self._queue: deque[Task] = deque()
+        self._lock = threading.Lock()
 
     def submit_task(self, task: Task) -> str:
         """
@@ -63,15 +66,19 @@ class VibeScheduler:
             >>> task = Task(agent_id="agent-1", payload={"action": "compile"})
             >>> task_id = scheduler.submit_task(task)
         """
-        self._queue.append(task)
+        with self._lock:
+            self._queue.append(task)
         return task.id
 
-    def next_task(self) -> Task | None:
+    def next_task(self, exclude_agents: Container[str] = ()) -> Task | None:
         """
         Retrieve and remove the next task from the queue (FIFO).
 
+        Args:
+            exclude_agents: Agents whose tasks are skipped (left queued in order)
+
         Returns:
-            Task | None: The next task in the queue, or None if empty
+            Task | None: The oldest task of a non-excluded agent, or None if none
 
         Example:
             >>> scheduler = VibeScheduler()
@@ -80,9 +87,11 @@ class VibeScheduler:
             >>> next_task = scheduler.next_task()
             >>> print(next_task.agent_id)  # "agent-1"
         """
-        try:
-            return self._queue.popleft()
-        except IndexError:
+        with self._lock:
+            for index, task in enumerate(self._queue):
+                if task.agent_id not in exclude_agents:
+                    del self._queue[index]
+                    return task
             return None
 
     def get_queue_status(self) -> dict:
@@ -97,4 +106,5 @@ class VibeScheduler:
             >>> status = scheduler.get_queue_status()
             >>> print(status["pending_tasks"])  # 0
         """
-        return {"pending_tasks": len(self._queue), "queue_type": "FIFO"}
+        with self._lock:
+            return {"pending_tasks": len(self._queue), "queue_type": "FIFO"}
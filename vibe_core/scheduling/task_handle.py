@@ -0,0 +1,128 @@
+"""
+Task handles and completion events for vibe-agency OS.
+
+VibeKernel.submit() returns a TaskHandle: the task ID (it IS a str, so
+existing callers that store, log or compare task IDs keep working) plus a
+future that the kernel resolves when the task completes or fails. Callers
+wait on the handle instead of polling the ledger:
+
+    >>> handle = kernel.submit(task)
+    >>> kernel.run_workers()
+    >>> handle.result()          # Blocking wait (threads)
+    >>> await handle             # Awaitable (run_async)
+
+Completion is also broadcast as a TaskEvent to kernel.subscribe() callbacks.
+"""
+
+import asyncio
+from collections.abc import Callable, Generator
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any
+
+from vibe_core.scheduling.scheduler import Task
+
+
+@dataclass(frozen=True)
+class TaskEvent:
+    """
+    A task reached a final state (published by the kernel).
+
+    Attributes:
+        task_id: ID of the finished task
+        agent_id: Agent that executed it
+        status: "COMPLETED" or "FAILED" (same values as the ledger)
+        result: Value returned by the agent (COMPLETED only)
+        error: The exception raised (FAILED only)
+        timestamp: When the task finished (ISO format)
+    """
+
+    task_id: str
+    agent_id: str
+    status: str
+    result: Any = None
+    error: BaseException | None = None
+    timestamp: str = field(default_factory=lambda: datetime.now().isoformat())
+
+
+class TaskHandle(str):
+    """
+    Task ID plus a future that resolves when the task finishes.
+
+    The handle compares, hashes and serializes exactly like the task ID
+    string. result() returns what the agent's process() returned, or raises
+    the exception the agent raised. Thread-safe; awaitable from any loop.
+    """
+
+    task: Task
+    _future: Future
+
+    def __new__(cls, task: Task) -> "TaskHandle":
+        """
+        Create an unresolved handle for a submitted task.
+
+        Args:
+            task: The submitted Task (its id becomes the string value)
+        """
+        handle = super().__new__(cls, task.id)
+        handle.task = task
+        handle._future = Future()
+        handle._event = None
+        return handle
+
+    @property
+    def task_id(self) -> str:
+        """Return the plain task ID string."""
+        return str(self)
+
+    @property
+    def event(self) -> TaskEvent | None:
+        """Return the completion event, or None while the task is pending."""
+        return self._event
+
+    def done(self) -> bool:
+        """Return True once the task has completed or failed."""
+        return self._future.done()
+
+    def result(self, timeout: float | None = None) -> Any:
+        """
+        Wait for the task and return the agent's result.
+
+        Args:
+            timeout: Seconds to wait (None = wait forever)
+
+        Returns:
+            Any: The value returned by the agent
+
+        Raises:
+            TimeoutError: If the task does not finish within timeout
+            Exception: The exception raised by the agent (task FAILED)
+        """
+        return self._future.result(timeout)
+
+    def exception(self, timeout: float | None = None) -> BaseException | None:
+        """Wait for the task and return its exception (None if it completed)."""
+        return self._future.exception(timeout)
+
+    def add_done_callback(self, fn: Callable[["TaskHandle"], None]) -> None:
+        """
+        Call fn(handle) when the task finishes (immediately if it already has).
+
+        Callbacks run on the thread that resolves the task.
+        """
+        self._future.add_done_callback(lambda _: fn(self))
+
+    def __await__(self) -> Generator[Any, None, Any]:
+        """Await the task result on the running event loop."""
+        return asyncio.wrap_future(self._future).__await__()
+
+    def _resolve(self, event: TaskEvent) -> None:
+        """Resolve the future from a completion event (kernel-internal)."""
+        if self._future.done():
+            return
+        self._event = event
+        if event.status == "COMPLETED":
+            self._future.set_result(event.result)
+        else:
+            self._future.set_exception(event.error)
@@ -5,7 +5,7 @@ Implements ARCH-002: SQLiteStore class with CRUD operations for:
 - Missions (lifecycle tracking + budget + metadata)
 - Tool calls (audit trail)
 - Decisions (provenance)
-- Playbook runs (metrics)
+- Playbook runs (metrics) and per-node checkpoints (resumable runs)
 - Agent memory (context persistence)
 - TODO: Session narrative, artifacts, quality gates (Part 2)
 
@@ -16,10 +16,65 @@ import json
 import os
 import sqlite3
 import threading
+import weakref
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
+# Prepared statements kept per connection (sqlite3 caches them by SQL text)
+STATEMENT_CACHE_SIZE = 256
+
+# Seconds a writer waits for the write lock before raising "database is locked"
+BUSY_TIMEOUT = 30.0
+
+# Bulk inserts at least this large drop the table's secondary indexes first and
+# rebuild them once at the end (one sort instead of N incremental B-tree updates).
+# Only done when the table holds fewer rows than the batch: rebuilding indexes
+# over a large existing table costs more than updating them incrementally.
+BULK_INDEX_DEFER_THRESHOLD = 5000
+
+# Max host parameters per lookup query (well under SQLite's limit)
+_LOOKUP_CHUNK_SIZE = 500
+
+_MISSION_COLUMNS = (
+    "mission_uuid",
+    "phase",
+    "status",
+    "created_at",
+    "completed_at",
+    "updated_at",
+    "planning_sub_state",
+    "max_cost_usd",
+    "current_cost_usd",
+    "alert_threshold",
+    "cost_breakdown",
+    "owner",
+    "description",
+    "api_version",
+    "metadata",
+)
+
+
+class _ThreadConnection:
+    """A thread's pooled connection (finalized when the thread exits)."""
+
+    __slots__ = ("__weakref__", "conn")
+
+    def __init__(self, conn: sqlite3.Connection):
+        self.conn = conn
+
+
+def _release_connection(
+    connections: list[sqlite3.Connection], lock: threading.RLock, conn: sqlite3.Connection
+) -> None:
+    """Close a pooled connection and drop it from the pool."""
+    with lock:
+        if conn in connections:
+            connections.remove(conn)
+    conn.close()
+
 
 class SQLiteStore:
     """
@@ -28,7 +83,11 @@ class SQLiteStore:
     Features:
     - Auto-creates database on first use (zero-config)
     - Loads schema from ARCH-001_schema.sql
-    - Thread-safe (check_same_thread=False)
+    - Connection pool: one connection per thread for file databases, so
+      WAL readers run concurrently with the single writer
+    - Unit of work: `with store.transaction():` groups many calls into
+      one commit
+    - Prepared statement reuse (per-connection statement cache)
     - Context manager support (with statement)
     - Row factory for dict-like access
 
@@ -41,6 +100,11 @@ class SQLiteStore:
         # Testing (in-memory, ephemeral)
         with SQLiteStore(":memory:") as store:
             # Test code here...
+
+        # Many writes, one commit
+        with store.transaction():
+            store.log_tool_call(...)
+            store.add_artifact(...)
     """
 
     def __init__(self, db_path: str):
@@ -69,31 +133,25 @@ class SQLiteStore:
             )
 
         self.db_path = db_path
-        self.conn: sqlite3.Connection | None = None
         self._lock = threading.RLock()  # Reentrant lock for thread-safe access
+        self._local = threading.local()  # Per-thread connection + transaction depth
+        self._connections: list[sqlite3.Connection] = []  # Every pooled connection
+        self._closed = False
+        self._node_results_ready = False  # playbook_node_results created on demand
+
+        # An in-memory database exists only inside its connection, so it cannot
+        # be pooled: all threads share one connection (the pre-pool behaviour).
+        self._pooled = db_path != ":memory:"
 
         # Create parent directory if needed (for file-based DBs)
-        if db_path != ":memory:":
+        if self._pooled:
             os.makedirs(os.path.dirname(db_path) or ".", exist_ok=True)
 
         # Connect to database (creates file if not exists)
-        self.conn = sqlite3.connect(
-            db_path,
-            check_same_thread=False,  # Thread-safe
-            isolation_level="DEFERRED",  # Use transactions for thread-safety
+        self._shared_conn: sqlite3.Connection | None = (
+            None if self._pooled else self._open_connection()
         )
 
-        # Enable dict-like row access (row['column_name'])
-        self.conn.row_factory = sqlite3.Row
-
-        # Enable foreign key constraints (required for CASCADE DELETE)
-        self.conn.execute("PRAGMA foreign_keys = ON")
-
-        # Enable WAL mode for better concurrency (prevents database locks in tests)
-        # WAL (Write-Ahead Logging) allows concurrent reads while writing
-        if db_path != ":memory:":  # WAL not supported for :memory: databases
-            self.conn.execute("PRAGMA journal_mode = WAL")
-
         # Check if database is empty (needs schema)
         cursor = self.conn.execute(
             "SELECT name FROM sqlite_master WHERE type='table' AND name='missions'"
@@ -103,6 +161,101 @@ class SQLiteStore:
         if not tables_exist:
             self._load_schema()
 
+    def _open_connection(self) -> sqlite3.Connection:
+        """
+        Open and configure one database connection.
+
+        File databases use WAL (concurrent readers alongside the single
+        writer) and IMMEDIATE transactions: a writer takes the write lock
+        when its transaction begins, so two threads never deadlock trying to
+        upgrade read transactions - the second simply waits (BUSY_TIMEOUT).
+        """
+        conn = sqlite3.connect(
+            self.db_path,
+            check_same_thread=False,  # Connections are closed from close()'s thread
+            isolation_level="IMMEDIATE" if self._pooled else "DEFERRED",
+            timeout=BUSY_TIMEOUT,
+            cached_statements=STATEMENT_CACHE_SIZE,
+        )
+
+        # Enable dict-like row access (row['column_name'])
+        conn.row_factory = sqlite3.Row
+
+        # Enable foreign key constraints (required for CASCADE DELETE)
+        conn.execute("PRAGMA foreign_keys = ON")
+
+        # Enable WAL mode for better concurrency (prevents database locks in tests)
+        # WAL (Write-Ahead Logging) allows concurrent reads while writing
+        if self._pooled:  # WAL not supported for :memory: databases
+            conn.execute("PRAGMA journal_mode = WAL")
+            conn.execute("PRAGMA synchronous = NORMAL")
+
+        with self._lock:
+            self._connections.append(conn)
+        return conn
+
+    @property
+    def conn(self) -> sqlite3.Connection | None:
+        """
+        The calling thread's connection (None after close()).
+
+        File databases lazily open one connection per thread; in-memory
+        databases return the single shared connection.
+        """
+        if self._closed:
+            return None
+        if not self._pooled:
+            return self._shared_conn
+
+        holder = getattr(self._local, "conn", None)
+        if holder is None:
+            holder = self._local.conn = _ThreadConnection(self._open_connection())
+            # Thread-locals are dropped when their thread exits: close the connection then,
+            # so thread churn (a pool per run_workers/execute_batch) does not leak them
+            weakref.finalize(
+                holder, _release_connection, self._connections, self._lock, holder.conn
+            )
+        return holder.conn
+
+    @contextmanager
+    def transaction(self) -> Iterator["SQLiteStore"]:
+        """
+        Unit of work: group many store calls into one transaction.
+
+        Every write method normally commits on its own. Inside this block
+        those per-call commits are deferred, and everything is committed
+        once on exit (or rolled back if an exception escapes). Blocks nest;
+        only the outermost one commits.
+
+        Example:
+            with store.transaction():
+                for call in calls:
+                    store.log_tool_call(mission_id, **call)
+            # one commit (one fsync) for all calls
+
+        Note:
+            For ":memory:" stores the connection is shared between threads,
+            so another thread's writes may be committed with this unit of work.
+        """
+        conn = self.conn
+        depth = getattr(self._local, "tx_depth", 0)
+        if depth == 0 and not conn.in_transaction:
+            # Explicit BEGIN so DDL and reads inside the block are covered too
+            # (sqlite3 only opens transactions implicitly before DML)
+            conn.execute("BEGIN IMMEDIATE" if self._pooled else "BEGIN")
+        self._local.tx_depth = depth + 1
+        try:
+            yield self
+        except BaseException:
+            if depth == 0:
+                conn.rollback()
+            raise
+        else:
+            if depth == 0:
+                conn.commit()
+        finally:
+            self._local.tx_depth = depth
+
     def _load_schema(self):
         """
         Load schema from ARCH-001_schema.sql
@@ -130,15 +283,24 @@ class SQLiteStore:
             self.conn.commit()
 
     def _commit(self):
-        """Commit transaction (for thread-safe writes)"""
-        if self.conn:
-            self.conn.commit()
+        """Commit transaction (deferred while inside a transaction() block)"""
+        if getattr(self._local, "tx_depth", 0):
+            return
+        conn = self.conn
+        if conn:
+            conn.commit()
 
     def close(self):
-        """Close database connection"""
-        if self.conn:
-            self.conn.close()
-            self.conn = None
+        """Close every pooled database connection"""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            for conn in list(self._connections):
+                conn.close()
+            self._connections.clear()
+            self._shared_conn = None
+        self._local = threading.local()
 
     def __enter__(self):
         """Context manager entry"""
@@ -512,25 +674,50 @@ class SQLiteStore:
             tool_call_id: Auto-incremented ID
         """
         cursor = self.conn.execute(
-            """
-            INSERT INTO tool_calls
-            (mission_id, tool_name, args, result, timestamp, duration_ms, success, error_message)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-        """,
-            (
+            self._TOOL_CALL_INSERT,
+            self._tool_call_params(
                 mission_id,
                 tool_name,
-                json.dumps(args),
-                json.dumps(result) if result else None,
+                args,
+                result,
                 timestamp,
                 duration_ms,
-                1 if success else 0,
+                success,
                 error_message,
             ),
         )
         self._commit()
         return cursor.lastrowid
 
+    _TOOL_CALL_INSERT = """
+        INSERT INTO tool_calls
+        (mission_id, tool_name, args, result, timestamp, duration_ms, success, error_message)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+    """
+
+    @staticmethod
+    def _tool_call_params(
+        mission_id: int,
+        tool_name: str,
+        args: dict[str, Any],
+        result: dict[str, Any] | None,
+        timestamp: str,
+        duration_ms: int,
+        success: bool,
+        error_message: str | None = None,
+    ) -> tuple:
+        """Serialize one tool call into _TOOL_CALL_INSERT parameters"""
+        return (
+            mission_id,
+            tool_name,
+            json.dumps(args),
+            json.dumps(result) if result else None,
+            timestamp,
+            duration_ms,
+            1 if success else 0,
+            error_message,
+        )
+
     def get_tool_call(self, tool_call_id: int) -> dict[str, Any] | None:
         """Get tool call by ID"""
         cursor = self.conn.execute("SELECT * FROM tool_calls WHERE id = ?", (tool_call_id,))
@@ -785,6 +972,117 @@ class SQLiteStore:
             run["metrics"] = json.loads(run["metrics"])
         return run
 
+    def _ensure_node_results_table(self):
+        """
+        Ensure playbook_node_results table exists (created on demand).
+
+        One row per workflow node per playbook run: the checkpoint that lets
+        an interrupted run resume without re-executing finished nodes.
+        """
+        if self._node_results_ready:
+            return
+        with self._lock:
+            self.conn.execute("""
+                CREATE TABLE IF NOT EXISTS playbook_node_results (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    run_id INTEGER NOT NULL,
+                    node_id TEXT NOT NULL,
+                    input_hash TEXT NOT NULL,
+                    status TEXT NOT NULL,
+                    output JSON,
+                    error_message TEXT,
+                    cost_usd REAL NOT NULL DEFAULT 0.0,
+                    duration_seconds REAL NOT NULL DEFAULT 0.0,
+                    completed_at TEXT NOT NULL,
+                    UNIQUE (run_id, node_id),
+                    FOREIGN KEY (run_id) REFERENCES playbook_runs(id) ON DELETE CASCADE
+                )
+            """)
+            self._commit()
+            self._node_results_ready = True
+
+    def save_playbook_node_result(
+        self,
+        run_id: int,
+        node_id: str,
+        input_hash: str,
+        status: str,
+        output: Any = None,
+        error_message: str | None = None,
+        cost_usd: float = 0.0,
+        duration_seconds: float = 0.0,
+        completed_at: str | None = None,
+    ):
+        """
+        Checkpoint the result of one workflow node (replaces an earlier result).
+
+        Args:
+            run_id: Playbook run ID
+            node_id: Workflow node ID
+            input_hash: Fingerprint of everything the node's result depends on
+            status: Execution status ('success', 'failed', 'skipped')
+            output: Node output (JSON-serialized; non-JSON values become strings)
+            error_message: Error details (optional)
+            cost_usd: Cost of the node execution
+            duration_seconds: Duration of the node execution
+            completed_at: ISO 8601 timestamp (default: now)
+        """
+        self._ensure_node_results_table()
+        completed_at = completed_at or datetime.utcnow().isoformat() + "Z"
+
+        with self._lock:
+            self.conn.execute(
+                """
+                INSERT INTO playbook_node_results (
+                    run_id, node_id, input_hash, status, output, error_message,
+                    cost_usd, duration_seconds, completed_at
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT (run_id, node_id) DO UPDATE SET
+                    input_hash = excluded.input_hash,
+                    status = excluded.status,
+                    output = excluded.output,
+                    error_message = excluded.error_message,
+                    cost_usd = excluded.cost_usd,
+                    duration_seconds = excluded.duration_seconds,
+                    completed_at = excluded.completed_at
+                """,
+                (
+                    run_id,
+                    node_id,
+                    input_hash,
+                    status,
+                    json.dumps(output, sort_keys=True, default=str),
+                    error_message,
+                    cost_usd,
+                    duration_seconds,
+                    completed_at,
+                ),
+            )
+            self._commit()
+
+    def get_playbook_node_results(self, run_id: int) -> list[dict[str, Any]]:
+        """
+        Get the checkpointed node results of a playbook run.
+
+        Args:
+            run_id: Playbook run ID
+
+        Returns:
+            List of node result dicts (output parsed from JSON)
+        """
+        self._ensure_node_results_table()
+
+        cursor = self.conn.execute(
+            "SELECT * FROM playbook_node_results WHERE run_id = ? ORDER BY id",
+            (run_id,),
+        )
+        results = []
+        for row in cursor.fetchall():
+            result = dict(row)
+            result["output"] = json.loads(result["output"])
+            results.append(result)
+        return results
+
     # ========================================================================
     # [ARCH-006] TASK MANAGEMENT (Hierarchical Sub-Task Tracking)
     # ========================================================================
@@ -1055,40 +1353,174 @@ class SQLiteStore:
         # Use adapter to map manifest to missions row
         mission_data = self._map_manifest_to_missions_row(manifest)
 
-        # Check if mission already exists (idempotent)
-        existing = self.get_mission_by_uuid(mission_data["mission_uuid"])
+        # One unit of work: mission row + all project memory rows commit together
+        with self.transaction():
+            # Check if mission already exists (idempotent)
+            existing = self.get_mission_by_uuid(mission_data["mission_uuid"])
+
+            if existing:
+                # Mission exists - UPDATE it
+                mission_id = existing["id"]
+
+                # Build UPDATE query dynamically
+                update_fields = []
+                update_values = []
+                for key, value in mission_data.items():
+                    if key != "mission_uuid":  # Don't update UUID
+                        update_fields.append(f"{key} = ?")
+                        if isinstance(value, dict):
+                            update_values.append(json.dumps(value))
+                        else:
+                            update_values.append(value)
+
+                update_values.append(mission_id)
+
+                # S608: False positive - joining safe column names from code, not user input
+                sql = f"UPDATE missions SET {', '.join(update_fields)} WHERE id = ?"  # noqa: S608
+                self.conn.execute(sql, update_values)
+                self._commit()
+            else:
+                # Mission doesn't exist - CREATE it
+                mission_id = self.create_mission(**mission_data)
+
+            # If project_memory provided, import it too
+            if project_memory:
+                timestamp = datetime.utcnow().isoformat() + "Z"
+                self._map_project_memory_to_sql(project_memory, mission_id, timestamp)
 
-        if existing:
-            # Mission exists - UPDATE it
-            mission_id = existing["id"]
-
-            # Build UPDATE query dynamically
-            update_fields = []
-            update_values = []
-            for key, value in mission_data.items():
-                if key != "mission_uuid":  # Don't update UUID
-                    update_fields.append(f"{key} = ?")
-                    if isinstance(value, dict):
-                        update_values.append(json.dumps(value))
-                    else:
-                        update_values.append(value)
-
-            update_values.append(mission_id)
-
-            # S608: False positive - joining safe column names from code, not user input
-            sql = f"UPDATE missions SET {', '.join(update_fields)} WHERE id = ?"  # noqa: S608
-            self.conn.execute(sql, update_values)
-            self._commit()
-        else:
-            # Mission doesn't exist - CREATE it
-            mission_id = self.create_mission(**mission_data)
+        return mission_id
 
-        # If project_memory provided, import it too
-        if project_memory:
-            timestamp = datetime.utcnow().isoformat() + "Z"
-            self._map_project_memory_to_sql(project_memory, mission_id, timestamp)
+    # ========================================================================
+    # BULK INGESTION (migrations, workspace re-hydration)
+    # ========================================================================
 
-        return mission_id
+    def bulk_log_tool_calls(self, calls: Iterable[dict[str, Any]]) -> int:
+        """
+        Insert many tool calls in one transaction
+
+        Args:
+            calls: Dicts with the keyword arguments of log_tool_call()
+
+        Returns:
+            Number of rows inserted
+
+        Example:
+            store.bulk_log_tool_calls([
+                {"mission_id": 1, "tool_name": "Read", "args": {...}, "result": None,
+                 "timestamp": "2025-01-01T00:00:00Z", "duration_ms": 3, "success": True},
+                ...
+            ])
+        """
+        rows = [self._tool_call_params(**call) for call in calls]
+        self._bulk_insert("tool_calls", self._TOOL_CALL_INSERT, rows)
+        return len(rows)
+
+    def bulk_add_artifacts(self, artifacts: Iterable[dict[str, Any]]) -> int:
+        """
+        Insert many artifacts in one transaction
+
+        Args:
+            artifacts: Dicts with the keyword arguments of add_artifact()
+
+        Returns:
+            Number of rows inserted
+        """
+        rows = [self._artifact_params(**artifact) for artifact in artifacts]
+        self._bulk_insert("artifacts", self._ARTIFACT_INSERT, rows)
+        return len(rows)
+
+    def bulk_import_manifests(self, manifests: Iterable[dict[str, Any]]) -> dict[str, int]:
+        """
+        Import many project manifests in one transaction (idempotent)
+
+        Bulk counterpart of import_project_manifest() (without project memory):
+        new missions are inserted, existing ones (same projectId) updated.
+        A mission's created_at is kept when it already exists.
+
+        Args:
+            manifests: project_manifest.json dicts
+
+        Returns:
+            Mapping of mission_uuid (projectId) -> mission_id
+        """
+        now = datetime.utcnow().isoformat() + "Z"
+        rows = []
+        for manifest in manifests:
+            mission = self._map_manifest_to_missions_row(manifest)
+            mission["created_at"] = mission["created_at"] or now
+            rows.append(
+                tuple(
+                    json.dumps(mission[col]) if isinstance(mission[col], dict) else mission[col]
+                    for col in _MISSION_COLUMNS
+                )
+            )
+        if not rows:
+            return {}
+
+        updates = ", ".join(
+            f"{col} = excluded.{col}"
+            for col in _MISSION_COLUMNS
+            if col not in ("mission_uuid", "created_at")
+        )
+        # S608: False positive - column names are module constants, not user input
+        sql = (
+            f"INSERT INTO missions ({', '.join(_MISSION_COLUMNS)}) "  # noqa: S608
+            f"VALUES ({', '.join('?' for _ in _MISSION_COLUMNS)}) "
+            f"ON CONFLICT(mission_uuid) DO UPDATE SET {updates}"
+        )
+
+        uuids = list(dict.fromkeys(row[0] for row in rows))
+        with self.transaction():
+            self._bulk_insert("missions", sql, rows)
+            mission_ids: dict[str, int] = {}
+            for start in range(0, len(uuids), _LOOKUP_CHUNK_SIZE):
+                chunk = uuids[start : start + _LOOKUP_CHUNK_SIZE]
+                placeholders = ", ".join("?" for _ in chunk)
+                cursor = self.conn.execute(
+                    f"SELECT mission_uuid, id FROM missions WHERE mission_uuid IN ({placeholders})",  # noqa: S608
+                    chunk,
+                )
+                mission_ids.update({row["mission_uuid"]: row["id"] for row in cursor})
+        return mission_ids
+
+    def _bulk_insert(self, table: str, sql: str, rows: list[tuple]) -> None:
+        """executemany() inside one transaction, deferring index builds for large loads"""
+        if not rows:
+            return
+        with self.transaction():
+            defer = len(rows) >= BULK_INDEX_DEFER_THRESHOLD
+            if defer and self._approx_row_count(table) < len(rows):
+                with self._deferred_indexes(table):
+                    self.conn.executemany(sql, rows)
+            else:
+                self.conn.executemany(sql, rows)
+
+    def _approx_row_count(self, table: str) -> int:
+        """Estimate a table's row count from its max rowid (a B-tree seek, not a scan)"""
+        # S608: False positive - table names come from the bulk_* methods, not user input
+        row = self.conn.execute(f'SELECT max(rowid) FROM "{table}"').fetchone()  # noqa: S608
+        return row[0] or 0
+
+    @contextmanager
+    def _deferred_indexes(self, table: str) -> Iterator[None]:
+        """
+        Drop a table's secondary indexes for the block and rebuild them after
+
+        Only plain (non-UNIQUE) indexes are dropped; UNIQUE indexes enforce
+        constraints (and ON CONFLICT targets) and stay in place. Must run inside
+        transaction(), so a failed load restores the original indexes.
+        """
+        cursor = self.conn.execute(
+            "SELECT name, sql FROM sqlite_master "
+            "WHERE type = 'index' AND tbl_name = ? AND sql IS NOT NULL",
+            (table,),
+        )
+        indexes = [(row["name"], row["sql"]) for row in cursor if "UNIQUE" not in row["sql"]]
+        for name, _ in indexes:
+            self.conn.execute(f'DROP INDEX "{name}"')
+        yield
+        for _, index_sql in indexes:
+            self.conn.execute(index_sql)
 
     # ========================================================================
     # v2: SESSION NARRATIVE (ProjectMemory)
@@ -1175,25 +1607,52 @@ class SQLiteStore:
             artifact_id: Auto-incremented ID
         """
         cursor = self.conn.execute(
-            """
-            INSERT INTO artifacts (mission_id, artifact_type, artifact_name, ref, path, url, branch, metadata, created_at)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """,
-            (
+            self._ARTIFACT_INSERT,
+            self._artifact_params(
                 mission_id,
                 artifact_type,
                 artifact_name,
+                created_at,
                 ref,
                 path,
                 url,
                 branch,
-                json.dumps(metadata) if metadata else None,
-                created_at,
+                metadata,
             ),
         )
         self._commit()
         return cursor.lastrowid
 
+    _ARTIFACT_INSERT = """
+        INSERT INTO artifacts (mission_id, artifact_type, artifact_name, ref, path, url, branch, metadata, created_at)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+    """
+
+    @staticmethod
+    def _artifact_params(
+        mission_id: int,
+        artifact_type: str,
+        artifact_name: str,
+        created_at: str,
+        ref: str | None = None,
+        path: str | None = None,
+        url: str | None = None,
+        branch: str | None = None,
+        metadata: dict[str, Any] | None = None,
+    ) -> tuple:
+        """Serialize one artifact into _ARTIFACT_INSERT parameters"""
+        return (
+            mission_id,
+            artifact_type,
+            artifact_name,
+            ref,
+            path,
+            url,
+            branch,
+            json.dumps(metadata) if metadata else None,
+            created_at,
+        )
+
     def get_artifacts(
         self, mission_id: int, artifact_type: str | None = None
     ) -> list[dict[str, Any]]:
@@ -5,6 +5,8 @@ from collections.abc import Callable
 from pathlib import Path
 from typing import Any
 
+from vibe_core.runtime.git_state import GitStateError, get_git_state
+
 # ============================================================================
 # VALIDATOR FUNCTIONS
 # ============================================================================
@@ -21,9 +23,14 @@ def validate_tests_passing(vibe_root: Path, scope: str = "tests/") -> bool:
 
 def validate_git_clean(vibe_root: Path) -> bool:
     """Check for uncommitted changes (git status --porcelain)"""
-    result = subprocess.run(["git", "status", "--porcelain"], cwd=vibe_root, capture_output=True)
-    # If stdout is empty, the working directory is clean
-    return len(result.stdout.strip()) == 0
+    git = get_git_state(vibe_root)
+    if not git.is_repository:
+        # Outside a repository `git status` prints nothing, which counted as clean
+        return True
+    try:
+        return git.is_clean()
+    except GitStateError:
+        return False  # Unreadable state must not pass the clean-gate
 
 
 def validate_docs_updated(vibe_root: Path, required_files: list) -> bool:
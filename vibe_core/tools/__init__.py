@@ -7,7 +7,9 @@ API calls, etc.) without dirty hacks like exec() or string parsing.
 
 from vibe_core.tools.agenda_tools import AddTaskTool, CompleteTaskTool, ListTasksTool
 from vibe_core.tools.delegate_tool import DelegateTool
+from vibe_core.tools.file_index import FileIndex, get_file_index
 from vibe_core.tools.file_tools import ReadFileTool, WriteFileTool
+from vibe_core.tools.grep_content import GrepContentTool
 from vibe_core.tools.tool_protocol import Tool, ToolCall, ToolResult
 from vibe_core.tools.tool_registry import ToolRegistry
 
@@ -15,6 +17,8 @@ __all__ = [
     "AddTaskTool",
     "CompleteTaskTool",
     "DelegateTool",
+    "FileIndex",
+    "GrepContentTool",
     "ListTasksTool",
     "ReadFileTool",
     "Tool",
@@ -22,4 +26,5 @@ __all__ = [
     "ToolRegistry",
     "ToolResult",
     "WriteFileTool",
+    "get_file_index",
 ]
@@ -251,8 +251,8 @@ class DelegateTool(Tool):
             # Create task
             task = Task(agent_id=agent_id, payload=payload)
 
-            # Submit to kernel
-            task_id = self.kernel.submit(task)
+            # Submit to kernel (the handle resolves on completion; report the plain ID)
+            task_id = str(self.kernel.submit(task))
 
             logger.info(
                 f"DelegateTool: Delegated task to {agent_id} "
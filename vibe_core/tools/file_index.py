@@ -0,0 +1,521 @@
+"""
+Workspace File Index for vibe-agency OS (ARCH-042 Extension).
+
+SearchFileTool used to rglob() the whole workspace on every call, filter
+hidden paths per result, stop at 50 hits and only then sort - slow on big
+trees and arbitrary about which 50 it returned. FileIndex keeps the
+workspace in memory instead and is shared by search_file, list_directory
+and SystemIntrospector.get_file_tree:
+
+- Path trie: one node per directory (subdirectories + file names)
+- Incremental refresh: each directory remembers its mtime; a refresh stats
+  every directory but only re-lists those whose mtime changed (adding or
+  removing an entry bumps the parent directory's mtime)
+- Polling: refreshes are throttled to one per refresh_interval seconds, so
+  repeated searches in a session are served from memory
+- Queries: glob (rglob semantics) and fuzzy name search, both with a
+  deterministic order, plus offset/limit pagination
+
+Hidden entries (except .vibe), IGNORED_NAMES and the root .gitignore's
+patterns are not indexed.
+
+Example:
+    >>> index = get_file_index()
+    >>> matches, total = index.glob("test_*.py", limit=20)
+    >>> matches, total = index.fuzzy("kernl")
+"""
+
+import bisect
+import fnmatch
+import logging
+import os
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from pathlib import Path, PurePosixPath
+
+logger = logging.getLogger(__name__)
+
+# Minimum seconds between two automatic refreshes of an index
+DEFAULT_REFRESH_INTERVAL = 1.0
+
+# Files listed per directory in tree() before collapsing into a count
+DEFAULT_TREE_FILES_PER_DIR = 10
+
+# Never indexed (in addition to hidden entries)
+IGNORED_NAMES = frozenset({"__pycache__", "node_modules"})
+
+# Hidden entries that ARE indexed
+VISIBLE_HIDDEN = frozenset({".vibe"})
+
+# Directories modified this recently are rescanned on the next refresh:
+# entries created within the same mtime tick would otherwise be missed
+_RACY_WINDOW_NS = 1_000_000_000
+
+
+@dataclass
+class _DirNode:
+    """A directory in the trie (mtime_ns -1 = must be rescanned)"""
+
+    mtime_ns: int = -1
+    dirs: dict[str, "_DirNode"] = field(default_factory=dict)
+    files: set[str] = field(default_factory=set)
+    linked: bool = False  # Symlinked directory: listed, never descended
+
+
+class _IgnoreRules:
+    """
+    The subset of .gitignore syntax the index needs.
+
+    Supports name globs ("*.pyc"), directory-only patterns ("build/"),
+    root-anchored patterns ("/dist") and path globs ("docs/*.tmp").
+    Negation ("!keep") and "**" are not supported and are skipped.
+    """
+
+    def __init__(self, lines: list[str] | None = None):
+        self.rules: list[tuple[str, bool, bool]] = []  # (pattern, dir_only, anchored)
+        for line in lines or []:
+            line = line.strip()
+            if not line or line.startswith(("#", "!")) or "**" in line:
+                continue
+            dir_only = line.endswith("/")
+            line = line.rstrip("/")
+            anchored = line.startswith("/") or "/" in line
+            self.rules.append((line.lstrip("/"), dir_only, anchored))
+
+    @classmethod
+    def load(cls, root: str) -> "_IgnoreRules":
+        """Parse root/.gitignore (no rules if missing or unreadable)."""
+        try:
+            with open(os.path.join(root, ".gitignore"), encoding="utf-8") as f:
+                return cls(f.read().splitlines())
+        except (OSError, UnicodeDecodeError):
+            return cls()
+
+    def ignored(self, rel_path: str, name: str, is_dir: bool) -> bool:
+        """Return True if the entry at rel_path (relative to root) is ignored."""
+        for pattern, dir_only, anchored in self.rules:
+            if dir_only and not is_dir:
+                continue
+            if fnmatch.fnmatchcase(rel_path if anchored else name, pattern):
+                return True
+        return False
+
+
+class FileIndex:
+    """
+    In-memory, incrementally refreshed index of the files under a root.
+
+    All paths going in and out are relative to the root, "/"-separated.
+    Thread-safe.
+    """
+
+    def __init__(self, root: str | Path, refresh_interval: float = DEFAULT_REFRESH_INTERVAL):
+        """
+        Initialize the index (the first query builds it).
+
+        Args:
+            root: Directory to index
+            refresh_interval: Minimum seconds between automatic refreshes
+                              (0 = check directory mtimes on every query)
+        """
+        self.root = os.path.realpath(root)
+        self.refresh_interval = refresh_interval
+        self._root_node = _DirNode()
+        self._ignore = _IgnoreRules()
+        self._ignore_mtime_ns: int | None = None
+        self._paths: list[str] | None = None  # Sorted file paths (rebuilt lazily)
+        self._last_refresh = float("-inf")
+        self._lock = threading.RLock()
+        self._stats = {"refreshes": 0, "rescanned_dirs": 0}
+
+    # ------------------------------------------------------------------
+    # Maintenance
+    # ------------------------------------------------------------------
+
+    def refresh(self, force: bool = False) -> None:
+        """
+        Bring the index up to date with the filesystem.
+
+        Args:
+            force: Refresh even if refresh_interval has not elapsed
+        """
+        with self._lock:
+            now = time.monotonic()
+            if not force and now - self._last_refresh < self.refresh_interval:
+                return
+            self._reload_ignore_rules()
+            if self._refresh_tree(self._root_node, self.root, ""):
+                self._paths = None
+            self._last_refresh = now
+            self._stats["refreshes"] += 1
+
+    def invalidate(self, path: str | Path | None = None) -> None:
+        """
+        Mark a path (or the whole index) as changed on disk.
+
+        The next query refreshes immediately and re-lists the directory
+        containing path, even within refresh_interval.
+
+        Args:
+            path: Changed file or directory (absolute or relative to root),
+                  or None for everything
+        """
+        with self._lock:
+            self._last_refresh = float("-inf")
+            if path is None:
+                self._mark_stale(self._root_node)
+                return
+            rel = self._relative(path)
+            if rel is None:
+                return
+            parent = self._node(rel.rpartition("/")[0])
+            if parent is not None:
+                parent.mtime_ns = -1
+            node = self._node(rel)
+            if node is not None:
+                node.mtime_ns = -1
+
+    def get_stats(self) -> dict[str, int]:
+        """Return the number of indexed files plus refresh counters."""
+        with self._lock:
+            return {"files": len(self._all_paths()), **self._stats}
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def glob(
+        self, pattern: str, under: str = "", offset: int = 0, limit: int | None = None
+    ) -> tuple[list[str], int]:
+        """
+        Find files matching a glob pattern, like Path(under).rglob(pattern).
+
+        A pattern without "/" matches file names at any depth; a pattern
+        with "/" matches the trailing components of the path below under.
+        Results are sorted by path.
+
+        Args:
+            pattern: Glob pattern (e.g. "*.py", "tests/test_*.py")
+            under: Directory to search below (relative to root, "" = root)
+            offset: Number of matches to skip (pagination)
+            limit: Maximum number of matches to return (None = all)
+
+        Returns:
+            (page of matching paths relative to root, total number of matches)
+        """
+        pattern = pattern.removeprefix("**/")
+        prefix = self._prefix(under)
+        if "/" in pattern:
+            matches = [
+                path
+                for path in self._paths_under(prefix)
+                if PurePosixPath(path[len(prefix) :]).match(pattern)
+            ]
+        else:
+            matches = [
+                path
+                for path in self._paths_under(prefix)
+                if fnmatch.fnmatchcase(path.rpartition("/")[2], pattern)
+            ]
+        return self._page(matches, offset, limit)
+
+    def fuzzy(
+        self, query: str, under: str = "", offset: int = 0, limit: int | None = None
+    ) -> tuple[list[str], int]:
+        """
+        Find files whose name or path loosely matches query (case-insensitive).
+
+        Ranking (best first): exact file name, name prefix, name substring,
+        path substring, name subsequence, path subsequence; ties are broken
+        by shorter path, then alphabetically.
+
+        Args:
+            query: Search text (e.g. "kernl" finds kernel.py)
+            under: Directory to search below (relative to root, "" = root)
+            offset: Number of matches to skip (pagination)
+            limit: Maximum number of matches to return (None = all)
+
+        Returns:
+            (page of matching paths relative to root, total number of matches)
+        """
+        query = query.lower()
+        scored = []
+        for path in self._paths_under(self._prefix(under)):
+            rank = _fuzzy_rank(query, path.lower())
+            if rank is not None:
+                scored.append((rank, len(path), path))
+        scored.sort()
+        return self._page([path for _, _, path in scored], offset, limit)
+
+    def list_dir(self, rel_dir: str = "") -> tuple[list[str], list[str]] | None:
+        """
+        List a directory from the index (its own mtime is always re-checked).
+
+        Args:
+            rel_dir: Directory relative to root ("" = root)
+
+        Returns:
+            (sorted subdirectory names, sorted file names), or None if the
+            directory is not indexed (missing, hidden or ignored)
+        """
+        with self._lock:
+            self.refresh()
+            rel_dir = "" if rel_dir in ("", ".") else rel_dir.strip("/")
+            node = self._node(rel_dir)
+            if node is None:
+                return None
+            if self._scan(node, os.path.join(self.root, rel_dir), rel_dir):
+                self._paths = None
+            return sorted(node.dirs), sorted(node.files)
+
+    def tree(
+        self,
+        max_depth: int = 3,
+        under: str = "",
+        files_per_dir: int = DEFAULT_TREE_FILES_PER_DIR,
+        skip: Callable[[str, bool], bool] | None = None,
+    ) -> list[str]:
+        """
+        Render the indexed tree as lines ("├── name"), directories first.
+
+        Args:
+            max_depth: Directory levels to expand (1 = direct children only)
+            under: Directory to render (relative to root)
+            files_per_dir: Files shown per directory before "... (+N files)"
+            skip: Optional predicate (name, is_dir) for entries to leave out
+
+        Returns:
+            Tree lines (without a line for the top directory itself)
+        """
+        with self._lock:
+            self.refresh()
+            node = self._node(under.strip("/"))
+            lines: list[str] = []
+            if node is not None:
+                self._render(node, "", max_depth, files_per_dir, skip, lines)
+            return lines
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _all_paths(self) -> list[str]:
+        with self._lock:
+            self.refresh()
+            if self._paths is None:
+                paths: list[str] = []
+                self._collect(self._root_node, "", paths)
+                paths.sort()
+                self._paths = paths
+            return self._paths
+
+    def _paths_under(self, prefix: str) -> list[str]:
+        paths = self._all_paths()
+        if not prefix:
+            return paths
+        # Sorted list: the paths under prefix are one contiguous run
+        start = bisect.bisect_left(paths, prefix)
+        end = bisect.bisect_left(paths, prefix[:-1] + chr(ord("/") + 1))
+        return paths[start:end]
+
+    @staticmethod
+    def _page(matches: list[str], offset: int, limit: int | None) -> tuple[list[str], int]:
+        end = None if limit is None else offset + limit
+        return matches[offset:end], len(matches)
+
+    @staticmethod
+    def _prefix(under: str) -> str:
+        under = under.strip("/")
+        return f"{under}/" if under and under != "." else ""
+
+    def _relative(self, path: str | Path) -> str | None:
+        absolute = os.path.realpath(os.path.join(self.root, path))
+        if absolute == self.root:
+            return ""
+        if not absolute.startswith(self.root + os.sep):
+            return None
+        return absolute[len(self.root) + 1 :].replace(os.sep, "/")
+
+    def _node(self, rel_dir: str) -> _DirNode | None:
+        node = self._root_node
+        for part in rel_dir.split("/") if rel_dir and rel_dir != "." else []:
+            node = node.dirs.get(part)
+            if node is None:
+                return None
+        return node
+
+    def _reload_ignore_rules(self) -> None:
+        try:
+            mtime_ns = os.stat(os.path.join(self.root, ".gitignore")).st_mtime_ns
+        except OSError:
+            mtime_ns = None
+        if mtime_ns != self._ignore_mtime_ns:
+            self._ignore = _IgnoreRules.load(self.root)
+            self._ignore_mtime_ns = mtime_ns
+            self._mark_stale(self._root_node)
+
+    def _mark_stale(self, node: _DirNode) -> None:
+        node.mtime_ns = -1
+        for child in node.dirs.values():
+            self._mark_stale(child)
+
+    def _refresh_tree(self, node: _DirNode, abs_dir: str, rel_dir: str) -> bool:
+        """Rescan node if its mtime changed, then recurse (returns True on change)."""
+        changed = self._scan(node, abs_dir, rel_dir)
+        for name, child in node.dirs.items():
+            if not child.linked:
+                child_rel = f"{rel_dir}/{name}" if rel_dir else name
+                changed |= self._refresh_tree(child, os.path.join(abs_dir, name), child_rel)
+        return changed
+
+    def _scan(self, node: _DirNode, abs_dir: str, rel_dir: str) -> bool:
+        """Re-list one directory if its mtime changed (returns True if re-listed)."""
+        try:
+            mtime_ns = os.stat(abs_dir).st_mtime_ns
+        except OSError:
+            mtime_ns = None
+        if mtime_ns is not None and mtime_ns == node.mtime_ns:
+            return False
+
+        dirs: dict[str, _DirNode] = {}
+        files: set[str] = set()
+        try:
+            with os.scandir(abs_dir) as entries:
+                for entry in entries:
+                    name = entry.name
+                    if name in IGNORED_NAMES or (
+                        name.startswith(".") and name not in VISIBLE_HIDDEN
+                    ):
+                        continue
+                    try:
+                        is_dir = entry.is_dir()
+                    except OSError:
+                        continue
+                    rel_path = f"{rel_dir}/{name}" if rel_dir else name
+                    if self._ignore.ignored(rel_path, name, is_dir):
+                        continue
+                    if is_dir:
+                        child = node.dirs.get(name) or _DirNode()
+                        child.linked = entry.is_symlink()
+                        dirs[name] = child
+                    else:
+                        files.add(name)
+        except OSError:
+            pass  # Vanished or unreadable: index it as empty
+
+        node.dirs, node.files = dirs, files
+        racy = mtime_ns is not None and time.time_ns() - mtime_ns < _RACY_WINDOW_NS
+        node.mtime_ns = -1 if mtime_ns is None or racy else mtime_ns
+        self._stats["rescanned_dirs"] += 1
+        return True
+
+    def _collect(self, node: _DirNode, prefix: str, paths: list[str]) -> None:
+        paths.extend(prefix + name for name in node.files)
+        for name, child in node.dirs.items():
+            if not child.linked:
+                self._collect(child, f"{prefix}{name}/", paths)
+
+    def _render(
+        self,
+        node: _DirNode,
+        indent: str,
+        depth: int,
+        files_per_dir: int,
+        skip: Callable[[str, bool], bool] | None,
+        lines: list[str],
+    ) -> None:
+        dirs = sorted(node.dirs)
+        files = sorted(node.files)
+        if skip is not None:
+            dirs = [name for name in dirs if not skip(name, True)]
+            files = [name for name in files if not skip(name, False)]
+        entries = [(name, True) for name in dirs]
+        entries += [(name, False) for name in files[:files_per_dir]]
+        hidden_files = len(files) - min(len(files), files_per_dir)
+
+        for i, (name, is_dir) in enumerate(entries):
+            last = i == len(entries) - 1 and not hidden_files
+            branch = "└── " if last else "├── "
+            lines.append(f"{indent}{branch}{name}{'/' if is_dir else ''}")
+            child = node.dirs.get(name) if is_dir else None
+            if child is not None and depth > 1 and not child.linked:
+                self._render(
+                    child,
+                    indent + ("    " if last else "│   "),
+                    depth - 1,
+                    files_per_dir,
+                    skip,
+                    lines,
+                )
+        if hidden_files:
+            lines.append(f"{indent}└── ... (+{hidden_files} files)")
+
+
+def _fuzzy_rank(query: str, path: str) -> int | None:
+    """Rank a lower-cased path against a lower-cased query (None = no match)."""
+    name = path.rpartition("/")[2]
+    if name == query:
+        return 0
+    if name.startswith(query):
+        return 1
+    if query in name:
+        return 2
+    if query in path:
+        return 3
+    if _is_subsequence(query, name):
+        return 4
+    if _is_subsequence(query, path):
+        return 5
+    return None
+
+
+def _is_subsequence(query: str, text: str) -> bool:
+    chars = iter(text)
+    return all(char in chars for char in query)
+
+
+# ========================================================================
+# Shared Instances (one index per workspace root)
+# ========================================================================
+
+_indexes: dict[str, FileIndex] = {}
+_indexes_lock = threading.Lock()
+
+
+def get_file_index(root: str | Path | None = None) -> FileIndex:
+    """
+    Get the shared index for a workspace root (created on first use).
+
+    Args:
+        root: Directory to index (default: current working directory)
+
+    Returns:
+        FileIndex shared by every caller using the same root
+    """
+    key = os.path.realpath(root if root is not None else os.getcwd())
+    with _indexes_lock:
+        index = _indexes.get(key)
+        if index is None:
+            index = _indexes[key] = FileIndex(key)
+            logger.debug(f"FileIndex: Created index for {key}")
+        return index
+
+
+def notify_file_changed(path: str | Path) -> None:
+    """
+    Tell every shared index containing path that it changed on disk.
+
+    Called by tools that write files, so a search right after a write
+    sees the new file without waiting for the refresh interval.
+
+    Args:
+        path: Absolute path of the created, modified or deleted file
+    """
+    absolute = os.path.realpath(path)
+    with _indexes_lock:
+        indexes = list(_indexes.values())
+    for index in indexes:
+        if absolute == index.root or absolute.startswith(index.root + os.sep):
+            index.invalidate(absolute)
@@ -2,27 +2,59 @@
 File operation tools for vibe-agency OS (ARCH-027)
 
 Provides safe, auditable file read/write operations for LLM agents.
+
+ReadFileTool never loads more than max_bytes of a file: large files are
+returned as a head/tail summary, and agents page through them with
+offset/limit (bytes) or start_line/end_line. Files at or above
+MMAP_THRESHOLD are memory-mapped rather than read into memory.
 """
 
 import logging
+import mmap
 from pathlib import Path
 from typing import Any
 
+from vibe_core.tools.file_index import notify_file_changed
 from vibe_core.tools.tool_protocol import Tool, ToolResult
 
 logger = logging.getLogger(__name__)
 
+# Default cap on the bytes returned by one read (larger files are summarized)
+MAX_READ_BYTES = 256 * 1024
+
+# Files at or above this size are memory-mapped instead of read
+MMAP_THRESHOLD = 1024 * 1024
+
+# Bytes inspected for NUL bytes to detect binary files
+BINARY_SNIFF_BYTES = 8192
+
+# Chunk size for streaming line counts
+_COUNT_CHUNK_BYTES = 1024 * 1024
+
 
 class ReadFileTool(Tool):
     """
     Tool for reading file content.
 
-    Allows LLM agents to read files from disk.
+    Allows LLM agents to read files from disk, whole or in pages.
+
+    Read modes:
+    - Whole file: content as-is up to max_bytes; larger files return the
+      head and tail with an omission marker (metadata["truncated"] is True)
+    - Byte range: offset/limit
+    - Line range: start_line/end_line (1-based, inclusive); a single line
+      longer than max_bytes is cut (metadata["truncated_line"] names it and
+      next_offset points at the rest of it)
+
+    Metadata always reports total_bytes and total_lines so the agent can
+    decide how to page, plus next_offset/next_line when more content follows.
 
     Example:
         >>> tool = ReadFileTool()
         >>> result = tool.execute({"path": "/tmp/test.txt"})
         >>> print(result.output)  # File content
+        >>> page = tool.execute({"path": "big.log", "start_line": 1000, "end_line": 1100})
+        >>> print(page.metadata["total_lines"])
     """
 
     @property
@@ -31,7 +63,10 @@ class ReadFileTool(Tool):
 
     @property
     def description(self) -> str:
-        return "Read content from a file on disk"
+        return (
+            "Read content from a file on disk. Large files are summarized (head and tail); "
+            "use offset/limit or start_line/end_line to read a part"
+        )
 
     @property
     def parameters_schema(self) -> dict[str, Any]:
@@ -40,7 +75,33 @@ class ReadFileTool(Tool):
                 "type": "string",
                 "required": True,
                 "description": "Absolute or relative path to the file to read",
-            }
+            },
+            "offset": {
+                "type": "integer",
+                "required": False,
+                "description": "Byte offset to start reading at",
+            },
+            "limit": {
+                "type": "integer",
+                "required": False,
+                "description": "Maximum number of bytes to read from offset",
+            },
+            "start_line": {
+                "type": "integer",
+                "required": False,
+                "description": "First line to read (1-based)",
+            },
+            "end_line": {
+                "type": "integer",
+                "required": False,
+                "description": "Last line to read (inclusive)",
+            },
+            "max_bytes": {
+                "type": "integer",
+                "required": False,
+                "default": MAX_READ_BYTES,
+                "description": "Maximum bytes returned; larger whole-file reads are summarized",
+            },
         }
 
     def validate(self, parameters: dict[str, Any]) -> None:
@@ -48,11 +109,12 @@ class ReadFileTool(Tool):
         Validate parameters.
 
         Args:
-            parameters: Must contain 'path' (string)
+            parameters: Must contain 'path' (string); optional integer
+                        offset/limit, start_line/end_line and max_bytes
 
         Raises:
-            ValueError: If path missing or invalid
-            TypeError: If path is not a string
+            ValueError: If path missing or invalid, or ranges are invalid
+            TypeError: If path is not a string or a range value is not an int
         """
         if "path" not in parameters:
             raise ValueError("Missing required parameter: path")
@@ -64,15 +126,34 @@ class ReadFileTool(Tool):
         if not path.strip():
             raise ValueError("path cannot be empty")
 
+        minimums = {"offset": 0, "limit": 1, "start_line": 1, "end_line": 1, "max_bytes": 1}
+        for key, minimum in minimums.items():
+            if key not in parameters:
+                continue
+            value = parameters[key]
+            if not isinstance(value, int) or isinstance(value, bool):
+                raise TypeError(f"{key} must be an integer, got {type(value).__name__}")
+            if value < minimum:
+                raise ValueError(f"{key} must be at least {minimum}, got {value}")
+
+        byte_range = "offset" in parameters or "limit" in parameters
+        line_range = "start_line" in parameters or "end_line" in parameters
+        if byte_range and line_range:
+            raise ValueError("Use either offset/limit or start_line/end_line, not both")
+
+        if parameters.get("end_line", float("inf")) < parameters.get("start_line", 1):
+            raise ValueError("end_line must not be before start_line")
+
     def execute(self, parameters: dict[str, Any]) -> ToolResult:
         """
         Execute file read operation.
 
         Args:
-            parameters: {"path": "/path/to/file.txt"}
+            parameters: {"path": "/path/to/file.txt"} plus optional
+                        offset/limit, start_line/end_line, max_bytes
 
         Returns:
-            ToolResult with file content or error
+            ToolResult with file content (or a page / summary of it) or error
 
         Example:
             >>> result = tool.execute({"path": "/tmp/test.txt"})
@@ -80,6 +161,8 @@ class ReadFileTool(Tool):
             ...     print(result.output)  # File content
         """
         path_str = parameters["path"]
+        path = path_str
+        max_bytes = parameters.get("max_bytes", MAX_READ_BYTES)
 
         try:
             # Resolve path
@@ -93,16 +176,41 @@ class ReadFileTool(Tool):
             if not path.is_file():
                 return ToolResult(success=False, error=f"Path is not a file: {path}")
 
-            # Read file content
-            content = path.read_text(encoding="utf-8")
-
-            logger.info(f"ReadFileTool: Read file {path} ({len(content)} bytes)")
-
-            return ToolResult(
-                success=True,
-                output=content,
-                metadata={"path": str(path), "size_bytes": len(content)},
-            )
+            with open(path, "rb") as f:
+                total_bytes = path.stat().st_size
+                view = _open_view(f, total_bytes)
+                try:
+                    if b"\0" in view[:BINARY_SNIFF_BYTES]:
+                        return ToolResult(
+                            success=False,
+                            error=f"File appears to be binary: {path}",
+                            metadata={"path": str(path), "total_bytes": total_bytes},
+                        )
+
+                    metadata = {
+                        "path": str(path),
+                        "total_bytes": total_bytes,
+                        "total_lines": _count_lines(view, total_bytes),
+                        "truncated": False,
+                    }
+                    if "offset" in parameters or "limit" in parameters:
+                        content = self._read_bytes(
+                            view, total_bytes, parameters, max_bytes, metadata
+                        )
+                    elif "start_line" in parameters or "end_line" in parameters:
+                        content = self._read_lines(f, parameters, max_bytes, metadata)
+                    elif total_bytes > max_bytes:
+                        content = self._summarize(view, total_bytes, max_bytes, metadata)
+                    else:
+                        content = bytes(view[:total_bytes]).decode("utf-8")
+                finally:
+                    if isinstance(view, mmap.mmap):
+                        view.close()
+
+            metadata["size_bytes"] = len(content)
+            logger.info(f"ReadFileTool: Read file {path} ({len(content)} of {total_bytes} bytes)")
+
+            return ToolResult(success=True, output=content, metadata=metadata)
 
         except PermissionError:
             error_msg = f"Permission denied: {path}"
@@ -119,6 +227,108 @@ class ReadFileTool(Tool):
             logger.error(f"ReadFileTool: {error_msg} (path={path})", exc_info=True)
             return ToolResult(success=False, error=error_msg)
 
+    @staticmethod
+    def _read_bytes(
+        view, total_bytes: int, parameters: dict[str, Any], max_bytes: int, metadata: dict
+    ) -> str:
+        """Read the offset/limit byte range (capped at max_bytes)."""
+        offset = min(parameters.get("offset", 0), total_bytes)
+        limit = min(parameters.get("limit", max_bytes), max_bytes)
+        end = min(offset + limit, total_bytes)
+
+        metadata["offset"] = offset
+        metadata["end_offset"] = end
+        if end < total_bytes:
+            metadata["next_offset"] = end
+        # A range may cut a multi-byte character at either edge
+        return bytes(view[offset:end]).decode("utf-8", errors="replace")
+
+    @staticmethod
+    def _read_lines(f, parameters: dict[str, Any], max_bytes: int, metadata: dict) -> str:
+        """Stream lines start_line..end_line (stops early at max_bytes)."""
+        start_line = parameters.get("start_line", 1)
+        end_line = parameters.get("end_line")
+
+        f.seek(0)
+        lines: list[bytes] = []
+        size = 0
+        position = 0
+        last_line = start_line - 1
+        for number, line in enumerate(f, start=1):
+            line_start = position
+            position += len(line)
+            if number < start_line:
+                continue
+            if (end_line is not None and number > end_line) or size + len(line) > max_bytes:
+                metadata["truncated"] = end_line is None or number <= end_line
+                if not lines and metadata["truncated"]:
+                    # A single line over max_bytes: return its head so paging
+                    # by line still advances; the rest is reachable by offset
+                    lines.append(line[:max_bytes])
+                    last_line = number
+                    metadata["truncated_line"] = number
+                    metadata["next_offset"] = line_start + max_bytes
+                break
+            lines.append(line)
+            size += len(line)
+            last_line = number
+
+        metadata["start_line"] = start_line
+        metadata["end_line"] = last_line
+        if last_line < metadata["total_lines"]:
+            metadata["next_line"] = last_line + 1
+        # A cut line may end inside a multi-byte character
+        errors = "replace" if "truncated_line" in metadata else "strict"
+        return b"".join(lines).decode("utf-8", errors=errors)
+
+    @staticmethod
+    def _summarize(view, total_bytes: int, max_bytes: int, metadata: dict) -> str:
+        """Return head and tail of an oversized file (cut at line boundaries)."""
+        half = max_bytes // 2
+        head = bytes(view[:half])
+        tail = bytes(view[total_bytes - half : total_bytes])
+
+        # Cut back to whole lines where possible
+        newline = head.rfind(b"\n")
+        if newline != -1:
+            head = head[: newline + 1]
+        newline = tail.find(b"\n")
+        if newline != -1:
+            tail = tail[newline + 1 :]
+
+        head_lines = head.count(b"\n")
+        tail_lines = tail.count(b"\n") + (0 if tail.endswith(b"\n") or not tail else 1)
+        omitted_bytes = total_bytes - len(head) - len(tail)
+        omitted_lines = metadata["total_lines"] - head_lines - tail_lines
+
+        metadata["truncated"] = True
+        metadata["head_lines"] = head_lines
+        metadata["tail_lines"] = tail_lines
+        marker = (
+            f"\n... [{omitted_bytes} bytes / {omitted_lines} lines omitted; "
+            f"read with start_line/end_line or offset/limit] ...\n\n"
+        )
+        return (
+            head.decode("utf-8", errors="replace") + marker + tail.decode("utf-8", errors="replace")
+        )
+
+
+def _open_view(f, total_bytes: int):
+    """Return a sliceable view of the file: an mmap for big files, else the bytes."""
+    if total_bytes >= MMAP_THRESHOLD:
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    return f.read()
+
+
+def _count_lines(view, total_bytes: int) -> int:
+    """Count lines (a final line without newline counts) in bounded chunks."""
+    if not total_bytes:
+        return 0
+    newlines = 0
+    for start in range(0, total_bytes, _COUNT_CHUNK_BYTES):
+        newlines += view[start : start + _COUNT_CHUNK_BYTES].count(b"\n")
+    return newlines + (0 if view[total_bytes - 1 : total_bytes] == b"\n" else 1)
+
 
 class WriteFileTool(Tool):
     """
@@ -241,6 +451,7 @@ class WriteFileTool(Tool):
 
             # Write file
             path.write_text(content, encoding="utf-8")
+            notify_file_changed(path)
 
             logger.info(f"WriteFileTool: Wrote file {path} ({len(content)} bytes)")
 
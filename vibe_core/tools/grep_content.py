@@ -0,0 +1,464 @@
+"""
+Grep Content Tool for vibe-agency OS (ARCH-042 Extension).
+
+Empowers the agent to find WHERE something is written, not just which
+files exist: a regex search over file contents with line context.
+
+Candidate files come from the shared FileIndex (hidden and .gitignore'd
+files are skipped). Small workloads are scanned in-process; once the
+candidate files add up to PROCESS_POOL_MIN_BYTES they are scanned in
+parallel worker processes. Matches stream back in path order, and the
+scan stops as soon as max_results matches are collected.
+
+Files the InvariantChecker would block for this tool (e.g. the kernel
+core or .db files) are never opened, so grep cannot leak content that
+read_file may not return.
+"""
+
+import logging
+import multiprocessing
+import os
+import re
+import threading
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import partial
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Optional
+
+from vibe_core.tools.file_index import get_file_index
+from vibe_core.tools.tool_protocol import Tool, ToolResult
+
+if TYPE_CHECKING:
+    from vibe_core.governance.invariants import InvariantChecker
+
+logger = logging.getLogger(__name__)
+
+# Default maximum number of matching lines returned
+MAX_RESULTS = 100
+
+# Files larger than this are skipped (unless max_file_bytes says otherwise)
+MAX_FILE_BYTES = 1024 * 1024
+
+# Largest number of context lines around each match
+MAX_CONTEXT_LINES = 10
+
+# Total candidate bytes from which scanning moves to worker processes
+PROCESS_POOL_MIN_BYTES = 8 * 1024 * 1024
+
+# Files per worker task (results stream back one batch at a time)
+BATCH_FILES = 64
+
+# Bytes inspected for NUL bytes to detect binary files
+BINARY_SNIFF_BYTES = 8192
+
+# Matched and context lines are cut to this many characters
+MAX_LINE_CHARS = 300
+
+# Worker pools shared by all tools in this process (max_workers -> pool), created
+# on first use. Workers never fork from the threaded kernel: forking a process
+# whose other threads hold locks can deadlock the child.
+_START_METHOD = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+_pools: dict[int | None, ProcessPoolExecutor] = {}
+_pools_lock = threading.Lock()
+
+
+def _get_pool(max_workers: int | None) -> ProcessPoolExecutor:
+    """Return the shared worker pool for max_workers, creating it on first use."""
+    with _pools_lock:
+        pool = _pools.get(max_workers)
+        if pool is None:
+            pool = _pools[max_workers] = ProcessPoolExecutor(
+                max_workers=max_workers, mp_context=multiprocessing.get_context(_START_METHOD)
+            )
+        return pool
+
+
+def _discard_pool(max_workers: int | None, pool: ProcessPoolExecutor) -> None:
+    """Forget a broken pool so the next scan starts a fresh one."""
+    with _pools_lock:
+        if _pools.get(max_workers) is pool:
+            del _pools[max_workers]
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+class GrepContentTool(Tool):
+    """
+    Tool for searching file contents with a regular expression.
+
+    Output uses grep conventions: "path:line: text" for matching lines,
+    "path-line- text" for context lines and "--" between groups.
+
+    Example:
+        >>> tool = GrepContentTool(invariant_checker=soul)
+        >>> result = tool.execute({"pattern": r"def execute_batch", "glob": "*.py"})
+        >>> print(result.output)
+        vibe_core/tools/tool_registry.py:224:     def execute_batch(
+    """
+
+    def __init__(
+        self,
+        invariant_checker: Optional["InvariantChecker"] = None,
+        max_workers: int | None = None,
+    ):
+        """
+        Initialize the tool.
+
+        Args:
+            invariant_checker: Soul rules applied to every candidate file
+                               (the registry only checks the search root)
+            max_workers: Worker processes for large scans (default: CPU count)
+        """
+        self._invariant_checker = invariant_checker
+        self.max_workers = max_workers
+
+    @property
+    def name(self) -> str:
+        return "grep_content"
+
+    @property
+    def description(self) -> str:
+        return "Search file contents with a regular expression and show matching lines"
+
+    @property
+    def parameters_schema(self) -> dict[str, Any]:
+        return {
+            "pattern": {
+                "type": "string",
+                "required": True,
+                "description": "Regular expression to search for (Python re syntax)",
+            },
+            "path": {
+                "type": "string",
+                "required": False,
+                "description": "Directory or file to search (default: current working directory)",
+            },
+            "glob": {
+                "type": "string",
+                "required": False,
+                "description": "Only search files matching this glob (e.g., '*.py')",
+            },
+            "ignore_case": {
+                "type": "boolean",
+                "required": False,
+                "default": False,
+                "description": "Case-insensitive matching",
+            },
+            "context": {
+                "type": "integer",
+                "required": False,
+                "default": 0,
+                "description": f"Lines of context around each match (max {MAX_CONTEXT_LINES})",
+            },
+            "max_results": {
+                "type": "integer",
+                "required": False,
+                "default": MAX_RESULTS,
+                "description": "Maximum number of matching lines to return",
+            },
+            "max_file_bytes": {
+                "type": "integer",
+                "required": False,
+                "default": MAX_FILE_BYTES,
+                "description": "Skip files larger than this",
+            },
+        }
+
+    def validate(self, parameters: dict[str, Any]) -> None:
+        """
+        Validate parameters.
+
+        Args:
+            parameters: Must contain 'pattern' (valid regex string)
+
+        Raises:
+            ValueError: If pattern is missing/invalid or a number is out of range
+            TypeError: If a parameter has the wrong type
+        """
+        if "pattern" not in parameters:
+            raise ValueError("Missing required parameter: pattern")
+
+        pattern = parameters["pattern"]
+        if not isinstance(pattern, str):
+            raise TypeError("pattern must be a string")
+        if not pattern:
+            raise ValueError("pattern cannot be empty")
+        try:
+            re.compile(pattern)
+        except re.error as e:
+            raise ValueError(f"Invalid regular expression: {e}") from e
+
+        for key in ("path", "glob"):
+            if key in parameters and not isinstance(parameters[key], str):
+                raise TypeError(f"{key} must be a string")
+
+        if "ignore_case" in parameters and not isinstance(parameters["ignore_case"], bool):
+            raise TypeError("ignore_case must be a boolean")
+
+        ranges = {
+            "context": (0, MAX_CONTEXT_LINES),
+            "max_results": (1, None),
+            "max_file_bytes": (1, None),
+        }
+        for key, (minimum, maximum) in ranges.items():
+            if key not in parameters:
+                continue
+            value = parameters[key]
+            if not isinstance(value, int) or isinstance(value, bool):
+                raise TypeError(f"{key} must be an integer")
+            if value < minimum:
+                raise ValueError(f"{key} must be at least {minimum}")
+            if maximum is not None and value > maximum:
+                raise ValueError(f"{key} must be at most {maximum}")
+
+    def execute(self, parameters: dict[str, Any]) -> ToolResult:
+        """
+        Execute content search.
+
+        Args:
+            parameters: {"pattern": "regex", "path": "optional/root", "glob": "*.py",
+                         "ignore_case": False, "context": 0, "max_results": 100}
+
+        Returns:
+            ToolResult with grep-style output and match statistics
+        """
+        pattern = parameters["pattern"]
+        path_str = parameters.get("path", ".")
+        max_results = parameters.get("max_results", MAX_RESULTS)
+
+        try:
+            target = Path(path_str).expanduser().resolve()
+            workspace_root = Path.cwd().resolve()
+
+            # Security Check: Ensure search root is within workspace
+            if not target.is_relative_to(workspace_root):
+                return ToolResult(
+                    success=False,
+                    error=f"Access denied: Search path {target} is outside workspace {workspace_root}",
+                )
+
+            if not target.exists():
+                return ToolResult(success=False, error=f"Path not found: {target}")
+
+            stats = {"files_scanned": 0, "skipped_large": 0, "skipped_blocked": 0}
+            candidates = self._candidates(
+                target,
+                workspace_root,
+                parameters.get("glob", "*"),
+                parameters.get("max_file_bytes", MAX_FILE_BYTES),
+                stats,
+            )
+
+            lines: list[str] = []
+            matched_files: set[str] = set()
+            count = 0
+            for rel_path, groups in self.iter_matches(
+                candidates,
+                pattern,
+                ignore_case=parameters.get("ignore_case", False),
+                context=parameters.get("context", 0),
+                max_results=max_results,
+                root=str(workspace_root),
+            ):
+                matched_files.add(rel_path)
+                for group in groups:
+                    if lines and parameters.get("context", 0):
+                        lines.append("--")
+                    for number, text, is_match in group:
+                        separator = ":" if is_match else "-"
+                        lines.append(f"{rel_path}{separator}{number}{separator} {text}")
+                        count += is_match
+
+            truncated = count >= max_results
+            stats["files_scanned"] = len(candidates)
+            metadata = {
+                "count": count,
+                "files_matched": len(matched_files),
+                "truncated": truncated,
+                **stats,
+            }
+
+            logger.info(
+                f"GrepContentTool: {count} matches for '{pattern}' in "
+                f"{len(matched_files)}/{len(candidates)} files under {target}"
+            )
+
+            if not lines:
+                return ToolResult(success=True, output="No matches found.", metadata=metadata)
+
+            output = "\n".join(lines)
+            if truncated:
+                output += f"\n\n(Stopped at {max_results} matches; narrow the pattern or path)"
+            return ToolResult(success=True, output=output, metadata=metadata)
+
+        except Exception as e:
+            error_msg = f"Failed to search contents: {type(e).__name__}: {e!s}"
+            logger.error(f"GrepContentTool: {error_msg}", exc_info=True)
+            return ToolResult(success=False, error=error_msg)
+
+    def iter_matches(
+        self,
+        rel_paths: list[str],
+        pattern: str,
+        ignore_case: bool = False,
+        context: int = 0,
+        max_results: int = MAX_RESULTS,
+        root: str = ".",
+    ) -> Iterator[tuple[str, list[list[tuple[int, str, bool]]]]]:
+        """
+        Stream matches file by file, in the order of rel_paths.
+
+        Args:
+            rel_paths: Files to scan (relative to root)
+            pattern: Regular expression
+            ignore_case: Case-insensitive matching
+            context: Lines of context around each match
+            max_results: Stop after this many matching lines
+            root: Directory rel_paths are relative to
+
+        Yields:
+            (rel_path, groups): groups of adjacent (line number, text, is_match)
+            tuples, one group per run of matches plus their context
+        """
+        scan = partial(
+            _grep_batch,
+            pattern=pattern,
+            flags=re.IGNORECASE if ignore_case else 0,
+            context=context,
+            root=root,
+        )
+        remaining = max_results
+        batches = [rel_paths[i : i + BATCH_FILES] for i in range(0, len(rel_paths), BATCH_FILES)]
+
+        if len(batches) > 1 and self._total_bytes(rel_paths, root) >= PROCESS_POOL_MIN_BYTES:
+            pool = _get_pool(self.max_workers)
+            # map() yields batches in submission order, so output stays sorted;
+            # closing it early cancels the batches not started yet
+            results = pool.map(scan, batches)
+            try:
+                for batch_result in results:
+                    remaining = yield from _take(batch_result, remaining)
+                    if remaining <= 0:
+                        return
+            except BrokenProcessPool:
+                _discard_pool(self.max_workers, pool)
+                raise
+            finally:
+                results.close()
+        else:
+            for batch in batches:
+                remaining = yield from _take(scan(batch), remaining)
+                if remaining <= 0:
+                    return
+
+    def _candidates(
+        self,
+        target: Path,
+        workspace_root: Path,
+        glob: str,
+        max_file_bytes: int,
+        stats: dict[str, int],
+    ) -> list[str]:
+        """Return the workspace-relative files to scan (filtered by size and soul rules)."""
+        rel_target = target.relative_to(workspace_root).as_posix()
+        if target.is_file():
+            rel_paths = [rel_target]
+        else:
+            rel_paths, _ = get_file_index(workspace_root).glob(glob, under=rel_target)
+
+        candidates = []
+        for rel_path in rel_paths:
+            if self._invariant_checker is not None:
+                verdict = self._invariant_checker.check_tool_call(self.name, {"path": rel_path})
+                if not verdict.allowed:
+                    stats["skipped_blocked"] += 1
+                    continue
+            try:
+                size = os.path.getsize(workspace_root / rel_path)
+            except OSError:
+                continue
+            if size > max_file_bytes:
+                stats["skipped_large"] += 1
+                continue
+            candidates.append(rel_path)
+        return candidates
+
+    @staticmethod
+    def _total_bytes(rel_paths: list[str], root: str) -> int:
+        total = 0
+        for rel_path in rel_paths:
+            try:
+                total += os.path.getsize(os.path.join(root, rel_path))
+            except OSError:
+                continue
+        return total
+
+
+def _take(
+    batch_result: list[tuple[str, list[list[tuple[int, str, bool]]]]], remaining: int
+) -> Iterator[tuple[str, list[list[tuple[int, str, bool]]]]]:
+    """Yield file results until remaining matching lines are used up; return what is left."""
+    for rel_path, groups in batch_result:
+        kept = []
+        for group in groups:
+            matches = sum(is_match for _, _, is_match in group)
+            if matches > remaining:
+                # Cut the group after the last match that still fits
+                seen = 0
+                for cut, (_, _, is_match) in enumerate(group):
+                    seen += is_match
+                    if seen == remaining:
+                        group = group[: cut + 1]
+                        break
+                matches = remaining
+            kept.append(group)
+            remaining -= matches
+            if remaining <= 0:
+                break
+        yield rel_path, kept
+        if remaining <= 0:
+            break
+    return remaining
+
+
+def _grep_batch(
+    rel_paths: list[str], pattern: str, flags: int, context: int, root: str
+) -> list[tuple[str, list[list[tuple[int, str, bool]]]]]:
+    """
+    Scan a batch of files (runs in a worker process for large scans).
+
+    Binary files (NUL byte near the start) and unreadable files are skipped.
+    """
+    regex = re.compile(pattern, flags)
+    results = []
+    for rel_path in rel_paths:
+        try:
+            with open(os.path.join(root, rel_path), "rb") as f:
+                data = f.read()
+        except OSError:
+            continue
+        if b"\0" in data[:BINARY_SNIFF_BYTES]:
+            continue
+        lines = data.decode("utf-8", errors="replace").splitlines()
+        groups: list[list[tuple[int, str, bool]]] = []
+        last_emitted = -1
+        for index, line in enumerate(lines):
+            if regex.search(line) is None:
+                continue
+            start = max(index - context, last_emitted + 1)
+            if not groups or start > last_emitted + 1:
+                groups.append([])
+            for ctx in range(start, index):
+                groups[-1].append((ctx + 1, lines[ctx][:MAX_LINE_CHARS], False))
+            groups[-1].append((index + 1, line[:MAX_LINE_CHARS], True))
+            last_emitted = index
+            # Trailing context stops at the next match (which extends this group)
+            for ctx in range(index + 1, min(index + 1 + context, len(lines))):
+                if regex.search(lines[ctx]) is not None:
+                    break
+                groups[-1].append((ctx + 1, lines[ctx][:MAX_LINE_CHARS], False))
+                last_emitted = ctx
+        if groups:
+            results.append((rel_path, groups))
+    return results
@@ -26,6 +26,8 @@ Example:
 
 from typing import Any
 
+from vibe_core.agent_protocol import AgentResponse
+from vibe_core.scheduling import TaskEvent
 from vibe_core.tools.tool_protocol import Tool, ToolResult
 
 
@@ -36,11 +38,14 @@ class InspectResultTool(Tool):
     This enables agents to:
     1. Submit a task to another agent
     2. Get a task_id back
-    3. Use this tool to poll for results
+    3. Use this tool to check for results
     4. Continue based on result status
 
     Design:
-    - Queries kernel.ledger.get_task(task_id)
+    - Answers from the kernel's task handle when the task finished recently
+      (no ledger round-trip)
+    - Otherwise queries kernel.ledger.get_task(task_id) for metadata and
+      fetches the result body lazily (only for COMPLETED tasks)
     - Returns structured result information
     - Safe to use (handles missing tasks gracefully)
     - Useful for synchronization/orchestration workflows
@@ -131,6 +136,17 @@ class InspectResultTool(Tool):
             if not isinstance(include_input, bool):
                 raise TypeError("include_input must be a boolean")
 
+    @staticmethod
+    def _output_from_event(event: TaskEvent) -> dict[str, Any]:
+        """Build the tool output from a kernel completion event (ledger format)."""
+        output = {"task_id": event.task_id, "status": event.status, "timestamp": event.timestamp}
+        if event.status == "COMPLETED":
+            result = event.result
+            output["output"] = result.to_dict() if isinstance(result, AgentResponse) else result
+        else:
+            output["error"] = f"{type(event.error).__name__}: {event.error!s}"
+        return output
+
     def execute(self, parameters: dict[str, Any]) -> ToolResult:
         """
         Execute the tool: query a task result from the ledger.
@@ -161,8 +177,13 @@ class InspectResultTool(Tool):
             task_id = parameters.get("task_id")
             include_input = parameters.get("include_input", False)
 
-            # Query the ledger
-            record = self.kernel.ledger.get_task(task_id)
+            # Recently finished tasks are answered from their handle (no ledger query)
+            handle = self.kernel.get_handle(task_id)
+            if handle is not None and handle.done() and not include_input:
+                return ToolResult(success=True, output=self._output_from_event(handle.event))
+
+            # Query the ledger (metadata only - the result body is fetched below if needed)
+            record = self.kernel.ledger.get_task(task_id, include_output=False)
 
             if record is None:
                 return ToolResult(
@@ -183,7 +204,7 @@ class InspectResultTool(Tool):
 
             # Add result data based on status
             if record.get("status") == "COMPLETED":
-                output["output"] = record.get("output_result")
+                output["output"] = self.kernel.ledger.get_task_output(task_id)
             elif record.get("status") == "FAILED":
                 output["error"] = record.get("error_message")
             elif record.get("status") == "STARTED":
@@ -2,12 +2,16 @@
 List Directory Tool for vibe-agency OS (ARCH-042).
 
 Empowers the agent to explore the filesystem "Senses".
+
+Listings come from the shared workspace FileIndex; directories the index
+skips (hidden or ignored) are listed directly from disk.
 """
 
 import logging
 from pathlib import Path
 from typing import Any
 
+from vibe_core.tools.file_index import get_file_index
 from vibe_core.tools.tool_protocol import Tool, ToolResult
 
 logger = logging.getLogger(__name__)
@@ -69,7 +73,7 @@ class ListDirectoryTool(Tool):
 
             # Security Check: Ensure path is within workspace
             # We allow listing the workspace root and subdirectories
-            if not str(path).startswith(str(workspace_root)):
+            if not path.is_relative_to(workspace_root):
                 # Exception: Allow /tmp for some operations if needed, but strictly enforce workspace for now
                 # unless it's a specific allowed external path.
                 # For strict safety, we block everything outside CWD.
@@ -85,15 +89,14 @@ class ListDirectoryTool(Tool):
                 return ToolResult(success=False, error=f"Path is not a directory: {path}")
 
             # List contents
-            items = []
-            for item in path.iterdir():
-                # Skip hidden files/dirs (simple security/noise filter)
-                if item.name.startswith(".") and item.name != ".vibe":
-                    # We might want to see .vibe, but generally skip .git, .env etc.
-                    continue
-
-                type_str = "DIR" if item.is_dir() else "FILE"
-                items.append(f"[{type_str}] {item.name}")
+            listing = get_file_index(workspace_root).list_dir(
+                path.relative_to(workspace_root).as_posix()
+            )
+            if listing is not None:
+                dirs, files = listing
+                items = [f"[DIR] {name}" for name in dirs] + [f"[FILE] {name}" for name in files]
+            else:
+                items = self._list_from_disk(path)
 
             # Sort for deterministic output
             items.sort()
@@ -117,3 +120,17 @@ class ListDirectoryTool(Tool):
             error_msg = f"Failed to list directory: {type(e).__name__}: {e!s}"
             logger.error(f"ListDirectoryTool: {error_msg}", exc_info=True)
             return ToolResult(success=False, error=error_msg)
+
+    @staticmethod
+    def _list_from_disk(path: Path) -> list[str]:
+        """List a directory the index does not cover (e.g. inside .git)."""
+        items = []
+        for item in path.iterdir():
+            # Skip hidden files/dirs (simple security/noise filter)
+            if item.name.startswith(".") and item.name != ".vibe":
+                # We might want to see .vibe, but generally skip .git, .env etc.
+                continue
+
+            type_str = "DIR" if item.is_dir() else "FILE"
+            items.append(f"[{type_str}] {item.name}")
+        return items
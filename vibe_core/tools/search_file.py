@@ -2,22 +2,36 @@
 Search File Tool for vibe-agency OS (ARCH-042).
 
 Empowers the agent to find files by pattern.
+
+Searches are answered from the shared workspace FileIndex (see
+file_index.py) instead of walking the tree on every call.
 """
 
 import logging
 from pathlib import Path
 from typing import Any
 
+from vibe_core.tools.file_index import get_file_index
 from vibe_core.tools.tool_protocol import Tool, ToolResult
 
 logger = logging.getLogger(__name__)
 
+# Default page size (limit results to prevent overwhelming output)
+MAX_RESULTS = 50
+
 
 class SearchFileTool(Tool):
     """
     Tool for searching files by name pattern.
 
     Allows LLM agents to find files without knowing the exact path.
+
+    Modes:
+    - Glob (default): rglob semantics, results sorted by path
+    - Fuzzy: loose name match ("kernl" finds kernel.py), best matches first
+
+    Results are paged with offset/limit; metadata reports the total number
+    of matches and the next offset.
     """
 
     @property
@@ -26,7 +40,10 @@ class SearchFileTool(Tool):
 
     @property
     def description(self) -> str:
-        return "Search for files matching a glob pattern (e.g., '*.py')"
+        return (
+            "Search for files matching a glob pattern (e.g., '*.py'), "
+            "or by approximate name with fuzzy=true"
+        )
 
     @property
     def parameters_schema(self) -> dict[str, Any]:
@@ -41,6 +58,24 @@ class SearchFileTool(Tool):
                 "required": False,
                 "description": "Root directory to search in (defaults to current working directory)",
             },
+            "fuzzy": {
+                "type": "boolean",
+                "required": False,
+                "default": False,
+                "description": "Treat pattern as approximate name text, ranked by match quality",
+            },
+            "offset": {
+                "type": "integer",
+                "required": False,
+                "default": 0,
+                "description": "Number of results to skip (pagination)",
+            },
+            "limit": {
+                "type": "integer",
+                "required": False,
+                "default": MAX_RESULTS,
+                "description": "Maximum number of results to return",
+            },
         }
 
     def validate(self, parameters: dict[str, Any]) -> None:
@@ -48,7 +83,8 @@ class SearchFileTool(Tool):
         Validate parameters.
 
         Args:
-            parameters: Must contain 'pattern' (string)
+            parameters: Must contain 'pattern' (string); optional path,
+                        fuzzy (bool), offset and limit (int)
         """
         if "pattern" not in parameters:
             raise ValueError("Missing required parameter: pattern")
@@ -59,18 +95,32 @@ class SearchFileTool(Tool):
         if "path" in parameters and not isinstance(parameters["path"], str):
             raise TypeError("path must be a string")
 
+        if "fuzzy" in parameters and not isinstance(parameters["fuzzy"], bool):
+            raise TypeError("fuzzy must be a boolean")
+
+        for key, minimum in (("offset", 0), ("limit", 1)):
+            if key in parameters:
+                value = parameters[key]
+                if not isinstance(value, int) or isinstance(value, bool):
+                    raise TypeError(f"{key} must be an integer")
+                if value < minimum:
+                    raise ValueError(f"{key} must be at least {minimum}")
+
     def execute(self, parameters: dict[str, Any]) -> ToolResult:
         """
         Execute file search.
 
         Args:
-            parameters: {"pattern": "*.py", "path": "optional/root"}
+            parameters: {"pattern": "*.py", "path": "optional/root",
+                         "fuzzy": False, "offset": 0, "limit": 50}
 
         Returns:
             ToolResult with list of matching file paths
         """
         pattern = parameters["pattern"]
         path_str = parameters.get("path", ".")
+        offset = parameters.get("offset", 0)
+        limit = parameters.get("limit", MAX_RESULTS)
 
         try:
             # Resolve search root
@@ -78,7 +128,7 @@ class SearchFileTool(Tool):
             workspace_root = Path.cwd().resolve()
 
             # Security Check: Ensure search root is within workspace
-            if not str(search_root).startswith(str(workspace_root)):
+            if not search_root.is_relative_to(workspace_root):
                 return ToolResult(
                     success=False,
                     error=f"Access denied: Search path {search_root} is outside workspace {workspace_root}",
@@ -87,48 +137,35 @@ class SearchFileTool(Tool):
             if not search_root.exists():
                 return ToolResult(success=False, error=f"Path not found: {search_root}")
 
-            # Perform search (recursive)
-            # We use rglob for recursive search
-            matches = []
-
-            # Limit results to prevent overwhelming output
-            MAX_RESULTS = 50
-
-            for item in search_root.rglob(pattern):
-                # Security: Skip hidden directories like .git
-                if any(part.startswith(".") and part != ".vibe" for part in item.parts):
-                    continue
-
-                if item.is_file():
-                    # Return relative path for readability
-                    try:
-                        rel_path = item.relative_to(workspace_root)
-                        matches.append(str(rel_path))
-                    except ValueError:
-                        # Should not happen given the security check, but safe fallback
-                        matches.append(str(item))
-
-                if len(matches) >= MAX_RESULTS:
-                    break
-
-            matches.sort()
+            # Paths are returned relative to the workspace for readability
+            index = get_file_index(workspace_root)
+            under = search_root.relative_to(workspace_root).as_posix()
+            query = index.fuzzy if parameters.get("fuzzy", False) else index.glob
+            matches, total = query(pattern, under=under, offset=offset, limit=limit)
 
             if not matches:
-                return ToolResult(success=True, output="No matches found.")
+                output = "No matches found." if not total else f"No results at offset {offset}."
+                return ToolResult(
+                    success=True,
+                    output=output,
+                    metadata={"count": 0, "total": total, "truncated": False},
+                )
 
+            next_offset = offset + len(matches)
+            truncated = next_offset < total
             output = "\n".join(matches)
-            if len(matches) >= MAX_RESULTS:
-                output += f"\n\n(Truncated at {MAX_RESULTS} results)"
-
-            logger.info(
-                f"SearchFileTool: Found {len(matches)} matches for '{pattern}' in {search_root}"
-            )
-
-            return ToolResult(
-                success=True,
-                output=output,
-                metadata={"count": len(matches), "truncated": len(matches) >= MAX_RESULTS},
-            )
+            if truncated:
+                output += (
+                    f"\n\n(Showing {offset + 1}-{next_offset} of {total} results; "
+                    f"use offset={next_offset} for more)"
+                )
+
+            logger.info(f"SearchFileTool: Found {total} matches for '{pattern}' in {search_root}")
+
+            metadata = {"count": len(matches), "total": total, "truncated": truncated}
+            if truncated:
+                metadata["next_offset"] = next_offset
+            return ToolResult(success=True, output=output, metadata=metadata)
 
         except Exception as e:
             error_msg = f"Failed to search files: {type(e).__name__}: {e!s}"
@@ -3,9 +3,13 @@ Tool Registry for vibe-agency OS (ARCH-027 + ARCH-029)
 
 Manages available tools and provides lookup/execution functionality.
 Integrates Soul Governance (ARCH-029) for security by design.
+Independent tool calls can run concurrently via execute_batch().
 """
 
 import logging
+import os
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
 
 from vibe_core.tools.tool_protocol import Tool, ToolCall, ToolResult
@@ -20,6 +24,9 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of tool calls a batch runs at the same time
+DEFAULT_BATCH_WORKERS = 8
+
 
 class ToolRegistry:
     """
@@ -29,6 +36,7 @@ class ToolRegistry:
     - Tool registration (add tools dynamically)
     - Tool lookup by name
     - Tool execution (validates + executes)
+    - Batched execution (independent calls run concurrently)
     - LLM-friendly tool descriptions
 
     Example:
@@ -213,6 +221,84 @@ class ToolRegistry:
             logger.error(f"ToolRegistry: {error_msg} (tool={tool_name})", exc_info=True)
             return ToolResult(success=False, error=error_msg)
 
+    def execute_batch(
+        self, tool_calls: Sequence[ToolCall], max_workers: int = DEFAULT_BATCH_WORKERS
+    ) -> list[ToolResult]:
+        """
+        Execute several tool calls, running independent ones concurrently.
+
+        Calls are grouped into chains that run one after another in their
+        original order:
+        - Calls with the same "path" parameter (after normalization) share a
+          chain, so a write and a read of one file never overlap
+        - Calls without a path share a chain per tool name (e.g. two
+          add_task calls on the agenda file)
+        Different chains run in parallel in a thread pool. Each call goes
+        through execute(), so governance checks and error handling apply; a
+        call that still raises (e.g. a failing governance check) becomes a
+        failed ToolResult without affecting the rest of the batch.
+
+        Args:
+            tool_calls: Calls to execute
+            max_workers: Maximum number of chains running at the same time
+
+        Returns:
+            list[ToolResult]: One result per call, in the order of tool_calls
+
+        Raises:
+            ValueError: If max_workers is less than 1
+
+        Example:
+            >>> results = registry.execute_batch([
+            ...     ToolCall(tool_name="read_file", parameters={"path": "a.py"}),
+            ...     ToolCall(tool_name="read_file", parameters={"path": "b.py"}),
+            ... ])  # Both files are read at the same time
+        """
+        if max_workers < 1:
+            raise ValueError(f"max_workers must be at least 1, got {max_workers}")
+
+        chains: dict[str, list[int]] = {}
+        for index, tool_call in enumerate(tool_calls):
+            chains.setdefault(self._serialization_key(tool_call), []).append(index)
+
+        results: list[ToolResult | None] = [None] * len(tool_calls)
+
+        def run_chain(indices: list[int]) -> None:
+            for index in indices:
+                try:
+                    results[index] = self.execute(tool_calls[index])
+                except Exception as e:
+                    error_msg = f"Tool execution failed: {type(e).__name__}: {e!s}"
+                    logger.error(
+                        f"ToolRegistry: {error_msg} (tool={tool_calls[index].tool_name})",
+                        exc_info=True,
+                    )
+                    results[index] = ToolResult(success=False, error=error_msg)
+
+        if len(chains) <= 1 or max_workers == 1:
+            for indices in chains.values():
+                run_chain(indices)
+        else:
+            logger.info(
+                f"ToolRegistry: Executing batch of {len(tool_calls)} calls "
+                f"({len(chains)} independent chains)"
+            )
+            workers = min(max_workers, len(chains))
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="vibe-tool") as pool:
+                # list() re-raises anything unexpected from a worker
+                list(pool.map(run_chain, chains.values()))
+
+        return results  # type: ignore[return-value]
+
+    @staticmethod
+    def _serialization_key(tool_call: ToolCall) -> str:
+        """Return the key of the chain a call must run in (same key = sequential)."""
+        parameters = tool_call.parameters if isinstance(tool_call.parameters, dict) else {}
+        path = parameters.get("path")
+        if isinstance(path, str) and path:
+            return f"path:{os.path.normcase(os.path.realpath(path))}"
+        return f"tool:{tool_call.tool_name}"
+
     def to_llm_prompt(self) -> str:
         """
         Generate LLM system prompt section describing available tools.
@@ -244,6 +330,7 @@ class ToolRegistry:
         lines.append("")
         lines.append("To use a tool, respond with JSON:")
         lines.append('{"tool": "tool_name", "parameters": {...}}')
+        lines.append("To use several tools at once, respond with a JSON list of such objects.")
 
         return "\n".join(lines)
 